@@ -0,0 +1,40 @@
+"""
+The `sysforge bench` suite as pytest tests: `pytest benchmarks`.
+
+Each benchmark's timings are attached to the test as properties (see `--junitxml`). Set
+SYSFORGE_BENCH_BASELINE to saved `sysforge bench` output to fail tests that regressed by more
+than SYSFORGE_BENCH_MAX_REGRESSION percent (default 10).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from sysforge.bench import benchmark_cases, compare_to_baseline, measure
+
+WARMUP = int(os.environ.get("SYSFORGE_BENCH_WARMUP", "3"))
+REPEAT = int(os.environ.get("SYSFORGE_BENCH_REPEAT", "20"))
+MAX_REGRESSION = float(os.environ.get("SYSFORGE_BENCH_MAX_REGRESSION", "10"))
+_baseline_path = os.environ.get("SYSFORGE_BENCH_BASELINE")
+BASELINE = json.loads(Path(_baseline_path).read_text()) if _baseline_path else None
+
+CASES = benchmark_cases()
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_benchmark(name: str, record_property) -> None:
+    stats = measure(CASES[name], warmup=WARMUP, repeat=REPEAT)
+    for key, value in stats.items():
+        record_property(key, value)
+    if BASELINE is None:
+        return
+    comparison = compare_to_baseline(
+        {"benchmarks": {name: stats}},
+        {"benchmarks": {name: (BASELINE.get("benchmarks") or {}).get(name)}},
+        max_regression=MAX_REGRESSION,
+    )
+    assert not comparison["regressions"], comparison["regressions"]
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import heapq
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Protocol, TypeVar
+
+from .checks.base import STATUS_SEVERITY
+from .utils import read_json_file
+
+HISTOGRAM_BINS = 10
+MAX_ERROR_SAMPLES = 20
+REPORT_SUFFIXES = (".json", ".json.gz", ".json.zst")
+
+
+class _Mergeable(Protocol):
+    def merge(self, other: Any) -> None: ...
+
+
+R = TypeVar("R", bound=_Mergeable)
+
+
+def _mapping(value: Any) -> dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _histogram_label(index: int) -> str:
+    return f"{index / HISTOGRAM_BINS:.1f}-{(index + 1) / HISTOGRAM_BINS:.1f}"
+
+
+class FleetRollup:
+    """
+    Mergeable fleet-level summary of many `sysforge report` payloads.
+
+    Memory is bounded by the number of distinct check names and versions plus `top` entries
+    per check, never by the number of reports, so partial rollups from worker processes can be
+    merged cheaply.
+    """
+
+    def __init__(self, *, top: int = 5) -> None:
+        self.top = top
+        self.reports = 0
+        self.errors = 0
+        self.error_samples: list[str] = []
+        self.checks: dict[str, Counter[str]] = {}
+        self.worst: dict[str, list[tuple[int, float, str, str, str]]] = {}
+        self.percent_free_bins = [0] * HISTOGRAM_BINS
+        self.percent_free_count = 0
+        self.percent_free_total = 0.0
+        self.percent_free_min: float | None = None
+        self.percent_free_max: float | None = None
+        self.python_versions: Counter[str] = Counter()
+        self.os_versions: Counter[str] = Counter()
+
+    def add_error(self, path: str, message: str) -> None:
+        self.errors += 1
+        if len(self.error_samples) < MAX_ERROR_SAMPLES:
+            self.error_samples.append(f"{path}: {message}")
+
+    def add_report(self, host: str, report: dict[str, Any]) -> None:
+        self.reports += 1
+        system = _mapping(_mapping(report.get("collected")).get("system"))
+
+        percent_free = _mapping(system.get("disk")).get("percent_free")
+        if isinstance(percent_free, (int, float)) and not isinstance(percent_free, bool):
+            self._add_percent_free(float(percent_free))
+
+        python_version = _mapping(system.get("python")).get("version")
+        if python_version:
+            self.python_versions[str(python_version)] += 1
+        os_info = _mapping(system.get("os"))
+        os_parts = [str(part) for part in (os_info.get("name"), os_info.get("release")) if part]
+        if os_parts:
+            self.os_versions[" ".join(os_parts)] += 1
+
+        results = _mapping(report.get("checks")).get("results")
+        for result in results if isinstance(results, list) else []:
+            result = _mapping(result)
+            name = result.get("name")
+            status = result.get("status")
+            if not isinstance(name, str) or not isinstance(status, str):
+                continue
+            if not name or status not in STATUS_SEVERITY:
+                continue
+            self.checks.setdefault(name, Counter())[status] += 1
+            value = _mapping(result.get("data")).get("percent_free")
+            # Within a severity, a lower percent_free (where reported) ranks as worse.
+            badness = 0.0
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                badness = -float(value)
+            entry = (STATUS_SEVERITY[status], badness, host, status, str(result.get("message")))
+            self._push_worst(name, entry)
+
+    def _add_percent_free(self, value: float) -> None:
+        index = min(max(int(value * HISTOGRAM_BINS), 0), HISTOGRAM_BINS - 1)
+        self.percent_free_bins[index] += 1
+        self.percent_free_count += 1
+        self.percent_free_total += value
+        if self.percent_free_min is None or value < self.percent_free_min:
+            self.percent_free_min = value
+        if self.percent_free_max is None or value > self.percent_free_max:
+            self.percent_free_max = value
+
+    def _push_worst(self, name: str, entry: tuple[int, float, str, str, str]) -> None:
+        heap = self.worst.setdefault(name, [])
+        if len(heap) < self.top:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+
+    def merge(self, other: FleetRollup) -> None:
+        self.reports += other.reports
+        self.errors += other.errors
+        room = MAX_ERROR_SAMPLES - len(self.error_samples)
+        self.error_samples.extend(other.error_samples[: max(room, 0)])
+        for name, counts in other.checks.items():
+            self.checks.setdefault(name, Counter()).update(counts)
+        for name, entries in other.worst.items():
+            for entry in entries:
+                self._push_worst(name, entry)
+        self.percent_free_bins = [
+            mine + theirs
+            for mine, theirs in zip(self.percent_free_bins, other.percent_free_bins, strict=True)
+        ]
+        self.percent_free_count += other.percent_free_count
+        self.percent_free_total += other.percent_free_total
+        for value in (other.percent_free_min, other.percent_free_max):
+            if value is not None:
+                if self.percent_free_min is None or value < self.percent_free_min:
+                    self.percent_free_min = value
+                if self.percent_free_max is None or value > self.percent_free_max:
+                    self.percent_free_max = value
+        self.python_versions.update(other.python_versions)
+        self.os_versions.update(other.os_versions)
+
+    def to_dict(self) -> dict[str, Any]:
+        mean = None
+        if self.percent_free_count:
+            mean = self.percent_free_total / self.percent_free_count
+        return {
+            "reports": self.reports,
+            "errors": {"count": self.errors, "samples": self.error_samples},
+            "checks": {
+                name: {
+                    "pass": counts["pass"],
+                    "warn": counts["warn"],
+                    "fail": counts["fail"],
+                    "worst": [
+                        {"host": host, "status": status, "message": message}
+                        for _, _, host, status, message in sorted(
+                            self.worst.get(name, []), reverse=True
+                        )
+                    ],
+                }
+                for name, counts in sorted(self.checks.items())
+            },
+            "percent_free": {
+                "count": self.percent_free_count,
+                "min": self.percent_free_min,
+                "max": self.percent_free_max,
+                "mean": mean,
+                "histogram": {
+                    _histogram_label(index): count
+                    for index, count in enumerate(self.percent_free_bins)
+                },
+            },
+            "python_versions": dict(self.python_versions.most_common()),
+            "os_versions": dict(self.os_versions.most_common()),
+        }
+
+
+def host_name(path: Path) -> str:
+    """
+    Derive the host name from a report file name (`web-01.json` -> `web-01`).
+    """
+    name = path.name
+    for suffix in (".gz", ".zst", ".json"):
+        name = name.removesuffix(suffix)
+    return name
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    report = read_json_file(path)
+    if not isinstance(report, dict):
+        raise ValueError("report is not a JSON object")
+    return report
+
+
+def aggregate_paths(paths: Sequence[str], *, top: int = 5) -> FleetRollup:
+    """
+    Roll up one batch of report files; unreadable or malformed files are counted as errors.
+    """
+    rollup = FleetRollup(top=top)
+    for name in paths:
+        path = Path(name)
+        try:
+            report = load_report(path)
+        except (OSError, ValueError) as exc:
+            rollup.add_error(name, str(exc))
+            continue
+        rollup.add_report(host_name(path), report)
+    return rollup
+
+
+def iter_report_paths(directory: Path, pattern: str | None = None) -> Iterator[str]:
+    """
+    Lazily yield matching report files below `directory`.
+
+    Without a `pattern`, plain and compressed JSON reports (`REPORT_SUFFIXES`) match.
+    """
+    for path in directory.rglob(pattern or "*"):
+        if pattern is None and not path.name.endswith(REPORT_SUFFIXES):
+            continue
+        if path.is_file():
+            yield str(path)
+
+
+def _batches(paths: Iterable[str], size: int) -> Iterator[list[str]]:
+    iterator = iter(paths)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def reduce_report_batches(
+    paths: Iterable[str],
+    worker: Callable[[list[str]], R],
+    total: R,
+    *,
+    jobs: int = 1,
+    batch_size: int = 256,
+) -> R:
+    """
+    Run `worker` over batches of `paths` in up to `jobs` processes and merge into `total`.
+
+    `worker` must be picklable and return an object whose `merge` `total` accepts. Paths are
+    consumed lazily and only a bounded window of batches is in flight.
+    """
+    if jobs < 1:
+        raise ValueError("jobs must be at least 1")
+    batches = _batches(paths, batch_size)
+    if jobs == 1:
+        for batch in batches:
+            total.merge(worker(batch))
+        return total
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        in_flight: set[Future[R]] = set()
+        for batch in batches:
+            in_flight.add(pool.submit(worker, batch))
+            if len(in_flight) >= jobs * 2:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    total.merge(future.result())
+        for future in in_flight:
+            total.merge(future.result())
+    return total
+
+
+def aggregate_reports(
+    paths: Iterable[str],
+    *,
+    jobs: int = 1,
+    top: int = 5,
+    batch_size: int = 256,
+) -> FleetRollup:
+    """
+    Roll up report files, parsing batches in up to `jobs` worker processes.
+
+    Paths are consumed lazily and only a bounded window of batches is in flight, so neither
+    the file list nor the parsed reports are ever held in memory all at once.
+    """
+    return reduce_report_batches(
+        paths,
+        partial(aggregate_paths, top=top),
+        FleetRollup(top=top),
+        jobs=jobs,
+        batch_size=batch_size,
+    )
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
+
+from .checks.base import CheckResult
+from .utils import flatten_metrics
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+# Spread assumed for a metric that has been flat, as a fraction of its mean, so the first
+# tiny change to a constant value is not an infinite z-score.
+MIN_RELATIVE_SPREAD = 0.01
+
+
+class Ewma:
+    """
+    Exponentially weighted moving mean and variance, updated in O(1) per value.
+    """
+
+    def __init__(self, alpha: float) -> None:
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+        self.alpha = alpha
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def zscore(self, value: float) -> float:
+        """
+        Return how many standard deviations `value` is from the current mean.
+        """
+        spread = max(self.stddev, abs(self.mean) * MIN_RELATIVE_SPREAD)
+        if spread == 0.0:
+            return 0.0 if value == self.mean else math.inf
+        return (value - self.mean) / spread
+
+    def update(self, value: float) -> None:
+        self.count += 1
+        if self.count == 1:
+            self.mean = value
+            return
+        diff = value - self.mean
+        increment = self.alpha * diff
+        self.mean += increment
+        self.variance = (1 - self.alpha) * (self.variance + diff * increment)
+
+
+class P2Quantile:
+    """
+    Streaming estimate of one quantile with the P-square algorithm (Jain and Chlamtac, 1985).
+
+    Five markers are kept whatever the number of values, and each update moves them in O(1).
+    """
+
+    def __init__(self, quantile: float) -> None:
+        if not 0.0 < quantile < 1.0:
+            raise ValueError("quantile must be in (0, 1)")
+        self.quantile = quantile
+        self._heights: list[float] = []
+        self._positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+        q = quantile
+        self._desired = [1.0, 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5.0]
+        self._increments = [0.0, q / 2, q, (1 + q) / 2, 1.0]
+
+    @property
+    def value(self) -> float | None:
+        heights = self._heights
+        if not heights:
+            return None
+        if len(heights) < 5:
+            # Too few values for the markers yet; interpolate the sorted sample.
+            position = (len(heights) - 1) * self.quantile
+            lower = math.floor(position)
+            upper = min(lower + 1, len(heights) - 1)
+            return heights[lower] + (heights[upper] - heights[lower]) * (position - lower)
+        return heights[2]
+
+    def update(self, value: float) -> None:
+        heights, positions = self._heights, self._positions
+        if len(heights) < 5:
+            heights.append(value)
+            heights.sort()
+            return
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if heights[i] <= value < heights[i + 1])
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                step = 1 if offset > 0 else -1
+                height = self._parabolic(i, step)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = self._linear(i, step)
+                heights[i] = height
+                positions[i] += step
+
+    def _parabolic(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + step) * (h[i + 1] - h[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - step) * (h[i] - h[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def _linear(self, i: int, step: int) -> float:
+        h, n = self._heights, self._positions
+        return h[i] + step * (h[i + step] - h[i]) / (n[i + step] - n[i])
+
+
+class FillRate:
+    """
+    Exponentially weighted least-squares slope of a value over time, updated in O(1).
+
+    Older samples fade with a time constant of `window` seconds, so the slope follows the
+    recent rate rather than the whole history.
+    """
+
+    def __init__(self, window: float) -> None:
+        if window <= 0:
+            raise ValueError("window must be greater than zero")
+        self.window = window
+        self.count = 0
+        self.first: float | None = None
+        self.last: float | None = None
+        # Weighted sums of 1, t, y, t*t and t*y, with t relative to the newest sample.
+        self._sums = [0.0] * 5
+
+    @property
+    def span(self) -> float:
+        if self.first is None or self.last is None:
+            return 0.0
+        return self.last - self.first
+
+    def update(self, timestamp: float, value: float) -> None:
+        if self.first is None or self.last is None:
+            self.first = self.last = timestamp
+        elif timestamp > self.last:
+            elapsed = timestamp - self.last
+            decay = math.exp(-elapsed / self.window)
+            weight, sum_t, sum_y, sum_tt, sum_ty = (total * decay for total in self._sums)
+            # Re-centre time on the newest sample so the sums stay small however long it runs.
+            self._sums = [
+                weight,
+                sum_t - elapsed * weight,
+                sum_y,
+                sum_tt - 2 * elapsed * sum_t + elapsed * elapsed * weight,
+                sum_ty - elapsed * sum_y,
+            ]
+            self.last = timestamp
+        t = timestamp - self.last
+        for index, term in enumerate((1.0, t, value, t * t, t * value)):
+            self._sums[index] += term
+        self.count += 1
+
+    def slope(self) -> float | None:
+        """
+        Return the fitted change per second, or None until at least three samples spread in
+        time were seen.
+        """
+        weight, sum_t, sum_y, sum_tt, sum_ty = self._sums
+        denominator = weight * sum_tt - sum_t * sum_t
+        if self.count < 3 or denominator <= 1e-12 * weight * sum_tt:
+            return None
+        return (weight * sum_ty - sum_t * sum_y) / denominator
+
+
+def format_eta(seconds: float) -> str:
+    """
+    Format a duration roughly, e.g. `45m`, `6h` or `3d`.
+    """
+    for unit, size in (("d", 86_400), ("h", 3_600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds / size:.0f}{unit}"
+    return f"{max(seconds, 0):.0f}s"
+
+
+def iter_disk_usages(data: Any, prefix: str) -> Iterator[tuple[str, float, float]]:
+    """
+    Yield (name, free_bytes, total_bytes) for every usage mapping in a collector payload.
+
+    List entries are named by their `mount_point`, e.g. `mounts.mounts[/var]`.
+    """
+    if isinstance(data, Mapping):
+        free, total = data.get("free_bytes"), data.get("total_bytes")
+        if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in (free, total)):
+            yield prefix, float(free), float(total)
+        for key, value in data.items():
+            if isinstance(value, (Mapping, list)):
+                yield from iter_disk_usages(value, f"{prefix}.{key}")
+    elif isinstance(data, list):
+        for item in data:
+            if isinstance(item, Mapping) and isinstance(item.get("mount_point"), str):
+                yield from iter_disk_usages(item, f"{prefix}[{item['mount_point']}]")
+
+
+class _MetricState:
+    __slots__ = ("ewma", "quantiles", "status")
+
+    def __init__(self, alpha: float, quantiles: Sequence[float]) -> None:
+        self.ewma = Ewma(alpha)
+        self.quantiles = [P2Quantile(q) for q in quantiles]
+        self.status = "pass"
+
+
+class _FillState:
+    __slots__ = ("fit", "status")
+
+    def __init__(self, window: float) -> None:
+        self.fit = FillRate(window)
+        self.status = "pass"
+
+
+class AnomalyDetector:
+    """
+    Streaming anomaly and disk fill-rate detection over sampled collector payloads.
+
+    Each numeric field keeps an EWMA mean and variance plus P-square quantile sketches; a value
+    more than `zscore` deviations from the mean, once `warmup` values were seen, is a warning.
+    Each disk usage keeps a fill-rate fit; if free space will run out within `fill_fail`
+    (`fill_warn`) seconds at the current rate, that is a failure (warning). All state is
+    constant-size per metric and updated in O(1) per sample, without revisiting history.
+    """
+
+    def __init__(
+        self,
+        *,
+        alpha: float = 0.05,
+        zscore: float = 4.0,
+        warmup: int = 30,
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+        fill_window: float = 3_600.0,
+        min_fill_span: float = 300.0,
+        fill_warn: float = 86_400.0,
+        fill_fail: float = 21_600.0,
+    ) -> None:
+        if zscore <= 0:
+            raise ValueError("zscore must be greater than zero")
+        if warmup < 1:
+            raise ValueError("warmup must be at least 1")
+        if not 0 < fill_fail <= fill_warn:
+            raise ValueError("fill_fail must be greater than zero and at most fill_warn")
+        if not 0.0 < alpha <= 1.0:
+            raise ValueError("alpha must be in (0, 1]")
+        if not all(0.0 < quantile < 1.0 for quantile in quantiles):
+            raise ValueError("quantiles must be in (0, 1)")
+        self.alpha = alpha
+        self.zscore = zscore
+        self.warmup = warmup
+        self.quantiles = tuple(quantiles)
+        self.fill_window = fill_window
+        self.min_fill_span = min_fill_span
+        self.fill_warn = fill_warn
+        self.fill_fail = fill_fail
+        self._metrics: dict[str, _MetricState] = {}
+        self._fills: dict[str, _FillState] = {}
+
+    def update(
+        self, collector: str, data: Mapping[str, Any], timestamp: float
+    ) -> list[CheckResult]:
+        """
+        Feed one sample of `collector` taken at `timestamp` (epoch seconds).
+
+        Returns a result for every metric whose status changed, including recoveries back to
+        pass, so a steady state produces no output.
+        """
+        changed: list[CheckResult] = []
+        for name, value in flatten_metrics(data, collector).items():
+            result = self._update_metric(name, value)
+            if result is not None:
+                changed.append(result)
+        for name, free, total in iter_disk_usages(data, collector):
+            result = self._update_fill(name, free, total, timestamp)
+            if result is not None:
+                changed.append(result)
+        return changed
+
+    def _update_metric(self, name: str, value: float) -> CheckResult | None:
+        state = self._metrics.get(name)
+        if state is None:
+            state = self._metrics[name] = _MetricState(self.alpha, self.quantiles)
+        ewma = state.ewma
+        score = ewma.zscore(value) if ewma.count >= self.warmup else 0.0
+        ewma.update(value)
+        for sketch in state.quantiles:
+            sketch.update(value)
+        status = "warn" if abs(score) > self.zscore else "pass"
+        if status == state.status:
+            return None
+        state.status = status
+        data: dict[str, Any] = {
+            "value": value,
+            "ewma": ewma.mean,
+            "stddev": ewma.stddev,
+            "zscore": score,
+            **{f"p{round(sketch.quantile * 100):02d}": sketch.value for sketch in state.quantiles},
+        }
+        if status == "pass":
+            message = f"{name} is back within {self.zscore:g} deviations of its average"
+        else:
+            message = (
+                f"{name} = {value:g} is {abs(score):.1f} deviations "
+                f"{'above' if score > 0 else 'below'} its average {ewma.mean:g}"
+            )
+        return CheckResult(name=f"anomaly.{name}", status=status, message=message, data=data)
+
+    def _update_fill(
+        self, name: str, free: float, total: float, timestamp: float
+    ) -> CheckResult | None:
+        state = self._fills.get(name)
+        if state is None:
+            state = self._fills[name] = _FillState(self.fill_window)
+        fit = state.fit
+        fit.update(timestamp, free)
+        slope = fit.slope() if fit.span >= self.min_fill_span else None
+        seconds_to_full = free / -slope if slope is not None and slope < 0 else None
+        if seconds_to_full is None or seconds_to_full > self.fill_warn:
+            status = "pass"
+        else:
+            status = "fail" if seconds_to_full <= self.fill_fail else "warn"
+        if status == state.status:
+            return None
+        state.status = status
+        data = {
+            "free_bytes": free,
+            "total_bytes": total,
+            "bytes_per_second": slope,
+            "seconds_to_full": seconds_to_full,
+        }
+        if seconds_to_full is None or status == "pass":
+            message = f"{name} is not on course to fill within {format_eta(self.fill_warn)}"
+        else:
+            message = f"{name} will be full in ~{format_eta(seconds_to_full)} at current rate"
+        return CheckResult(name=f"disk_fill.{name}", status=status, message=message, data=data)
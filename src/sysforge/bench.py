@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import math
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+from .checks import get_checks
+from .collectors import get_collectors
+from .context import RunContext
+from .reporting import assemble_report, render_report_markdown
+from .utils import iso_timestamp, json_dump
+
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_METRIC = "p50_ms"
+# Changes smaller than this are timer and scheduler noise, whatever their percentage.
+NOISE_FLOOR_MS = 0.05
+
+STAT_KEYS = ("min_ms", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms")
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """
+    Return the `fraction` quantile of sorted `values`, interpolating between neighbours.
+    """
+    if not values:
+        raise ValueError("percentile of an empty sample")
+    position = (len(values) - 1) * fraction
+    lower = math.floor(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def summarize(samples_ms: Iterable[float]) -> dict[str, Any]:
+    """
+    Summarize timings in milliseconds as run count, min, mean, p50/p95/p99 and max.
+    """
+    ordered = sorted(samples_ms)
+    if not ordered:
+        raise ValueError("no samples to summarize")
+    stats = {
+        "min_ms": ordered[0],
+        "mean_ms": sum(ordered) / len(ordered),
+        "p50_ms": percentile(ordered, 0.50),
+        "p95_ms": percentile(ordered, 0.95),
+        "p99_ms": percentile(ordered, 0.99),
+        "max_ms": ordered[-1],
+    }
+    return {"runs": len(ordered), **{key: round(value, 4) for key, value in stats.items()}}
+
+
+def measure(func: Callable[[], object], *, warmup: int = 3, repeat: int = 20) -> dict[str, Any]:
+    """
+    Call `func` `warmup` times untimed, then time `repeat` calls and summarize them.
+    """
+    if warmup < 0:
+        raise ValueError("warmup must not be negative")
+    if repeat < 1:
+        raise ValueError("repeat must be at least 1")
+    for _ in range(warmup):
+        func()
+    samples: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        func()
+        samples.append((time.perf_counter_ns() - start) / 1e6)
+    return summarize(samples)
+
+
+def synthetic_report(size: int) -> dict[str, Any]:
+    """
+    Build a deterministic report shaped like `assemble_report` output with `size` check
+    results and `size` collected entries.
+    """
+    statuses = ("pass", "warn", "fail")
+    results = [
+        {
+            "name": f"check_{index}",
+            "status": statuses[index % 3],
+            "message": f"Synthetic check {index} | value {index * 7 % 101}",
+            "data": {"value": index * 0.5, "limit": 100, "tags": [f"t{index % 5}", "bench"]},
+        }
+        for index in range(size)
+    ]
+    summary = {status: sum(1 for r in results if r["status"] == status) for status in statuses}
+    return {
+        "timestamp": "2024-01-01T00:00:00+00:00",
+        "collected": {
+            "system": {
+                "os": {
+                    "name": "Linux",
+                    "release": "6.1.0",
+                    "version": "#1 SMP",
+                    "machine": "x86_64",
+                },
+                "python": {
+                    "version": "3.11.0",
+                    "implementation": "CPython",
+                    "executable": "/usr/bin/python3",
+                },
+                "hardware": {"cpu_count": 8, "memory_bytes": 16 * 1024**3},
+                "disk": {"path": "/", "free_bytes": 50 * 1024**3, "percent_free": 0.42},
+            },
+            "synthetic": {
+                f"item_{index}": {"pid": index, "rss_bytes": index * 4096, "name": f"proc-{index}"}
+                for index in range(size)
+            },
+        },
+        "checks": {"results": results, "summary": summary},
+    }
+
+
+def cli_startup_command() -> tuple[list[str], dict[str, str]]:
+    """
+    Return the command and environment that start a fresh interpreter running this sysforge.
+    """
+    env = dict(os.environ)
+    # Point the child at the same source tree even when sysforge is not installed.
+    package_parent = str(Path(__file__).resolve().parent.parent)
+    existing = env.get("PYTHONPATH")
+    env["PYTHONPATH"] = package_parent + (os.pathsep + existing if existing else "")
+    return [sys.executable, "-m", "sysforge", "--version"], env
+
+
+def _startup() -> None:
+    command, env = cli_startup_command()
+    subprocess.run(command, env=env, check=True, stdout=subprocess.DEVNULL)
+
+
+def benchmark_cases(
+    *, sizes: Iterable[int] = DEFAULT_SIZES, startup: bool = True
+) -> dict[str, Callable[[], object]]:
+    """
+    Return the benchmarks by name.
+
+    Every collector and check call gets a fresh run context and no persistent cache, so each
+    one is timed standalone rather than reusing probes resolved by a neighbour.
+    """
+    cases: dict[str, Callable[[], object]] = {}
+    if startup:
+        cases["startup.cli"] = _startup
+    for collector in get_collectors():
+        cases[f"collector.{collector.name}"] = (
+            lambda collector=collector: collector.collect(RunContext())
+        )
+    for check in get_checks():
+        cases[f"check.{check.name}"] = lambda check=check: check.run(context=RunContext())
+    for size in sizes:
+        if size < 1:
+            raise ValueError("report sizes must be at least 1")
+        report = synthetic_report(size)
+        cases[f"json_dump.{size}"] = lambda report=report: json_dump(report)
+        cases[f"render_report_markdown.{size}"] = (
+            lambda report=report: render_report_markdown(report)
+        )
+    cases["assemble_report"] = assemble_report
+    return cases
+
+
+def run_benchmarks(
+    *,
+    warmup: int = 3,
+    repeat: int = 20,
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    startup: bool = True,
+    pattern: str | None = None,
+) -> dict[str, Any]:
+    """
+    Run the benchmarks whose name matches the `pattern` regex (all by default).
+
+    A benchmark that raises is recorded with its error instead of stopping the run.
+    """
+    matcher = re.compile(pattern) if pattern else None
+    results: dict[str, Any] = {}
+    for name, func in benchmark_cases(sizes=sizes, startup=startup).items():
+        if matcher is not None and not matcher.search(name):
+            continue
+        try:
+            results[name] = measure(func, warmup=warmup, repeat=repeat)
+        except Exception as exc:
+            results[name] = {"error": f"{type(exc).__name__}: {exc}"}
+    return {
+        "sysforge_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": iso_timestamp(),
+        "warmup": warmup,
+        "repeat": repeat,
+        "benchmarks": results,
+    }
+
+
+def compare_to_baseline(
+    current: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    *,
+    max_regression: float = 10.0,
+    metric: str = DEFAULT_METRIC,
+    noise_floor_ms: float = NOISE_FLOOR_MS,
+) -> dict[str, Any]:
+    """
+    Compare two `run_benchmarks` results on `metric`.
+
+    A benchmark regresses when it got more than `max_regression` percent slower and by more
+    than `noise_floor_ms`. Benchmarks missing from either side, or that errored, are listed
+    as not compared rather than failing the comparison.
+    """
+    if metric not in STAT_KEYS:
+        raise ValueError(f"metric must be one of {', '.join(STAT_KEYS)}")
+    if max_regression < 0:
+        raise ValueError("max_regression must not be negative")
+    current_results = current.get("benchmarks") or {}
+    baseline_results = baseline.get("benchmarks") or {}
+    changes: list[dict[str, Any]] = []
+    regressions: list[dict[str, Any]] = []
+    not_compared: list[str] = []
+    for name in sorted(set(current_results) | set(baseline_results)):
+        now = (current_results.get(name) or {}).get(metric)
+        before = (baseline_results.get(name) or {}).get(metric)
+        if not isinstance(now, (int, float)) or not isinstance(before, (int, float)):
+            not_compared.append(name)
+            continue
+        change_pct = ((now - before) / before * 100) if before > 0 else 0.0
+        entry = {
+            "name": name,
+            "baseline_ms": before,
+            "current_ms": now,
+            "change_pct": round(change_pct, 2),
+        }
+        changes.append(entry)
+        if change_pct > max_regression and now - before > noise_floor_ms:
+            regressions.append(entry)
+    return {
+        "metric": metric,
+        "max_regression_pct": max_regression,
+        "changes": changes,
+        "regressions": regressions,
+        "not_compared": not_compared,
+    }
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+from . import __version__
+
+BOOT_ID_PATH = Path("/proc/sys/kernel/random/boot_id")
+
+
+def default_cache_dir() -> Path:
+    """
+    Return the per-user cache directory, honouring XDG_CACHE_HOME.
+    """
+    base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "sysforge"
+
+
+def boot_id() -> str | None:
+    """
+    Return the kernel boot id, which changes on every reboot. None where unsupported.
+    """
+    try:
+        return BOOT_ID_PATH.read_text().strip() or None
+    except OSError:
+        return None
+
+
+def invalidation_key() -> dict[str, Any]:
+    """
+    Return the facts that invalidate cached collector output when any of them change.
+    """
+    executable = os.fsdecode(sys.executable) if sys.executable else None
+    executable_mtime = None
+    if executable:
+        try:
+            executable_mtime = os.stat(executable).st_mtime_ns
+        except OSError:
+            pass
+    return {
+        "boot_id": boot_id(),
+        "executable": executable,
+        "executable_mtime": executable_mtime,
+        "version": __version__,
+    }
+
+
+class CollectorCache:
+    """
+    On-disk cache for slow-changing collector output.
+
+    Each entry is one JSON file holding the value, when it was stored, and the invalidation
+    key it was computed under. An entry is served only while it is younger than the caller's
+    TTL and its key still matches. Cache I/O is best-effort and never fails a collection.
+    """
+
+    def __init__(self, directory: Path | None = None, *, refresh: bool = False) -> None:
+        self.directory = directory or default_cache_dir()
+        self.refresh = refresh
+        self._base_key: dict[str, Any] | None = None
+
+    def _key(self, extra: Mapping[str, Any] | None) -> dict[str, Any]:
+        if self._base_key is None:
+            self._base_key = invalidation_key()
+        key = dict(self._base_key)
+        if extra:
+            key.update(extra)
+        # Round-trip so the comparison matches what a later read will see.
+        return json.loads(json.dumps(key, default=str))
+
+    def _path(self, name: str) -> Path:
+        return self.directory / f"{name}.json"
+
+    def load(self, name: str, *, ttl: float, key: Mapping[str, Any] | None = None) -> Any | None:
+        """
+        Return the cached value for `name`, or None on a miss, expiry, or key mismatch.
+        """
+        if self.refresh:
+            return None
+        try:
+            entry = json.loads(self._path(name).read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or "value" not in entry:
+            return None
+        stored_at = entry.get("stored_at")
+        if not isinstance(stored_at, (int, float)) or time.time() - stored_at > ttl:
+            return None
+        if entry.get("key") != self._key(key):
+            return None
+        return entry["value"]
+
+    def store(self, name: str, value: Any, *, key: Mapping[str, Any] | None = None) -> None:
+        """
+        Atomically replace the cached value for `name`.
+        """
+        entry = {"stored_at": time.time(), "key": self._key(key), "value": value}
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=f".{name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as handle:
+                    json.dump(entry, handle, default=str)
+                os.replace(tmp_name, self._path(name))
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            pass
+
+    def get_or_compute(
+        self,
+        name: str,
+        compute: Callable[[], Any],
+        *,
+        ttl: float,
+        key: Mapping[str, Any] | None = None,
+    ) -> Any:
+        """
+        Return the cached value for `name`, computing and storing it on a miss.
+        """
+        value = self.load(name, ttl=ttl, key=key)
+        if value is None:
+            value = compute()
+            self.store(name, value, key=key)
+        return value
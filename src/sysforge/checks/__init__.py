@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-from .base import BaseCheck
+from collections.abc import Iterator, MutableMapping
+from typing import TYPE_CHECKING
+
+from ..context import RunContext
+from ..parallel import CancelScope, current_scope
+from ..timing import timed
+from .base import DEFAULT_TIMEOUT_STATUS, BaseCheck, CheckResult, CheckStatus
+from .scheduler import schedule_checks
+
+if TYPE_CHECKING:
+    from ..cache import CollectorCache
 
 _check_registry: list[BaseCheck] = []
 
@@ -21,22 +31,168 @@ def get_checks() -> list[BaseCheck]:
     return list(_check_registry)
 
 
-def run_checks(*, disk_threshold: float = 0.10) -> dict[str, object]:
+def _run_checks_for(context: RunContext | None) -> list[BaseCheck]:
+    # Rules from the run's `rules` setting run after the registered checks, one check each.
+    # Imported here: the rule engine imports `aggregate`, which imports `checks.base`.
+    from .rules import rule_checks
+
+    settings = context.settings if context is not None else {}
+    return [*get_checks(), *rule_checks(settings)]
+
+
+def _scheduled(
+    checks: list[BaseCheck],
+    *,
+    disk_threshold: float,
+    jobs: int,
+    context: RunContext | None,
+    result_cache: CollectorCache | None = None,
+    timeout: float | None = None,
+    deadline: float | None = None,
+    timeout_status: CheckStatus = DEFAULT_TIMEOUT_STATUS,
+    abandoned: MutableMapping[str, CancelScope] | None = None,
+) -> Iterator[tuple[BaseCheck, CheckResult]]:
+    ctx = context or RunContext()
+
+    def evaluate(check: BaseCheck) -> CheckResult:
+        if result_cache is None:
+            return check.run(disk_threshold=disk_threshold, context=ctx)
+        fingerprint = check.fingerprint(disk_threshold=disk_threshold, context=ctx)
+        if fingerprint is None:
+            result = check.run(disk_threshold=disk_threshold, context=ctx)
+            result.freshness = "fresh"
+            return result
+        section = f"check.{check.name}"
+        key = {"fingerprint": fingerprint, "disk_threshold": disk_threshold}
+        stored = result_cache.load(section, ttl=check.result_ttl, key=key)
+        if isinstance(stored, dict):
+            try:
+                result = CheckResult.from_dict(stored)
+            except (KeyError, TypeError, ValueError):
+                pass
+            else:
+                result.freshness = "cached"
+                return result
+        result = check.run(disk_threshold=disk_threshold, context=ctx)
+        result_cache.store(section, result.to_dict(), key=key)
+        result.freshness = "fresh"
+        return result
+
+    def execute(check: BaseCheck) -> CheckResult:
+        result, sample = timed(evaluate, check)
+        scope = current_scope()
+        # An abandoned check finishing late must not replace its recorded timeout.
+        if scope is None or not scope.cancelled:
+            ctx.record_timing("checks", check.name, sample)
+        return result
+
+    scheduled = schedule_checks(
+        checks,
+        execute,
+        jobs=jobs,
+        timeout=timeout,
+        deadline=deadline,
+        timeout_status=timeout_status,
+        abandoned=abandoned,
+    )
+    for check, result in scheduled:
+        if result.timed_out:
+            sample = {"wall_ms": (result.data or {}).get("elapsed_ms"), "timed_out": True}
+            ctx.record_timing("checks", check.name, sample)
+        yield check, result
+
+
+def iter_checks(
+    *,
+    disk_threshold: float = 0.10,
+    jobs: int = 1,
+    context: RunContext | None = None,
+    result_cache: CollectorCache | None = None,
+    timeout: float | None = None,
+    deadline: float | None = None,
+    timeout_status: CheckStatus = DEFAULT_TIMEOUT_STATUS,
+) -> Iterator[CheckResult]:
+    """
+    Execute all registered checks and yield each result as soon as it is available.
+
+    Pass the collectors' `context` to reuse probes they already resolved, and a
+    `result_cache` to reuse stored results of checks whose fingerprint is unchanged.
+    `timeout` bounds each check in seconds and `deadline` (`time.monotonic()`) the whole run;
+    overruns yield results marked `timed_out` with status `timeout_status`.
+    """
+    scheduled = _scheduled(
+        _run_checks_for(context),
+        disk_threshold=disk_threshold,
+        jobs=jobs,
+        context=context,
+        result_cache=result_cache,
+        timeout=timeout,
+        deadline=deadline,
+        timeout_status=timeout_status,
+    )
+    for _, result in scheduled:
+        yield result
+
+
+def run_checks(
+    *,
+    disk_threshold: float = 0.10,
+    jobs: int = 1,
+    context: RunContext | None = None,
+    result_cache: CollectorCache | None = None,
+    timeout: float | None = None,
+    deadline: float | None = None,
+    timeout_status: CheckStatus = DEFAULT_TIMEOUT_STATUS,
+    abandoned: MutableMapping[str, CancelScope] | None = None,
+) -> dict[str, object]:
     """
     Execute all registered checks and return results plus summary counts.
+
+    Results keep registration order regardless of the order the scheduler ran them in.
+    Pass the collectors' `context` to reuse probes they already resolved, and a
+    `result_cache` to reuse stored results of checks whose fingerprint is unchanged.
+    `timeout`, `deadline` and `timeout_status` bound the checks as in `iter_checks`.
+    Repeated runs pass the same `abandoned` mapping so a check still stuck from an earlier
+    run is not started again; see `schedule_checks`.
     """
+    checks = _run_checks_for(context)
+    scheduled = _scheduled(
+        checks,
+        disk_threshold=disk_threshold,
+        jobs=jobs,
+        context=context,
+        result_cache=result_cache,
+        timeout=timeout,
+        deadline=deadline,
+        timeout_status=timeout_status,
+        abandoned=abandoned,
+    )
+    finished = {check.name: result for check, result in scheduled}
     summary = {"pass": 0, "warn": 0, "fail": 0}
     results: list[dict[str, object]] = []
-    for check in get_checks():
-        result = check.run(disk_threshold=disk_threshold)
+    for check in checks:
+        result = finished[check.name]
         results.append(result.to_dict())
         summary[result.status] += 1
     return {"results": results, "summary": summary}
 
 
 # Register built-in checks
+from .cgroup import CgroupLimitsCheck  # noqa: E402
 from .core import DiskSpaceCheck, GitInstalledCheck, PythonVersionCheck  # noqa: E402
+from .cpu import CpuSaturationCheck  # noqa: E402
+from .network import InterfaceErrorsCheck, SocketExhaustionCheck  # noqa: E402
+from .packages import PackageRequirementsCheck  # noqa: E402
+from .processes import ProcessesCheck  # noqa: E402
+from .toolchain import ToolchainCheck  # noqa: E402
 
 register_check(DiskSpaceCheck())
 register_check(GitInstalledCheck())
 register_check(PythonVersionCheck())
+register_check(CpuSaturationCheck())
+register_check(ProcessesCheck())
+register_check(InterfaceErrorsCheck())
+register_check(SocketExhaustionCheck())
+register_check(CgroupLimitsCheck())
+register_check(PackageRequirementsCheck())
+register_check(ToolchainCheck())
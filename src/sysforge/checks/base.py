@@ -1,10 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
-from typing import Any, Literal
+from typing import Any, Literal, cast
+
+from ..context import RunContext
 
 CheckStatus = Literal["pass", "warn", "fail"]
+STATUS_SEVERITY: dict[str, int] = {"pass": 0, "warn": 1, "fail": 2}
+DEFAULT_TIMEOUT_STATUS: CheckStatus = "fail"
 
 
 @dataclass
@@ -13,6 +18,11 @@ class CheckResult:
     status: CheckStatus
     message: str
     data: dict[str, Any] | None = None
+    skipped: bool = False
+    # "fresh" or "cached" in incremental runs; None otherwise.
+    freshness: str | None = None
+    # The check overran its deadline; `status` is the run's configured timeout status.
+    timed_out: bool = False
 
     def to_dict(self) -> dict[str, Any]:
         payload: dict[str, Any] = {
@@ -22,12 +32,72 @@ class CheckResult:
         }
         if self.data is not None:
             payload["data"] = self.data
+        if self.skipped:
+            payload["skipped"] = True
+        if self.freshness is not None:
+            payload["freshness"] = self.freshness
+        if self.timed_out:
+            payload["timed_out"] = True
         return payload
 
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> CheckResult:
+        """
+        Rebuild a result from `to_dict` output.
+        """
+        status = payload["status"]
+        if status not in STATUS_SEVERITY:
+            raise ValueError(f"invalid check status {status!r}")
+        return cls(
+            name=payload["name"],
+            status=status,
+            message=payload["message"],
+            data=payload.get("data"),
+            skipped=bool(payload.get("skipped", False)),
+            freshness=payload.get("freshness"),
+            timed_out=bool(payload.get("timed_out", False)),
+        )
+
+
+def worst_status(statuses: Iterable[str]) -> CheckStatus:
+    """
+    Return the most severe of `statuses`, or "pass" when there are none.
+    """
+    return cast(CheckStatus, max(statuses, key=STATUS_SEVERITY.__getitem__, default="pass"))
+
 
 class BaseCheck(ABC):
+    """
+    Interface for health checks.
+
+    `depends_on` names checks that must not fail before this one runs, and `cost` is a relative
+    runtime hint the scheduler uses to start expensive checks first. Checks read shared probes
+    and collector payloads through `context` rather than probing again.
+
+    Checks whose inputs can be summarized cheaply override `fingerprint`. In incremental runs
+    a stored result is reused while the fingerprint matches and is younger than `result_ttl`
+    seconds; checks without a fingerprint always run.
+
+    `timeout` overrides the run's per-check deadline in seconds. Checks that start processes
+    should use `parallel.run_command`, so an overrun kills them along with the check.
+    """
+
     name: str
+    depends_on: tuple[str, ...] = ()
+    cost: float = 1.0
+    result_ttl: float = 24 * 60 * 60.0
+    timeout: float | None = None
+
+    def fingerprint(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Return a JSON-serializable summary of everything the result depends on, or None.
+        """
+        return None
 
     @abstractmethod
-    def run(self, *, disk_threshold: float = 0.10) -> CheckResult:
+    def run(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> CheckResult:
         raise NotImplementedError
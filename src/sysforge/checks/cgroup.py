@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from ..collectors.cgroup import probe_cgroup
+from ..context import RunContext
+from .base import BaseCheck, CheckResult, worst_status
+
+# Working set as a share of the cgroup memory limit.
+MEMORY_WARN = 0.80
+MEMORY_FAIL = 0.95
+# Share of CFS periods in which the cgroup was throttled, once enough periods have elapsed.
+THROTTLE_WARN = 0.25
+THROTTLE_MIN_PERIODS = 100
+
+
+class CgroupLimitsCheck(BaseCheck):
+    """
+    Warn when the container's working set nears its memory limit or its CPU quota throttles.
+    """
+
+    name = "cgroup_limits"
+
+    def run(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> CheckResult:  # disk_threshold unused
+        ctx = context or RunContext()
+        cgroup = ctx.fact("cgroup", probe_cgroup)
+        if not cgroup.get("supported"):
+            return CheckResult(
+                name=self.name,
+                status="pass",
+                message="Not running under cgroup resource control.",
+            )
+
+        memory = cgroup.get("memory") or {}
+        cpu = cgroup.get("cpu") or {}
+        statuses = ["pass"]
+        problems: list[str] = []
+
+        percent_used = memory.get("percent_used")
+        if percent_used is not None and percent_used >= MEMORY_WARN:
+            statuses.append("fail" if percent_used >= MEMORY_FAIL else "warn")
+            problems.append(
+                f"memory working set at {percent_used:.0%} of "
+                f"{memory['limit_bytes']:,} byte limit"
+            )
+
+        throttled_ratio = cpu.get("throttled_ratio") or 0.0
+        if cpu.get("periods", 0) >= THROTTLE_MIN_PERIODS and throttled_ratio >= THROTTLE_WARN:
+            statuses.append("warn")
+            problems.append(
+                f"CPU throttled in {throttled_ratio:.0%} of periods "
+                f"(quota {cpu.get('quota_cores')} cores)"
+            )
+
+        status = worst_status(statuses)
+        if problems:
+            message = "Container limits under pressure: " + "; ".join(problems)
+        elif memory.get("limit_bytes") is None and cpu.get("quota_cores") is None:
+            message = "No cgroup CPU or memory limits apply."
+        else:
+            message = "Container is within its cgroup limits."
+        data = {
+            "version": cgroup.get("version"),
+            "memory_limit_bytes": memory.get("limit_bytes"),
+            "memory_percent_used": percent_used,
+            "cpu_quota_cores": cpu.get("quota_cores"),
+            "cpu_throttled_ratio": throttled_ratio,
+        }
+        return CheckResult(name=self.name, status=status, message=message, data=data)
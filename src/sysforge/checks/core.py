@@ -1,42 +1,207 @@
 from __future__ import annotations
 
-import shutil
+import math
+import os
 import sys
+from collections.abc import Sequence
 from pathlib import Path
+from typing import Any
 
+from ..collectors.mounts import probe_mounts
+from ..collectors.toolchain import ToolchainCollector, resolve
+from ..context import RunContext
 from ..utils import disk_usage_summary
-from .base import BaseCheck, CheckResult
+from .base import BaseCheck, CheckResult, worst_status
 
 WARN_THRESHOLD_MARGIN = 0.05
+# Free-space fingerprints change once per this fraction of capacity, so a stored disk result
+# is reused while usage drifts within one bucket (and never across a status boundary).
+FINGERPRINT_BUCKET = 0.01
+
+
+def parse_mount_thresholds(values: Sequence[str]) -> dict[str, float]:
+    """
+    Parse repeated MOUNT=FRACTION options into per-mount free-space thresholds.
+    """
+    thresholds: dict[str, float] = {}
+    for value in values:
+        mount, sep, fraction = value.rpartition("=")
+        if not sep or not mount.strip():
+            raise ValueError(f"invalid mount threshold {value!r}; use MOUNT=FRACTION")
+        try:
+            threshold = float(fraction)
+        except ValueError:
+            raise ValueError(f"invalid mount threshold {value!r}; use MOUNT=FRACTION") from None
+        if not 0.0 <= threshold <= 1.0:
+            raise ValueError(f"mount threshold {value!r} must be between 0 and 1")
+        thresholds[mount.strip()] = threshold
+    return thresholds
+
+
+def _free_space_status(percent_free: float, threshold: float) -> str:
+    if percent_free <= threshold:
+        return "fail"
+    if percent_free <= min(threshold + WARN_THRESHOLD_MARGIN, 1.0):
+        return "warn"
+    return "pass"
+
+
+def _free_space_bucket(percent_free: float | None, threshold: float) -> list[Any] | None:
+    if percent_free is None:
+        return None
+    bucket = math.floor(percent_free / FINGERPRINT_BUCKET)
+    return [_free_space_status(percent_free, threshold), bucket]
 
 
 class DiskSpaceCheck(BaseCheck):
+    """
+    Check free space on the home directory's filesystem, or on individual mounts.
+
+    Per-mount mode is enabled through the run context settings: `mount_thresholds` maps mount
+    points to their own thresholds and `all_mounts` evaluates every mount the mounts collector
+    reports, using `disk_threshold` unless a mount has its own. Both free bytes and free
+    inodes count against the threshold.
+    """
+
     name = "disk_space"
 
-    def run(self, *, disk_threshold: float = 0.10) -> CheckResult:
-        usage = disk_usage_summary(Path.home())
-        percent_free = usage["percent_free"]
+    def fingerprint(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> dict[str, Any] | None:
+        ctx = context or RunContext()
+        thresholds = dict(ctx.settings.get("mount_thresholds") or {})
+        all_mounts = bool(ctx.settings.get("all_mounts"))
+        if not thresholds and not all_mounts:
+            home = Path.home()
+            usage = ctx.fact(f"disk_usage:{home}", lambda: disk_usage_summary(home))
+            return {
+                "path": str(home),
+                "free": _free_space_bucket(usage.get("percent_free"), disk_threshold),
+            }
+        payload = ctx.fact("mounts", probe_mounts)
+        mounts: dict[str, Any] = {}
+        for mount in payload.get("mounts") or []:
+            threshold = thresholds.get(mount["mount_point"], disk_threshold)
+            if "error" in mount:
+                mounts[mount["mount_point"]] = mount["error"]
+            else:
+                mounts[mount["mount_point"]] = [
+                    _free_space_bucket(mount.get("percent_free"), threshold),
+                    _free_space_bucket(mount.get("percent_inodes_free"), threshold),
+                ]
+        return {
+            "supported": bool(payload.get("supported")),
+            "thresholds": thresholds,
+            "all_mounts": all_mounts,
+            "mounts": mounts,
+        }
+
+    def run(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> CheckResult:
+        ctx = context or RunContext()
+        thresholds = dict(ctx.settings.get("mount_thresholds") or {})
+        if thresholds or ctx.settings.get("all_mounts"):
+            return self._run_mounts(
+                ctx, disk_threshold, thresholds, all_mounts=bool(ctx.settings.get("all_mounts"))
+            )
 
-        warn_limit = min(disk_threshold + WARN_THRESHOLD_MARGIN, 1.0)
+        home = Path.home()
+        usage = ctx.fact(f"disk_usage:{home}", lambda: disk_usage_summary(home))
+        percent_free = usage["percent_free"]
 
-        if percent_free <= disk_threshold:
-            status = "fail"
+        status = _free_space_status(percent_free, disk_threshold)
+        if status == "fail":
             message = f"Low disk space: {percent_free:.2%} free (<= {disk_threshold:.0%})"
-        elif percent_free <= warn_limit:
-            status = "warn"
+        elif status == "warn":
             message = f"Disk space is getting low: {percent_free:.2%} free"
         else:
-            status = "pass"
             message = f"Disk space healthy: {percent_free:.2%} free"
 
         return CheckResult(name=self.name, status=status, message=message, data=usage)
 
+    def _run_mounts(
+        self,
+        ctx: RunContext,
+        disk_threshold: float,
+        thresholds: dict[str, float],
+        *,
+        all_mounts: bool,
+    ) -> CheckResult:
+        # Shares the fact key with MountsCollector, so the mount table is probed once per run.
+        payload = ctx.fact("mounts", probe_mounts)
+        if not payload.get("supported"):
+            return CheckResult(
+                name=self.name,
+                status="warn",
+                message="Per-mount disk checks are not supported on this platform.",
+            )
+        mounts = {mount["mount_point"]: mount for mount in payload["mounts"]}
+        selected = list(mounts) if all_mounts else []
+        selected += [point for point in thresholds if point not in selected]
+
+        entries: list[dict[str, Any]] = []
+        problems: list[str] = []
+        for point in selected:
+            threshold = thresholds.get(point, disk_threshold)
+            mount = mounts.get(point)
+            entry: dict[str, Any] = {"mount_point": point, "threshold": threshold}
+            if mount is None:
+                entry.update(status="warn", error="not mounted")
+                problems.append(f"{point} is not mounted")
+            elif "error" in mount:
+                entry.update(status="warn", error=mount["error"])
+                problems.append(f"could not stat {point} ({mount['error']})")
+            else:
+                percent_free = mount["percent_free"]
+                inodes_free = mount.get("percent_inodes_free")
+                statuses = [_free_space_status(percent_free, threshold)]
+                if inodes_free is not None:
+                    statuses.append(_free_space_status(inodes_free, threshold))
+                status = worst_status(statuses)
+                entry.update(
+                    status=status, percent_free=percent_free, percent_inodes_free=inodes_free
+                )
+                if status != "pass":
+                    detail = f"{percent_free:.2%} free"
+                    if inodes_free is not None:
+                        detail += f", {inodes_free:.2%} inodes free"
+                    problems.append(f"{point} {detail} (threshold {threshold:.0%})")
+            entries.append(entry)
+
+        status = worst_status(entry["status"] for entry in entries)
+        if status == "fail":
+            message = "Low disk space: " + "; ".join(problems)
+        elif status == "warn":
+            message = "Disk space is getting low: " + "; ".join(problems)
+        else:
+            message = f"Disk space healthy on {len(entries)} mount(s)"
+        measured = [entry["percent_free"] for entry in entries if "percent_free" in entry]
+        data = {"percent_free": min(measured, default=None), "mounts": entries}
+        return CheckResult(name=self.name, status=status, message=message, data=data)
+
 
 class GitInstalledCheck(BaseCheck):
     name = "git_installed"
 
-    def run(self, *, disk_threshold: float = 0.10) -> CheckResult:  # disk_threshold unused
-        found = shutil.which("git") is not None
+    def _resolve(self, ctx: RunContext) -> str | None:
+        # Shares the PATH index with the toolchain check instead of walking PATH again.
+        return resolve(ctx.fact("path_index", lambda: ToolchainCollector().index(ctx)), "git")
+
+    def fingerprint(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> dict[str, Any] | None:
+        resolved = self._resolve(context or RunContext())
+        try:
+            modified = os.stat(resolved).st_mtime_ns if resolved else None
+        except OSError:
+            modified = None
+        return {"path": os.environ.get("PATH", ""), "git": resolved, "mtime": modified}
+
+    def run(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> CheckResult:  # disk_threshold unused
+        found = self._resolve(context or RunContext()) is not None
         if found:
             return CheckResult(
                 name=self.name,
@@ -53,7 +218,14 @@ class GitInstalledCheck(BaseCheck):
 class PythonVersionCheck(BaseCheck):
     name = "python_version"
 
-    def run(self, *, disk_threshold: float = 0.10) -> CheckResult:  # disk_threshold unused
+    def fingerprint(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> dict[str, Any] | None:
+        return {"version_info": list(sys.version_info[:3])}
+
+    def run(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> CheckResult:  # disk_threshold and context unused
         version_info = sys.version_info
         meets_requirement = version_info.major > 3 or (
             version_info.major == 3 and version_info.minor >= 11
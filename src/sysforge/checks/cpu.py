@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+from typing import Any
+
+from ..collectors.cpu import CpuCollector
+from ..context import RunContext
+from .base import BaseCheck, CheckResult, worst_status
+
+# 5-minute load average per core; a sustained run queue above the core count means saturation.
+LOAD_WARN_PER_CORE = 1.0
+LOAD_FAIL_PER_CORE = 2.0
+# Share of time the hypervisor ran something else while this guest wanted the CPU.
+STEAL_WARN = 0.05
+STEAL_FAIL = 0.20
+
+
+# Shared so repeated runs in one process (e.g. `sysforge serve`) measure against the last one.
+_COLLECTOR = CpuCollector()
+
+
+def _measure_cpu(ctx: RunContext) -> dict[str, Any]:
+    collected = ctx.collected("cpu")
+    if isinstance(collected, dict) and collected.get("supported"):
+        return collected
+    return ctx.fact("cpu", lambda: _COLLECTOR.sample(ctx))
+
+
+def _level(value: float, warn: float, fail: float) -> str:
+    if value >= fail:
+        return "fail"
+    if value >= warn:
+        return "warn"
+    return "pass"
+
+
+class CpuSaturationCheck(BaseCheck):
+    """
+    Flag sustained CPU saturation (5-minute load per core) and high steal time.
+    """
+
+    name = "cpu_saturation"
+    # Measuring utilization needs a short sampling window when there is no earlier sample.
+    cost = 2.0
+
+    def run(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> CheckResult:  # disk_threshold unused
+        ctx = context or RunContext()
+        usage = _measure_cpu(ctx)
+        if usage.get("supported"):
+            load = usage["loadavg"]["5m"]
+            cores = usage["cpu_count"] or os.cpu_count() or 1
+            total = usage["total"]
+        else:
+            try:
+                load = os.getloadavg()[1]
+            except OSError:
+                return CheckResult(
+                    name=self.name,
+                    status="pass",
+                    message="CPU load is not available on this platform.",
+                )
+            cores = os.cpu_count() or 1
+            total = {}
+
+        load_per_core = load / cores
+        steal = total.get("steal", 0.0)
+        load_status = _level(load_per_core, LOAD_WARN_PER_CORE, LOAD_FAIL_PER_CORE)
+        steal_status = _level(steal, STEAL_WARN, STEAL_FAIL)
+        status = worst_status((load_status, steal_status))
+
+        problems = []
+        if load_status != "pass":
+            problems.append(f"5m load {load:.2f} on {cores} core(s) ({load_per_core:.2f} per core)")
+        if steal_status != "pass":
+            problems.append(f"steal time {steal:.1%}")
+        if status == "pass":
+            message = f"CPU load healthy: {load_per_core:.2f} per core over 5m"
+        else:
+            message = "CPU under pressure: " + "; ".join(problems)
+
+        data = {
+            "load_5m": load,
+            "cores": cores,
+            "load_per_core": load_per_core,
+            "busy": total.get("busy"),
+            "iowait": total.get("iowait"),
+            "steal": total.get("steal"),
+        }
+        return CheckResult(name=self.name, status=status, message=message, data=data)
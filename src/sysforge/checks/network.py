@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ..collectors.network import NetworkCollector
+from ..context import RunContext
+from .base import BaseCheck, CheckResult, worst_status
+
+# Share of an interface's packets that were errored or dropped.
+INTERFACE_ERROR_WARN = 0.001
+INTERFACE_ERROR_FAIL = 0.01
+# Share of the ephemeral port range tied up in TIME_WAIT.
+TIME_WAIT_WARN = 0.5
+TIME_WAIT_FAIL = 0.8
+# CLOSE_WAIT sockets are connections the local application never closed.
+CLOSE_WAIT_WARN = 500
+CLOSE_WAIT_FAIL = 5000
+
+
+def _network(ctx: RunContext) -> dict[str, Any]:
+    return ctx.fact("network", lambda: NetworkCollector().sample())
+
+
+def _unsupported(name: str) -> CheckResult:
+    return CheckResult(
+        name=name,
+        status="pass",
+        message="Network statistics are not available on this platform.",
+    )
+
+
+class InterfaceErrorsCheck(BaseCheck):
+    """
+    Flag interfaces whose error and drop counters are a noticeable share of their traffic.
+    """
+
+    name = "interface_errors"
+
+    def run(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> CheckResult:  # disk_threshold unused
+        ctx = context or RunContext()
+        network = _network(ctx)
+        if not network.get("supported"):
+            return _unsupported(self.name)
+
+        statuses = ["pass"]
+        problems: list[str] = []
+        flagged: dict[str, float] = {}
+        for name, counters in network["interfaces"].items():
+            packets = counters["rx_packets"] + counters["tx_packets"]
+            bad = sum(
+                counters[field] for field in ("rx_errors", "rx_dropped", "tx_errors", "tx_dropped")
+            )
+            if not packets or not bad:
+                continue
+            share = bad / packets
+            if share >= INTERFACE_ERROR_WARN:
+                statuses.append("fail" if share >= INTERFACE_ERROR_FAIL else "warn")
+                flagged[name] = share
+                problems.append(f"{name} {bad} errors/drops ({share:.2%} of packets)")
+
+        status = worst_status(statuses)
+        if problems:
+            message = "Interface errors: " + "; ".join(problems)
+        else:
+            message = f"No significant errors on {len(network['interfaces'])} interface(s)"
+        return CheckResult(
+            name=self.name, status=status, message=message, data={"interfaces": flagged}
+        )
+
+
+class SocketExhaustionCheck(BaseCheck):
+    """
+    Flag TIME_WAIT pressure on ephemeral ports, CLOSE_WAIT leaks and overflowing listen queues.
+    """
+
+    name = "socket_exhaustion"
+
+    def run(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> CheckResult:  # disk_threshold unused
+        ctx = context or RunContext()
+        network = _network(ctx)
+        if not network.get("supported"):
+            return _unsupported(self.name)
+
+        sockets = network["sockets"]
+        states = sockets["states"]
+        time_wait = states.get("TIME_WAIT", 0)
+        close_wait = states.get("CLOSE_WAIT", 0)
+        ports = sockets.get("ephemeral_ports")
+        overflow_rate = (network["tcp"].get("rates") or {}).get("listen_overflows_per_sec")
+
+        statuses = ["pass"]
+        problems: list[str] = []
+        if ports:
+            share = time_wait / ports
+            if share >= TIME_WAIT_WARN:
+                statuses.append("fail" if share >= TIME_WAIT_FAIL else "warn")
+                problems.append(f"{time_wait} TIME_WAIT sockets ({share:.0%} of ephemeral ports)")
+        if close_wait >= CLOSE_WAIT_WARN:
+            statuses.append("fail" if close_wait >= CLOSE_WAIT_FAIL else "warn")
+            problems.append(f"{close_wait} CLOSE_WAIT sockets")
+        if overflow_rate:
+            statuses.append("warn")
+            problems.append(f"listen queue overflowing at {overflow_rate:.1f}/s")
+
+        status = worst_status(statuses)
+        if problems:
+            message = "Socket pressure: " + "; ".join(problems)
+        else:
+            message = f"{sockets['total']} TCP sockets, no exhaustion"
+        data = {
+            "total": sockets["total"],
+            "time_wait": time_wait,
+            "close_wait": close_wait,
+            "ephemeral_ports": ports,
+            "listeners": sockets["listen"]["sockets"],
+            "listen_overflows": network["tcp"].get("listen_overflows"),
+            "listen_drops": network["tcp"].get("listen_drops"),
+        }
+        return CheckResult(name=self.name, status=status, message=message, data=data)
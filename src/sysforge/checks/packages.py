@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import re
+import sys
+from typing import Any
+
+from ..collectors.packages import PackagesCollector, normalize_name, path_mtimes, search_paths
+from ..context import RunContext
+from .base import BaseCheck, CheckResult
+
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+    from packaging.version import InvalidVersion, Version
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    Requirement = None  # type: ignore[assignment,misc]
+
+MAX_REPORTED = 10
+_NAME_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+def _requirement_problem(
+    requirement: str, installed: dict[str, str]
+) -> tuple[str, str] | None:
+    """
+    Return ("missing" | "conflict", detail) when `requirement` is not satisfied.
+    """
+    if Requirement is None:
+        # Without packaging only unconditional requirements can be checked, by name alone.
+        if ";" in requirement:
+            return None
+        match = _NAME_RE.match(requirement)
+        if match is None or normalize_name(match.group(1)) in installed:
+            return None
+        return "missing", requirement.strip()
+
+    try:
+        parsed = Requirement(requirement)
+    except InvalidRequirement:
+        return None
+    # Requirements that only apply to an extra or another platform are not needed here.
+    if parsed.marker is not None and not parsed.marker.evaluate({"extra": ""}):
+        return None
+    version = installed.get(normalize_name(parsed.name))
+    if version is None:
+        return "missing", str(parsed)
+    if not parsed.specifier:
+        return None
+    try:
+        satisfied = parsed.specifier.contains(Version(version), prereleases=True)
+    except InvalidVersion:
+        return None
+    if satisfied:
+        return None
+    return "conflict", f"{parsed} (installed {version})"
+
+
+class PackageRequirementsCheck(BaseCheck):
+    """
+    Flag installed distributions whose requirements are missing (fail) or at an incompatible
+    version (warn), like `pip check`. Version checks need the optional `packaging` package.
+    """
+
+    name = "package_requirements"
+
+    def fingerprint(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> dict[str, Any] | None:
+        # The same key that invalidates the cached package index.
+        return {
+            "prefix": sys.prefix,
+            "paths": path_mtimes(search_paths()),
+            "packaging": Requirement is not None,
+        }
+
+    def run(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> CheckResult:  # disk_threshold unused
+        ctx = context or RunContext()
+        index = ctx.fact("package_index", lambda: PackagesCollector().index(ctx))
+        distributions = index["distributions"]
+        installed = {normalize_name(dist["name"]): dist["version"] for dist in distributions}
+
+        problems: dict[str, list[str]] = {"missing": [], "conflict": []}
+        for dist in distributions:
+            for requirement in dist["requires"]:
+                problem = _requirement_problem(requirement, installed)
+                if problem is not None:
+                    kind, detail = problem
+                    problems[kind].append(f"{dist['name']} {dist['version']} requires {detail}")
+
+        missing, conflicts = problems["missing"], problems["conflict"]
+        data: dict[str, Any] = {
+            "distributions": len(distributions),
+            "missing": missing[:MAX_REPORTED],
+            "conflicts": conflicts[:MAX_REPORTED],
+            "version_checks": Requirement is not None,
+        }
+        if missing:
+            status = "fail"
+            message = f"{len(missing)} missing requirement(s): " + "; ".join(missing[:3])
+        elif conflicts:
+            status = "warn"
+            message = f"{len(conflicts)} conflicting requirement(s): " + "; ".join(conflicts[:3])
+        else:
+            status = "pass"
+            message = f"All requirements of {len(distributions)} distributions are satisfied"
+        return CheckResult(name=self.name, status=status, message=message, data=data)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ..collectors.processes import scan_processes
+from ..context import RunContext
+from ..utils import memory_bytes
+from .base import BaseCheck, CheckResult, worst_status
+
+ZOMBIE_WARN = 20
+ZOMBIE_FAIL = 200
+# A process averaging this much of one core over its lifetime, for at least this long.
+RUNAWAY_CPU_PERCENT = 90.0
+RUNAWAY_MIN_SECONDS = 600.0
+# Share of physical memory held by a single process.
+RSS_WARN_SHARE = 0.5
+RSS_FAIL_SHARE = 0.8
+
+
+class ProcessesCheck(BaseCheck):
+    """
+    Flag zombie accumulation and runaway processes (sustained CPU burn or outsized RSS).
+    """
+
+    name = "processes"
+    # A full process table scan is the most expensive probe when the collector has not run.
+    cost = 3.0
+
+    def run(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> CheckResult:  # disk_threshold unused
+        ctx = context or RunContext()
+        table = ctx.fact("processes", scan_processes)
+        if not table.get("supported"):
+            return CheckResult(
+                name=self.name,
+                status="pass",
+                message="Process table is not available on this platform.",
+            )
+
+        statuses = ["pass"]
+        problems: list[str] = []
+
+        zombies = table["zombies"]["count"]
+        if zombies >= ZOMBIE_WARN:
+            statuses.append("fail" if zombies >= ZOMBIE_FAIL else "warn")
+            parents = ", ".join(
+                f"{parent['name'] or '?'} (pid {parent['pid']}): {parent['zombies']}"
+                for parent in table["zombies"]["parents"]
+            )
+            problems.append(f"{zombies} zombie processes" + (f" [{parents}]" if parents else ""))
+
+        runaways: dict[int, dict[str, Any]] = {}
+        for process in table["top_cpu"]:
+            cpu_percent = process.get("cpu_percent")
+            elapsed = process.get("elapsed_seconds")
+            if cpu_percent is None or elapsed is None:
+                continue
+            if cpu_percent >= RUNAWAY_CPU_PERCENT and elapsed >= RUNAWAY_MIN_SECONDS:
+                runaways[process["pid"]] = process
+                statuses.append("warn")
+                problems.append(
+                    f"{process['name']} (pid {process['pid']}) averaging {cpu_percent:.0f}% CPU"
+                )
+
+        total_memory = ctx.fact("memory_bytes", memory_bytes)
+        if total_memory:
+            for process in table["top_rss"]:
+                share = process["rss_bytes"] / total_memory
+                if share < RSS_WARN_SHARE:
+                    break
+                runaways[process["pid"]] = process
+                statuses.append("fail" if share >= RSS_FAIL_SHARE else "warn")
+                problems.append(
+                    f"{process['name']} (pid {process['pid']}) using {share:.0%} of memory"
+                )
+
+        status = worst_status(statuses)
+        if problems:
+            message = "Process problems: " + "; ".join(problems)
+        else:
+            message = f"{table['count']} processes, {zombies} zombies, no runaways"
+        data = {
+            "count": table["count"],
+            "zombies": zombies,
+            "runaways": [
+                {key: process[key] for key in ("pid", "name", "cpu_percent", "rss_bytes")}
+                for process in runaways.values()
+            ],
+        }
+        return CheckResult(name=self.name, status=status, message=message, data=data)
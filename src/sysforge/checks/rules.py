@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from ..collectors import get_collectors
+from ..context import RunContext
+from ..rules import Rule, compile_rules, rule_outcome
+from .base import BaseCheck, CheckResult
+
+
+def _payload(ctx: RunContext, name: str) -> Any:
+    payload = ctx.collected(name)
+    if payload is not None:
+        return payload
+    collector = next((item for item in get_collectors() if item.name == name), None)
+    if collector is None:
+        return None
+    # `sysforge doctor` runs no collectors; collect once per run for every rule that needs it.
+    return ctx.fact(f"collected:{name}", lambda: collector.collect(ctx))
+
+
+class RuleCheck(BaseCheck):
+    """
+    Run one compiled rule from the `rules` setting against this run's collector payloads.
+
+    Payloads recorded by the run's collectors are used as they are; only the collectors a
+    rule reads are run otherwise. A rule whose fields are missing passes as skipped.
+    """
+
+    cost = 0.5
+
+    def __init__(self, rule: Rule) -> None:
+        self.rule = rule
+        self.name = f"rule.{rule.name}"
+
+    def run(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> CheckResult:  # disk_threshold unused
+        ctx = context or RunContext()
+        sources = {str(path[0]) for path in self.rule.fields.values()}
+        collected = {name: _payload(ctx, name) for name in sorted(sources)}
+        outcome = rule_outcome(self.rule, self.rule.matches(collected))
+        data = {"when": self.rule.when, "values": self.rule.values(collected)}
+        if outcome == "unknown":
+            missing = [name for name, value in data["values"].items() if value is None]
+            return CheckResult(
+                name=self.name,
+                status="pass",
+                message=f"Not evaluated; missing {', '.join(missing) or 'comparable values'}.",
+                data=data,
+                skipped=True,
+            )
+        if outcome == "pass":
+            return CheckResult(
+                name=self.name, status="pass", message=f"Not matched: {self.rule.when}", data=data
+            )
+        message = self.rule.message or f"Matched: {self.rule.when}"
+        return CheckResult(name=self.name, status=self.rule.status, message=message, data=data)
+
+
+def rule_checks(settings: Mapping[str, Any]) -> list[BaseCheck]:
+    """
+    Build a check for every rule in the run's `rules` setting.
+    """
+    definitions: Sequence[Mapping[str, Any]] = settings.get("rules") or ()
+    return [RuleCheck(rule) for rule in compile_rules(definitions)]
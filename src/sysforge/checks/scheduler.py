@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import heapq
+import time
+from collections.abc import Callable, Iterator, MutableMapping, Sequence
+
+from ..parallel import CancelScope, ThreadTaskPool
+from .base import DEFAULT_TIMEOUT_STATUS, BaseCheck, CheckResult, CheckStatus
+
+
+def _validate(checks: Sequence[BaseCheck]) -> dict[str, BaseCheck]:
+    by_name = {check.name: check for check in checks}
+    for check in checks:
+        for dependency in check.depends_on:
+            if dependency not in by_name:
+                raise ValueError(f"Check {check.name!r} depends on unknown check {dependency!r}.")
+
+    visiting: set[str] = set()
+    done: set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle detected at check {name!r}.")
+        visiting.add(name)
+        for dependency in by_name[name].depends_on:
+            visit(dependency)
+        visiting.discard(name)
+        done.add(name)
+
+    for name in by_name:
+        visit(name)
+    return by_name
+
+
+def _skipped(check: BaseCheck, prerequisite: str) -> CheckResult:
+    return CheckResult(
+        name=check.name,
+        status="warn",
+        message=f"Skipped: prerequisite {prerequisite!r} failed.",
+        skipped=True,
+    )
+
+
+def _timed_out(
+    check: BaseCheck, status: CheckStatus, elapsed_ms: float, budget: float | None
+) -> CheckResult:
+    if elapsed_ms:
+        message = f"Timed out after {elapsed_ms / 1000:.1f}s; the check was abandoned."
+    else:
+        message = "Not run: the run's time budget was used up."
+    return CheckResult(
+        name=check.name,
+        status=status,
+        message=message,
+        data={"elapsed_ms": elapsed_ms, "timeout_seconds": budget},
+        timed_out=True,
+    )
+
+
+def _still_running(check: BaseCheck, status: CheckStatus, budget: float | None) -> CheckResult:
+    return CheckResult(
+        name=check.name,
+        status=status,
+        message="Not run: an earlier run of the check timed out and has not returned yet.",
+        data={"elapsed_ms": 0.0, "timeout_seconds": budget},
+        timed_out=True,
+    )
+
+
+def schedule_checks(
+    checks: Sequence[BaseCheck],
+    execute: Callable[[BaseCheck], CheckResult],
+    *,
+    jobs: int = 1,
+    timeout: float | None = None,
+    deadline: float | None = None,
+    timeout_status: CheckStatus = DEFAULT_TIMEOUT_STATUS,
+    abandoned: MutableMapping[str, CancelScope] | None = None,
+) -> Iterator[tuple[BaseCheck, CheckResult]]:
+    """
+    Run checks in dependency order and yield `(check, result)` pairs as they finish.
+
+    Independent checks run concurrently on up to `jobs` threads, highest `cost` first. A check
+    whose prerequisite failed, was skipped or timed out is not executed; it yields a skipped
+    result.
+
+    Each check may run for its own `timeout` or else the given `timeout` seconds, and none past
+    `deadline` (a `time.monotonic()` value). An overrun check is abandoned, its child processes
+    are killed, and it yields a `timed_out` result with status `timeout_status`.
+
+    Callers that run checks repeatedly pass the same `abandoned` mapping each time: abandoned
+    checks are recorded in it, and a check whose earlier invocation is still stuck is reported
+    as timed out again instead of being started alongside it.
+    """
+    by_name = _validate(checks)
+    order = {check.name: index for index, check in enumerate(checks)}
+    waiting_on = {check.name: set(check.depends_on) for check in checks}
+    dependents: dict[str, list[str]] = {name: [] for name in by_name}
+    for check in checks:
+        for dependency in check.depends_on:
+            dependents[dependency].append(check.name)
+
+    ready: list[tuple[float, int, str]] = []
+    blocked: dict[str, str] = {}
+
+    def release(name: str, result: CheckResult) -> None:
+        for dependent in dependents[name]:
+            if result.status == "fail" or result.skipped or result.timed_out:
+                blocked.setdefault(dependent, blocked.get(name, name))
+            waiting_on[dependent].discard(name)
+            if not waiting_on[dependent]:
+                candidate = by_name[dependent]
+                heapq.heappush(ready, (-candidate.cost, order[dependent], dependent))
+
+    for check in checks:
+        if not check.depends_on:
+            heapq.heappush(ready, (-check.cost, order[check.name], check.name))
+
+    budgets = {
+        check.name: timeout if check.timeout is None else check.timeout for check in checks
+    }
+    # Deadlines need a worker thread to abandon, so bounded runs use the pool even for one job.
+    bounded = deadline is not None or any(budget is not None for budget in budgets.values())
+    pool = ThreadTaskPool(jobs=jobs, deadline=deadline) if jobs > 1 or bounded else None
+    scopes: dict[str, CancelScope] = {}
+    try:
+        while ready or (pool is not None and len(pool)):
+            while ready and (pool is None or len(pool) < jobs):
+                _, _, name = heapq.heappop(ready)
+                check = by_name[name]
+                if abandoned is not None and name in abandoned and abandoned[name].closed:
+                    # The abandoned invocation has returned; the check may run again.
+                    del abandoned[name]
+                if name in blocked:
+                    result = _skipped(check, blocked[name])
+                elif abandoned is not None and name in abandoned:
+                    result = _still_running(check, timeout_status, budgets[name])
+                elif deadline is not None and time.monotonic() >= deadline:
+                    result = _timed_out(check, timeout_status, 0.0, budgets[name])
+                elif pool is None:
+                    result = execute(check)
+                else:
+                    scopes[name] = pool.submit(
+                        name, lambda check=check: execute(check), timeout=budgets[name]
+                    )
+                    continue
+                release(name, result)
+                yield check, result
+
+            if pool is not None and len(pool):
+                outcome = pool.next_outcome()
+                if outcome.status == "error":
+                    assert outcome.error is not None
+                    raise outcome.error
+                check = by_name[outcome.name]
+                if outcome.status == "timeout":
+                    if abandoned is not None:
+                        abandoned[outcome.name] = scopes[outcome.name]
+                    result = _timed_out(
+                        check, timeout_status, outcome.elapsed_ms, budgets[outcome.name]
+                    )
+                else:
+                    result = outcome.value
+                release(outcome.name, result)
+                yield check, result
+    finally:
+        if pool is not None:
+            pool.close()
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import tomllib
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from ..collectors.packages import path_mtimes
+from ..collectors.toolchain import ToolchainCollector, resolve_all
+from ..context import RunContext
+from ..parallel import run_command, run_tasks
+from .base import BaseCheck, CheckResult
+
+DEFAULT_VERSION_ARGS = ("--version",)
+DEFAULT_VERSION_PATTERN = r"(\d+(?:\.\d+)+)"
+DEFAULT_PROBE_JOBS = 8
+DEFAULT_PROBE_TIMEOUT = 5.0
+MAX_REPORTED = 10
+
+_VERSION_RE = re.compile(r"\d+(?:\.\d+)*")
+
+
+def version_tuple(version: str) -> tuple[int, ...]:
+    """
+    Parse the leading dotted number of `version` ("2.43.0.windows.1" -> (2, 43, 0)).
+    """
+    match = _VERSION_RE.search(version)
+    if match is None:
+        raise ValueError(f"no version number in {version!r}")
+    return tuple(int(part) for part in match.group(0).split("."))
+
+
+def _tool(name: str, spec: Any) -> dict[str, Any]:
+    if isinstance(spec, str):
+        spec = {"min_version": spec}
+    if not isinstance(spec, Mapping):
+        raise ValueError(f"tool {name!r} must map to a minimum version or a table")
+    unknown = set(spec) - {"min_version", "version_args", "version_pattern"}
+    if unknown:
+        raise ValueError(f"tool {name!r} has unknown key(s): {', '.join(sorted(unknown))}")
+    min_version = spec.get("min_version")
+    if min_version is not None:
+        version_tuple(str(min_version))
+    args = spec.get("version_args", list(DEFAULT_VERSION_ARGS))
+    if not isinstance(args, list) or not all(isinstance(arg, str) for arg in args):
+        raise ValueError(f"tool {name!r}: version_args must be a list of strings")
+    pattern = spec.get("version_pattern", DEFAULT_VERSION_PATTERN)
+    try:
+        re.compile(pattern)
+    except (re.error, TypeError) as exc:
+        raise ValueError(f"tool {name!r}: invalid version_pattern: {exc}") from None
+    return {
+        "name": name,
+        "min_version": None if min_version is None else str(min_version),
+        "version_args": args,
+        "version_pattern": pattern,
+    }
+
+
+def parse_toolchain(data: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Validate a toolchain definition into the `toolchain` run setting.
+
+    `tools` is a list of names, or a table mapping each name to a minimum version string or
+    to a table with `min_version`, `version_args` and `version_pattern`. `probe_jobs` and
+    `probe_timeout` bound the `--version` probes.
+    """
+    tools = data.get("tools")
+    if isinstance(tools, list) and all(isinstance(name, str) for name in tools):
+        tools = {name: {} for name in tools}
+    if not isinstance(tools, Mapping) or not tools:
+        raise ValueError("toolchain needs a non-empty `tools` list or table")
+    jobs = data.get("probe_jobs", DEFAULT_PROBE_JOBS)
+    timeout = data.get("probe_timeout", DEFAULT_PROBE_TIMEOUT)
+    if not isinstance(jobs, int) or isinstance(jobs, bool) or jobs < 1:
+        raise ValueError("probe_jobs must be a positive integer")
+    if not isinstance(timeout, (int, float)) or isinstance(timeout, bool) or timeout <= 0:
+        raise ValueError("probe_timeout must be a positive number of seconds")
+    return {
+        "tools": [_tool(str(name), spec) for name, spec in tools.items()],
+        "probe_jobs": jobs,
+        "probe_timeout": float(timeout),
+    }
+
+
+def load_toolchain(path: Path) -> dict[str, Any]:
+    """
+    Read a toolchain definition from a TOML file (`.toml`) or a JSON file.
+    """
+    try:
+        if path.suffix.lower() == ".toml":
+            data = tomllib.loads(path.read_text())
+        else:
+            data = json.loads(path.read_text())
+    except (tomllib.TOMLDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError(f"{path}: {exc}") from None
+    if not isinstance(data, Mapping):
+        raise ValueError(f"{path}: expected a table of settings")
+    return parse_toolchain(data)
+
+
+def probe_version(path: str, args: list[str], pattern: str, *, timeout: float) -> str | None:
+    """
+    Run `path args...` and return the first `pattern` match in its output, or None.
+
+    A probe that overruns `timeout` (or the check's deadline) is killed with its process group.
+    """
+    completed = run_command(
+        [path, *args],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        timeout=timeout,
+    )
+    match = re.search(pattern, f"{completed.stdout}\n{completed.stderr}")
+    if match is None:
+        return None
+    return match.group(1) if match.groups() else match.group(0)
+
+
+def _mtime(path: str | None) -> int | None:
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class ToolchainCheck(BaseCheck):
+    """
+    Verify the tools in the run's `toolchain` setting are on PATH and new enough.
+
+    Every tool is resolved against one shared PATH index instead of a `which` walk per tool.
+    Tools with a `min_version` are probed with their `version_args` in a bounded pool of
+    `probe_jobs` subprocesses, each under `probe_timeout` seconds. Missing or outdated tools
+    fail; a probe that errors, times out or prints no version warns.
+    """
+
+    name = "toolchain"
+    cost = 5.0
+
+    def _index(self, ctx: RunContext) -> dict[str, Any]:
+        return ctx.fact("path_index", lambda: ToolchainCollector().index(ctx))
+
+    def fingerprint(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> dict[str, Any] | None:
+        ctx = context or RunContext()
+        toolchain = ctx.settings.get("toolchain")
+        if not toolchain:
+            return {"toolchain": None}
+        index = self._index(ctx)
+        resolved = resolve_all(index, [tool["name"] for tool in toolchain["tools"]])
+        # Upgrading a tool in place changes its own mtime, not its directory's.
+        return {
+            "toolchain": toolchain,
+            "directories": path_mtimes(index["directories"]),
+            "tools": {name: [path, _mtime(path)] for name, path in resolved.items()},
+        }
+
+    def run(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> CheckResult:  # disk_threshold unused
+        ctx = context or RunContext()
+        toolchain = ctx.settings.get("toolchain")
+        if not toolchain:
+            return CheckResult(
+                name=self.name,
+                status="pass",
+                message="No toolchain requirements configured.",
+            )
+        tools = toolchain["tools"]
+        resolved = resolve_all(self._index(ctx), [tool["name"] for tool in tools])
+        missing = [tool["name"] for tool in tools if resolved[tool["name"]] is None]
+
+        probes = {
+            tool["name"]: (
+                lambda tool=tool: probe_version(
+                    resolved[tool["name"]],
+                    tool["version_args"],
+                    tool["version_pattern"],
+                    timeout=toolchain["probe_timeout"],
+                )
+            )
+            for tool in tools
+            if tool["min_version"] is not None and resolved[tool["name"]] is not None
+        }
+        versions: dict[str, str | None] = {}
+        unprobed: list[str] = []
+        for outcome in run_tasks(probes, jobs=min(toolchain["probe_jobs"], len(probes) or 1)):
+            if outcome.status == "ok" and _VERSION_RE.search(outcome.value or ""):
+                versions[outcome.name] = outcome.value
+            else:
+                versions[outcome.name] = None
+                if outcome.error is not None:
+                    reason = f"{type(outcome.error).__name__}: {outcome.error}"
+                else:
+                    reason = "no version in output"
+                unprobed.append(f"{outcome.name} ({reason})")
+
+        outdated = [
+            f"{tool['name']} {versions[tool['name']]} < {tool['min_version']}"
+            for tool in tools
+            if versions.get(tool["name"]) is not None
+            and version_tuple(versions[tool["name"]]) < version_tuple(tool["min_version"])
+        ]
+        data: dict[str, Any] = {
+            "tools": {
+                name: {"path": path, "version": versions.get(name)}
+                for name, path in resolved.items()
+            },
+            "missing": missing[:MAX_REPORTED],
+            "outdated": outdated[:MAX_REPORTED],
+            "unprobed": unprobed[:MAX_REPORTED],
+        }
+        if missing or outdated:
+            problems = [f"missing: {', '.join(missing[:5])}"] if missing else []
+            if outdated:
+                problems.append(f"outdated: {'; '.join(outdated[:5])}")
+            status = "fail"
+            count = len(missing) + len(outdated)
+            message = f"{count} toolchain problem(s): " + "; ".join(problems)
+        elif unprobed:
+            status = "warn"
+            message = f"Could not determine the version of {len(unprobed)} tool(s): "
+            message += "; ".join(unprobed[:3])
+        else:
+            status = "pass"
+            message = f"All {len(tools)} required tools are available."
+        return CheckResult(name=self.name, status=status, message=message, data=data)
@@ -1,20 +1,57 @@
 from __future__ import annotations
 
+import json
+import math
+import os
+import re
+import sqlite3
 import sys
+import time
+from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
 import typer
 
 from . import __version__
-from .checks import run_checks
-from .collectors import run_collectors
-from .reporting import assemble_report, write_report_file, write_report_markdown
-from .utils import json_dump
+from .aggregate import aggregate_reports, iter_report_paths, load_report
+from .anomaly import AnomalyDetector
+from .bench import DEFAULT_SIZES, compare_to_baseline, run_benchmarks
+from .cache import CollectorCache
+from .checks import iter_checks, run_checks
+from .checks.base import STATUS_SEVERITY
+from .checks.core import parse_mount_thresholds
+from .checks.toolchain import load_toolchain
+from .collectors import get_collectors, iter_collectors, run_collectors
+from .context import RunContext
+from .du import disk_usage_tree
+from .exporter import Exporter, MetricsServer
+from .history import (
+    HistoryStore,
+    default_history_path,
+    report_from_records,
+    report_timestamp,
+)
+from .parallel import EXECUTOR_MODES
+from .reporting import (
+    assemble_report,
+    iter_report_records,
+    write_report_file,
+    write_report_markdown,
+)
+from .rules import evaluate_reports, load_rules
+from .streaming import check_record, collector_record, open_ndjson, summary_record
+from .timing import profiled
+from .tsdb import DEFAULT_METRICS, MetricStore, open_or_create
+from .utils import flatten_metrics, json_dump
+from .watch import Sampler, parse_duration, parse_interval_overrides, parse_time
 
 app = typer.Typer(
     add_completion=False,
     help="sysforge — collect environment data, run health checks, and write reports.",
 )
+history_app = typer.Typer(help="Record report runs in a local database and query trends.")
+app.add_typer(history_app, name="history")
 
 def _exit_code_from_summary(summary: object) -> int:
     """Map doctor `summary` to CLI exit codes.
@@ -52,11 +89,105 @@ def _validate_threshold(value: float) -> float:
 
 def _validate_report_format(value: str) -> str:
     normalized = value.lower()
-    if normalized not in {"json", "md"}:
-        raise typer.BadParameter("format must be either 'json' or 'md'")
+    if normalized not in {"json", "md", "ndjson"}:
+        raise typer.BadParameter("format must be json, md or ndjson")
+    return normalized
+
+
+def _validate_stream_format(value: str) -> str:
+    normalized = value.lower()
+    if normalized not in {"json", "ndjson"}:
+        raise typer.BadParameter("format must be either 'json' or 'ndjson'")
     return normalized
 
 
+def _validate_executor(value: str) -> str:
+    normalized = value.lower()
+    if normalized not in EXECUTOR_MODES:
+        raise typer.BadParameter("executor must be either 'thread' or 'process'")
+    return normalized
+
+
+def _validate_collector_timeout(value: float | None) -> float | None:
+    if value is not None and value <= 0:
+        raise typer.BadParameter("collector-timeout must be greater than 0")
+    return value
+
+
+def _validate_seconds(param: typer.CallbackParam, value: float | None) -> float | None:
+    if value is not None and value <= 0:
+        raise typer.BadParameter(f"{param.opts[0].lstrip('-')} must be greater than 0")
+    return value
+
+
+def _validate_timeout_status(value: str) -> str:
+    normalized = value.lower()
+    if normalized not in STATUS_SEVERITY:
+        raise typer.BadParameter("timeout-status must be pass, warn or fail")
+    return normalized
+
+
+_TIMEOUT_OPTION = typer.Option(
+    None,
+    "--timeout",
+    callback=_validate_seconds,
+    help="Wall-clock budget in seconds for the whole run; work still running is abandoned.",
+)
+_CHECK_TIMEOUT_OPTION = typer.Option(
+    None,
+    "--check-timeout",
+    callback=_validate_seconds,
+    help="Seconds each check may run before it is abandoned and its child processes killed "
+    "(default: no limit).",
+)
+_TIMEOUT_STATUS_OPTION = typer.Option(
+    "fail",
+    "--timeout-status",
+    callback=_validate_timeout_status,
+    help="Status counted for a check that times out: pass, warn or fail.",
+)
+
+
+def _deadline(timeout: float | None) -> float | None:
+    return None if timeout is None else time.monotonic() + timeout
+
+
+def _collector_cache(no_cache: bool, refresh: bool) -> CollectorCache | None:
+    if no_cache and refresh:
+        raise typer.BadParameter("--no-cache and --refresh cannot be combined")
+    if no_cache:
+        return None
+    return CollectorCache(refresh=refresh)
+
+
+def _run_settings(
+    mount_thresholds: list[str],
+    all_mounts: bool,
+    toolchain: Path | None,
+    rules: Path | None = None,
+) -> dict[str, Any]:
+    try:
+        thresholds = parse_mount_thresholds(mount_thresholds)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+    settings: dict[str, Any] = {"mount_thresholds": thresholds, "all_mounts": all_mounts}
+    if toolchain is not None:
+        try:
+            settings["toolchain"] = load_toolchain(toolchain)
+        except (OSError, ValueError) as exc:
+            raise typer.BadParameter(str(exc), param_hint="--toolchain") from exc
+    if rules is not None:
+        settings["rules"] = _load_rules(rules)
+    return settings
+
+
+def _load_rules(path: Path) -> list[dict[str, Any]]:
+    try:
+        return load_rules(path)
+    except (OSError, ValueError) as exc:
+        raise typer.BadParameter(str(exc), param_hint="--rules") from exc
+
+
 @app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
@@ -77,6 +208,20 @@ def main(
         typer.echo(ctx.get_help())
 
 
+def _finish_with_summary(summary: Any) -> None:
+    try:
+        typer.echo(
+            f"Summary: {summary['pass']} pass, {summary['warn']} warn, {summary['fail']} fail",
+            file=sys.stderr,
+        )
+    except Exception as exc:
+        raise typer.Exit(code=2) from exc
+
+    exit_code = _exit_code_from_summary(summary)
+    if exit_code:
+        raise typer.Exit(code=exit_code)
+
+
 @app.command()
 def collect(
     pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON output."),
@@ -87,12 +232,65 @@ def collect(
         help="Optional file path to write the JSON collection.",
         path_type=Path,
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of collectors to run concurrently.",
+    ),
+    collector_timeout: float | None = typer.Option(
+        None,
+        "--collector-timeout",
+        callback=_validate_collector_timeout,
+        help="Per-collector wall-clock budget in seconds; overruns are reported as timeouts.",
+    ),
+    executor: str = typer.Option(
+        "thread",
+        "--executor",
+        help="Run collectors in worker threads or in killable child processes.",
+        callback=_validate_executor,
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore the on-disk collector cache and do not update it.",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Recompute cached collector output and overwrite the cache.",
+    ),
+    output_format: str = typer.Option(
+        "json",
+        "--format",
+        "-f",
+        help="Emit one JSON document, or stream NDJSON records as collectors finish.",
+        callback=_validate_stream_format,
+    ),
 ) -> None:
     """
     Collect system information and emit JSON.
     """
+    context = RunContext(cache=_collector_cache(no_cache, refresh))
+    if output_format == "ndjson":
+        try:
+            with open_ndjson(output) as writer:
+                for name, payload in iter_collectors(
+                    jobs=jobs, timeout=collector_timeout, executor=executor, context=context
+                ):
+                    writer.write(collector_record(name, payload))
+        except Exception as exc:  # pragma: no cover - defensive
+            typer.echo(f"Error collecting system info: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+        if output:
+            typer.echo(f"Appended collection to {output}")
+        return
+
     try:
-        data = run_collectors()
+        data = run_collectors(
+            jobs=jobs, timeout=collector_timeout, executor=executor, context=context
+        )
     except Exception as exc:  # pragma: no cover - defensive
         typer.echo(f"Error collecting system info: {exc}", err=True)
         raise typer.Exit(code=1) from exc
@@ -126,12 +324,113 @@ def doctor(
         help="Optional file path to write the JSON check results.",
         path_type=Path,
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of independent checks to run concurrently.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore the on-disk cache of package and PATH indexes and do not update it.",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Recompute cached package and PATH indexes and overwrite the cache.",
+    ),
+    mount_threshold: list[str] = typer.Option(
+        [],
+        "--mount-threshold",
+        help="Check free space on a mount with its own threshold (MOUNT=FRACTION, repeatable).",
+    ),
+    all_mounts: bool = typer.Option(
+        False,
+        "--all-mounts",
+        help="Check free space and inodes on every mount instead of the home directory.",
+    ),
+    toolchain: Path | None = typer.Option(
+        None,
+        "--toolchain",
+        help="TOML or JSON file listing required tools and minimum versions.",
+        path_type=Path,
+    ),
+    rules: Path | None = typer.Option(
+        None,
+        "--rules",
+        help="TOML or JSON file of declarative rules to run as extra checks.",
+        path_type=Path,
+    ),
+    output_format: str = typer.Option(
+        "json",
+        "--format",
+        "-f",
+        help="Emit one JSON document, or stream NDJSON records as checks finish.",
+        callback=_validate_stream_format,
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Reuse stored results of checks whose inputs have not changed.",
+    ),
+    timeout: float | None = _TIMEOUT_OPTION,
+    check_timeout: float | None = _CHECK_TIMEOUT_OPTION,
+    timeout_status: str = _TIMEOUT_STATUS_OPTION,
 ) -> None:
     """
     Run health checks and report pass/warn/fail statuses.
+
+    With --incremental, results are marked "fresh" or "cached". Checks that overrun
+    --check-timeout or the --timeout budget are marked "timed_out" and counted as
+    --timeout-status.
     """
+    deadline = _deadline(timeout)
+    cache = _collector_cache(no_cache, refresh)
+    if incremental and cache is None:
+        raise typer.BadParameter("--incremental needs the on-disk cache; drop --no-cache")
+    context = RunContext(
+        cache=cache, settings=_run_settings(mount_threshold, all_mounts, toolchain, rules)
+    )
+    result_cache = cache if incremental else None
+    limits: dict[str, Any] = {
+        "timeout": check_timeout,
+        "deadline": deadline,
+        "timeout_status": timeout_status,
+    }
+    if output_format == "ndjson":
+        summary = {"pass": 0, "warn": 0, "fail": 0}
+        try:
+            with open_ndjson(output) as writer:
+                for result in iter_checks(
+                    disk_threshold=disk_threshold,
+                    jobs=jobs,
+                    context=context,
+                    result_cache=result_cache,
+                    **limits,
+                ):
+                    summary[result.status] += 1
+                    writer.write(check_record(result))
+                writer.write(summary_record(summary))
+        except Exception as exc:  # pragma: no cover - defensive
+            typer.echo(f"Error running checks: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+        if output:
+            typer.echo(f"Appended doctor results to {output}")
+        exit_code = _exit_code_from_summary(summary)
+        if exit_code:
+            raise typer.Exit(code=exit_code)
+        return
+
     try:
-        checks = run_checks(disk_threshold=disk_threshold)
+        checks = run_checks(
+            disk_threshold=disk_threshold,
+            jobs=jobs,
+            context=context,
+            result_cache=result_cache,
+            **limits,
+        )
     except Exception as exc:  # pragma: no cover - defensive
         typer.echo(f"Error running checks: {exc}", err=True)
         raise typer.Exit(code=1) from exc
@@ -151,6 +450,33 @@ def doctor(
         raise typer.Exit(code=exit_code)
 
 
+def _open_history(path: Path | None, *, must_exist: bool = False) -> HistoryStore:
+    db_path = path or default_history_path()
+    if must_exist and not db_path.exists():
+        typer.echo(
+            f"No history database at {db_path}; record runs with `report --history`.", err=True
+        )
+        raise typer.Exit(code=1)
+    try:
+        return HistoryStore(db_path)
+    except (OSError, ValueError) as exc:
+        typer.echo(f"Failed to open history database: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+
+def _record_history(report_data: dict[str, Any], path: Path | None) -> None:
+    with _open_history(path) as store:
+        try:
+            run_id = store.record(report_data)
+        except (OSError, ValueError, sqlite3.Error) as exc:
+            typer.echo(f"Failed to record history: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+    if run_id is None:
+        typer.echo(f"Run already recorded in {store.path}")
+    else:
+        typer.echo(f"Recorded run in {store.path}")
+
+
 @app.command()
 def report(
     output: Path | None = typer.Option(
@@ -176,17 +502,149 @@ def report(
         callback=_validate_threshold,
         help="Minimum free disk fraction before warning/fail.",
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of collectors and independent checks to run concurrently.",
+    ),
+    collector_timeout: float | None = typer.Option(
+        None,
+        "--collector-timeout",
+        callback=_validate_collector_timeout,
+        help="Per-collector wall-clock budget in seconds; overruns are reported as timeouts.",
+    ),
+    executor: str = typer.Option(
+        "thread",
+        "--executor",
+        help="Run collectors in worker threads or in killable child processes.",
+        callback=_validate_executor,
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore the on-disk collector cache and do not update it.",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Recompute cached collector output and overwrite the cache.",
+    ),
+    mount_threshold: list[str] = typer.Option(
+        [],
+        "--mount-threshold",
+        help="Check free space on a mount with its own threshold (MOUNT=FRACTION, repeatable).",
+    ),
+    all_mounts: bool = typer.Option(
+        False,
+        "--all-mounts",
+        help="Check free space and inodes on every mount instead of the home directory.",
+    ),
+    toolchain: Path | None = typer.Option(
+        None,
+        "--toolchain",
+        help="TOML or JSON file listing required tools and minimum versions.",
+        path_type=Path,
+    ),
+    rules: Path | None = typer.Option(
+        None,
+        "--rules",
+        help="TOML or JSON file of declarative rules to run as extra checks.",
+        path_type=Path,
+    ),
+    profile: Path | None = typer.Option(
+        None,
+        "--profile",
+        help="Profile the run with cProfile and write the stats to this .pstats file "
+        "(worker threads are not profiled; use --jobs 1 for a complete profile).",
+        path_type=Path,
+    ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Reuse stored results of checks whose inputs have not changed.",
+    ),
+    history: bool = typer.Option(
+        False,
+        "--history",
+        help="Also record the run in the history database for `sysforge history`.",
+    ),
+    history_db: Path | None = typer.Option(
+        None,
+        "--history-db",
+        help="History database path (default: $XDG_DATA_HOME/sysforge/history.sqlite3).",
+        path_type=Path,
+    ),
+    timeout: float | None = _TIMEOUT_OPTION,
+    check_timeout: float | None = _CHECK_TIMEOUT_OPTION,
+    timeout_status: str = _TIMEOUT_STATUS_OPTION,
 ) -> None:
     """
     Collect system data, run checks, and write a combined report.
+
+    --timeout bounds collectors and checks together.
     """
+    deadline = _deadline(timeout)
     report_format = output_format
+    cache = _collector_cache(no_cache, refresh)
+    if incremental and cache is None:
+        raise typer.BadParameter("--incremental needs the on-disk cache; drop --no-cache")
+    settings = _run_settings(mount_threshold, all_mounts, toolchain, rules)
+
+    if report_format == "ndjson":
+        stream_path = output or Path("sysforge-report.ndjson")
+        streamed_summary: object = None
+        records: list[dict[str, Any]] = []
+        try:
+            with profiled(profile), open_ndjson(stream_path) as writer:
+                for record in iter_report_records(
+                    disk_threshold=disk_threshold,
+                    jobs=jobs,
+                    collector_timeout=collector_timeout,
+                    executor=executor,
+                    cache=cache,
+                    settings=settings,
+                    incremental=incremental,
+                    check_timeout=check_timeout,
+                    deadline=deadline,
+                    timeout_status=timeout_status,
+                ):
+                    writer.write(record)
+                    if history:
+                        records.append(record)
+                    if record["type"] == "summary":
+                        streamed_summary = record["summary"]
+        except Exception as exc:  # pragma: no cover - defensive
+            typer.echo(f"Error generating report: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+        typer.echo(f"Appended report to {stream_path}")
+        if profile:
+            typer.echo(f"Wrote profile to {profile}")
+        if history:
+            _record_history(report_from_records(records), history_db)
+        _finish_with_summary(streamed_summary)
+        return
 
     try:
-        report_data = assemble_report(disk_threshold=disk_threshold)
+        with profiled(profile):
+            report_data = assemble_report(
+                disk_threshold=disk_threshold,
+                jobs=jobs,
+                collector_timeout=collector_timeout,
+                executor=executor,
+                cache=cache,
+                settings=settings,
+                incremental=incremental,
+                check_timeout=check_timeout,
+                deadline=deadline,
+                timeout_status=timeout_status,
+            )
     except Exception as exc:  # pragma: no cover - defensive
         typer.echo(f"Error generating report: {exc}", err=True)
         raise typer.Exit(code=1) from exc
+    if profile:
+        typer.echo(f"Wrote profile to {profile}")
 
     output_path = output
     if output_path is None:
@@ -202,16 +660,910 @@ def report(
     except Exception as exc:  # pragma: no cover - defensive
         typer.echo(f"Failed to write report: {exc}", err=True)
         raise typer.Exit(code=1) from exc
+    if history:
+        _record_history(report_data, history_db)
 
     try:
         summary = report_data["checks"]["summary"]
-        typer.echo(
-            f"Summary: {summary['pass']} pass, {summary['warn']} warn, {summary['fail']} fail",
-            file=sys.stderr,
-        )
     except Exception as exc:
         raise typer.Exit(code=2) from exc
+    _finish_with_summary(summary)
 
-    exit_code = _exit_code_from_summary(summary)
-    if exit_code:
-        raise typer.Exit(code=exit_code)
+
+@app.command()
+def watch(
+    interval: str = typer.Option(
+        "5s",
+        "--interval",
+        "-i",
+        help="Default sampling interval, e.g. 500ms, 5s or 1m.",
+    ),
+    every: list[str] = typer.Option(
+        [],
+        "--every",
+        help="Per-collector interval override as NAME=DURATION; repeatable.",
+    ),
+    count: int | None = typer.Option(
+        None,
+        "--count",
+        "-n",
+        min=1,
+        help="Stop after emitting this many samples.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore the on-disk collector cache and do not update it.",
+    ),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Append samples to this NDJSON file instead of stdout.",
+        path_type=Path,
+    ),
+    max_bytes: int | None = typer.Option(
+        None,
+        "--max-bytes",
+        min=1,
+        help="Rotate the output file once it would grow past this size.",
+    ),
+    backups: int = typer.Option(
+        5,
+        "--backups",
+        min=0,
+        help="Number of rotated output files to keep.",
+    ),
+    store_path: Path | None = typer.Option(
+        None,
+        "--store",
+        help="Also append numeric metrics to this binary time-series store.",
+        path_type=Path,
+    ),
+    metrics: list[str] = typer.Option(
+        [],
+        "--metric",
+        "-m",
+        help="Metric column of the store, e.g. system.disk.free_bytes; repeatable.",
+    ),
+    retention: str = typer.Option(
+        "7d",
+        "--retention",
+        help="How much history the store keeps at its collectors' intervals.",
+    ),
+    single_precision: bool = typer.Option(
+        False,
+        "--single-precision",
+        help="Store values as float32 to halve the store's size.",
+    ),
+    detect: bool = typer.Option(
+        False,
+        "--detect",
+        help="Emit check lines when a metric turns anomalous or a disk is filling up.",
+    ),
+    zscore: float = typer.Option(
+        4.0,
+        "--zscore",
+        help="Deviations from a metric's moving average that count as an anomaly.",
+    ),
+    fill_warn: str = typer.Option(
+        "24h",
+        "--fill-warn",
+        help="Warn when a disk will be full within this long at its current rate.",
+    ),
+    fill_fail: str = typer.Option(
+        "6h",
+        "--fill-fail",
+        help="Fail when a disk will be full within this long at its current rate.",
+    ),
+) -> None:
+    """
+    Sample collectors continuously on a fixed-rate schedule and emit one JSON line per sample.
+
+    With --detect, streaming statistics also flag anomalous values and filling disks as
+    `check` lines whenever a status changes.
+    """
+    try:
+        default_interval = parse_duration(interval)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--interval") from exc
+    try:
+        overrides = parse_interval_overrides(every)
+        sampler = Sampler(
+            get_collectors(),
+            interval=default_interval,
+            overrides=overrides,
+            cache=_collector_cache(no_cache, False),
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--every") from exc
+
+    detector: AnomalyDetector | None = None
+    if detect:
+        if zscore <= 0:
+            raise typer.BadParameter("zscore must be greater than zero", param_hint="--zscore")
+        try:
+            warn_within = parse_duration(fill_warn)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--fill-warn") from exc
+        try:
+            fail_within = parse_duration(fill_fail)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--fill-fail") from exc
+        try:
+            detector = AnomalyDetector(zscore=zscore, fill_warn=warn_within, fill_fail=fail_within)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--fill-fail") from exc
+
+    store: MetricStore | None = None
+    feeding: set[str] = set()
+    if store_path is not None:
+        columns = metrics or DEFAULT_METRICS
+        try:
+            window = parse_duration(retention)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--retention") from exc
+        # Every sample of a collector feeding the store is one row, so the ring buffer needs
+        # room for each of them at its own interval to span the whole retention window.
+        sources = {column.split(".")[0] for column in columns}
+        capacity = sum(
+            math.ceil(window / sampler.intervals[index])
+            for index, collector in enumerate(sampler.collectors)
+            if collector.name in sources
+        ) or math.ceil(window / default_interval)
+        try:
+            store = open_or_create(
+                store_path,
+                columns,
+                capacity=capacity,
+                typecode="f" if single_precision else "d",
+            )
+        except OSError as exc:
+            typer.echo(f"Failed to open metric store: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--store") from exc
+        feeding = {column.split(".")[0] for column in store.columns}
+
+    emitted = 0
+    try:
+        with open_ndjson(output, max_bytes=max_bytes, backups=backups) as writer:
+            for record in sampler.samples():
+                writer.write(record)
+                if "data" in record:
+                    now = time.time()
+                    if store is not None and record["collector"] in feeding:
+                        # A wall-clock step backwards (NTP) must not break the ordered store.
+                        now = max(now, store.last_timestamp or now)
+                        store.append(now, flatten_metrics(record["data"], record["collector"]))
+                    if detector is not None:
+                        for result in detector.update(record["collector"], record["data"], now):
+                            writer.write(check_record(result))
+                emitted += 1
+                if count is not None and emitted >= count:
+                    break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if store is not None:
+            store.close()
+
+
+def _epoch_iso(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, UTC).isoformat()
+
+
+@app.command()
+def query(
+    store_path: Path = typer.Option(
+        ...,
+        "--store",
+        help="Binary time-series store written by `sysforge watch --store`.",
+        path_type=Path,
+    ),
+    metrics: list[str] = typer.Option(
+        [],
+        "--metric",
+        "-m",
+        help="Metric to read; repeatable. Defaults to every metric in the store.",
+    ),
+    start: str | None = typer.Option(
+        None,
+        "--start",
+        help="Range start: epoch seconds, ISO 8601 datetime, or a duration ago such as 6h.",
+    ),
+    end: str | None = typer.Option(
+        None,
+        "--end",
+        help="Range end (exclusive), in the same formats as --start.",
+    ),
+    bucket: str | None = typer.Option(
+        None,
+        "--bucket",
+        "-b",
+        help="Downsample into min/max/avg buckets of this duration, e.g. 1m.",
+    ),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON output."),
+) -> None:
+    """
+    Read a time range from a metric store, optionally downsampled.
+    """
+    try:
+        start_ts = parse_time(start) if start is not None else None
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--start") from exc
+    try:
+        end_ts = parse_time(end) if end is not None else None
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--end") from exc
+    try:
+        bucket_seconds = parse_duration(bucket) if bucket is not None else None
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--bucket") from exc
+
+    try:
+        store = MetricStore(store_path)
+    except (OSError, ValueError) as exc:
+        typer.echo(f"Failed to open metric store: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    with store:
+        unknown = [metric for metric in metrics if metric not in store.columns]
+        if unknown:
+            raise typer.BadParameter(
+                f"unknown metric(s): {', '.join(unknown)}", param_hint="--metric"
+            )
+        result: dict[str, Any] = {}
+        for metric in metrics or store.columns:
+            if bucket_seconds is None:
+                result[metric] = [
+                    {"timestamp": _epoch_iso(ts), "value": value}
+                    for ts, value in store.rows(metric, start=start_ts, end=end_ts)
+                ]
+            else:
+                result[metric] = [
+                    {**entry, "start": _epoch_iso(entry["start"])}
+                    for entry in store.downsample(
+                        metric, bucket_seconds, start=start_ts, end=end_ts
+                    )
+                ]
+    typer.echo(json_dump({"metrics": result}, pretty=pretty))
+
+
+@app.command()
+def aggregate(
+    directory: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help="Directory containing `sysforge report` JSON files, one per host.",
+    ),
+    pattern: str | None = typer.Option(
+        None,
+        "--pattern",
+        help="Glob for report files (default: *.json, *.json.gz and *.json.zst).",
+    ),
+    jobs: int = typer.Option(
+        os.cpu_count() or 1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of worker processes parsing reports.",
+    ),
+    top: int = typer.Option(5, "--top", min=1, help="Worst hosts to keep per check."),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Optional file path to write the JSON rollup.",
+        path_type=Path,
+    ),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON output."),
+) -> None:
+    """
+    Roll up many host reports into fleet-level check, disk and version summaries.
+    """
+    try:
+        rollup = aggregate_reports(iter_report_paths(directory, pattern), jobs=jobs, top=top)
+    except Exception as exc:  # pragma: no cover - defensive
+        typer.echo(f"Error aggregating reports: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    data = rollup.to_dict()
+    if output:
+        try:
+            write_report_file(data, output, pretty=pretty)
+            typer.echo(f"Wrote rollup of {rollup.reports} reports to {output}")
+        except Exception as exc:  # pragma: no cover - defensive
+            typer.echo(f"Failed to write output: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+    else:
+        typer.echo(json_dump(data, pretty=pretty))
+
+
+@app.command()
+def evaluate(
+    directory: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help="Directory containing stored `sysforge report` JSON files.",
+    ),
+    rules: Path = typer.Option(
+        ...,
+        "--rules",
+        help="TOML or JSON file of declarative rules to apply.",
+        path_type=Path,
+    ),
+    pattern: str | None = typer.Option(
+        None,
+        "--pattern",
+        help="Glob for report files (default: *.json, *.json.gz and *.json.zst).",
+    ),
+    jobs: int = typer.Option(
+        os.cpu_count() or 1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of worker processes parsing reports.",
+    ),
+    batch_size: int = typer.Option(
+        1024, "--batch-size", min=1, help="Reports evaluated together per worker task."
+    ),
+    top: int = typer.Option(5, "--top", min=1, help="Matching hosts to list per rule."),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Optional file path to write the JSON results.",
+        path_type=Path,
+    ),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON output."),
+) -> None:
+    """
+    Apply rules retroactively to stored reports and count pass/warn/fail per rule.
+
+    Reports whose data lacks a field a rule reads are counted as unknown for that rule.
+    """
+    definitions = _load_rules(rules)
+    try:
+        rollup = evaluate_reports(
+            iter_report_paths(directory, pattern),
+            definitions,
+            jobs=jobs,
+            top=top,
+            batch_size=batch_size,
+        )
+    except Exception as exc:  # pragma: no cover - defensive
+        typer.echo(f"Error evaluating reports: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    data = rollup.to_dict()
+    if output:
+        try:
+            write_report_file(data, output, pretty=pretty)
+            typer.echo(f"Wrote rule results for {rollup.reports} reports to {output}")
+        except Exception as exc:  # pragma: no cover - defensive
+            typer.echo(f"Failed to write output: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+    else:
+        typer.echo(json_dump(data, pretty=pretty))
+
+
+@app.command("du")
+def du(
+    path: Path = typer.Argument(
+        Path("."),
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help="Directory tree to measure.",
+    ),
+    top: int = typer.Option(10, "--top", "-n", min=1, help="Largest directories/files to keep."),
+    max_depth: int | None = typer.Option(
+        None,
+        "--max-depth",
+        "-d",
+        min=0,
+        help="Only rank directories at most this deep below PATH (sizes still include all).",
+    ),
+    jobs: int = typer.Option(
+        8,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of threads listing directories concurrently.",
+    ),
+    cross_filesystems: bool = typer.Option(
+        False,
+        "--cross-filesystems",
+        help="Descend into directories on other filesystems (mount points).",
+    ),
+    apparent_size: bool = typer.Option(
+        False,
+        "--apparent-size",
+        help="Report file lengths instead of allocated disk space.",
+    ),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Optional file path to write the JSON results.",
+        path_type=Path,
+    ),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON output."),
+) -> None:
+    """
+    Find what is filling a filesystem: total size plus the largest directories and files.
+    """
+    try:
+        data = disk_usage_tree(
+            path,
+            jobs=jobs,
+            top=top,
+            max_depth=max_depth,
+            one_filesystem=not cross_filesystems,
+            apparent_size=apparent_size,
+        )
+    except Exception as exc:  # pragma: no cover - defensive
+        typer.echo(f"Error measuring {path}: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    if output:
+        try:
+            write_report_file(data, output, pretty=pretty)
+            typer.echo(f"Wrote disk usage of {path} to {output}")
+        except Exception as exc:  # pragma: no cover - defensive
+            typer.echo(f"Failed to write output: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+    else:
+        typer.echo(json_dump(data, pretty=pretty))
+
+
+@app.command()
+def bench(
+    repeat: int = typer.Option(20, "--repeat", "-r", min=1, help="Timed runs per benchmark."),
+    warmup: int = typer.Option(3, "--warmup", min=0, help="Untimed runs before timing."),
+    sizes: list[int] = typer.Option(
+        [],
+        "--size",
+        min=1,
+        help="Synthetic report size for the serialization benchmarks; repeatable "
+        f"(default: {', '.join(str(size) for size in DEFAULT_SIZES)}).",
+    ),
+    pattern: str | None = typer.Option(
+        None,
+        "--filter",
+        "-k",
+        help="Only run benchmarks whose name matches this regular expression.",
+    ),
+    startup: bool = typer.Option(
+        True,
+        "--startup/--no-startup",
+        help="Time cold CLI startup in a fresh interpreter.",
+    ),
+    baseline: Path | None = typer.Option(
+        None,
+        "--baseline",
+        exists=True,
+        dir_okay=False,
+        help="Earlier `sysforge bench` JSON output to compare against.",
+        path_type=Path,
+    ),
+    max_regression: float = typer.Option(
+        10.0,
+        "--max-regression",
+        min=0.0,
+        help="Fail when a benchmark's median is more than this many percent slower.",
+    ),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Optional file path to write the JSON results.",
+        path_type=Path,
+    ),
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON output."),
+) -> None:
+    """
+    Time startup, every collector and check, report serialization and a full report.
+
+    With --baseline, exits 2 when any benchmark regressed beyond --max-regression.
+    """
+    if pattern is not None:
+        try:
+            re.compile(pattern)
+        except re.error as exc:
+            raise typer.BadParameter(f"Invalid pattern: {exc}", param_hint="--filter") from exc
+    baseline_data: dict[str, Any] | None = None
+    if baseline is not None:
+        try:
+            baseline_data = json.loads(baseline.read_text())
+        except (OSError, ValueError) as exc:
+            raise typer.BadParameter(
+                f"Cannot read baseline: {exc}", param_hint="--baseline"
+            ) from exc
+        if not isinstance(baseline_data, dict):
+            raise typer.BadParameter("Baseline must be a JSON object.", param_hint="--baseline")
+
+    data = run_benchmarks(
+        warmup=warmup,
+        repeat=repeat,
+        sizes=sizes or DEFAULT_SIZES,
+        startup=startup,
+        pattern=pattern,
+    )
+    comparison = None
+    if baseline_data is not None:
+        comparison = compare_to_baseline(data, baseline_data, max_regression=max_regression)
+        data["comparison"] = comparison
+
+    if output:
+        try:
+            write_report_file(data, output, pretty=pretty)
+            typer.echo(f"Wrote benchmark results to {output}")
+        except Exception as exc:  # pragma: no cover - defensive
+            typer.echo(f"Failed to write output: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+    else:
+        typer.echo(json_dump(data, pretty=pretty))
+
+    if comparison is not None and comparison["regressions"]:
+        for entry in comparison["regressions"]:
+            typer.echo(
+                f"Regression: {entry['name']} {entry['baseline_ms']:.3f} ms -> "
+                f"{entry['current_ms']:.3f} ms (+{entry['change_pct']:.1f}%)",
+                err=True,
+            )
+        raise typer.Exit(code=2)
+
+
+@app.command()
+def serve(
+    port: int = typer.Option(9477, "--port", "-p", min=0, max=65535, help="Port to listen on."),
+    host: str = typer.Option(
+        "127.0.0.1",
+        "--host",
+        help="Address to bind; use 0.0.0.0 to accept scrapes from other hosts.",
+    ),
+    interval: str = typer.Option(
+        "15s",
+        "--interval",
+        "-i",
+        help="Default collector refresh interval, e.g. 5s or 1m.",
+    ),
+    every: list[str] = typer.Option(
+        [],
+        "--every",
+        help="Per-collector interval override as NAME=DURATION; repeatable.",
+    ),
+    check_interval: str | None = typer.Option(
+        None,
+        "--check-interval",
+        help="How often to re-run checks (defaults to --interval).",
+    ),
+    disk_threshold: float = typer.Option(
+        0.10,
+        "--disk-threshold",
+        min=0.0,
+        max=1.0,
+        callback=_validate_threshold,
+        help="Minimum free disk fraction before warning/fail.",
+    ),
+    mount_threshold: list[str] = typer.Option(
+        [],
+        "--mount-threshold",
+        help="Check free space on a mount with its own threshold (MOUNT=FRACTION, repeatable).",
+    ),
+    all_mounts: bool = typer.Option(
+        False,
+        "--all-mounts",
+        help="Check free space and inodes on every mount instead of the home directory.",
+    ),
+    toolchain: Path | None = typer.Option(
+        None,
+        "--toolchain",
+        help="TOML or JSON file listing required tools and minimum versions.",
+        path_type=Path,
+    ),
+    rules: Path | None = typer.Option(
+        None,
+        "--rules",
+        help="TOML or JSON file of declarative rules to run as extra checks.",
+        path_type=Path,
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Ignore the on-disk collector cache and do not update it.",
+    ),
+    check_timeout: float | None = _CHECK_TIMEOUT_OPTION,
+) -> None:
+    """
+    Serve collector and check results as Prometheus metrics at /metrics.
+
+    Results are refreshed in the background; scrapes never run probes.
+    """
+    try:
+        default_interval = parse_duration(interval)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--interval") from exc
+    try:
+        checks_every = parse_duration(check_interval) if check_interval else None
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--check-interval") from exc
+    try:
+        exporter = Exporter(
+            get_collectors(),
+            interval=default_interval,
+            overrides=parse_interval_overrides(every),
+            check_interval=checks_every,
+            disk_threshold=disk_threshold,
+            check_timeout=check_timeout,
+            cache=_collector_cache(no_cache, False),
+            settings=_run_settings(mount_threshold, all_mounts, toolchain, rules),
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--every") from exc
+
+    try:
+        server = MetricsServer(exporter, host, port)
+    except OSError as exc:
+        typer.echo(f"Cannot listen on {host}:{port}: {exc}", err=True)
+        raise typer.Exit(code=1) from exc
+
+    exporter.start()
+    bound_host, bound_port = server.server_address[:2]
+    typer.echo(f"Serving metrics on http://{bound_host}:{bound_port}/metrics", err=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        exporter.stop(timeout=5)
+
+
+_HISTORY_DB_OPTION = typer.Option(
+    None,
+    "--db",
+    help="History database path (default: $XDG_DATA_HOME/sysforge/history.sqlite3).",
+    path_type=Path,
+)
+_HISTORY_START_OPTION = typer.Option(
+    None,
+    "--start",
+    help="Range start: epoch seconds, ISO 8601 datetime, or a duration ago such as 30d.",
+)
+_HISTORY_END_OPTION = typer.Option(
+    None, "--end", help="Range end (exclusive), in the same formats as --start."
+)
+_HISTORY_BUCKET_OPTION = typer.Option(
+    None, "--bucket", "-b", help="Aggregate into buckets of this duration, e.g. 1d."
+)
+
+
+def _history_range(
+    start: str | None, end: str | None, bucket: str | None
+) -> tuple[float | None, float | None, float | None]:
+    parsed: list[float | None] = []
+    for value, hint, parse in (
+        (start, "--start", parse_time),
+        (end, "--end", parse_time),
+        (bucket, "--bucket", parse_duration),
+    ):
+        try:
+            parsed.append(parse(value) if value is not None else None)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint=hint) from exc
+    return parsed[0], parsed[1], parsed[2]
+
+
+@history_app.command("check")
+def history_check(
+    name: str = typer.Argument(..., help="Check name, e.g. disk_space."),
+    start: str | None = _HISTORY_START_OPTION,
+    end: str | None = _HISTORY_END_OPTION,
+    bucket: str | None = _HISTORY_BUCKET_OPTION,
+    db: Path | None = _HISTORY_DB_OPTION,
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON output."),
+) -> None:
+    """
+    Show a check's recorded results, or its status counts per bucket.
+    """
+    start_ts, end_ts, bucket_seconds = _history_range(start, end, bucket)
+    with _open_history(db, must_exist=True) as store:
+        if bucket_seconds is None:
+            results = store.check_results(name, start=start_ts, end=end_ts)
+            data: dict[str, Any] = {
+                "check": name,
+                "results": [
+                    {**entry, "timestamp": _epoch_iso(entry["timestamp"])} for entry in results
+                ],
+            }
+        else:
+            buckets = store.check_buckets(name, bucket_seconds, start=start_ts, end=end_ts)
+            data = {
+                "check": name,
+                "buckets": [{**entry, "start": _epoch_iso(entry["start"])} for entry in buckets],
+            }
+    typer.echo(json_dump(data, pretty=pretty))
+
+
+@history_app.command("metric")
+def history_metric(
+    name: str = typer.Argument(..., help="Dotted metric name, e.g. system.disk.percent_free."),
+    start: str | None = _HISTORY_START_OPTION,
+    end: str | None = _HISTORY_END_OPTION,
+    bucket: str | None = _HISTORY_BUCKET_OPTION,
+    db: Path | None = _HISTORY_DB_OPTION,
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON output."),
+) -> None:
+    """
+    Show a metric's recorded values, or min/max/avg per bucket.
+    """
+    start_ts, end_ts, bucket_seconds = _history_range(start, end, bucket)
+    with _open_history(db, must_exist=True) as store:
+        if bucket_seconds is None:
+            samples = store.metric_samples(name, start=start_ts, end=end_ts)
+            data: dict[str, Any] = {
+                "metric": name,
+                "samples": [
+                    {"timestamp": _epoch_iso(ts), "value": value} for ts, value in samples
+                ],
+            }
+        else:
+            buckets = store.metric_buckets(name, bucket_seconds, start=start_ts, end=end_ts)
+            data = {
+                "metric": name,
+                "buckets": [{**entry, "start": _epoch_iso(entry["start"])} for entry in buckets],
+            }
+    typer.echo(json_dump(data, pretty=pretty))
+
+
+@history_app.command("changed")
+def history_changed(
+    name: str = typer.Argument(..., help="Check name, or metric name with --metric."),
+    metric: bool = typer.Option(False, "--metric", help="Look up a metric instead of a check."),
+    messages: bool = typer.Option(
+        False, "--messages", help="Also count a changed check message as a change."
+    ),
+    db: Path | None = _HISTORY_DB_OPTION,
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON output."),
+) -> None:
+    """
+    Show when a check's status (or, with --messages, its message) or a metric's value last
+    changed.
+    """
+    kind = "metric" if metric else "check"
+    with _open_history(db, must_exist=True) as store:
+        change = store.last_change(kind, name, messages=messages)
+    if change is None:
+        typer.echo(f"No history for {kind} {name!r}.", err=True)
+        raise typer.Exit(code=1)
+    fields = ("status", "message") if kind == "check" else ("value",)
+    data = {
+        kind: name,
+        "current": dict(zip(fields, change["current"], strict=True)),
+        "since": _epoch_iso(change["since"]),
+        "previous": (
+            dict(zip(fields, change["previous"], strict=True)) if change["previous"] else None
+        ),
+    }
+    typer.echo(json_dump(data, pretty=pretty))
+
+
+@history_app.command("list")
+def history_list(
+    db: Path | None = _HISTORY_DB_OPTION,
+    pretty: bool = typer.Option(False, "--pretty", help="Pretty-print JSON output."),
+) -> None:
+    """
+    List the recorded check and metric names.
+    """
+    with _open_history(db, must_exist=True) as store:
+        data = {"checks": store.names("check"), "metrics": store.names("metric")}
+    typer.echo(json_dump(data, pretty=pretty))
+
+
+@history_app.command("import")
+def history_import(
+    directory: Path = typer.Argument(
+        ...,
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        help="Directory of `sysforge report` JSON files from this host.",
+    ),
+    pattern: str | None = typer.Option(
+        None,
+        "--pattern",
+        help="Glob for report files (default: *.json, *.json.gz and *.json.zst).",
+    ),
+    batch_size: int = typer.Option(
+        500, "--batch-size", min=1, help="Reports recorded per transaction."
+    ),
+    db: Path | None = _HISTORY_DB_OPTION,
+) -> None:
+    """
+    Record existing report files in the history database.
+    """
+    imported = errors = duplicates = 0
+    batch: list[dict[str, Any]] = []
+
+    def flush() -> None:
+        nonlocal imported, duplicates
+        try:
+            recorded = len(store.record_many(batch))
+        except sqlite3.Error as exc:
+            typer.echo(f"Failed to record history: {exc}", err=True)
+            raise typer.Exit(code=1) from exc
+        imported += recorded
+        duplicates += len(batch) - recorded
+        batch.clear()
+
+    with _open_history(db) as store:
+        for name in iter_report_paths(directory, pattern):
+            try:
+                report_data = load_report(Path(name))
+                # Validate up front so one bad file cannot roll back a whole batch.
+                report_timestamp(report_data)
+            except (OSError, ValueError) as exc:
+                typer.echo(f"Skipping {name}: {exc}", err=True)
+                errors += 1
+                continue
+            batch.append(report_data)
+            if len(batch) >= batch_size:
+                flush()
+        if batch:
+            flush()
+    typer.echo(
+        f"Imported {imported} report(s) into {store.path}; skipped {errors}; "
+        f"{duplicates} already recorded."
+    )
+
+
+@history_app.command("prune")
+def history_prune(
+    max_age: str | None = typer.Option(
+        None, "--max-age", help="Delete runs older than this, e.g. 365d."
+    ),
+    compact_after: str | None = typer.Option(
+        None,
+        "--compact-after",
+        help="Thin runs older than this to one per --resolution window, e.g. 30d.",
+    ),
+    resolution: str = typer.Option(
+        "1h", "--resolution", help="Window kept per run once compacted."
+    ),
+    vacuum: bool = typer.Option(False, "--vacuum", help="Reclaim the freed disk space."),
+    db: Path | None = _HISTORY_DB_OPTION,
+) -> None:
+    """
+    Apply a retention policy: drop old runs and thin older history.
+    """
+    durations: list[float | None] = []
+    for value, hint in ((max_age, "--max-age"), (compact_after, "--compact-after")):
+        try:
+            durations.append(parse_duration(value) if value is not None else None)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint=hint) from exc
+    try:
+        resolution_seconds = parse_duration(resolution)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--resolution") from exc
+    if durations == [None, None]:
+        raise typer.BadParameter("pass --max-age and/or --compact-after")
+    with _open_history(db, must_exist=True) as store:
+        result = store.prune(
+            max_age=durations[0],
+            compact_after=durations[1],
+            resolution=resolution_seconds,
+            now=time.time(),
+            vacuum=vacuum,
+        )
+    typer.echo(
+        f"Deleted {result['deleted_runs']} run(s); compacted away {result['compacted_runs']}."
+    )
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Iterator
+from functools import partial
 
+from ..context import RunContext
+from ..parallel import run_tasks
+from ..timing import timed
 from .base import BaseCollector
 
 _collector_registry: list[BaseCollector] = []
@@ -27,17 +32,95 @@ def get_collectors() -> list[BaseCollector]:
     return list(_collector_registry)
 
 
-def run_collectors() -> dict[str, object]:
+def _collect_isolated(collector: BaseCollector, context: RunContext) -> object:
+    # Worker processes cannot share the context; ship resolved facts back with the payload.
+    payload = collector.collect(context)
+    return payload, context.facts()
+
+
+def iter_collectors(
+    *,
+    jobs: int = 1,
+    timeout: float | None = None,
+    deadline: float | None = None,
+    executor: str = "thread",
+    context: RunContext | None = None,
+) -> Iterator[tuple[str, object]]:
+    """
+    Execute collectors and yield `(name, payload)` pairs as each one finishes.
+
+    A collector that exceeds `timeout` seconds, or runs past `deadline` (`time.monotonic()`),
+    yields a structured timeout entry instead of its payload. Collector exceptions propagate
+    to the caller. Payloads are recorded on `context` so checks later in the same run can read
+    them, and so is each collector's cost, measured in the worker that ran it.
+    """
+    ctx = context or RunContext()
+    isolated = executor == "process"
+    tasks = {
+        collector.name: (
+            partial(timed, _collect_isolated, collector, ctx)
+            if isolated
+            else partial(timed, collector.collect, ctx)
+        )
+        for collector in get_collectors()
+    }
+    for outcome in run_tasks(tasks, jobs=jobs, timeout=timeout, deadline=deadline, mode=executor):
+        if outcome.status == "error":
+            assert outcome.error is not None
+            raise outcome.error
+        if outcome.status == "timeout":
+            payload: object = {"error": "timeout", "elapsed_ms": outcome.elapsed_ms}
+            sample: dict[str, object] = {"wall_ms": outcome.elapsed_ms, "timed_out": True}
+        elif isolated:
+            (payload, facts), sample = outcome.value
+            ctx.merge_facts(facts)
+        else:
+            payload, sample = outcome.value
+        ctx.record_timing("collectors", outcome.name, sample)
+        ctx.record_collected(outcome.name, payload)
+        yield outcome.name, payload
+
+
+def run_collectors(
+    *,
+    jobs: int = 1,
+    timeout: float | None = None,
+    deadline: float | None = None,
+    executor: str = "thread",
+    context: RunContext | None = None,
+) -> dict[str, object]:
     """
     Execute all collectors and combine results keyed by collector name.
+
+    Results keep registration order regardless of which collector finished first.
     """
-    results: dict[str, object] = {}
-    for collector in get_collectors():
-        results[collector.name] = collector.collect()
-    return results
+    finished = dict(
+        iter_collectors(
+            jobs=jobs, timeout=timeout, deadline=deadline, executor=executor, context=context
+        )
+    )
+    return {
+        collector.name: finished[collector.name]
+        for collector in get_collectors()
+        if collector.name in finished
+    }
 
 
 # Register built-in collectors
+from .cgroup import CgroupCollector  # noqa: E402
+from .cpu import CpuCollector  # noqa: E402
+from .mounts import MountsCollector  # noqa: E402
+from .network import NetworkCollector  # noqa: E402
+from .packages import PackagesCollector  # noqa: E402
+from .processes import ProcessesCollector  # noqa: E402
 from .system import SystemCollector  # noqa: E402
+from .toolchain import ToolchainCollector  # noqa: E402
 
 register_collector(SystemCollector())
+register_collector(MountsCollector())
+register_collector(CpuCollector())
+register_collector(ProcessesCollector())
+register_collector(NetworkCollector())
+register_collector(CgroupCollector())
+register_collector(PackagesCollector())
+register_collector(ToolchainCollector())
@@ -1,16 +1,43 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
 from typing import Any
 
+from ..context import RunContext
+
 
 class BaseCollector(ABC):
     """
     Interface for data collectors.
+
+    Collectors should resolve shared probes through `context.fact` so a run never repeats them.
+    Output that only changes across reboots or reinstalls can be wrapped in `cached`, which
+    honours the collector's `cache_ttl` (seconds; None disables persistent caching).
+    `sample_interval` is the collector's preferred period in `sysforge watch` (seconds; None
+    uses the command's default interval).
     """
 
     name: str
+    cache_ttl: float | None = None
+    sample_interval: float | None = None
+
+    def cached(
+        self,
+        context: RunContext | None,
+        section: str,
+        compute: Callable[[], Any],
+        *,
+        key: Mapping[str, Any] | None = None,
+    ) -> Any:
+        """
+        Return `compute()` through the run's persistent cache when one is configured.
+        """
+        cache = context.cache if context is not None else None
+        if cache is None or self.cache_ttl is None:
+            return compute()
+        return cache.get_or_compute(f"{self.name}.{section}", compute, ttl=self.cache_ttl, key=key)
 
     @abstractmethod
-    def collect(self) -> dict[str, Any]:
+    def collect(self, context: RunContext | None = None) -> dict[str, Any]:
         raise NotImplementedError
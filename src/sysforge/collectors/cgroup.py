@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Any
+
+from ..context import RunContext
+from . import mounts
+from .base import BaseCollector
+
+PROC_CGROUP = Path("/proc/self/cgroup")
+PRESSURE_DIR = Path("/proc/pressure")
+
+# cgroup v1 reports "no limit" as a huge page-aligned number rather than a keyword.
+_V1_UNLIMITED = 1 << 60
+PRESSURE_RESOURCES = ("cpu", "memory", "io")
+
+
+def parse_proc_cgroup(text: str) -> dict[str, str]:
+    """
+    Map each controller in /proc/self/cgroup to its cgroup path; "" is the v2 unified entry.
+    """
+    paths: dict[str, str] = {}
+    for line in text.splitlines():
+        parts = line.split(":", 2)
+        if len(parts) != 3:
+            continue
+        _, controllers, path = parts
+        if not controllers:
+            paths[""] = path
+        for controller in controllers.split(","):
+            if controller:
+                paths[controller] = path
+    return paths
+
+
+def parse_pressure(text: str) -> dict[str, dict[str, float]]:
+    """
+    Parse a PSI file ("some avg10=... total=..." / "full ...") into nested mappings.
+    """
+    pressure: dict[str, dict[str, float]] = {}
+    for line in text.splitlines():
+        kind, *pairs = line.split()
+        pressure[kind] = {
+            key: float(value) for key, _, value in (pair.partition("=") for pair in pairs)
+        }
+    return pressure
+
+
+def _read(path: Path) -> str | None:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def _read_int(path: Path) -> int | None:
+    value = _read(path)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _read_keyed(path: Path) -> dict[str, int]:
+    values: dict[str, int] = {}
+    for line in (_read(path) or "").splitlines():
+        key, _, value = line.partition(" ")
+        try:
+            values[key] = int(value)
+        except ValueError:
+            continue
+    return values
+
+
+def _cgroup_dir(mount: dict[str, str], path: str) -> Path:
+    mount_point = Path(mount["mount_point"])
+    root = mount["root"].rstrip("/")
+    # Inside a cgroup namespace the path is already relative to the mount's root.
+    relative = path[len(root) :] if root and path.startswith(root + "/") else path
+    directory = mount_point / relative.lstrip("/")
+    return directory if directory.is_dir() else mount_point
+
+
+def _lineage(directory: Path, mount_point: Path) -> list[Path]:
+    # Limits are hierarchical: an ancestor's limit caps every cgroup below it.
+    lineage = [directory]
+    while lineage[-1] != mount_point and mount_point in lineage[-1].parents:
+        lineage.append(lineage[-1].parent)
+    return lineage
+
+
+class _Hierarchy:
+    """
+    Where the cpu and memory controllers of this process live, per cgroup version.
+    """
+
+    def __init__(self, proc_cgroup: str, mountinfo: str) -> None:
+        paths = parse_proc_cgroup(proc_cgroup)
+        table = mounts.parse_mountinfo(mountinfo)
+        self.controllers: dict[str, tuple[int, Path, Path]] = {}
+        unified = next((mount for mount in table if mount["fstype"] == "cgroup2"), None)
+        for controller in ("cpu", "memory"):
+            v1 = next(
+                (
+                    mount
+                    for mount in table
+                    if mount["fstype"] == "cgroup"
+                    and controller in mount["super_options"].split(",")
+                ),
+                None,
+            )
+            if v1 is not None and controller in paths:
+                directory = _cgroup_dir(v1, paths[controller])
+                self.controllers[controller] = (1, directory, Path(v1["mount_point"]))
+            elif unified is not None and "" in paths:
+                directory = _cgroup_dir(unified, paths[""])
+                self.controllers[controller] = (2, directory, Path(unified["mount_point"]))
+        self.unified_dir = (
+            _cgroup_dir(unified, paths[""]) if unified is not None and "" in paths else None
+        )
+
+
+def _cpu_info(version: int, directory: Path, mount_point: Path) -> dict[str, Any]:
+    quota_cores: float | None = None
+    for level in _lineage(directory, mount_point):
+        if version == 2:
+            quota, _, period = (_read(level / "cpu.max") or "max").partition(" ")
+            if quota == "max" or not period:
+                continue
+            cores = int(quota) / int(period)
+        else:
+            quota_us = _read_int(level / "cpu.cfs_quota_us")
+            period_us = _read_int(level / "cpu.cfs_period_us")
+            if quota_us is None or quota_us < 0 or not period_us:
+                continue
+            cores = quota_us / period_us
+        quota_cores = cores if quota_cores is None else min(quota_cores, cores)
+
+    stat = _read_keyed(directory / "cpu.stat")
+    periods = stat.get("nr_periods", 0)
+    throttled = stat.get("nr_throttled", 0)
+    if version == 2:
+        throttled_seconds = stat.get("throttled_usec", 0) / 1e6
+    else:
+        throttled_seconds = stat.get("throttled_time", 0) / 1e9
+
+    try:
+        affinity: int | None = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):
+        affinity = None
+    candidates = [value for value in (quota_cores, affinity, os.cpu_count()) if value]
+    return {
+        "quota_cores": quota_cores,
+        "cpuset_cpus": affinity,
+        "effective_cpus": min(candidates) if candidates else None,
+        "periods": periods,
+        "throttled_periods": throttled,
+        "throttled_ratio": (throttled / periods) if periods else 0.0,
+        "throttled_seconds": round(throttled_seconds, 6),
+    }
+
+
+def _memory_info(version: int, directory: Path, mount_point: Path) -> dict[str, Any]:
+    limit_name, usage_name, inactive_key = (
+        ("memory.max", "memory.current", "inactive_file")
+        if version == 2
+        else ("memory.limit_in_bytes", "memory.usage_in_bytes", "total_inactive_file")
+    )
+    limit: int | None = None
+    for level in _lineage(directory, mount_point):
+        value = _read_int(level / limit_name)
+        if value is None or value >= _V1_UNLIMITED:
+            continue
+        limit = value if limit is None else min(limit, value)
+
+    usage = _read_int(directory / usage_name)
+    inactive = _read_keyed(directory / "memory.stat").get(inactive_key, 0)
+    # The kernel reclaims inactive page cache before OOM-killing, so the working set is what
+    # actually counts against the limit.
+    working_set = max(usage - inactive, 0) if usage is not None else None
+    return {
+        "limit_bytes": limit,
+        "usage_bytes": usage,
+        "working_set_bytes": working_set,
+        "percent_used": (working_set / limit) if limit and working_set is not None else None,
+    }
+
+
+def probe_cgroup() -> dict[str, Any]:
+    """
+    Report the effective CPU and memory limits, throttling and PSI of this process's cgroup.
+    """
+    proc_cgroup = _read(PROC_CGROUP)
+    mountinfo = _read(mounts.MOUNTINFO_PATH)
+    if proc_cgroup is None or mountinfo is None:
+        return {"supported": False}
+    hierarchy = _Hierarchy(proc_cgroup, mountinfo)
+    if not hierarchy.controllers:
+        return {"supported": False}
+
+    versions = {version for version, _, _ in hierarchy.controllers.values()}
+    result: dict[str, Any] = {
+        "supported": True,
+        "version": 1 if 1 in versions else 2,
+        "cpu": None,
+        "memory": None,
+        "pressure": {},
+    }
+    if "cpu" in hierarchy.controllers:
+        result["cpu"] = _cpu_info(*hierarchy.controllers["cpu"])
+    if "memory" in hierarchy.controllers:
+        result["memory"] = _memory_info(*hierarchy.controllers["memory"])
+
+    for resource in PRESSURE_RESOURCES:
+        text = None
+        if hierarchy.unified_dir is not None:
+            text = _read(hierarchy.unified_dir / f"{resource}.pressure")
+        if text is None:
+            # cgroup v1 has no per-cgroup PSI; fall back to the system-wide numbers.
+            text = _read(PRESSURE_DIR / resource)
+        if text:
+            result["pressure"][resource] = parse_pressure(text)
+    return result
+
+
+class CgroupCollector(BaseCollector):
+    """
+    Container resource limits from cgroup v1 or v2: CPU quota, memory limit and working set,
+    throttling counters and pressure stall information.
+    """
+
+    name = "cgroup"
+
+    def collect(self, context: RunContext | None = None) -> dict[str, Any]:
+        ctx = context or RunContext()
+        return ctx.fact("cgroup", probe_cgroup)
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from ..context import RunContext
+from .base import BaseCollector
+
+STAT_PATH = Path("/proc/stat")
+LOADAVG_PATH = Path("/proc/loadavg")
+
+# Columns of a /proc/stat cpu line, in order. guest and guest_nice are already included in
+# user and nice, so they are not part of the total.
+CPU_FIELDS = ("user", "nice", "system", "idle", "iowait", "irq", "softirq", "steal")
+_IDLE_FIELDS = ("idle", "iowait")
+# Counters saved by an earlier run are a usable baseline while younger than this (seconds).
+BASELINE_MAX_AGE = 15 * 60.0
+# Sampling loops save their counters at most this often (seconds).
+BASELINE_SAVE_INTERVAL = 60.0
+# Boot-relative, so a baseline saved by another process compares with this one's samples.
+_CLOCK = getattr(time, "CLOCK_BOOTTIME", time.CLOCK_MONOTONIC)
+
+Counters = dict[str, tuple[int, ...]]
+
+
+class _ProcReader:
+    """
+    Re-readable /proc file backed by one unbuffered handle and a reusable buffer.
+    """
+
+    def __init__(self, path: Path, size: int) -> None:
+        self.path = path
+        self._buffer = bytearray(size)
+        self._handle: BinaryIO | None = None
+
+    def read(self, complete: Callable[[memoryview], bool] | None = None) -> memoryview:
+        """
+        Return the file's current contents from the start.
+
+        Reading stops early once `complete` accepts the prefix read so far; the buffer grows
+        only when a single read cannot hold what is needed.
+        """
+        if self._handle is None:
+            self._handle = self.path.open("rb", buffering=0)
+        while True:
+            self._handle.seek(0)
+            size = self._handle.readinto(self._buffer) or 0
+            view = memoryview(self._buffer)[:size]
+            if size < len(self._buffer) or (complete is not None and complete(view)):
+                return view
+            view.release()
+            self._buffer = bytearray(len(self._buffer) * 2)
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+
+def _cpu_lines_complete(view: memoryview) -> bool:
+    # cpu lines come first in /proc/stat; once a later line has started, all of them are in.
+    return b"\nintr" in view or b"\nctxt" in view
+
+
+def parse_proc_stat(data: bytes | memoryview) -> Counters:
+    """
+    Parse the cpu lines of /proc/stat into tick counters keyed by cpu name ("cpu" = total).
+    """
+    counters: Counters = {}
+    for line in bytes(data).splitlines():
+        if not line.startswith(b"cpu"):
+            if counters:
+                break
+            continue
+        fields = line.split()
+        values = tuple(int(value) for value in fields[1 : len(CPU_FIELDS) + 1])
+        counters[fields[0].decode()] = values + (0,) * (len(CPU_FIELDS) - len(values))
+    return counters
+
+
+def parse_loadavg(data: bytes | memoryview) -> dict[str, Any]:
+    fields = bytes(data).split()
+    running, _, total = fields[3].partition(b"/")
+    return {
+        "1m": float(fields[0]),
+        "5m": float(fields[1]),
+        "15m": float(fields[2]),
+        "runnable": int(running),
+        "tasks": int(total),
+    }
+
+
+def utilization(previous: tuple[int, ...], current: tuple[int, ...]) -> dict[str, float]:
+    """
+    Return the share of time spent in each state between two counter samples, plus `busy`.
+    """
+    deltas = [max(now - before, 0) for before, now in zip(previous, current, strict=True)]
+    total = sum(deltas)
+    shares = {
+        field: (delta / total) if total else 0.0
+        for field, delta in zip(CPU_FIELDS, deltas, strict=True)
+    }
+    shares["busy"] = 1.0 - sum(shares[field] for field in _IDLE_FIELDS) if total else 0.0
+    return shares
+
+
+class CpuCollector(BaseCollector):
+    """
+    Aggregate and per-core CPU utilization from /proc/stat deltas, plus load averages.
+
+    Utilization is measured against the previous call on the same instance, so in a sampling
+    loop each sample covers the time since the last one. With a persistent cache, the first
+    call compares against the counters an earlier run saved, if they are recent enough; only
+    without any baseline does it take two samples `window` seconds apart. The /proc handles
+    and read buffers are kept open and reused between calls.
+    """
+
+    name = "cpu"
+
+    def __init__(self, *, window: float = 0.25) -> None:
+        self.window = window
+        self._lock = threading.Lock()
+        self._stat = _ProcReader(STAT_PATH, 16 * 1024)
+        self._loadavg = _ProcReader(LOADAVG_PATH, 128)
+        self._previous: tuple[float, Counters] | None = None
+        self._saved_at: float | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Open handles and the lock cannot cross into a worker process.
+        return {"window": self.window}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)
+
+    def _sample(self) -> tuple[float, Counters]:
+        return time.clock_gettime(_CLOCK), parse_proc_stat(self._stat.read(_cpu_lines_complete))
+
+    def _saved_baseline(self, context: RunContext | None) -> tuple[float, Counters] | None:
+        cache = context.cache if context is not None else None
+        if cache is None:
+            return None
+        saved = cache.load(f"{self.name}.baseline", ttl=BASELINE_MAX_AGE)
+        try:
+            clock = float(saved["clock"])
+            counters = {
+                str(name): tuple(int(value) for value in values)
+                for name, values in saved["counters"].items()
+            }
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+        # The cache key includes the boot id, so the clock only moves forward between runs.
+        if clock >= time.clock_gettime(_CLOCK):
+            return None
+        return clock, counters
+
+    def sample(self, context: RunContext | None = None) -> dict[str, Any]:
+        """
+        Measure utilization since the previous sample, a baseline saved by an earlier run, or
+        over `window` when there is neither.
+        """
+        with self._lock:
+            try:
+                if self._previous is None:
+                    self._previous = self._saved_baseline(context)
+                if self._previous is None:
+                    self._previous = self._sample()
+                    time.sleep(self.window)
+                before_time, before = self._previous
+                now_time, now = self._sample()
+                loadavg = parse_loadavg(self._loadavg.read())
+            except OSError:
+                return {"supported": False}
+            self._previous = (now_time, now)
+            save = self._saved_at is None or now_time - self._saved_at >= BASELINE_SAVE_INTERVAL
+            if save:
+                self._saved_at = now_time
+        if save and context is not None and context.cache is not None:
+            saved = {name: list(values) for name, values in now.items()}
+            context.cache.store(f"{self.name}.baseline", {"clock": now_time, "counters": saved})
+
+        total = utilization(before["cpu"], now["cpu"]) if "cpu" in before and "cpu" in now else {}
+        cores = [
+            {"cpu": name, **utilization(before[name], counters)}
+            for name, counters in now.items()
+            if name != "cpu" and name in before
+        ]
+        return {
+            "supported": True,
+            "interval_seconds": round(now_time - before_time, 6),
+            "cpu_count": len(cores),
+            "loadavg": loadavg,
+            "total": total,
+            "cores": cores,
+        }
+
+    def close(self) -> None:
+        self._stat.close()
+        self._loadavg.close()
+
+    def collect(self, context: RunContext | None = None) -> dict[str, Any]:
+        ctx = context or RunContext()
+        return ctx.fact("cpu", lambda: self.sample(ctx))
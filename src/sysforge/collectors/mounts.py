@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Collection
+from pathlib import Path
+from typing import Any
+
+from ..context import RunContext
+from ..parallel import run_tasks
+from .base import BaseCollector
+
+MOUNTINFO_PATH = Path("/proc/self/mountinfo")
+
+# Kernel and virtual filesystems that never hold user data or report meaningful usage.
+PSEUDO_FSTYPES = frozenset(
+    {
+        "autofs",
+        "binfmt_misc",
+        "bpf",
+        "cgroup",
+        "cgroup2",
+        "configfs",
+        "debugfs",
+        "devpts",
+        "devtmpfs",
+        "efivarfs",
+        "fusectl",
+        "hugetlbfs",
+        "mqueue",
+        "nsfs",
+        "proc",
+        "pstore",
+        "rpc_pipefs",
+        "securityfs",
+        "selinuxfs",
+        "squashfs",
+        "sysfs",
+        "tracefs",
+    }
+)
+
+_OCTAL_ESCAPE = re.compile(r"\\([0-7]{3})")
+
+
+def _unescape(value: str) -> str:
+    return _OCTAL_ESCAPE.sub(lambda match: chr(int(match.group(1), 8)), value)
+
+
+def parse_mountinfo(text: str) -> list[dict[str, str]]:
+    """
+    Parse /proc/self/mountinfo into mount point, fstype, source, options, the mount's root
+    within its filesystem and the superblock options.
+
+    When several entries share a mount point only the last (topmost) one is kept, since it
+    hides the others.
+    """
+    mounts: dict[str, dict[str, str]] = {}
+    for line in text.splitlines():
+        fields = line.split()
+        try:
+            separator = fields.index("-", 6)
+        except ValueError:
+            continue
+        if len(fields) < separator + 3:
+            continue
+        mount_point = _unescape(fields[4])
+        mounts.pop(mount_point, None)
+        mounts[mount_point] = {
+            "mount_point": mount_point,
+            "fstype": fields[separator + 1],
+            "source": _unescape(fields[separator + 2]),
+            "options": fields[5],
+            "root": _unescape(fields[3]),
+            "super_options": fields[separator + 3] if len(fields) > separator + 3 else "",
+        }
+    return list(mounts.values())
+
+
+def statvfs_summary(mount_point: str) -> dict[str, Any]:
+    """
+    Return byte and inode usage for a mount, using the same conventions as shutil.disk_usage.
+    """
+    stats = os.statvfs(mount_point)
+    total = stats.f_blocks * stats.f_frsize
+    free = stats.f_bavail * stats.f_frsize
+    used = (stats.f_blocks - stats.f_bfree) * stats.f_frsize
+    inodes_total = stats.f_files
+    inodes_free = stats.f_favail
+    return {
+        "total_bytes": total,
+        "used_bytes": used,
+        "free_bytes": free,
+        "percent_free": (free / total) if total else 0.0,
+        "inodes_total": inodes_total,
+        "inodes_free": inodes_free,
+        "percent_inodes_free": (inodes_free / inodes_total) if inodes_total else None,
+    }
+
+
+def probe_mounts(
+    *,
+    include_fstypes: Collection[str] | None = None,
+    exclude_fstypes: Collection[str] = PSEUDO_FSTYPES,
+    timeout: float = 5.0,
+    jobs: int = 8,
+) -> dict[str, Any]:
+    """
+    Enumerate mounts and statvfs them concurrently, each call under its own hard timeout.
+
+    A mount whose statvfs hangs (stale NFS, wedged FUSE) is reported with an error entry; its
+    worker thread is abandoned so the rest of the run is not held up.
+    """
+    try:
+        text = MOUNTINFO_PATH.read_text()
+    except OSError:
+        return {"supported": False, "mounts": []}
+
+    mounts = [
+        mount
+        for mount in parse_mountinfo(text)
+        if (include_fstypes is None or mount["fstype"] in include_fstypes)
+        and mount["fstype"] not in exclude_fstypes
+    ]
+    tasks = {
+        mount["mount_point"]: (lambda point=mount["mount_point"]: statvfs_summary(point))
+        for mount in mounts
+    }
+    usage: dict[str, dict[str, Any]] = {}
+    for outcome in run_tasks(tasks, jobs=max(1, min(jobs, len(tasks))), timeout=timeout):
+        if outcome.status == "ok":
+            usage[outcome.name] = outcome.value
+        elif outcome.status == "timeout":
+            usage[outcome.name] = {"error": "timeout", "elapsed_ms": outcome.elapsed_ms}
+        else:
+            usage[outcome.name] = {"error": f"{type(outcome.error).__name__}: {outcome.error}"}
+
+    return {
+        "supported": True,
+        "mounts": [
+            {
+                "mount_point": mount["mount_point"],
+                "fstype": mount["fstype"],
+                "source": mount["source"],
+                **usage.get(mount["mount_point"], {}),
+            }
+            for mount in mounts
+        ],
+    }
+
+
+class MountsCollector(BaseCollector):
+    name = "mounts"
+    # statvfs on every mount (and network mounts can stall) is too much for every tick, while
+    # disk fill rates still get a sample twice a minute.
+    sample_interval = 30.0
+
+    def __init__(
+        self,
+        *,
+        include_fstypes: Collection[str] | None = None,
+        exclude_fstypes: Collection[str] = PSEUDO_FSTYPES,
+        timeout: float = 5.0,
+        jobs: int = 8,
+    ) -> None:
+        self.include_fstypes = include_fstypes
+        self.exclude_fstypes = exclude_fstypes
+        self.timeout = timeout
+        self.jobs = jobs
+
+    def collect(self, context: RunContext | None = None) -> dict[str, Any]:
+        ctx = context or RunContext()
+        return ctx.fact(
+            "mounts",
+            lambda: probe_mounts(
+                include_fstypes=self.include_fstypes,
+                exclude_fstypes=self.exclude_fstypes,
+                timeout=self.timeout,
+                jobs=self.jobs,
+            ),
+        )
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from ..context import RunContext
+from .base import BaseCollector
+
+PROC_NET = Path("/proc/net")
+PORT_RANGE_PATH = Path("/proc/sys/net/ipv4/ip_local_port_range")
+
+# Receive and transmit columns of /proc/net/dev that are reported per interface.
+DEV_FIELDS = (
+    "rx_bytes",
+    "rx_packets",
+    "rx_errors",
+    "rx_dropped",
+    "tx_bytes",
+    "tx_packets",
+    "tx_errors",
+    "tx_dropped",
+)
+_DEV_COLUMNS = (0, 1, 2, 3, 8, 9, 10, 11)
+
+# Kernel counters reported from /proc/net/snmp (Tcp) and /proc/net/netstat (TcpExt).
+TCP_COUNTERS = {
+    ("Tcp", "ActiveOpens"): "active_opens",
+    ("Tcp", "PassiveOpens"): "passive_opens",
+    ("Tcp", "AttemptFails"): "attempt_fails",
+    ("Tcp", "EstabResets"): "estab_resets",
+    ("Tcp", "CurrEstab"): "curr_estab",
+    ("Tcp", "RetransSegs"): "retrans_segs",
+    ("Tcp", "InErrs"): "in_errs",
+    ("TcpExt", "ListenOverflows"): "listen_overflows",
+    ("TcpExt", "ListenDrops"): "listen_drops",
+}
+# Gauges are reported as-is; every other counter also gets a per-second rate.
+_TCP_GAUGES = {"curr_estab"}
+
+TCP_STATES = {
+    b"01": "ESTABLISHED",
+    b"02": "SYN_SENT",
+    b"03": "SYN_RECV",
+    b"04": "FIN_WAIT1",
+    b"05": "FIN_WAIT2",
+    b"06": "TIME_WAIT",
+    b"07": "CLOSE",
+    b"08": "CLOSE_WAIT",
+    b"09": "LAST_ACK",
+    b"0A": "LISTEN",
+    b"0B": "CLOSING",
+    b"0C": "NEW_SYN_RECV",
+}
+_LISTEN = b"0A"
+
+# Everything after the slot number is fixed width, so the state column can be matched
+# without splitting rows. Address widths differ between IPv4 and IPv6 tables.
+_ADDRESS = {"tcp": rb"[0-9A-F]{8}:[0-9A-F]{4}", "tcp6": rb"[0-9A-F]{32}:[0-9A-F]{4}"}
+_STATE_RE = {
+    table: re.compile(rb": " + address + rb" " + address + rb" ([0-9A-F]{2}) ")
+    for table, address in _ADDRESS.items()
+}
+_CHUNK_BYTES = 1 << 20
+
+
+def parse_net_dev(text: str) -> dict[str, tuple[int, ...]]:
+    """
+    Parse /proc/net/dev into the `DEV_FIELDS` counters per interface.
+    """
+    interfaces: dict[str, tuple[int, ...]] = {}
+    for line in text.splitlines()[2:]:
+        name, sep, rest = line.partition(":")
+        if not sep:
+            continue
+        columns = rest.split()
+        interfaces[name.strip()] = tuple(int(columns[index]) for index in _DEV_COLUMNS)
+    return interfaces
+
+
+def parse_snmp(text: str) -> dict[tuple[str, str], int]:
+    """
+    Parse the header/value line pairs of /proc/net/snmp or /proc/net/netstat.
+    """
+    counters: dict[tuple[str, str], int] = {}
+    lines = text.splitlines()
+    for header, values in zip(lines[::2], lines[1::2], strict=False):
+        prefix, _, names = header.partition(":")
+        _, _, numbers = values.partition(":")
+        for name, number in zip(names.split(), numbers.split(), strict=False):
+            counters[(prefix, name)] = int(number)
+    return counters
+
+
+def scan_socket_table(path: Path, table: str = "tcp") -> Counter[bytes]:
+    """
+    Count sockets by state code in one streaming pass over /proc/net/tcp or tcp6.
+
+    No per-socket objects are built beyond the matched state code. Listener queue overflows
+    are not visible here (tx_queue is always 0 for a listener); they come from the TcpExt
+    ListenOverflows and ListenDrops counters instead.
+    """
+    states: Counter[bytes] = Counter()
+    state_re = _STATE_RE[table]
+    with path.open("rb") as handle:
+        handle.readline()
+        remainder = b""
+        while chunk := handle.read(_CHUNK_BYTES):
+            chunk = remainder + chunk
+            end = chunk.rfind(b"\n") + 1
+            remainder = chunk[end:]
+            states.update(state_re.findall(chunk, 0, end))
+    return states
+
+
+def _rates(
+    previous: tuple[int, ...], current: tuple[int, ...], fields: tuple[str, ...], seconds: float
+) -> dict[str, float]:
+    return {
+        f"{field}_per_sec": round(max(now - before, 0) / seconds, 3)
+        for field, before, now in zip(fields, previous, current, strict=True)
+    }
+
+
+class NetworkCollector(BaseCollector):
+    """
+    Interface counters, TCP counters and socket-state histograms from /proc/net.
+
+    Rates are computed against the previous call on the same instance, so they appear from
+    the second sample on (e.g. in `sysforge watch`); a one-shot run reports counters only.
+    """
+
+    name = "network"
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._previous: tuple[float, dict[str, tuple[int, ...]], tuple[int, ...]] | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__()
+
+    def sample(self) -> dict[str, Any]:
+        try:
+            interfaces = parse_net_dev((PROC_NET / "dev").read_text())
+        except OSError:
+            return {"supported": False}
+
+        counters: dict[tuple[str, str], int] = {}
+        for name in ("snmp", "netstat"):
+            try:
+                counters.update(parse_snmp((PROC_NET / name).read_text()))
+            except OSError:
+                pass
+        tcp_fields = tuple(TCP_COUNTERS.values())
+        tcp_values = tuple(counters.get(key, 0) for key in TCP_COUNTERS)
+
+        states: Counter[bytes] = Counter()
+        for table in ("tcp", "tcp6"):
+            try:
+                states.update(scan_socket_table(PROC_NET / table, table))
+            except OSError:
+                continue
+
+        try:
+            low, high = (int(value) for value in PORT_RANGE_PATH.read_text().split())
+            ephemeral_ports: int | None = high - low + 1
+        except (OSError, ValueError):
+            ephemeral_ports = None
+
+        now = time.monotonic()
+        with self._lock:
+            previous, self._previous = self._previous, (now, interfaces, tcp_values)
+        elapsed = (now - previous[0]) if previous is not None else 0.0
+        rates_available = previous is not None and elapsed > 0
+
+        interface_data: dict[str, Any] = {}
+        for name, values in interfaces.items():
+            entry: dict[str, Any] = dict(zip(DEV_FIELDS, values, strict=True))
+            entry["rates"] = None
+            if rates_available and name in previous[1]:
+                entry["rates"] = _rates(previous[1][name], values, DEV_FIELDS, elapsed)
+            interface_data[name] = entry
+
+        tcp: dict[str, Any] = dict(zip(tcp_fields, tcp_values, strict=True))
+        tcp["rates"] = None
+        if rates_available:
+            counter_fields = [
+                (index, field) for index, field in enumerate(tcp_fields) if field not in _TCP_GAUGES
+            ]
+            tcp["rates"] = _rates(
+                tuple(previous[2][index] for index, _ in counter_fields),
+                tuple(tcp_values[index] for index, _ in counter_fields),
+                tuple(field for _, field in counter_fields),
+                elapsed,
+            )
+
+        return {
+            "supported": True,
+            "interval_seconds": round(elapsed, 6) if rates_available else None,
+            "interfaces": interface_data,
+            "tcp": tcp,
+            "sockets": {
+                "total": sum(states.values()),
+                "states": {
+                    TCP_STATES.get(code, code.decode()): count
+                    for code, count in sorted(states.items())
+                },
+                "listen": {"sockets": states[_LISTEN]},
+                "ephemeral_ports": ephemeral_ports,
+            },
+        }
+
+    def collect(self, context: RunContext | None = None) -> dict[str, Any]:
+        ctx = context or RunContext()
+        return ctx.fact("network", self.sample)
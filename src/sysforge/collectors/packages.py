@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sys
+from importlib import metadata
+from typing import Any
+
+from ..context import RunContext
+from .base import BaseCollector
+
+_NORMALIZE_RE = re.compile(r"[-_.]+")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a distribution name as PEP 503 does ("Foo_Bar" -> "foo-bar").
+    """
+    return _NORMALIZE_RE.sub("-", name).lower()
+
+
+def search_paths() -> list[str]:
+    """
+    Return the sys.path directories importlib.metadata searches for distributions.
+    """
+    paths: list[str] = []
+    for entry in sys.path:
+        path = os.path.abspath(entry or ".")
+        if path not in paths and os.path.isdir(path):
+            paths.append(path)
+    return paths
+
+
+def path_mtimes(paths: list[str]) -> dict[str, int]:
+    """
+    Return each directory's mtime; installing or removing a distribution changes it.
+    """
+    mtimes: dict[str, int] = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+    return mtimes
+
+
+def build_index(paths: list[str]) -> dict[str, Any]:
+    """
+    Read name, version and requirements of every distribution on `paths`.
+
+    As with imports, the first distribution found for a name wins; later ones are shadowed
+    and reported as duplicates.
+    """
+    distributions: dict[str, dict[str, Any]] = {}
+    duplicates: set[str] = set()
+    for dist in metadata.distributions(path=paths):
+        # Each access to `dist.metadata` re-reads the METADATA file, so read it once.
+        info = dist.metadata
+        name = info["Name"]
+        if not name:
+            continue
+        key = normalize_name(name)
+        if key in distributions:
+            duplicates.add(key)
+            continue
+        distributions[key] = {
+            "name": name,
+            "version": info["Version"],
+            "requires": info.get_all("Requires-Dist") or [],
+        }
+    return {
+        "distributions": [distributions[key] for key in sorted(distributions)],
+        "duplicates": sorted(duplicates),
+    }
+
+
+class PackagesCollector(BaseCollector):
+    """
+    Installed Python distributions and their versions, via importlib.metadata.
+
+    The index is cached per interpreter prefix and keyed by the mtimes of the sys.path
+    directories, so an unchanged environment is answered without reading any metadata.
+    """
+
+    name = "packages"
+    # The mtime key catches installs and removals; the TTL only bounds staleness on top.
+    cache_ttl = 24 * 60 * 60.0
+    # Installs are rare; `watch` and `serve` re-list site-packages hourly unless told otherwise.
+    sample_interval = 60 * 60.0
+
+    def index(self, context: RunContext | None = None) -> dict[str, Any]:
+        """
+        Return the distribution index, including requirements, from the cache when valid.
+        """
+        paths = search_paths()
+        prefix = hashlib.sha256(sys.prefix.encode()).hexdigest()[:12]
+        return self.cached(
+            context,
+            f"index-{prefix}",
+            lambda: build_index(paths),
+            key={"paths": path_mtimes(paths)},
+        )
+
+    def collect(self, context: RunContext | None = None) -> dict[str, Any]:
+        ctx = context or RunContext()
+        index = ctx.fact("package_index", lambda: self.index(ctx))
+        return {
+            "count": len(index["distributions"]),
+            "packages": {dist["name"]: dist["version"] for dist in index["distributions"]},
+            "duplicates": index["duplicates"],
+        }
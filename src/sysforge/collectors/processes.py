@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import heapq
+import os
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from ..context import RunContext
+from .base import BaseCollector
+
+PROC_ROOT = Path("/proc")
+CMDLINE_LIMIT = 256
+MAX_ZOMBIE_PARENTS = 5
+
+# name, state, ppid, cpu ticks, threads, start ticks, rss pages
+_PidStat = tuple[str, str, int, int, int, int, int]
+# (rank value, pid, stat); pids are unique, so the stat itself is never compared.
+_Ranked = tuple[int, int, _PidStat]
+
+
+def _read(path: str, size: int = 4096) -> bytes:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+def parse_pid_stat(data: bytes) -> _PidStat:
+    """
+    Parse /proc/<pid>/stat into name, state, ppid, cpu ticks, threads, start ticks, rss pages.
+    """
+    # The command name may itself contain spaces and parentheses; it ends at the last ")".
+    open_paren = data.index(b"(")
+    close_paren = data.rindex(b")")
+    name = data[open_paren + 1 : close_paren].decode(errors="replace")
+    fields = data[close_paren + 2 :].split(None, 22)
+    return (
+        name,
+        fields[0].decode(),
+        int(fields[1]),
+        int(fields[11]) + int(fields[12]),
+        int(fields[17]),
+        int(fields[19]),
+        int(fields[21]),
+    )
+
+
+def _push(heap: list[_Ranked], entry: _Ranked, top: int) -> None:
+    if len(heap) < top:
+        heapq.heappush(heap, entry)
+    elif entry > heap[0]:
+        heapq.heapreplace(heap, entry)
+
+
+def _cmdline(root: str, pid: int) -> str | None:
+    try:
+        raw = _read(f"{root}/{pid}/cmdline", CMDLINE_LIMIT)
+    except OSError:
+        return None
+    return raw.replace(b"\0", b" ").strip().decode(errors="replace") or None
+
+
+def scan_processes(*, top: int = 10) -> dict[str, Any]:
+    """
+    Scan the process table once, keeping only counters and the top `top` processes.
+
+    Only /proc/<pid>/stat is read per process; command lines and owners are looked up for the
+    handful of processes that make it into a top list. Processes that exit mid-scan are
+    skipped.
+    """
+    root = str(PROC_ROOT)
+    start = time.perf_counter()
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return {"supported": False}
+
+    clock_ticks = os.sysconf("SC_CLK_TCK")
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    try:
+        uptime = float(_read(f"{root}/uptime").split()[0])
+    except (OSError, ValueError, IndexError):
+        uptime = None
+
+    by_rss: list[_Ranked] = []
+    by_cpu: list[_Ranked] = []
+    states: Counter[str] = Counter()
+    zombie_parents: Counter[int] = Counter()
+    count = threads = 0
+
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if not name.isdigit():
+                continue
+            pid = int(name)
+            try:
+                stat = parse_pid_stat(_read(f"{root}/{name}/stat"))
+            except (OSError, ValueError, IndexError):
+                continue
+            _, state, ppid, cpu_ticks, num_threads, _, rss_pages = stat
+            count += 1
+            threads += num_threads
+            states[state] += 1
+            if state == "Z":
+                zombie_parents[ppid] += 1
+            _push(by_rss, (rss_pages, pid, stat), top)
+            _push(by_cpu, (cpu_ticks, pid, stat), top)
+
+    def describe(pid: int, stat: _PidStat) -> dict[str, Any]:
+        name, state, ppid, cpu_ticks, num_threads, start_ticks, rss_pages = stat
+        cpu_seconds = cpu_ticks / clock_ticks
+        record: dict[str, Any] = {
+            "pid": pid,
+            "name": name,
+            "state": state,
+            "ppid": ppid,
+            "threads": num_threads,
+            "rss_bytes": rss_pages * page_size,
+            "cpu_seconds": round(cpu_seconds, 2),
+            "elapsed_seconds": None,
+            "cpu_percent": None,
+            "uid": None,
+            "cmdline": _cmdline(root, pid),
+        }
+        if uptime is not None:
+            elapsed = max(uptime - start_ticks / clock_ticks, 0.0)
+            record["elapsed_seconds"] = round(elapsed, 2)
+            if elapsed > 0:
+                record["cpu_percent"] = round(cpu_seconds / elapsed * 100, 2)
+        try:
+            record["uid"] = os.stat(f"{root}/{pid}").st_uid
+        except OSError:
+            pass
+        return record
+
+    parents = []
+    for ppid, zombies in zombie_parents.most_common(MAX_ZOMBIE_PARENTS):
+        try:
+            parent_name = parse_pid_stat(_read(f"{root}/{ppid}/stat"))[0]
+        except (OSError, ValueError, IndexError):
+            parent_name = None
+        parents.append({"pid": ppid, "name": parent_name, "zombies": zombies})
+
+    return {
+        "supported": True,
+        "count": count,
+        "threads": threads,
+        "states": dict(states.most_common()),
+        "zombies": {"count": states["Z"], "parents": parents},
+        "top_rss": [describe(pid, stat) for _, pid, stat in sorted(by_rss, reverse=True)],
+        "top_cpu": [describe(pid, stat) for _, pid, stat in sorted(by_cpu, reverse=True)],
+        "scan_ms": round((time.perf_counter() - start) * 1000, 3),
+    }
+
+
+class ProcessesCollector(BaseCollector):
+    """
+    Process table summary: counts by state, zombies, and the top processes by RSS and CPU time.
+    """
+
+    name = "processes"
+
+    def __init__(self, *, top: int = 10) -> None:
+        self.top = top
+
+    def collect(self, context: RunContext | None = None) -> dict[str, Any]:
+        ctx = context or RunContext()
+        return ctx.fact("processes", lambda: scan_processes(top=self.top))
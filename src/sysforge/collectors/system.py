@@ -6,14 +6,35 @@ import sys
 from pathlib import Path
 from typing import Any
 
+from ..context import RunContext
 from ..utils import disk_usage_summary, iso_timestamp, memory_bytes, safe_env_summary
 from .base import BaseCollector
+from .cgroup import probe_cgroup
+
+
+def effective_limits(hardware: dict[str, Any], cgroup: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return the container's CPU and memory allowance where it is below the host totals.
+    """
+    limits: dict[str, Any] = {}
+    if not cgroup.get("supported"):
+        return limits
+    cpus = (cgroup.get("cpu") or {}).get("effective_cpus")
+    if cpus and (hardware.get("cpu_count") is None or cpus < hardware["cpu_count"]):
+        limits["effective_cpu_count"] = cpus
+    memory = (cgroup.get("memory") or {}).get("limit_bytes")
+    if memory and (hardware.get("memory_bytes") is None or memory < hardware["memory_bytes"]):
+        limits["effective_memory_bytes"] = memory
+    return limits
 
 
 class SystemCollector(BaseCollector):
     name = "system"
+    # OS, interpreter and hardware details only change across reboots or reinstalls, which the
+    # cache's invalidation key already detects; the TTL bounds staleness on top of that.
+    cache_ttl = 6 * 60 * 60.0
 
-    def collect(self) -> dict[str, Any]:
+    def _static_info(self, ctx: RunContext) -> dict[str, Any]:
         os_info = {
             "name": platform.system(),
             "release": platform.release(),
@@ -27,19 +48,31 @@ class SystemCollector(BaseCollector):
             "executable": os.fsdecode(sys.executable) if sys.executable is not None else None,
         }
         hardware: dict[str, Any] = {"cpu_count": os.cpu_count()}
-        mem_bytes = memory_bytes()
+        mem_bytes = ctx.fact("memory_bytes", memory_bytes)
         if mem_bytes is not None:
             hardware["memory_bytes"] = mem_bytes
+        return {"os": os_info, "python": python_info, "hardware": hardware}
+
+    def collect(self, context: RunContext | None = None) -> dict[str, Any]:
+        ctx = context or RunContext()
+        static = self.cached(ctx, "static", lambda: self._static_info(ctx))
 
-        disk_info = disk_usage_summary(Path.home())
+        home = Path.home()
+        disk_info = ctx.fact(f"disk_usage:{home}", lambda: disk_usage_summary(home))
         env_info = safe_env_summary(
             ["PATH", "SHELL", "TERM", "LANG", "HOME", "USER", "USERNAME", "LOGNAME"]
         )
 
+        # Container limits can change without a reboot, so they are resolved on every run.
+        hardware = {
+            **static["hardware"],
+            **effective_limits(static["hardware"], ctx.fact("cgroup", probe_cgroup)),
+        }
+
         return {
             "timestamp": iso_timestamp(),
-            "os": os_info,
-            "python": python_info,
+            "os": static["os"],
+            "python": static["python"],
             "hardware": hardware,
             "disk": disk_info,
             "environment": env_info,
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from ..context import RunContext
+from .base import BaseCollector
+from .packages import path_mtimes
+
+WINDOWS = os.name == "nt"
+
+
+def path_directories(path: str | None = None) -> list[str]:
+    """
+    Return the existing directories on `path` (default: $PATH) in search order, once each.
+
+    Empty entries are ignored rather than meaning the current directory.
+    """
+    value = os.environ.get("PATH", os.defpath) if path is None else path
+    directories: list[str] = []
+    for entry in value.split(os.pathsep):
+        if not entry:
+            continue
+        directory = os.path.abspath(entry)
+        if directory not in directories and os.path.isdir(directory):
+            directories.append(directory)
+    return directories
+
+
+def _key(name: str) -> str:
+    return name.lower() if WINDOWS else name
+
+
+def build_path_index(directories: list[str]) -> dict[str, Any]:
+    """
+    List every directory once with `os.scandir` and map each name to the directories holding
+    it, in search order.
+
+    Names are not stat-ed here; whether a candidate is executable is checked on lookup, for
+    the few names actually looked up.
+    """
+    names: dict[str, list[int]] = {}
+    for position, directory in enumerate(directories):
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            continue
+                    except OSError:
+                        continue
+                    names.setdefault(_key(entry.name), []).append(position)
+        except OSError:
+            continue
+    return {"directories": directories, "names": names}
+
+
+def _candidates(name: str) -> list[str]:
+    if not WINDOWS or os.path.splitext(name)[1]:
+        return [name]
+    extensions = os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep)
+    return [name, *(name + extension for extension in extensions if extension)]
+
+
+def resolve(index: Mapping[str, Any], name: str) -> str | None:
+    """
+    Return the path `shutil.which(name)` would find, using a `build_path_index` index.
+    """
+    directories = index["directories"]
+    found: list[tuple[int, str]] = []
+    for candidate in _candidates(name):
+        for position in index["names"].get(_key(candidate), ()):
+            found.append((position, os.path.join(directories[position], candidate)))
+    for _, path in sorted(found):
+        if os.access(path, os.X_OK) and not os.path.isdir(path):
+            return path
+    return None
+
+
+def resolve_all(index: Mapping[str, Any], names: Iterable[str]) -> dict[str, str | None]:
+    """
+    Resolve many names against one index.
+    """
+    return {name: resolve(index, name) for name in names}
+
+
+class ToolchainCollector(BaseCollector):
+    """
+    Executables on PATH, indexed with one directory listing per PATH entry.
+
+    The index is cached and keyed by PATH and each directory's mtime, which changes whenever
+    an executable is added, removed or replaced, so an unchanged PATH is answered without
+    listing anything. Tools named in the run's `toolchain` setting are resolved against it.
+    """
+
+    name = "toolchain"
+    cache_ttl = 24 * 60 * 60.0
+    # PATH contents change on installs; a stale answer for a few minutes is harmless.
+    sample_interval = 15 * 60.0
+
+    def index(self, context: RunContext | None = None) -> dict[str, Any]:
+        """
+        Return the PATH index, from the cache when valid.
+        """
+        directories = path_directories()
+        return self.cached(
+            context,
+            "path-index",
+            lambda: build_path_index(directories),
+            key={"directories": directories, "mtimes": path_mtimes(directories)},
+        )
+
+    def collect(self, context: RunContext | None = None) -> dict[str, Any]:
+        ctx = context or RunContext()
+        index = ctx.fact("path_index", lambda: self.index(ctx))
+        tools = [tool["name"] for tool in ctx.settings.get("toolchain", {}).get("tools", [])]
+        return {
+            "directories": index["directories"],
+            "entries": len(index["names"]),
+            "tools": resolve_all(index, tools),
+        }
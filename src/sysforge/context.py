@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from .cache import CollectorCache
+
+T = TypeVar("T")
+
+
+class RunContext:
+    """
+    Per-run fact store shared by collectors and checks.
+
+    Probes are memoized by key so each one runs at most once per run, even when collectors and
+    checks ask for it concurrently. Collector payloads are recorded so checks can read them,
+    along with what each collector and check cost to run.
+    `cache` is the optional persistent cache for output that outlives a single run, and
+    `settings` carries run-wide options that individual checks may consult.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache: CollectorCache | None = None,
+        settings: Mapping[str, Any] | None = None,
+    ) -> None:
+        self.cache = cache
+        self.settings: dict[str, Any] = dict(settings or {})
+        self._lock = threading.Lock()
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._facts: dict[str, Any] = {}
+        self._collected: dict[str, Any] = {}
+        self._timings: dict[str, dict[str, Any]] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = dict(self.__dict__)
+        del state["_lock"], state["_key_locks"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def fact(self, key: str, producer: Callable[[], T]) -> T:
+        """
+        Return the value for `key`, calling `producer` only the first time it is requested.
+        """
+        try:
+            return self._facts[key]
+        except KeyError:
+            pass
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._facts:
+                self._facts[key] = producer()
+            return self._facts[key]
+
+    def facts(self) -> dict[str, Any]:
+        """
+        Return a snapshot of every fact resolved so far.
+        """
+        return dict(self._facts)
+
+    def merge_facts(self, facts: Mapping[str, Any]) -> None:
+        """
+        Adopt facts resolved elsewhere (e.g. in a worker process) without overwriting.
+        """
+        for key, value in facts.items():
+            self._facts.setdefault(key, value)
+
+    def record_collected(self, name: str, payload: Any) -> None:
+        self._collected[name] = payload
+
+    def collected(self, name: str) -> Any | None:
+        """
+        Return the payload a collector produced earlier in this run, if any.
+        """
+        return self._collected.get(name)
+
+    def record_timing(self, section: str, name: str, sample: Mapping[str, Any]) -> None:
+        with self._lock:
+            self._timings.setdefault(section, {})[name] = dict(sample)
+
+    def timings(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the recorded costs by section ("collectors", "checks") and name.
+        """
+        with self._lock:
+            return {section: dict(entries) for section, entries in self._timings.items()}
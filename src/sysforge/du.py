@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import heapq
+import os
+import stat
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .parallel import ThreadTaskPool
+
+MAX_ERROR_SAMPLES = 20
+
+
+class _Listing(NamedTuple):
+    files_bytes: int
+    files: int
+    # (dev, inode, bytes, path) for files with more than one link; deduplicated centrally.
+    linked: list[tuple[int, int, int, str]]
+    # (path, bytes of the directory inode itself)
+    subdirs: list[tuple[str, int]]
+    top_files: list[tuple[int, str]]
+    errors: list[str]
+    other_filesystems: int
+
+
+class _Node:
+    """
+    A directory whose subtree has not been fully measured yet.
+    """
+
+    __slots__ = ("path", "parent", "depth", "size", "pending", "scanned")
+
+    def __init__(self, path: str, parent: _Node | None, depth: int, size: int) -> None:
+        self.path = path
+        self.parent = parent
+        self.depth = depth
+        self.size = size
+        self.pending = 0
+        self.scanned = False
+
+
+def _size(info: os.stat_result, apparent: bool) -> int:
+    if apparent:
+        return info.st_size
+    blocks = getattr(info, "st_blocks", None)
+    return info.st_size if blocks is None else blocks * 512
+
+
+def _push(heap: list[tuple[int, str]], entry: tuple[int, str], top: int) -> None:
+    if len(heap) < top:
+        heapq.heappush(heap, entry)
+    elif entry > heap[0]:
+        heapq.heapreplace(heap, entry)
+
+
+def _scan_directory(
+    path: str, device: int, *, one_filesystem: bool, apparent: bool, top: int
+) -> _Listing:
+    files_bytes = files = other_filesystems = 0
+    linked: list[tuple[int, int, int, str]] = []
+    subdirs: list[tuple[str, int]] = []
+    top_files: list[tuple[int, str]] = []
+    errors: list[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                info = entry.stat(follow_symlinks=False)
+            except OSError as exc:
+                errors.append(f"{entry.path}: {exc.strerror or exc}")
+                continue
+            size = _size(info, apparent)
+            if stat.S_ISDIR(info.st_mode):
+                if one_filesystem and info.st_dev != device:
+                    other_filesystems += 1
+                else:
+                    subdirs.append((entry.path, size))
+                continue
+            files += 1
+            if info.st_nlink > 1:
+                linked.append((info.st_dev, info.st_ino, size, entry.path))
+                continue
+            files_bytes += size
+            _push(top_files, (size, entry.path), top)
+    return _Listing(files_bytes, files, linked, subdirs, top_files, errors, other_filesystems)
+
+
+def disk_usage_tree(
+    root: Path,
+    *,
+    jobs: int = 8,
+    top: int = 10,
+    max_depth: int | None = None,
+    one_filesystem: bool = True,
+    apparent_size: bool = False,
+) -> dict[str, Any]:
+    """
+    Measure the tree below `root` and report its largest directories and files.
+
+    Directories are listed by up to `jobs` threads. Pending directories are taken
+    newest-first, so the walk stays depth-first and only the directories still being measured
+    (plus the siblings waiting behind them) are held in memory; each finished directory rolls
+    its total into its parent and is dropped. Files with several hard links are counted once
+    per (device, inode). `max_depth` limits which directories are ranked, not the walk, as with
+    `du --max-depth`. Sizes are allocated bytes unless `apparent_size` is set.
+    """
+    if jobs < 1:
+        raise ValueError("jobs must be at least 1")
+    if top < 1:
+        raise ValueError("top must be at least 1")
+    if max_depth is not None and max_depth < 0:
+        raise ValueError("max_depth must not be negative")
+    root_info = os.stat(root)
+    if not stat.S_ISDIR(root_info.st_mode):
+        raise ValueError(f"{root} is not a directory")
+
+    start = time.perf_counter()
+    device = root_info.st_dev
+    scan = partial(
+        _scan_directory,
+        device=device,
+        one_filesystem=one_filesystem,
+        apparent=apparent_size,
+        top=top,
+    )
+    top_dirs: list[tuple[int, str]] = []
+    top_files: list[tuple[int, str]] = []
+    seen_links: set[tuple[int, int]] = set()
+    errors: list[str] = []
+    totals = {
+        "files": 0,
+        "directories": 1,
+        "hardlinks_skipped": 0,
+        "other_filesystems": 0,
+        "errors": 0,
+    }
+    root_node = _Node(str(root), None, 0, _size(root_info, apparent_size))
+    result_size = 0
+
+    def finish(node: _Node | None) -> None:
+        nonlocal result_size
+        while node is not None and node.scanned and node.pending == 0:
+            parent = node.parent
+            if parent is None:
+                result_size = node.size
+            else:
+                if max_depth is None or node.depth <= max_depth:
+                    _push(top_dirs, (node.size, node.path), top)
+                parent.size += node.size
+                parent.pending -= 1
+            node = parent
+
+    def record_error(message: str) -> None:
+        totals["errors"] += 1
+        if len(errors) < MAX_ERROR_SAMPLES:
+            errors.append(message)
+
+    def absorb(node: _Node, listing: _Listing | None, error: BaseException | None) -> list[_Node]:
+        children: list[_Node] = []
+        if listing is None:
+            if isinstance(error, OSError):
+                record_error(f"{node.path}: {error.strerror or error}")
+            elif error is not None:
+                raise error
+        else:
+            node.size += listing.files_bytes
+            totals["files"] += listing.files
+            totals["other_filesystems"] += listing.other_filesystems
+            for message in listing.errors:
+                record_error(message)
+            for size, path in listing.top_files:
+                _push(top_files, (size, path), top)
+            for dev, ino, size, path in listing.linked:
+                if (dev, ino) in seen_links:
+                    totals["hardlinks_skipped"] += 1
+                    continue
+                seen_links.add((dev, ino))
+                node.size += size
+                _push(top_files, (size, path), top)
+            for path, size in listing.subdirs:
+                children.append(_Node(path, node, node.depth + 1, size))
+            node.pending += len(children)
+            totals["directories"] += len(children)
+        node.scanned = True
+        finish(node)
+        return children
+
+    frontier: list[_Node] = [root_node]
+    if jobs == 1:
+        while frontier:
+            node = frontier.pop()
+            try:
+                listing, error = scan(node.path), None
+            except OSError as exc:
+                listing, error = None, exc
+            frontier.extend(absorb(node, listing, error))
+    else:
+        pool = ThreadTaskPool(jobs=jobs)
+        in_flight: dict[str, _Node] = {}
+        serial = 0
+        try:
+            while frontier or in_flight:
+                while frontier and len(in_flight) < jobs * 2:
+                    node = frontier.pop()
+                    serial += 1
+                    in_flight[str(serial)] = node
+                    pool.submit(str(serial), partial(scan, node.path))
+                outcome = pool.next_outcome()
+                node = in_flight.pop(outcome.name)
+                frontier.extend(absorb(node, outcome.value, outcome.error))
+        finally:
+            pool.close()
+
+    return {
+        "path": str(root),
+        "total_bytes": result_size,
+        "apparent_size": apparent_size,
+        "one_filesystem": one_filesystem,
+        "max_depth": max_depth,
+        **totals,
+        "error_samples": errors,
+        "top_directories": [
+            {"path": path, "bytes": size} for size, path in sorted(top_dirs, reverse=True)
+        ],
+        "top_files": [
+            {"path": path, "bytes": size} for size, path in sorted(top_files, reverse=True)
+        ],
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 3),
+    }
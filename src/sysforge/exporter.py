@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import math
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from .cache import CollectorCache
+from .checks import run_checks
+from .checks.base import STATUS_SEVERITY
+from .collectors.base import BaseCollector
+from .context import RunContext
+from .parallel import CancelScope
+from .watch import Sampler
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+PREFIX = "sysforge"
+
+_INVALID_NAME_RE = re.compile(r"[^a-zA-Z0-9_]+")
+
+STATUS_HELP = {
+    "exporter_ready": "1 once every collector and the checks have run.",
+    "collector_success": "1 if the collector's last sample succeeded.",
+    "collector_duration_seconds": "Duration of the collector's last sample.",
+    "collector_last_sample_timestamp_seconds": "Unix time of the collector's last sample.",
+    "checks_success": "1 if the last check run succeeded.",
+    "checks_last_run_timestamp_seconds": "Unix time of the last check run.",
+    "check_status": "Status of the check's last run: 0 pass, 1 warn, 2 fail.",
+    "check_duration_seconds": "Duration of the check's last run.",
+    "collector_series_collisions": "Collector values dropped because they repeat a series.",
+}
+
+# Collections whose keys are instances rather than fields, by (collector, dotted path): they
+# become one labelled family instead of a metric name per interface, mount or state. Mappings
+# are keyed by the label value; lists of mappings carry it in the field of the same name.
+SERIES_LABELS = {
+    ("cpu", "cores"): "cpu",
+    ("mounts", "mounts"): "mount_point",
+    ("network", "interfaces"): "interface",
+    ("network", "sockets.states"): "state",
+    ("processes", "states"): "state",
+}
+
+# Family name -> (help, type, [(labels, value)])
+_Families = dict[str, tuple[str, str, list[tuple[dict[str, str], float]]]]
+
+
+def metric_name(*parts: str) -> str:
+    """
+    Join `parts` into a valid Prometheus metric name under the sysforge prefix.
+    """
+    return _INVALID_NAME_RE.sub("_", "_".join((PREFIX, *parts))).strip("_")
+
+
+def _format_value(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_exposition(families: Mapping[str, tuple[str, str, Iterable[Any]]]) -> str:
+    """
+    Render metric families in the Prometheus text exposition format (version 0.0.4).
+    """
+    lines: list[str] = []
+    for name in sorted(families):
+        help_text, metric_type, samples = families[name]
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for labels, value in samples:
+            label_text = ",".join(
+                f'{key}="{_escape_label(str(label))}"' for key, label in labels.items()
+            )
+            series = f"{name}{{{label_text}}}" if label_text else name
+            lines.append(f"{series} {_format_value(value)}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def collector_series(
+    collector: str, data: Mapping[str, Any]
+) -> Iterator[tuple[tuple[str, ...], dict[str, str], float]]:
+    """
+    Yield `(path, labels, value)` for every numeric leaf of a collector payload.
+
+    Collections listed in `SERIES_LABELS` put their keys into a label; other lists, strings
+    and booleans are skipped.
+    """
+
+    def walk(
+        path: tuple[str, ...], value: Any, labels: dict[str, str], keyed: bool
+    ) -> Iterator[tuple[tuple[str, ...], dict[str, str], float]]:
+        label = SERIES_LABELS.get((collector, ".".join(path))) if keyed else None
+        if label is not None:
+            if isinstance(value, Mapping):
+                entries = list(value.items())
+            elif isinstance(value, list):
+                entries = [
+                    (item[label], item)
+                    for item in value
+                    if isinstance(item, Mapping) and item.get(label) is not None
+                ]
+            else:
+                entries = []
+            for key, item in entries:
+                yield from walk(path, item, {**labels, label: str(key)}, False)
+        elif isinstance(value, Mapping):
+            for key, item in value.items():
+                yield from walk((*path, str(key)), item, labels, True)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield path, labels, float(value)
+
+    yield from walk((), data, {}, True)
+
+
+class _Stopped(Exception):
+    pass
+
+
+class Exporter:
+    """
+    Keeps collector and check results fresh in a background thread and serves them as
+    Prometheus metrics.
+
+    Collectors are sampled on their own intervals by a `Sampler`; checks run every
+    `check_interval` against the latest payloads and the probes those samples resolved, so
+    they only probe what no collector has. Every update re-renders the exposition text once;
+    scrapes just read it, so no number of concurrent scrapes runs a probe. A check running
+    past `check_timeout` seconds is abandoned, so one wedged check cannot stall the refreshes;
+    until it returns, later refreshes report it as timed out without starting it again.
+    """
+
+    def __init__(
+        self,
+        collectors: Sequence[BaseCollector],
+        *,
+        interval: float,
+        overrides: Mapping[str, float] | None = None,
+        check_interval: float | None = None,
+        disk_threshold: float = 0.10,
+        check_timeout: float | None = None,
+        cache: CollectorCache | None = None,
+        settings: Mapping[str, Any] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._stop = threading.Event()
+        self._sampler = Sampler(
+            collectors,
+            interval=interval,
+            overrides=overrides,
+            cache=cache,
+            clock=clock,
+            sleep=self._sleep,
+        )
+        self.check_interval = check_interval or interval
+        self.disk_threshold = disk_threshold
+        self.check_timeout = check_timeout
+        self.cache = cache
+        self.settings = dict(settings or {})
+        self.ready = threading.Event()
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._samples: dict[str, dict[str, Any]] = {}
+        self._facts: dict[str, Any] = {}
+        self._checks: dict[str, Any] | None = None
+        self._checks_timings: dict[str, Any] = {}
+        self._checks_error: str | None = None
+        self._checks_timestamp: float | None = None
+        # Checks abandoned by an earlier refresh, kept until their invocation returns.
+        self._abandoned: dict[str, CancelScope] = {}
+        self._thread: threading.Thread | None = None
+        self._text = self._render()
+
+    def _sleep(self, seconds: float) -> None:
+        # Leave the sampler's loop from its sleep, before it starts another probe.
+        if self._stop.wait(seconds):
+            raise _Stopped
+
+    def start(self) -> None:
+        """
+        Start refreshing in a daemon thread.
+        """
+        if self._thread is not None:
+            raise RuntimeError("exporter already started")
+        self._thread = threading.Thread(target=self._run, name="sysforge-exporter", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Ask the refresh thread to stop after its current probe and wait for it.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def metrics(self) -> str:
+        """
+        Return the current exposition text without running anything.
+        """
+        return self._text
+
+    def _run(self) -> None:
+        pending = {collector.name for collector in self._sampler.collectors}
+        next_checks: float | None = None
+        try:
+            for record in self._sampler.samples():
+                if self._stop.is_set():
+                    return
+                self._record_sample(record, self._sampler.last_context)
+                pending.discard(record["collector"])
+                now = self._clock()
+                if pending or (next_checks is not None and now < next_checks):
+                    continue
+                self._run_checks()
+                self.ready.set()
+                # Like collector ticks, missed check runs are skipped rather than caught up.
+                next_checks = (next_checks or now) + self.check_interval
+                if next_checks <= now:
+                    next_checks = now + self.check_interval
+        except _Stopped:
+            return
+
+    def _record_sample(self, record: dict[str, Any], context: RunContext | None) -> None:
+        with self._lock:
+            self._samples[record["collector"]] = dict(record, received=time.time())
+            if context is not None and "data" in record:
+                self._facts.update(context.facts())
+            self._text = self._render()
+
+    def _run_checks(self) -> None:
+        context = RunContext(cache=self.cache, settings=self.settings)
+        with self._lock:
+            context.merge_facts(self._facts)
+            for name, record in self._samples.items():
+                if "data" in record:
+                    context.record_collected(name, record["data"])
+        try:
+            checks: dict[str, Any] | None = run_checks(
+                disk_threshold=self.disk_threshold,
+                context=context,
+                timeout=self.check_timeout,
+                abandoned=self._abandoned,
+            )
+            error = None
+        except Exception as exc:
+            checks, error = None, f"{type(exc).__name__}: {exc}"
+        with self._lock:
+            if checks is not None:
+                self._checks = checks
+                self._checks_timings = context.timings().get("checks", {})
+            self._checks_error = error
+            self._checks_timestamp = time.time()
+            self._text = self._render()
+
+    def _render(self) -> str:
+        families: _Families = {}
+        seen: set[tuple[str, tuple[tuple[str, str], ...]]] = set()
+
+        def add(
+            name: str, value: float, labels: dict[str, str] | None = None, help_text: str = ""
+        ) -> bool:
+            family_name = metric_name(name)
+            series = (family_name, tuple(sorted((labels or {}).items())))
+            if series in seen:
+                return False
+            seen.add(series)
+            family = families.setdefault(family_name, (help_text or STATUS_HELP[name], "gauge", []))
+            family[2].append((labels or {}, value))
+            return True
+
+        add("exporter_ready", 1.0 if self._checks_timestamp is not None else 0.0)
+        for name, record in self._samples.items():
+            labels = {"collector": name}
+            add("collector_success", 0.0 if "error" in record else 1.0, labels)
+            add("collector_duration_seconds", round(record["elapsed_ms"] / 1000, 6), labels)
+            add("collector_last_sample_timestamp_seconds", record["received"], labels)
+            collisions = 0
+            for path, series_labels, value in collector_series(name, record.get("data") or {}):
+                key = ".".join(path)
+                # Distinct paths can sanitize to the same name; keep the first series only.
+                if not add(f"{name}_{key}", value, series_labels, f"Collector {name} value {key}."):
+                    collisions += 1
+            if collisions:
+                add("collector_series_collisions", float(collisions), labels)
+
+        if self._checks_timestamp is not None:
+            add("checks_success", 0.0 if self._checks_error else 1.0)
+            add("checks_last_run_timestamp_seconds", self._checks_timestamp)
+        for result in (self._checks or {}).get("results", []):
+            labels = {"check": str(result["name"])}
+            severity = STATUS_SEVERITY.get(result["status"], STATUS_SEVERITY["fail"])
+            add("check_status", float(severity), labels)
+            sample = self._checks_timings.get(result["name"])
+            if sample is not None:
+                add("check_duration_seconds", round(sample["wall_ms"] / 1000, 6), labels)
+        return render_exposition(families)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    server: MetricsServer
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        path = self.path.split("?", 1)[0]
+        if path == "/metrics":
+            body = self.server.exporter.metrics().encode()
+            content_type = CONTENT_TYPE
+            status = 200
+        elif path == "/":
+            body = b'<html><body><a href="/metrics">Metrics</a></body></html>\n'
+            content_type = "text/html; charset=utf-8"
+            status = 200
+        else:
+            body = b"Not found\n"
+            content_type = "text/plain; charset=utf-8"
+            status = 404
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Scrapes every few seconds would flood stderr.
+        return
+
+
+class MetricsServer(ThreadingHTTPServer):
+    """
+    HTTP server answering `/metrics` from an `Exporter`'s cached text.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, exporter: Exporter, host: str, port: int) -> None:
+        self.exporter = exporter
+        super().__init__((host, port), _MetricsHandler)
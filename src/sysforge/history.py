@@ -0,0 +1,471 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .checks.base import STATUS_SEVERITY
+from .utils import flatten_metrics
+
+SCHEMA_VERSION = 2
+BUSY_TIMEOUT_MS = 5000
+
+# Samples are clustered on (series, timestamp): a trend query is one index range scan and
+# reads only its own rows, however many other checks and metrics the database holds.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    pass INTEGER NOT NULL,
+    warn INTEGER NOT NULL,
+    fail INTEGER NOT NULL,
+    digest TEXT
+);
+CREATE INDEX IF NOT EXISTS runs_timestamp ON runs (timestamp);
+CREATE UNIQUE INDEX IF NOT EXISTS runs_digest ON runs (digest);
+CREATE TABLE IF NOT EXISTS checks (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS metrics (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS check_results (
+    check_id INTEGER NOT NULL,
+    timestamp REAL NOT NULL,
+    run_id INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    message TEXT,
+    data TEXT,
+    PRIMARY KEY (check_id, timestamp, run_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS metric_samples (
+    metric_id INTEGER NOT NULL,
+    timestamp REAL NOT NULL,
+    run_id INTEGER NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (metric_id, timestamp, run_id)
+) WITHOUT ROWID;
+"""
+
+# Per-kind table and column names; never user input.
+_SERIES = {
+    "check": ("checks", "check_results", "check_id"),
+    "metric": ("metrics", "metric_samples", "metric_id"),
+}
+
+
+def default_history_path() -> Path:
+    """
+    Return the per-user history database path, honouring XDG_DATA_HOME.
+    """
+    base = os.environ.get("XDG_DATA_HOME")
+    root = Path(base) if base else Path.home() / ".local" / "share"
+    return root / "sysforge" / "history.sqlite3"
+
+
+def report_timestamp(report: Mapping[str, Any]) -> float:
+    """
+    Return a report's `timestamp` as epoch seconds.
+    """
+    value = report.get("timestamp")
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        raise ValueError(f"report has no valid timestamp: {value!r}") from None
+
+
+def report_from_records(records: Iterable[Mapping[str, Any]]) -> dict[str, Any]:
+    """
+    Rebuild a report from `iter_report_records` output, for recording streamed runs.
+    """
+    report: dict[str, Any] = {"collected": {}, "checks": {"results": [], "summary": {}}}
+    for record in records:
+        kind = record.get("type")
+        if kind == "report":
+            report["timestamp"] = record.get("timestamp")
+        elif kind == "collector":
+            report["collected"][record["name"]] = record.get("data")
+        elif kind == "check":
+            result = {key: value for key, value in record.items() if key != "type"}
+            report["checks"]["results"].append(result)
+        elif kind == "summary":
+            report["checks"]["summary"] = record.get("summary") or {}
+    return report
+
+
+def run_digest(
+    timestamp: float, results: Iterable[Mapping[str, Any]], metrics: Mapping[str, float]
+) -> str:
+    """
+    Return the key that identifies a run: a hash of everything recorded about it.
+    """
+    recorded = [
+        timestamp,
+        [
+            [result["name"], result.get("status"), result.get("message"), result.get("data")]
+            for result in results
+        ],
+        metrics,
+    ]
+    text = json.dumps(recorded, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class HistoryStore:
+    """
+    SQLite history of `sysforge report` runs: every check result and numeric collector field.
+
+    The database runs in WAL mode, so queries never block the writer, and each call to
+    `record_many` is a single transaction however many reports it holds.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        try:
+            self._setup()
+        except sqlite3.DatabaseError as exc:
+            self._conn.close()
+            raise ValueError(f"{path} is not a sysforge history database: {exc}") from exc
+        except ValueError:
+            self._conn.close()
+            raise
+        self._ids: dict[str, dict[str, int]] = {"check": {}, "metric": {}}
+
+    def _setup(self) -> None:
+        conn = self._conn
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise ValueError(f"{self.path} uses history schema {version}, newer than supported")
+        conn.execute("PRAGMA journal_mode = WAL")
+        # WAL keeps committed transactions consistent on crash; fsync on checkpoint is enough.
+        conn.execute("PRAGMA synchronous = NORMAL")
+        with conn:
+            if version == 1:
+                # Runs recorded before digests existed keep a NULL one and are never matched.
+                conn.execute("ALTER TABLE runs ADD COLUMN digest TEXT")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> HistoryStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _series_id(self, kind: str, name: str, *, create: bool) -> int | None:
+        cached = self._ids[kind].get(name)
+        if cached is not None:
+            return cached
+        table = _SERIES[kind][0]
+        if create:
+            self._conn.execute(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", (name,))
+        row = self._conn.execute(f"SELECT id FROM {table} WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return None
+        self._ids[kind][name] = row[0]
+        return row[0]
+
+    def names(self, kind: str) -> list[str]:
+        """
+        Return the recorded check or metric names.
+        """
+        table = _SERIES[kind][0]
+        return [row[0] for row in self._conn.execute(f"SELECT name FROM {table} ORDER BY name")]
+
+    def record(self, report: Mapping[str, Any]) -> int | None:
+        """
+        Record one report and return its run id, or None if it was already recorded.
+        """
+        recorded = self.record_many([report])
+        return recorded[0] if recorded else None
+
+    def record_many(self, reports: Iterable[Mapping[str, Any]]) -> list[int]:
+        """
+        Record reports in one transaction and return the run ids of those newly recorded.
+
+        A run is identified by a digest of its timestamp, check results and metrics, so
+        reports that were already recorded (e.g. by `report --history` before an import) are
+        skipped.
+        """
+        try:
+            return self._record_many(reports)
+        except BaseException:
+            # Names inserted by the rolled-back transaction are gone again.
+            self._ids = {"check": {}, "metric": {}}
+            raise
+
+    def _record_many(self, reports: Iterable[Mapping[str, Any]]) -> list[int]:
+        run_ids: list[int] = []
+        checks: list[tuple[Any, ...]] = []
+        samples: list[tuple[Any, ...]] = []
+        with self._conn:
+            for report in reports:
+                timestamp = report_timestamp(report)
+                section = report.get("checks")
+                section = section if isinstance(section, Mapping) else {}
+                results = [
+                    result
+                    for result in section.get("results") or []
+                    if isinstance(result, Mapping) and isinstance(result.get("name"), str)
+                ]
+                counts = {status: 0 for status in STATUS_SEVERITY}
+                for result in results:
+                    if result.get("status") in counts:
+                        counts[result["status"]] += 1
+                collected = report.get("collected")
+                metrics = flatten_metrics(collected) if isinstance(collected, Mapping) else {}
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO runs (timestamp, pass, warn, fail, digest) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        timestamp,
+                        counts["pass"],
+                        counts["warn"],
+                        counts["fail"],
+                        run_digest(timestamp, results, metrics),
+                    ),
+                )
+                if not cursor.rowcount:
+                    continue
+                run_id = int(cursor.lastrowid or 0)
+                run_ids.append(run_id)
+                for result in results:
+                    data = result.get("data")
+                    checks.append(
+                        (
+                            self._series_id("check", result["name"], create=True),
+                            timestamp,
+                            run_id,
+                            str(result.get("status")),
+                            result.get("message"),
+                            None if data is None else json.dumps(data, default=str),
+                        )
+                    )
+                for name, value in metrics.items():
+                    samples.append(
+                        (self._series_id("metric", name, create=True), timestamp, run_id, value)
+                    )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO check_results VALUES (?, ?, ?, ?, ?, ?)", checks
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO metric_samples VALUES (?, ?, ?, ?)", samples
+            )
+        return run_ids
+
+    def _range(
+        self, column: str, series_id: int, start: float | None, end: float | None
+    ) -> tuple[str, list[Any]]:
+        clause = f"{column} = ?"
+        params: list[Any] = [series_id]
+        if start is not None:
+            clause += " AND timestamp >= ?"
+            params.append(start)
+        if end is not None:
+            clause += " AND timestamp < ?"
+            params.append(end)
+        return clause, params
+
+    def check_results(
+        self, name: str, *, start: float | None = None, end: float | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Return the recorded results of check `name` in [start, end), oldest first.
+        """
+        check_id = self._series_id("check", name, create=False)
+        if check_id is None:
+            return []
+        clause, params = self._range("check_id", check_id, start, end)
+        rows = self._conn.execute(
+            "SELECT timestamp, status, message, data FROM check_results "
+            f"WHERE {clause} ORDER BY timestamp",
+            params,
+        )
+        results = []
+        for timestamp, status, message, data in rows:
+            entry: dict[str, Any] = {"timestamp": timestamp, "status": status, "message": message}
+            if data is not None:
+                entry["data"] = json.loads(data)
+            results.append(entry)
+        return results
+
+    def check_buckets(
+        self,
+        name: str,
+        bucket: float,
+        *,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Count the statuses of check `name` per wall-clock aligned bucket of `bucket` seconds.
+        """
+        if bucket <= 0:
+            raise ValueError("bucket must be greater than zero")
+        check_id = self._series_id("check", name, create=False)
+        if check_id is None:
+            return []
+        clause, params = self._range("check_id", check_id, start, end)
+        rows = self._conn.execute(
+            "SELECT CAST(timestamp / ? AS INTEGER) AS slot, status, COUNT(*) "
+            f"FROM check_results WHERE {clause} GROUP BY slot, status ORDER BY slot",
+            [bucket, *params],
+        )
+        buckets: dict[int, dict[str, Any]] = {}
+        for slot, status, count in rows:
+            entry = buckets.setdefault(
+                slot, {"start": slot * bucket, **{key: 0 for key in STATUS_SEVERITY}}
+            )
+            entry[status] = entry.get(status, 0) + count
+        for entry in buckets.values():
+            seen = [status for status in STATUS_SEVERITY if entry[status]]
+            entry["worst"] = max(seen, key=STATUS_SEVERITY.__getitem__) if seen else None
+        return list(buckets.values())
+
+    def metric_samples(
+        self, name: str, *, start: float | None = None, end: float | None = None
+    ) -> list[tuple[float, float]]:
+        """
+        Return (timestamp, value) samples of metric `name` in [start, end), oldest first.
+        """
+        metric_id = self._series_id("metric", name, create=False)
+        if metric_id is None:
+            return []
+        clause, params = self._range("metric_id", metric_id, start, end)
+        return self._conn.execute(
+            f"SELECT timestamp, value FROM metric_samples WHERE {clause} ORDER BY timestamp",
+            params,
+        ).fetchall()
+
+    def metric_buckets(
+        self,
+        name: str,
+        bucket: float,
+        *,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Aggregate metric `name` into min/max/avg buckets of `bucket` seconds, like
+        `MetricStore.downsample`.
+        """
+        if bucket <= 0:
+            raise ValueError("bucket must be greater than zero")
+        metric_id = self._series_id("metric", name, create=False)
+        if metric_id is None:
+            return []
+        clause, params = self._range("metric_id", metric_id, start, end)
+        rows = self._conn.execute(
+            "SELECT CAST(timestamp / ? AS INTEGER) AS slot, MIN(value), MAX(value), AVG(value), "
+            f"COUNT(*) FROM metric_samples WHERE {clause} GROUP BY slot ORDER BY slot",
+            [bucket, *params],
+        )
+        return [
+            {"start": slot * bucket, "min": low, "max": high, "avg": avg, "count": count}
+            for slot, low, high, avg, count in rows
+        ]
+
+    def last_change(
+        self, kind: str, name: str, *, messages: bool = False
+    ) -> dict[str, Any] | None:
+        """
+        Return the current value of check or metric `name`, since when it has held and the
+        value before, or None if `name` was never recorded.
+
+        A check changes when its status does (or its message too, with `messages`; messages
+        such as free space drift on every run), a metric when its value does; `previous` is
+        None if it never changed. Only the rows since the change are read.
+        """
+        table, samples, column = _SERIES[kind]
+        series_id = self._series_id(kind, name, create=False)
+        if series_id is None:
+            return None
+        fields = "status, message" if kind == "check" else "value"
+        latest = self._conn.execute(
+            f"SELECT timestamp, {fields} FROM {samples} WHERE {column} = ? "
+            "ORDER BY timestamp DESC LIMIT 1",
+            (series_id,),
+        ).fetchone()
+        if latest is None:
+            return None
+        current = list(latest[1:])
+        compared = fields.split(", ")
+        if kind == "check" and not messages:
+            compared = ["status"]
+        differs = " OR ".join(f"{field} IS NOT ?" for field in compared)
+        previous = self._conn.execute(
+            f"SELECT timestamp, {fields} FROM {samples} WHERE {column} = ? AND ({differs}) "
+            "ORDER BY timestamp DESC LIMIT 1",
+            (series_id, *current[: len(compared)]),
+        ).fetchone()
+        if previous is None:
+            since = self._conn.execute(
+                f"SELECT MIN(timestamp) FROM {samples} WHERE {column} = ?", (series_id,)
+            ).fetchone()[0]
+            return {"name": name, "current": current, "since": since, "previous": None}
+        since = self._conn.execute(
+            f"SELECT MIN(timestamp) FROM {samples} WHERE {column} = ? AND timestamp > ?",
+            (series_id, previous[0]),
+        ).fetchone()[0]
+        return {"name": name, "current": current, "since": since, "previous": list(previous[1:])}
+
+    def prune(
+        self,
+        *,
+        max_age: float | None = None,
+        compact_after: float | None = None,
+        resolution: float = 3600.0,
+        now: float,
+        vacuum: bool = False,
+    ) -> dict[str, int]:
+        """
+        Apply the retention policy and return how many runs were deleted.
+
+        Runs older than `max_age` seconds are dropped. Of runs older than `compact_after`,
+        only the first in each `resolution`-second window is kept, so old history stays
+        queryable at a coarser grain.
+        """
+        if resolution <= 0:
+            raise ValueError("resolution must be greater than zero")
+        cutoffs = []
+        deleted = compacted = 0
+        with self._conn:
+            if max_age is not None:
+                cutoff = now - max_age
+                cutoffs.append(cutoff)
+                deleted = self._conn.execute(
+                    "DELETE FROM runs WHERE timestamp < ?", (cutoff,)
+                ).rowcount
+            if compact_after is not None:
+                cutoff = now - compact_after
+                cutoffs.append(cutoff)
+                compacted = self._conn.execute(
+                    "DELETE FROM runs WHERE timestamp < ? AND id NOT IN ("
+                    "SELECT MIN(id) FROM runs WHERE timestamp < ? "
+                    "GROUP BY CAST(timestamp / ? AS INTEGER))",
+                    (cutoff, cutoff, resolution),
+                ).rowcount
+            if deleted or compacted:
+                self._delete_orphans(max(cutoffs))
+        if vacuum:
+            self._conn.execute("VACUUM")
+        self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return {"deleted_runs": deleted, "compacted_runs": compacted}
+
+    def _delete_orphans(self, before: float) -> None:
+        # Walk each series' own index range rather than scanning every sample.
+        for kind in ("check", "metric"):
+            table, samples, column = _SERIES[kind]
+            for (series_id,) in self._conn.execute(f"SELECT id FROM {table}").fetchall():
+                self._conn.execute(
+                    f"DELETE FROM {samples} WHERE {column} = ? AND timestamp < ? "
+                    f"AND NOT EXISTS (SELECT 1 FROM runs WHERE runs.id = {samples}.run_id)",
+                    (series_id, before),
+                )
@@ -0,0 +1,479 @@
+from __future__ import annotations
+
+import contextvars
+import multiprocessing
+import os
+import queue
+import signal
+import subprocess
+import threading
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from multiprocessing.connection import Connection, wait
+from typing import Any, Literal
+
+TaskStatus = Literal["ok", "error", "timeout"]
+
+EXECUTOR_MODES = ("thread", "process")
+
+
+@dataclass
+class TaskOutcome:
+    name: str
+    status: TaskStatus
+    value: Any = None
+    error: BaseException | None = None
+    elapsed_ms: float = 0.0
+
+
+def _elapsed_ms(start: float, end: float | None = None) -> float:
+    finished = time.monotonic() if end is None else end
+    return round((finished - start) * 1000, 3)
+
+
+def _earliest(*limits: float | None) -> float | None:
+    return min((limit for limit in limits if limit is not None), default=None)
+
+
+def kill_process_group(pid: int) -> None:
+    """
+    Kill the process group led by `pid`, or just the process where groups are unavailable.
+    """
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(pid, signal.SIGKILL)
+        else:  # pragma: no cover - Windows has no process groups to signal
+            os.kill(pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+class CancelScope:
+    """
+    Deadline and cancellation shared by a task and everything it starts.
+
+    Scopes nest: a child never outlives its parent's deadline, and cancelling a scope cancels
+    its children. Child processes started with `run_command` are tracked by the current scope
+    and their process groups are killed on cancellation, so an abandoned task leaks nothing.
+    """
+
+    def __init__(self, *, deadline: float | None = None, parent: CancelScope | None = None):
+        self.parent = parent
+        self.deadline = _earliest(deadline, parent.deadline if parent is not None else None)
+        self.cancelled = False
+        self.closed = False
+        self._lock = threading.Lock()
+        self._pids: set[int] = set()
+        self._children: set[CancelScope] = set()
+        if parent is not None:
+            parent._adopt(self)
+
+    def remaining(self) -> float | None:
+        """
+        Return the seconds left before the deadline, or None without one.
+        """
+        return None if self.deadline is None else self.deadline - time.monotonic()
+
+    def cancel(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            pids = list(self._pids)
+            children = list(self._children)
+        for pid in pids:
+            kill_process_group(pid)
+        for child in children:
+            child.cancel()
+
+    def close(self) -> None:
+        """
+        Detach from the parent once the scope's task is done.
+        """
+        self.closed = True
+        if self.parent is not None:
+            with self.parent._lock:
+                self.parent._children.discard(self)
+
+    def track(self, pid: int) -> None:
+        with self._lock:
+            if not self.cancelled:
+                self._pids.add(pid)
+                return
+        kill_process_group(pid)
+
+    def untrack(self, pid: int) -> None:
+        with self._lock:
+            self._pids.discard(pid)
+
+    def _adopt(self, child: CancelScope) -> None:
+        with self._lock:
+            self._children.add(child)
+            cancelled = self.cancelled
+        if cancelled:
+            child.cancel()
+
+
+_current_scope: contextvars.ContextVar[CancelScope | None] = contextvars.ContextVar(
+    "sysforge_cancel_scope", default=None
+)
+
+
+def current_scope() -> CancelScope | None:
+    """
+    Return the scope of the task running in this thread, if any.
+    """
+    return _current_scope.get()
+
+
+def _run_in_scope(scope: CancelScope, func: Callable[[], Any]) -> Any:
+    _current_scope.set(scope)
+    try:
+        return func()
+    finally:
+        scope.close()
+
+
+def run_command(
+    args: Sequence[str], *, timeout: float | None = None, **kwargs: Any
+) -> subprocess.CompletedProcess[Any]:
+    """
+    Run a command like `subprocess.run`, bounded by `timeout` and the current scope's deadline.
+
+    The command leads its own process group (session on POSIX). On timeout or cancellation the
+    whole group is killed, so grandchildren holding its pipes cannot keep the call waiting.
+    Raises `subprocess.TimeoutExpired` in both cases.
+    """
+    scope = current_scope()
+    limit = _earliest(timeout, scope.remaining() if scope is not None else None)
+    if limit is not None and limit <= 0:
+        raise subprocess.TimeoutExpired(list(args), 0)
+    if hasattr(os, "killpg"):
+        kwargs["start_new_session"] = True
+    else:  # pragma: no cover - Windows
+        kwargs["creationflags"] = (
+            kwargs.get("creationflags", 0) | subprocess.CREATE_NEW_PROCESS_GROUP
+        )
+    with subprocess.Popen(list(args), **kwargs) as process:
+        if scope is not None:
+            scope.track(process.pid)
+        try:
+            stdout, stderr = process.communicate(timeout=limit)
+        except BaseException:
+            kill_process_group(process.pid)
+            process.communicate()
+            raise
+        finally:
+            if scope is not None:
+                scope.untrack(process.pid)
+    if scope is not None and scope.cancelled:
+        raise subprocess.TimeoutExpired(list(args), limit or 0)
+    return subprocess.CompletedProcess(process.args, process.returncode, stdout, stderr)
+
+
+def run_tasks(
+    tasks: Mapping[str, Callable[[], Any]],
+    *,
+    jobs: int = 1,
+    timeout: float | None = None,
+    deadline: float | None = None,
+    mode: str = "thread",
+) -> Iterator[TaskOutcome]:
+    """
+    Run named callables and yield their outcomes in completion order.
+
+    `timeout` is a per-task wall-clock budget in seconds, measured from the moment the task
+    starts, and `deadline` an overall `time.monotonic()` limit no task may run past.
+    Overrunning tasks are reported with status "timeout" and abandoned: worker threads are
+    daemonic so they never block interpreter exit, their cancel scope kills any child process
+    groups, and worker processes are killed along with their process group.
+    """
+    if jobs < 1:
+        raise ValueError("jobs must be at least 1")
+    if mode not in EXECUTOR_MODES:
+        raise ValueError(f"mode must be one of {', '.join(EXECUTOR_MODES)}")
+
+    if mode == "process":
+        yield from _run_processes(tasks, jobs=jobs, timeout=timeout, deadline=deadline)
+    elif jobs == 1 and timeout is None and deadline is None:
+        yield from _run_inline(tasks)
+    else:
+        yield from _run_threads(tasks, jobs=jobs, timeout=timeout, deadline=deadline)
+
+
+def _run_inline(tasks: Mapping[str, Callable[[], Any]]) -> Iterator[TaskOutcome]:
+    for name, func in tasks.items():
+        start = time.monotonic()
+        try:
+            outcome = TaskOutcome(name=name, status="ok", value=func())
+        except Exception as exc:
+            outcome = TaskOutcome(name=name, status="error", error=exc)
+        outcome.elapsed_ms = _elapsed_ms(start)
+        yield outcome
+
+
+class ThreadTaskPool:
+    """
+    Daemon worker threads that accept tasks while running and report outcomes one at a time.
+
+    Each task gets its own wall-clock budget measured from when it starts, capped by an
+    optional absolute `deadline`, and runs in a `CancelScope` nested in the submitter's. A
+    worker stuck in an overrunning task is abandoned and replaced, so the pool keeps its
+    width, and the task's scope is cancelled to kill the processes it started. An abandoned
+    worker exits as soon as its task returns instead of taking more work.
+    """
+
+    def __init__(
+        self, *, jobs: int, timeout: float | None = None, deadline: float | None = None
+    ) -> None:
+        if jobs < 1:
+            raise ValueError("jobs must be at least 1")
+        self._jobs = jobs
+        self._timeout = timeout
+        self._deadline = deadline
+        self._pending: queue.SimpleQueue[
+            tuple[str, Callable[[], Any], CancelScope, contextvars.Context] | None
+        ] = queue.SimpleQueue()
+        self._events: queue.SimpleQueue[tuple[str, float, TaskOutcome | None]] = (
+            queue.SimpleQueue()
+        )
+        self._limits: dict[str, tuple[float | None, CancelScope]] = {}
+        self._running: dict[str, tuple[float, float | None]] = {}
+        # Tasks started and not yet reported, by scope: "running" or "abandoned". The lock
+        # makes a worker reporting its result and the pool abandoning it mutually exclusive.
+        self._states: dict[CancelScope, str] = {}
+        self._lock = threading.Lock()
+        self._workers = 0
+
+    def __len__(self) -> int:
+        return len(self._limits)
+
+    def submit(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        *,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> CancelScope:
+        """
+        Queue a task; `timeout` and `deadline` override the pool-wide limits for this task.
+
+        Returns the task's scope, which is closed once the task has returned, even if late.
+        """
+        if name in self._limits:
+            raise ValueError(f"task {name!r} is already outstanding")
+        scope = CancelScope(
+            deadline=self._deadline if deadline is None else deadline, parent=current_scope()
+        )
+        self._limits[name] = (self._timeout if timeout is None else timeout, scope)
+        self._pending.put((name, func, scope, contextvars.copy_context()))
+        if self._workers < self._jobs:
+            self._spawn_worker()
+        return scope
+
+    def next_outcome(self) -> TaskOutcome:
+        """
+        Block until an outstanding task finishes or runs out of time.
+        """
+        if not self._limits:
+            raise LookupError("no outstanding tasks")
+        while True:
+            deadlines = [end for _, end in self._running.values() if end is not None]
+            wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            try:
+                name, start, outcome = self._events.get(timeout=wait_for)
+            except queue.Empty:
+                expired = self._expire()
+                if expired is not None:
+                    return expired
+                continue
+
+            if outcome is None:
+                if name in self._limits:
+                    budget, scope = self._limits[name]
+                    end = _earliest(None if budget is None else start + budget, scope.deadline)
+                    self._running[name] = (start, end)
+            elif name in self._limits:
+                self._running.pop(name, None)
+                del self._limits[name]
+                return outcome
+            # Otherwise the task already timed out and its late result is discarded.
+
+    def close(self) -> None:
+        """
+        Stop idle workers; abandoned workers exit on their own once their task returns.
+        """
+        for _ in range(self._workers):
+            self._pending.put(None)
+        self._workers = 0
+
+    def _expire(self) -> TaskOutcome | None:
+        now = time.monotonic()
+        for name, (start, end) in list(self._running.items()):
+            if end is not None and now >= end:
+                _, scope = self._limits[name]
+                with self._lock:
+                    if scope not in self._states:
+                        # It finished just now; its outcome is already queued.
+                        continue
+                    self._states[scope] = "abandoned"
+                del self._running[name]
+                del self._limits[name]
+                scope.cancel()
+                # The stuck worker is lost; replace it so the pool keeps its width.
+                self._workers -= 1
+                self._spawn_worker()
+                return TaskOutcome(name=name, status="timeout", elapsed_ms=_elapsed_ms(start, now))
+        return None
+
+    def _spawn_worker(self) -> None:
+        self._workers += 1
+        threading.Thread(target=self._work, name="sysforge-task", daemon=True).start()
+
+    def _work(self) -> None:
+        while True:
+            item = self._pending.get()
+            if item is None:
+                return
+            name, func, scope, context = item
+            start = time.monotonic()
+            if scope.deadline is not None and start >= scope.deadline:
+                # The deadline passed while the task was queued; report it without starting.
+                scope.close()
+                self._events.put((name, start, TaskOutcome(name=name, status="timeout")))
+                continue
+            with self._lock:
+                self._states[scope] = "running"
+            self._events.put((name, start, None))
+            try:
+                value = context.run(_run_in_scope, scope, func)
+                outcome = TaskOutcome(name=name, status="ok", value=value)
+            except Exception as exc:
+                outcome = TaskOutcome(name=name, status="error", error=exc)
+            outcome.elapsed_ms = _elapsed_ms(start)
+            with self._lock:
+                if self._states.pop(scope) == "abandoned":
+                    # A replacement worker has taken this one's place in the pool.
+                    return
+                self._events.put((name, start, outcome))
+
+
+def _run_threads(
+    tasks: Mapping[str, Callable[[], Any]],
+    *,
+    jobs: int,
+    timeout: float | None,
+    deadline: float | None = None,
+) -> Iterator[TaskOutcome]:
+    pool = ThreadTaskPool(jobs=jobs, timeout=timeout, deadline=deadline)
+    try:
+        for name, func in tasks.items():
+            pool.submit(name, func)
+        while len(pool):
+            yield pool.next_outcome()
+    finally:
+        pool.close()
+
+
+def _mp_context() -> Any:
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _process_entry(func: Callable[[], Any], conn: Connection) -> None:
+    if hasattr(os, "setpgid"):
+        # Lead a process group so a kill also reaches anything the task started.
+        os.setpgid(0, 0)
+    try:
+        conn.send(("ok", func()))
+    except BaseException as exc:
+        conn.send(("error", f"{type(exc).__name__}: {exc}"))
+    finally:
+        conn.close()
+
+
+def _kill_task_process(process: Any) -> None:
+    if process.pid is not None:
+        kill_process_group(process.pid)
+    process.kill()
+    process.join()
+
+
+def _run_processes(
+    tasks: Mapping[str, Callable[[], Any]],
+    *,
+    jobs: int,
+    timeout: float | None,
+    deadline: float | None = None,
+) -> Iterator[TaskOutcome]:
+    ctx = _mp_context()
+    waiting = list(tasks.items())
+    waiting.reverse()
+    running: dict[str, tuple[Any, Connection, float]] = {}
+
+    try:
+        while waiting or running:
+            while waiting and len(running) < jobs:
+                name, func = waiting.pop()
+                if deadline is not None and time.monotonic() >= deadline:
+                    yield TaskOutcome(name=name, status="timeout")
+                    continue
+                receiver, sender = ctx.Pipe(duplex=False)
+                process = ctx.Process(
+                    target=_process_entry,
+                    args=(func, sender),
+                    name=f"sysforge-{name}",
+                    daemon=True,
+                )
+                start = time.monotonic()
+                process.start()
+                sender.close()
+                running[name] = (process, receiver, start)
+            if not running:
+                break
+
+            wait_for = None
+            if timeout is not None or deadline is not None:
+                earliest = min(start for _, _, start in running.values())
+                end = _earliest(None if timeout is None else earliest + timeout, deadline)
+                assert end is not None
+                wait_for = max(0.0, end - time.monotonic())
+            ready = wait([receiver for _, receiver, _ in running.values()], timeout=wait_for)
+
+            now = time.monotonic()
+            for name, (process, receiver, start) in list(running.items()):
+                if receiver in ready:
+                    try:
+                        status, payload = receiver.recv()
+                    except EOFError:
+                        process.join()
+                        status = "error"
+                        payload = f"task process exited with code {process.exitcode}"
+                    process.join()
+                    receiver.close()
+                    del running[name]
+                    if status == "ok":
+                        yield TaskOutcome(
+                            name=name, status="ok", value=payload, elapsed_ms=_elapsed_ms(start)
+                        )
+                    else:
+                        yield TaskOutcome(
+                            name=name,
+                            status="error",
+                            error=RuntimeError(payload),
+                            elapsed_ms=_elapsed_ms(start),
+                        )
+                elif (timeout is not None and now - start >= timeout) or (
+                    deadline is not None and now >= deadline
+                ):
+                    _kill_task_process(process)
+                    receiver.close()
+                    del running[name]
+                    yield TaskOutcome(
+                        name=name, status="timeout", elapsed_ms=_elapsed_ms(start, now)
+                    )
+    finally:
+        for process, receiver, _ in running.values():
+            _kill_task_process(process)
+            receiver.close()
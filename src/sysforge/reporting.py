@@ -1,26 +1,116 @@
 from __future__ import annotations
 
+import time
+from collections.abc import Iterator, Mapping
 from pathlib import Path
 from typing import Any
 
-from .checks import run_checks
-from .collectors import run_collectors
+from .cache import CollectorCache
+from .checks import iter_checks, run_checks
+from .checks.base import DEFAULT_TIMEOUT_STATUS, CheckStatus
+from .collectors import iter_collectors, run_collectors
+from .context import RunContext
+from .streaming import check_record, collector_record, summary_record
 from .utils import iso_timestamp, write_json_file, write_text_file
 
 
-def assemble_report(*, disk_threshold: float = 0.10) -> dict[str, Any]:
+def assemble_report(
+    *,
+    disk_threshold: float = 0.10,
+    jobs: int = 1,
+    collector_timeout: float | None = None,
+    executor: str = "thread",
+    cache: CollectorCache | None = None,
+    settings: Mapping[str, Any] | None = None,
+    incremental: bool = False,
+    check_timeout: float | None = None,
+    deadline: float | None = None,
+    timeout_status: CheckStatus = DEFAULT_TIMEOUT_STATUS,
+) -> dict[str, Any]:
     """
     Collect system data and run health checks in a single payload.
+
+    Collectors and checks share one run context, so each probe runs once and the collected
+    and checked numbers agree. `cache` serves slow-changing collector output across runs and
+    `settings` carries run-wide check options such as per-mount disk thresholds.
+
+    `deadline` (a `time.monotonic()` value) bounds collectors and checks together, and
+    `check_timeout` each check; see `run_checks`. With `incremental`, checks whose fingerprint
+    is unchanged reuse their result stored in `cache`. `_meta.timings` records what each
+    collector and check cost: wall and CPU time, peak RSS growth and I/O counters.
     """
-    collected = run_collectors()
-    checks = run_checks(disk_threshold=disk_threshold)
+    start = time.perf_counter()
+    context = RunContext(cache=cache, settings=settings)
+    collected = run_collectors(
+        jobs=jobs,
+        timeout=collector_timeout,
+        deadline=deadline,
+        executor=executor,
+        context=context,
+    )
+    checks = run_checks(
+        disk_threshold=disk_threshold,
+        jobs=jobs,
+        context=context,
+        result_cache=cache if incremental else None,
+        timeout=check_timeout,
+        deadline=deadline,
+        timeout_status=timeout_status,
+    )
+    timings: dict[str, Any] = {"collectors": {}, "checks": {}, **context.timings()}
+    timings["total_wall_ms"] = round((time.perf_counter() - start) * 1000, 3)
     return {
         "timestamp": iso_timestamp(),
         "collected": collected,
         "checks": checks,
+        "_meta": {"timings": timings},
     }
 
 
+def iter_report_records(
+    *,
+    disk_threshold: float = 0.10,
+    jobs: int = 1,
+    collector_timeout: float | None = None,
+    executor: str = "thread",
+    cache: CollectorCache | None = None,
+    settings: Mapping[str, Any] | None = None,
+    incremental: bool = False,
+    check_timeout: float | None = None,
+    deadline: float | None = None,
+    timeout_status: CheckStatus = DEFAULT_TIMEOUT_STATUS,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield the combined report as NDJSON records in the order they become available.
+
+    A header record comes first, then one record per collector and per check as each one
+    finishes, then the summary counts.
+    """
+    context = RunContext(cache=cache, settings=settings)
+    yield {"type": "report", "timestamp": iso_timestamp()}
+    for name, payload in iter_collectors(
+        jobs=jobs,
+        timeout=collector_timeout,
+        deadline=deadline,
+        executor=executor,
+        context=context,
+    ):
+        yield collector_record(name, payload)
+    summary = {"pass": 0, "warn": 0, "fail": 0}
+    for result in iter_checks(
+        disk_threshold=disk_threshold,
+        jobs=jobs,
+        context=context,
+        result_cache=cache if incremental else None,
+        timeout=check_timeout,
+        deadline=deadline,
+        timeout_status=timeout_status,
+    ):
+        summary[result.status] += 1
+        yield check_record(result)
+    yield summary_record(summary)
+
+
 def write_report_file(data: dict[str, Any], path: Path, *, pretty: bool = False) -> None:
     """
     Persist report data to disk.
@@ -44,6 +134,54 @@ def _escape_table(value: str) -> str:
     return value.replace("|", "\\|")
 
 
+def _format_count(value: Any) -> str:
+    if isinstance(value, (int, float)):
+        return f"{int(value):,}"
+    return "unknown"
+
+
+def _format_ms(value: Any) -> str:
+    if isinstance(value, (int, float)):
+        return f"{value:,.1f}"
+    return "unknown"
+
+
+def _timing_rows(timings: Mapping[str, Any]) -> list[str]:
+    entries: list[tuple[str, str, dict[str, Any]]] = []
+    for section, kind in (("collectors", "collector"), ("checks", "check")):
+        for name, sample in (timings.get(section) or {}).items():
+            if isinstance(sample, dict):
+                entries.append((kind, str(name), sample))
+    entries.sort(key=lambda entry: -float(entry[2].get("wall_ms") or 0))
+
+    rows: list[str] = []
+    for kind, name, sample in entries:
+        io = sample.get("io") or {}
+        wall = _format_ms(sample.get("wall_ms"))
+        if sample.get("timed_out"):
+            wall = f"{wall} (timeout)"
+        syscalls = (
+            _format_count(io.get("syscr", 0) + io.get("syscw", 0))
+            if "syscr" in io or "syscw" in io
+            else "unknown"
+        )
+        rss = sample.get("max_rss_delta_bytes")
+        rows.append(
+            " | ".join(
+                [
+                    _escape_table(name),
+                    kind,
+                    wall,
+                    _format_ms(sample.get("cpu_ms")),
+                    _format_bytes(rss) if rss is not None else "unknown",
+                    _format_bytes(io["rchar"]) if "rchar" in io else "unknown",
+                    syscalls,
+                ]
+            )
+        )
+    return rows
+
+
 def render_report_markdown(report: dict[str, Any]) -> str:
     """
     Render the combined report dictionary as Markdown.
@@ -118,6 +256,21 @@ def render_report_markdown(report: dict[str, Any]) -> str:
         ]
     )
 
+    timings = (report.get("_meta") or {}).get("timings")
+    if isinstance(timings, dict):
+        content.extend(
+            [
+                "",
+                "## Timings",
+                "",
+                f"Total: {_format_ms(timings.get('total_wall_ms'))} ms",
+                "",
+                "Name | Kind | Wall ms | CPU ms | Peak RSS growth | Read | Syscalls",
+                "--- | --- | --- | --- | --- | --- | ---",
+                *_timing_rows(timings),
+            ]
+        )
+
     markdown = "\n".join(content).rstrip()
     return f"{markdown}\n"
 
@@ -0,0 +1,514 @@
+from __future__ import annotations
+
+import ast
+import heapq
+import json
+import operator
+import tomllib
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any
+
+from .aggregate import host_name, load_report, reduce_report_batches
+from .checks.base import STATUS_SEVERITY
+
+RULE_STATUSES = ("warn", "fail")
+MAX_ERROR_SAMPLES = 20
+
+FieldPath = tuple[str | int, ...]
+RowFn = Callable[[Mapping[str, Any]], Any]
+ColumnFn = Callable[[Mapping[str, list[Any]], int], list[Any]]
+
+_COMPARISONS: dict[type[ast.cmpop], Callable[[Any, Any], Any]] = {
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.In: lambda left, right: left in right,
+    ast.NotIn: lambda left, right: left not in right,
+}
+_ARITHMETIC: dict[type[ast.operator], Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _step(data: Any, key: str | int) -> Any:
+    if isinstance(data, Mapping):
+        return data.get(key)
+    if isinstance(data, list) and isinstance(key, int):
+        return data[key] if -len(data) <= key < len(data) else None
+    if isinstance(data, list):
+        for item in data:
+            if isinstance(item, Mapping) and item.get("mount_point") == key:
+                return item
+    return None
+
+
+def get_field(data: Any, path: FieldPath) -> Any:
+    """
+    Follow `path` into nested collector data, or return None where it leads nowhere.
+
+    A string key on a list selects the entry with that `mount_point`, so
+    `mounts.mounts["/var"]` is the `/var` mount.
+    """
+    for key in path:
+        data = _step(data, key)
+        if data is None:
+            return None
+    return data
+
+
+def extract_columns(
+    rows: Sequence[Mapping[str, Any]], paths: Mapping[str, FieldPath]
+) -> dict[str, list[Any]]:
+    """
+    Return one list of values per named path, like `get_field` on every row.
+
+    Paths are walked a level at a time across all rows, and a shared prefix such as
+    `system.disk` is walked once for every path below it.
+    """
+    levels: dict[FieldPath, list[Any]] = {(): list(rows)}
+
+    def column(path: FieldPath) -> list[Any]:
+        values = levels.get(path)
+        if values is None:
+            key = path[-1]
+            values = levels[path] = [
+                value.get(key) if type(value) is dict else _step(value, key)
+                for value in column(path[:-1])
+            ]
+        return values
+
+    return {name: column(path) for name, path in paths.items()}
+
+
+# Missing fields and type mismatches make a comparison unknown (None) rather than false, and
+# `and`/`or`/`not` follow three-valued logic, so a rule never fires on data that is absent.
+
+
+def _compare(op: Callable[[Any, Any], Any], left: Any, right: Any) -> bool | None:
+    if left is None or right is None:
+        return None
+    try:
+        return bool(op(left, right))
+    except TypeError:
+        return None
+
+
+def _arithmetic(op: Callable[[Any, Any], Any], left: Any, right: Any) -> float | None:
+    if not (_is_number(left) and _is_number(right)):
+        return None
+    try:
+        return op(left, right)
+    except (ZeroDivisionError, OverflowError):
+        return None
+
+
+def _negate(value: Any) -> Any:
+    return -value if _is_number(value) else None
+
+
+def _not(value: Any) -> bool | None:
+    return None if value is None else not value
+
+
+def _all(values: Iterable[Any]) -> bool | None:
+    unknown = False
+    for value in values:
+        if value is None:
+            unknown = True
+        elif not value:
+            return False
+    return None if unknown else True
+
+
+def _any(values: Iterable[Any]) -> bool | None:
+    unknown = False
+    for value in values:
+        if value is None:
+            unknown = True
+        elif value:
+            return True
+    return None if unknown else False
+
+
+def _field_path(node: ast.expr) -> FieldPath | None:
+    if isinstance(node, ast.Name):
+        return (node.id,)
+    if isinstance(node, ast.Attribute):
+        parent = _field_path(node.value)
+        return None if parent is None else (*parent, node.attr)
+    if isinstance(node, ast.Subscript):
+        parent = _field_path(node.value)
+        key = node.slice
+        if parent is None or not isinstance(key, ast.Constant):
+            return None
+        if isinstance(key.value, str) or (
+            isinstance(key.value, int) and not isinstance(key.value, bool)
+        ):
+            return (*parent, key.value)
+    return None
+
+
+def _field_name(path: FieldPath) -> str:
+    name = str(path[0])
+    for key in path[1:]:
+        name += f"[{key!r}]" if not isinstance(key, str) or not key.isidentifier() else f".{key}"
+    return name
+
+
+def _constant(node: ast.expr) -> Any:
+    if isinstance(node, ast.Constant) and isinstance(node.value, (str, int, float)):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _constant(node.operand)
+        if _is_number(value):
+            return -value
+    raise ValueError(f"unsupported literal {ast.unparse(node)!r}")
+
+
+class _Compiler:
+    """
+    Turn a validated expression tree into a row closure and a column closure.
+    """
+
+    def __init__(self) -> None:
+        self.fields: dict[str, FieldPath] = {}
+
+    def compile(self, node: ast.expr) -> tuple[RowFn, ColumnFn]:
+        path = _field_path(node)
+        if path is not None:
+            name = _field_name(path)
+            self.fields[name] = path
+            return (lambda data: get_field(data, path)), (lambda columns, _: columns[name])
+        if isinstance(node, ast.Constant):
+            value = _constant(node)
+            return (lambda _: value), (lambda _, count: [value] * count)
+        if isinstance(node, (ast.Tuple, ast.List)):
+            values = frozenset(_constant(element) for element in node.elts)
+            return (lambda _: values), (lambda _, count: [values] * count)
+        if isinstance(node, ast.UnaryOp):
+            row, column = self.compile(node.operand)
+            if isinstance(node.op, ast.Not):
+                return (
+                    lambda data: _not(row(data)),
+                    lambda columns, count: [_not(value) for value in column(columns, count)],
+                )
+            if isinstance(node.op, ast.USub):
+                return (
+                    lambda data: _negate(row(data)),
+                    lambda columns, count: [_negate(value) for value in column(columns, count)],
+                )
+        if isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC:
+            return self._pairwise(_arithmetic, _ARITHMETIC[type(node.op)], node.left, node.right)
+        if isinstance(node, ast.Compare) and all(type(op) in _COMPARISONS for op in node.ops):
+            # `a < b < c` means `a < b and b < c`, as in Python.
+            operands = [node.left, *node.comparators]
+            links = [
+                self._pairwise(_compare, _COMPARISONS[type(op)], left, right)
+                for op, left, right in zip(node.ops, operands, operands[1:], strict=False)
+            ]
+            return self._combine(_all, links)
+        if isinstance(node, ast.BoolOp):
+            combine = _all if isinstance(node.op, ast.And) else _any
+            return self._combine(combine, [self.compile(value) for value in node.values])
+        raise ValueError(f"unsupported expression {ast.unparse(node)!r}")
+
+    def _pairwise(
+        self,
+        apply: Callable[[Callable[[Any, Any], Any], Any, Any], Any],
+        op: Callable[[Any, Any], Any],
+        left_node: ast.expr,
+        right_node: ast.expr,
+    ) -> tuple[RowFn, ColumnFn]:
+        left_row, left_column = self.compile(left_node)
+        right_row, right_column = self.compile(right_node)
+
+        def column(columns: Mapping[str, list[Any]], count: int) -> list[Any]:
+            return [
+                apply(op, left, right)
+                for left, right in zip(
+                    left_column(columns, count), right_column(columns, count), strict=True
+                )
+            ]
+
+        return (lambda data: apply(op, left_row(data), right_row(data))), column
+
+    @staticmethod
+    def _combine(
+        combine: Callable[[Iterable[Any]], Any], parts: list[tuple[RowFn, ColumnFn]]
+    ) -> tuple[RowFn, ColumnFn]:
+        if len(parts) == 1:
+            return parts[0]
+        rows = [row for row, _ in parts]
+        columns = [column for _, column in parts]
+        return (
+            lambda data: combine(row(data) for row in rows),
+            lambda data, count: [
+                combine(values)
+                for values in zip(*(column(data, count) for column in columns), strict=True)
+            ],
+        )
+
+
+class Rule:
+    """
+    One declarative check: an expression over collector payloads and the status it sets.
+
+    The expression is parsed with the Python grammar, restricted to field paths, literals,
+    comparisons, `and`/`or`/`not` and arithmetic, and compiled once into closures: `matches`
+    evaluates one run's payloads and `matches_columns` evaluates many runs at once over
+    per-field value lists.
+    """
+
+    def __init__(self, name: str, when: str, status: str, message: str | None = None) -> None:
+        if status not in RULE_STATUSES:
+            raise ValueError(f"rule {name!r}: status must be one of {', '.join(RULE_STATUSES)}")
+        try:
+            tree = ast.parse(when.strip(), mode="eval")
+        except SyntaxError as exc:
+            raise ValueError(f"rule {name!r}: invalid expression: {exc.msg}") from None
+        compiler = _Compiler()
+        try:
+            self._row, self._column = compiler.compile(tree.body)
+        except ValueError as exc:
+            raise ValueError(f"rule {name!r}: {exc}") from None
+        self.name = name
+        self.when = when.strip()
+        self.status = status
+        self.message = message
+        self.fields = compiler.fields
+
+    def matches(self, collected: Mapping[str, Any]) -> bool | None:
+        """
+        Return whether the rule fires for one run's payloads, or None if fields are missing.
+        """
+        result = self._row(collected)
+        return None if result is None else bool(result)
+
+    def matches_columns(self, columns: Mapping[str, list[Any]], count: int) -> list[bool | None]:
+        """
+        Evaluate `count` runs at once; `columns` maps each of `fields` to a list of values.
+        """
+        return [None if value is None else bool(value) for value in self._column(columns, count)]
+
+    def values(self, collected: Mapping[str, Any]) -> dict[str, Any]:
+        """
+        Return the value of every field the expression reads.
+        """
+        return {name: get_field(collected, path) for name, path in self.fields.items()}
+
+
+@lru_cache(maxsize=512)
+def _compile_cached(name: str, when: str, status: str, message: str | None) -> Rule:
+    return Rule(name, when, status, message)
+
+
+def compile_rules(definitions: Sequence[Mapping[str, Any]]) -> list[Rule]:
+    """
+    Compile `parse_rules` output, reusing rules this process already compiled.
+    """
+    return [
+        _compile_cached(rule["name"], rule["when"], rule["status"], rule.get("message"))
+        for rule in definitions
+    ]
+
+
+def _definition(name: str, spec: Any) -> dict[str, Any]:
+    if isinstance(spec, str):
+        when, arrow, status = spec.rpartition("->")
+        if not arrow:
+            raise ValueError(f"rule {name!r} must look like `EXPRESSION -> warn|fail`")
+        spec = {"when": when, "status": status.strip()}
+    if not isinstance(spec, Mapping):
+        raise ValueError(f"rule {name!r} must be a string or a table")
+    unknown = set(spec) - {"when", "status", "message"}
+    if unknown:
+        raise ValueError(f"rule {name!r} has unknown key(s): {', '.join(sorted(unknown))}")
+    when, status, message = spec.get("when"), spec.get("status", "warn"), spec.get("message")
+    if not isinstance(when, str) or not when.strip():
+        raise ValueError(f"rule {name!r} needs a `when` expression")
+    if message is not None and not isinstance(message, str):
+        raise ValueError(f"rule {name!r}: message must be a string")
+    definition = {"name": name, "when": when.strip(), "status": status, "message": message}
+    compile_rules([definition])
+    return definition
+
+
+def parse_rules(data: Mapping[str, Any]) -> list[dict[str, Any]]:
+    """
+    Validate a rule file into the `rules` run setting.
+
+    `rules` maps each rule name to `"EXPRESSION -> warn|fail"` or to a table with `when`,
+    `status` (default `warn`) and an optional `message`. Every expression is compiled here, so
+    a bad rule is reported before anything runs.
+    """
+    rules = data.get("rules")
+    if not isinstance(rules, Mapping) or not rules:
+        raise ValueError("rule file needs a non-empty `rules` table")
+    return [_definition(str(name), spec) for name, spec in rules.items()]
+
+
+def load_rules(path: Path) -> list[dict[str, Any]]:
+    """
+    Read rules from a TOML file (`.toml`) or a JSON file.
+    """
+    try:
+        if path.suffix.lower() == ".toml":
+            data = tomllib.loads(path.read_text())
+        else:
+            data = json.loads(path.read_text())
+    except (tomllib.TOMLDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError(f"{path}: {exc}") from None
+    if not isinstance(data, Mapping):
+        raise ValueError(f"{path}: expected a table of settings")
+    return parse_rules(data)
+
+
+def rule_outcome(rule: Rule, matched: bool | None) -> str:
+    """
+    Map a match result to `pass`, the rule's status, or `unknown` when data was missing.
+    """
+    if matched is None:
+        return "unknown"
+    return rule.status if matched else "pass"
+
+
+def evaluate_columns(
+    rules: Sequence[Rule], collected: Sequence[Mapping[str, Any]]
+) -> dict[str, list[str]]:
+    """
+    Evaluate every rule against many runs' payloads and return each rule's outcomes in order.
+
+    Each field any rule reads is extracted once into a column shared by all rules.
+    """
+    count = len(collected)
+    paths: dict[str, FieldPath] = {}
+    for rule in rules:
+        paths.update(rule.fields)
+    columns = extract_columns(collected, paths)
+    return {
+        rule.name: [rule_outcome(rule, matched) for matched in rule.matches_columns(columns, count)]
+        for rule in rules
+    }
+
+
+class RuleRollup:
+    """
+    Mergeable per-rule outcome counts over many stored reports.
+
+    Up to `top` matching hosts are kept per rule: failures before warnings, then by host name,
+    so the result does not depend on how the reports were split across workers.
+    """
+
+    def __init__(self, *, top: int = 5) -> None:
+        self.top = top
+        self.reports = 0
+        self.errors = 0
+        self.error_samples: list[str] = []
+        self.rules: dict[str, Counter[str]] = {}
+        self.hosts: dict[str, list[tuple[int, str]]] = {}
+
+    def add_error(self, path: str, message: str) -> None:
+        self.errors += 1
+        if len(self.error_samples) < MAX_ERROR_SAMPLES:
+            self.error_samples.append(f"{path}: {message}")
+
+    def add_outcomes(self, hosts: Sequence[str], outcomes: Mapping[str, list[str]]) -> None:
+        self.reports += len(hosts)
+        for name, results in outcomes.items():
+            self.rules.setdefault(name, Counter()).update(results)
+            self._keep_worst(
+                name,
+                (
+                    (-STATUS_SEVERITY[result], host)
+                    for host, result in zip(hosts, results, strict=True)
+                    if result in RULE_STATUSES
+                ),
+            )
+
+    def _keep_worst(self, name: str, entries: Iterable[tuple[int, str]]) -> None:
+        self.hosts[name] = heapq.nsmallest(self.top, [*self.hosts.get(name, []), *entries])
+
+    def merge(self, other: RuleRollup) -> None:
+        self.reports += other.reports
+        self.errors += other.errors
+        room = MAX_ERROR_SAMPLES - len(self.error_samples)
+        self.error_samples.extend(other.error_samples[: max(room, 0)])
+        for name, counts in other.rules.items():
+            self.rules.setdefault(name, Counter()).update(counts)
+        for name, entries in other.hosts.items():
+            self._keep_worst(name, entries)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "reports": self.reports,
+            "errors": {"count": self.errors, "samples": self.error_samples},
+            "rules": {
+                name: {
+                    "pass": counts["pass"],
+                    "warn": counts["warn"],
+                    "fail": counts["fail"],
+                    "unknown": counts["unknown"],
+                    "hosts": [host for _, host in self.hosts.get(name, [])],
+                }
+                for name, counts in self.rules.items()
+            },
+        }
+
+
+def evaluate_paths(
+    paths: Sequence[str], *, rules: Sequence[Mapping[str, Any]], top: int = 5
+) -> RuleRollup:
+    """
+    Apply rule definitions to one batch of report files; unreadable files count as errors.
+    """
+    compiled = compile_rules(rules)
+    rollup = RuleRollup(top=top)
+    hosts: list[str] = []
+    collected: list[Mapping[str, Any]] = []
+    for name in paths:
+        path = Path(name)
+        try:
+            report = load_report(path)
+        except (OSError, ValueError) as exc:
+            rollup.add_error(name, str(exc))
+            continue
+        payloads = report.get("collected")
+        hosts.append(host_name(path))
+        collected.append(payloads if isinstance(payloads, Mapping) else {})
+    rollup.add_outcomes(hosts, evaluate_columns(compiled, collected))
+    return rollup
+
+
+def evaluate_reports(
+    paths: Iterable[str],
+    rules: Sequence[Mapping[str, Any]],
+    *,
+    jobs: int = 1,
+    top: int = 5,
+    batch_size: int = 1024,
+) -> RuleRollup:
+    """
+    Apply rules to stored report files in batches across up to `jobs` worker processes.
+
+    Each batch is evaluated column by column, and each worker compiles the rules once.
+    """
+    return reduce_report_batches(
+        paths,
+        partial(evaluate_paths, rules=list(rules), top=top),
+        RuleRollup(top=top),
+        jobs=jobs,
+        batch_size=batch_size,
+    )
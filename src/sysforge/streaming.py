@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from typing import Any, TextIO
+
+from .checks.base import CheckResult
+from .utils import json_dump
+
+
+def collector_record(name: str, payload: Any) -> dict[str, Any]:
+    return {"type": "collector", "name": name, "data": payload}
+
+
+def check_record(result: CheckResult) -> dict[str, Any]:
+    return {"type": "check", **result.to_dict()}
+
+
+def summary_record(summary: dict[str, int]) -> dict[str, Any]:
+    return {"type": "summary", "summary": summary}
+
+
+class NdjsonWriter:
+    """
+    Write one compact JSON document per line, flushing after every record.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+
+    def write(self, record: Any) -> None:
+        self._stream.write(json_dump(record) + "\n")
+        self._stream.flush()
+
+    def close(self) -> None:
+        self._stream.flush()
+
+    def __enter__(self) -> NdjsonWriter:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+
+class RotatingNdjsonFile(NdjsonWriter):
+    """
+    Append NDJSON records to a file, rotating it once it would exceed `max_bytes`.
+
+    Rotated files are renamed `<name>.1` (newest) through `<name>.<backups>` (oldest); with
+    `backups=0` the file is simply truncated. Without `max_bytes` the file grows unbounded.
+    """
+
+    def __init__(self, path: Path, *, max_bytes: int | None = None, backups: int = 5) -> None:
+        if max_bytes is not None and max_bytes <= 0:
+            raise ValueError("max_bytes must be greater than 0")
+        if backups < 0:
+            raise ValueError("backups must not be negative")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        path.parent.mkdir(parents=True, exist_ok=True)
+        super().__init__(path.open("a", encoding="utf-8"))
+        self._size = self._stream.tell()
+
+    def write(self, record: Any) -> None:
+        line = json_dump(record) + "\n"
+        size = len(line.encode("utf-8"))
+        if self.max_bytes is not None and self._size and self._size + size > self.max_bytes:
+            self._rotate()
+        self._stream.write(line)
+        self._stream.flush()
+        self._size += size
+
+    def _rotate(self) -> None:
+        self._stream.close()
+        if self.backups:
+            for index in range(self.backups - 1, 0, -1):
+                source = self.path.with_name(f"{self.path.name}.{index}")
+                if source.exists():
+                    os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+            self._stream = self.path.open("a", encoding="utf-8")
+        else:
+            self._stream = self.path.open("w", encoding="utf-8")
+        self._size = 0
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+def open_ndjson(
+    path: Path | None, *, max_bytes: int | None = None, backups: int = 5
+) -> NdjsonWriter:
+    """
+    Return an NDJSON writer for `path`, or for stdout when no path is given.
+    """
+    if path is None:
+        return NdjsonWriter(sys.stdout)
+    return RotatingNdjsonFile(path, max_bytes=max_bytes, backups=backups)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import cProfile
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import cache
+from pathlib import Path
+from typing import Any, TypeVar
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+T = TypeVar("T")
+
+# Per-thread counters, so concurrent probes do not see each other's I/O.
+THREAD_IO_PATH = Path("/proc/thread-self/io")
+IO_FIELDS = ("rchar", "wchar", "syscr", "syscw", "read_bytes", "write_bytes")
+
+
+def read_io_counters(path: Path | None = None) -> dict[str, int] | None:
+    """
+    Read the I/O accounting counters of the calling thread, or None where unavailable.
+    """
+    try:
+        text = (path or THREAD_IO_PATH).read_text()
+    except OSError:
+        return None
+    counters: dict[str, int] = {}
+    for line in text.splitlines():
+        key, _, value = line.partition(":")
+        if key in IO_FIELDS:
+            counters[key] = int(value)
+    return counters
+
+
+@cache
+def _io_overhead() -> dict[str, int]:
+    # Reading the counters shows up in them; measure that once so it can be subtracted.
+    before = read_io_counters()
+    after = read_io_counters()
+    if before is None or after is None:
+        return {}
+    return {key: after[key] - before.get(key, 0) for key in after}
+
+
+def max_rss_bytes() -> int | None:
+    """
+    Return the process's peak resident set size in bytes, or None where unavailable.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def timed(func: Callable[..., T], *args: Any, **kwargs: Any) -> tuple[T, dict[str, Any]]:
+    """
+    Call `func` and return its result with the wall time, thread CPU time, peak RSS growth and
+    thread I/O counters it took.
+
+    Peak RSS is process-wide, so under concurrency growth is charged to whichever probe was
+    running when the peak rose.
+    """
+    io_before = read_io_counters()
+    rss_before = max_rss_bytes()
+    cpu_start = time.thread_time()
+    wall_start = time.perf_counter()
+    value = func(*args, **kwargs)
+    wall = time.perf_counter() - wall_start
+    cpu = time.thread_time() - cpu_start
+    rss_after = max_rss_bytes()
+    io_after = read_io_counters()
+    io = None
+    if io_before is not None and io_after is not None:
+        overhead = _io_overhead()
+        io = {
+            key: max(io_after[key] - io_before.get(key, 0) - overhead.get(key, 0), 0)
+            for key in io_after
+        }
+    return value, {
+        "wall_ms": round(wall * 1000, 3),
+        "cpu_ms": round(cpu * 1000, 3),
+        "max_rss_delta_bytes": (
+            rss_after - rss_before if rss_before is not None and rss_after is not None else None
+        ),
+        "io": io,
+    }
+
+
+@contextmanager
+def profiled(path: Path | None) -> Iterator[None]:
+    """
+    Run the block under cProfile and write the stats to `path` (no-op when `path` is None).
+
+    cProfile only follows the calling thread; run with one job for a complete profile.
+    """
+    if path is None:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(path)
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import math
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+MAGIC = b"SFTS"
+FORMAT_VERSION = 1
+NAME_BYTES = 64
+# magic, version, value typecode, column count, capacity, head, count
+_HEADER = struct.Struct("<4sHcxIQQQ")
+_HEAD_OFFSET = _HEADER.size - 16
+VALUE_TYPECODES = ("d", "f")
+
+DEFAULT_METRICS = (
+    "system.disk.free_bytes",
+    "system.disk.percent_free",
+    "system.hardware.memory_bytes",
+)
+
+
+def _align(value: int, boundary: int = 8) -> int:
+    return (value + boundary - 1) // boundary * boundary
+
+
+class MetricStore:
+    """
+    Fixed-retention, memory-mapped store of numeric samples.
+
+    The file holds a header, a float64 timestamp column and one fixed-width column per metric,
+    each `capacity` slots long and laid out contiguously, so reading one metric only touches
+    that metric's pages. Rows are appended as a ring buffer: once full, the oldest row is
+    overwritten. Missing values are stored as NaN. Columns use native byte order.
+    """
+
+    def __init__(self, path: Path, *, writable: bool = False) -> None:
+        self.path = path
+        self._file = path.open("r+b" if writable else "rb")
+        try:
+            self._mm = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            )
+        except ValueError as exc:
+            self._file.close()
+            raise ValueError(f"{path} is not a sysforge metric store") from exc
+        try:
+            self._load_header()
+        except ValueError:
+            self.close()
+            raise
+
+    @classmethod
+    def create(
+        cls,
+        path: Path,
+        columns: Sequence[str],
+        *,
+        capacity: int,
+        typecode: str = "d",
+    ) -> MetricStore:
+        """
+        Create an empty store with the given metric columns and retention in rows.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not columns:
+            raise ValueError("at least one metric column is required")
+        if len(set(columns)) != len(columns):
+            raise ValueError("metric columns must be unique")
+        if typecode not in VALUE_TYPECODES:
+            raise ValueError("typecode must be 'd' (float64) or 'f' (float32)")
+        encoded = [name.encode("utf-8") for name in columns]
+        if any(len(name) > NAME_BYTES for name in encoded):
+            raise ValueError(f"metric names are limited to {NAME_BYTES} bytes")
+
+        header_size = _align(_HEADER.size + NAME_BYTES * len(columns))
+        value_width = struct.calcsize(typecode)
+        size = header_size + capacity * 8 + _align(capacity * value_width) * len(columns)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as handle:
+            handle.write(
+                _HEADER.pack(MAGIC, FORMAT_VERSION, typecode.encode(), len(columns), capacity, 0, 0)
+            )
+            for name in encoded:
+                handle.write(name.ljust(NAME_BYTES, b"\0"))
+            handle.truncate(size)
+        store = cls(path, writable=True)
+        # Fresh files are zero-filled; mark every value slot as missing.
+        missing = array(typecode, [math.nan]) * capacity
+        for column in store._values.values():
+            column[:] = missing
+        return store
+
+    def _load_header(self) -> None:
+        if len(self._mm) < _HEADER.size:
+            raise ValueError(f"{self.path} is not a sysforge metric store")
+        magic, version, typecode, ncols, capacity, head, count = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{self.path} is not a sysforge metric store")
+        self.typecode = typecode.decode()
+        self.capacity = capacity
+        self._head = head
+        self._count = count
+
+        names = []
+        for index in range(ncols):
+            offset = _HEADER.size + index * NAME_BYTES
+            names.append(bytes(self._mm[offset : offset + NAME_BYTES]).rstrip(b"\0").decode())
+        self.columns: tuple[str, ...] = tuple(names)
+
+        view = memoryview(self._mm)
+        offset = _align(_HEADER.size + NAME_BYTES * ncols)
+        self._timestamps = view[offset : offset + capacity * 8].cast("d")
+        offset += capacity * 8
+        width = struct.calcsize(self.typecode)
+        self._values: dict[str, memoryview] = {}
+        for name in self.columns:
+            self._values[name] = view[offset : offset + capacity * width].cast(self.typecode)
+            offset += _align(capacity * width)
+        view.release()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def last_timestamp(self) -> float | None:
+        """
+        Timestamp of the newest row, or None while the store is empty.
+        """
+        if not self._count:
+            return None
+        return self._timestamps[self._physical(self._count - 1)]
+
+    def __enter__(self) -> MetricStore:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for column in getattr(self, "_values", {}).values():
+            column.release()
+        if hasattr(self, "_timestamps"):
+            self._timestamps.release()
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+    def _physical(self, logical: int) -> int:
+        return (self._head - self._count + logical) % self.capacity
+
+    def append(self, timestamp: float, values: Mapping[str, float | None]) -> None:
+        """
+        Append one row; metrics absent from `values` are stored as missing.
+        """
+        if self._count and timestamp < self._timestamps[self._physical(self._count - 1)]:
+            raise ValueError("timestamps must be appended in non-decreasing order")
+        slot = self._head
+        self._timestamps[slot] = timestamp
+        for name, column in self._values.items():
+            value = values.get(name)
+            column[slot] = math.nan if value is None else float(value)
+        self._head = (slot + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        struct.pack_into("<QQ", self._mm, _HEAD_OFFSET, self._head, self._count)
+
+    def _lower_bound(self, timestamp: float) -> int:
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._timestamps[self._physical(mid)] < timestamp:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def rows(
+        self, metric: str, *, start: float | None = None, end: float | None = None
+    ) -> Iterator[tuple[float, float]]:
+        """
+        Yield `(timestamp, value)` for `metric` in `[start, end)`, skipping missing values.
+
+        The range is located by binary search, so only the rows inside it are read.
+        """
+        if metric not in self._values:
+            raise KeyError(f"unknown metric {metric!r}")
+        column = self._values[metric]
+        first = 0 if start is None else self._lower_bound(start)
+        last = self._count if end is None else self._lower_bound(end)
+        for logical in range(first, last):
+            slot = self._physical(logical)
+            value = column[slot]
+            if not math.isnan(value):
+                yield self._timestamps[slot], value
+
+    def downsample(
+        self,
+        metric: str,
+        bucket: float,
+        *,
+        start: float | None = None,
+        end: float | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Aggregate `metric` into wall-clock aligned buckets of `bucket` seconds.
+        """
+        if bucket <= 0:
+            raise ValueError("bucket must be greater than zero")
+        buckets: list[dict[str, Any]] = []
+        current: float | None = None
+        low = high = total = 0.0
+        count = 0
+        for timestamp, value in self.rows(metric, start=start, end=end):
+            key = math.floor(timestamp / bucket) * bucket
+            if key != current:
+                if current is not None:
+                    buckets.append(_bucket(current, low, high, total, count))
+                current, low, high, total, count = key, value, value, 0.0, 0
+            low = min(low, value)
+            high = max(high, value)
+            total += value
+            count += 1
+        if current is not None:
+            buckets.append(_bucket(current, low, high, total, count))
+        return buckets
+
+
+def _bucket(start: float, low: float, high: float, total: float, count: int) -> dict[str, Any]:
+    return {"start": start, "min": low, "max": high, "avg": total / count, "count": count}
+
+
+def open_or_create(
+    path: Path,
+    columns: Sequence[str],
+    *,
+    capacity: int,
+    typecode: str = "d",
+) -> MetricStore:
+    """
+    Open an existing store for appending, creating it first if needed.
+
+    Raises ValueError if an existing store's columns, capacity or typecode differ from the ones
+    requested: its layout is fixed when it is created.
+    """
+    if not (path.exists() and os.path.getsize(path) > 0):
+        return MetricStore.create(path, columns, capacity=capacity, typecode=typecode)
+    store = MetricStore(path, writable=True)
+    if store.columns != tuple(columns):
+        problem = f"has columns {', '.join(store.columns)}, not {', '.join(columns)}"
+    elif store.capacity != capacity:
+        problem = f"holds {store.capacity} rows, not {capacity}"
+    elif store.typecode != typecode:
+        problem = f"stores typecode {store.typecode!r} values, not {typecode!r}"
+    else:
+        return store
+    store.close()
+    raise ValueError(f"{path} {problem}; use a new store to change its layout")
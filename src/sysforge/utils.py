@@ -1,13 +1,41 @@
 from __future__ import annotations
 
+import gzip
+import io
 import json
 import os
 import shutil
 import sys
-from collections.abc import Iterable
+import tempfile
+import zlib
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager, suppress
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - exercised only without the optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+WRITE_BUFFER_BYTES = 1 << 16
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# Containers this deep are written member by member; anything below is encoded in one call.
+STREAM_DEPTH = 3
 
 
 def json_dump(data: Any, *, pretty: bool = False) -> str:
@@ -17,20 +45,183 @@ def json_dump(data: Any, *, pretty: bool = False) -> str:
     return json.dumps(data, indent=2 if pretty else None, default=str)
 
 
-def write_json_file(data: Any, path: Path, *, pretty: bool = False) -> None:
+def json_backend() -> str:
+    """
+    Return the JSON library used for files: orjson or msgspec when installed, else json.
+    """
+    if orjson is not None:
+        return "orjson"
+    if msgspec is not None:
+        return "msgspec"
+    return "json"
+
+
+def _iter_stdlib_json(value: Any, pretty: bool, level: int = 0) -> Iterator[str]:
+    # Same text as `json_dump`, but the top levels are yielded piece by piece so the whole
+    # document never sits in memory; leaves still go through the C encoder in one call.
+    streamable = (
+        isinstance(value, dict) and all(isinstance(key, str) for key in value)
+    ) or isinstance(value, (list, tuple))
+    if level >= STREAM_DEPTH or not streamable or not value:
+        text = json.dumps(value, indent=2 if pretty else None, default=str)
+        # Encoded strings escape newlines, so every newline here is indentation.
+        yield text.replace("\n", "\n" + "  " * level) if pretty and level else text
+        return
+    is_dict = isinstance(value, dict)
+    inner = "\n" + "  " * (level + 1) if pretty else ""
+    separator = "," + inner if pretty else ", "
+    yield ("{" if is_dict else "[") + inner
+    items = value.items() if is_dict else enumerate(value)
+    for index, (key, item) in enumerate(items):
+        if index:
+            yield separator
+        if is_dict:
+            yield json.dumps(key) + ": "
+        yield from _iter_stdlib_json(item, pretty, level + 1)
+    yield ("\n" + "  " * level if pretty else "") + ("}" if is_dict else "]")
+
+
+def _native_json(data: Any, pretty: bool) -> bytes | None:
+    # One native call straight to UTF-8; None when no fast backend can encode `data`.
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=str, option=option)
+        except TypeError:
+            # Integers beyond 64 bits and the like; the stdlib encoder handles them.
+            return None
+    if msgspec is not None:
+        try:
+            encoded = msgspec.json.encode(data, enc_hook=str)
+        except (TypeError, ValueError, msgspec.EncodeError):
+            return None
+        return msgspec.json.format(encoded, indent=2) if pretty else encoded
+    return None
+
+
+def _default_file_mode() -> int:
+    # mkstemp creates files 0600; give new files the mode a plain open() would have. Setting
+    # the umask to read it would briefly change it for every thread, so ask the kernel instead.
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("Umask:"):
+                    return 0o666 & ~int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0o644
+
+
+@contextmanager
+def _compressed(handle: IO[bytes], path: Path) -> Iterator[IO[bytes]]:
+    suffix = path.suffix.lower()
+    if suffix == ".gz":
+        with gzip.GzipFile(
+            filename=path.name, mode="wb", fileobj=handle, compresslevel=GZIP_LEVEL, mtime=0
+        ) as stream:
+            yield stream
+    elif suffix == ".zst":
+        if zstandard is None:
+            raise ValueError("writing .zst files needs the optional zstandard package")
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+        with compressor.stream_writer(handle, closefd=False) as stream:
+            yield stream
+    else:
+        yield handle
+
+
+@contextmanager
+def atomic_writer(path: Path) -> Iterator[IO[bytes]]:
     """
-    Write JSON data to disk, creating parent directories if needed.
+    Yield a buffered binary stream whose contents replace `path` only once the block ends.
+
+    Data goes to a temporary file in the same directory, which is fsynced and renamed over
+    `path`, so readers see the old file or the complete new one, never a partial write.
+    Files ending in `.gz` (or `.zst`, with zstandard installed) are compressed on the way.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json_dump(data, pretty=pretty))
+    try:
+        mode = path.stat().st_mode & 0o777
+    except OSError:
+        mode = _default_file_mode()
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb", buffering=WRITE_BUFFER_BYTES) as handle:
+            with _compressed(handle, path) as stream:
+                yield stream
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    # Make the rename itself durable; not every platform can open a directory.
+    with suppress(OSError):
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def write_json_file(data: Any, path: Path, *, pretty: bool = False) -> None:
+    """
+    Atomically write JSON data to disk, creating parent directories if needed.
+
+    Uses orjson or msgspec when installed and otherwise streams the stdlib encoder's output;
+    `.gz` and `.zst` paths are compressed.
+    """
+    with atomic_writer(path) as stream:
+        encoded = _native_json(data, pretty)
+        if encoded is not None:
+            stream.write(encoded)
+            return
+        text = io.TextIOWrapper(stream, encoding="utf-8", write_through=False)
+        try:
+            for chunk in _iter_stdlib_json(data, pretty):
+                text.write(chunk)
+            text.flush()
+        finally:
+            # Leave the underlying stream open for the writer to finish.
+            text.detach()
+
+
+def read_json_file(path: Path) -> Any:
+    """
+    Read a JSON file written by `write_json_file`, decompressing gzip and zstd content.
+    """
+    raw = path.read_bytes()
+    errors: tuple[type[Exception], ...] = (EOFError, zlib.error)
+    if zstandard is not None:
+        errors += (zstandard.ZstdError,)
+    try:
+        if raw.startswith(GZIP_MAGIC):
+            raw = gzip.decompress(raw)
+        elif raw.startswith(ZSTD_MAGIC):
+            if zstandard is None:
+                raise ValueError("reading .zst files needs the optional zstandard package")
+            raw = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(raw)).read()
+    except errors as exc:
+        raise ValueError(f"corrupt compressed data: {exc}") from exc
+    if orjson is not None:
+        return orjson.loads(raw)
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(raw)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+    return json.loads(raw)
 
 
 def write_text_file(text: str, path: Path) -> None:
     """
-    Write raw text data to disk, creating parent directories if needed.
+    Atomically write raw text data to disk, creating parent directories if needed.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text)
+    with atomic_writer(path) as stream:
+        stream.write(text.encode())
 
 
 def iso_timestamp() -> str:
@@ -109,3 +300,19 @@ def disk_usage_summary(path: Path) -> dict[str, Any]:
         "free_bytes": free,
         "percent_free": percent_free,
     }
+
+
+def flatten_metrics(data: Mapping[str, Any], prefix: str = "") -> dict[str, float]:
+    """
+    Flatten nested numeric leaves into dotted metric names, e.g. `system.disk.free_bytes`.
+
+    Booleans, strings and lists are skipped.
+    """
+    metrics: dict[str, float] = {}
+    for key, value in data.items():
+        name = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, Mapping):
+            metrics.update(flatten_metrics(value, name))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            metrics[name] = float(value)
+    return metrics
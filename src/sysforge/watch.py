@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import heapq
+import re
+import time
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from datetime import datetime
+from typing import Any
+
+from .cache import CollectorCache
+from .collectors.base import BaseCollector
+from .context import RunContext
+from .utils import iso_timestamp
+
+_DURATION_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(ms|s|m|h|d)?\s*$")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0, "d": 86400.0}
+
+
+def parse_duration(value: str) -> float:
+    """
+    Parse a duration such as "500ms", "5s", "1m", "2h", "7d" or a bare number of seconds.
+    """
+    match = _DURATION_RE.match(value)
+    if match is None:
+        raise ValueError(f"invalid duration {value!r}; use e.g. 500ms, 5s, 1m or 2h")
+    seconds = float(match.group(1)) * _DURATION_UNITS[match.group(2) or "s"]
+    if seconds <= 0:
+        raise ValueError(f"duration {value!r} must be greater than zero")
+    return seconds
+
+
+def parse_time(value: str, *, now: float | None = None) -> float:
+    """
+    Parse an epoch number, an ISO 8601 datetime (naive values are local time), or a duration
+    meaning that long ago (e.g. "6h"), into epoch seconds.
+    """
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        pass
+    try:
+        return (time.time() if now is None else now) - parse_duration(value)
+    except ValueError:
+        raise ValueError(
+            f"invalid time {value!r}; use epoch seconds, an ISO 8601 datetime, or e.g. 6h"
+        ) from None
+
+
+def parse_interval_overrides(values: Sequence[str]) -> dict[str, float]:
+    """
+    Parse repeated NAME=DURATION options into per-collector intervals.
+    """
+    overrides: dict[str, float] = {}
+    for value in values:
+        name, sep, duration = value.partition("=")
+        if not sep or not name.strip():
+            raise ValueError(f"invalid interval override {value!r}; use NAME=DURATION")
+        overrides[name.strip()] = parse_duration(duration)
+    return overrides
+
+
+class Sampler:
+    """
+    Fixed-rate sampler that keeps collector instances warm in one process.
+
+    Every collector is sampled on its own interval (an override, its `sample_interval`, or the
+    default). Due times are derived from the start time rather than from the previous sample,
+    so collector latency never accumulates into drift. A collector that overruns its interval
+    skips the missed ticks instead of bursting to catch up. `last_context` is the run context
+    of the latest sample, so callers can reuse the probes it resolved.
+    """
+
+    def __init__(
+        self,
+        collectors: Sequence[BaseCollector],
+        *,
+        interval: float,
+        overrides: Mapping[str, float] | None = None,
+        cache: CollectorCache | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        overrides = dict(overrides or {})
+        unknown = set(overrides) - {collector.name for collector in collectors}
+        if unknown:
+            raise ValueError(f"unknown collector(s): {', '.join(sorted(unknown))}")
+        self.collectors = list(collectors)
+        self.intervals = [
+            overrides.get(collector.name, collector.sample_interval or interval)
+            for collector in self.collectors
+        ]
+        self.cache = cache
+        self.last_context: RunContext | None = None
+        self._clock = clock
+        self._sleep = sleep
+
+    def _sample(self, collector: BaseCollector) -> dict[str, Any]:
+        record: dict[str, Any] = {
+            "type": "sample",
+            "timestamp": iso_timestamp(),
+            "collector": collector.name,
+        }
+        context = self.last_context = RunContext(cache=self.cache)
+        start = self._clock()
+        try:
+            record["data"] = collector.collect(context)
+        except Exception as exc:
+            record["error"] = f"{type(exc).__name__}: {exc}"
+        record["elapsed_ms"] = round((self._clock() - start) * 1000, 3)
+        return record
+
+    def samples(self) -> Iterator[dict[str, Any]]:
+        """
+        Yield sample records indefinitely, each as soon as it is produced.
+        """
+        if not self.collectors:
+            return
+        origin = self._clock()
+        ticks = [0] * len(self.collectors)
+        schedule = [(origin, index) for index in range(len(self.collectors))]
+        heapq.heapify(schedule)
+
+        while True:
+            due, index = schedule[0]
+            delay = due - self._clock()
+            if delay > 0:
+                self._sleep(delay)
+            heapq.heappop(schedule)
+
+            record = self._sample(self.collectors[index])
+
+            interval = self.intervals[index]
+            ticks[index] += 1
+            next_due = origin + ticks[index] * interval
+            now = self._clock()
+            if next_due <= now:
+                ticks[index] = int((now - origin) // interval) + 1
+                next_due = origin + ticks[index] * interval
+            heapq.heappush(schedule, (next_due, index))
+            yield record
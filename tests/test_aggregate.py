@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from sysforge.aggregate import FleetRollup, aggregate_reports, host_name, iter_report_paths
+from sysforge.cli import app
+from sysforge.utils import write_json_file
+
+
+def make_report(percent_free: float, *, python: str = "3.11.8", git: str = "pass") -> dict:
+    disk_status = "fail" if percent_free <= 0.1 else "warn" if percent_free <= 0.15 else "pass"
+    return {
+        "timestamp": "2025-01-01T00:00:00Z",
+        "collected": {
+            "system": {
+                "os": {"name": "Linux", "release": "6.1"},
+                "python": {"version": python},
+                "disk": {"percent_free": percent_free},
+            }
+        },
+        "checks": {
+            "results": [
+                {
+                    "name": "disk_space",
+                    "status": disk_status,
+                    "message": f"{percent_free:.0%} free",
+                    "data": {"percent_free": percent_free},
+                },
+                {"name": "git_installed", "status": git, "message": "git"},
+            ],
+            "summary": {},
+        },
+    }
+
+
+@pytest.fixture
+def fleet(tmp_path: Path) -> Path:
+    values = {"web-01": 0.05, "web-02": 0.12, "db-01": 0.5, "db-02": 0.08, "cache-01": 0.95}
+    for host, percent_free in values.items():
+        report = make_report(percent_free, python="3.12.1" if host.startswith("db") else "3.11.8")
+        (tmp_path / f"{host}.json").write_text(json.dumps(report))
+    nested = tmp_path / "rack-2"
+    nested.mkdir()
+    (nested / "edge.example.com.json").write_text(json.dumps(make_report(0.6, git="fail")))
+    (tmp_path / "broken.json").write_text("{not json")
+    return tmp_path
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_aggregate_reports_rollup(fleet: Path, jobs: int) -> None:
+    rollup = aggregate_reports(
+        iter_report_paths(fleet), jobs=jobs, top=2, batch_size=2
+    ).to_dict()
+
+    assert rollup["reports"] == 6
+    assert rollup["errors"]["count"] == 1
+    assert rollup["checks"]["disk_space"] == {
+        "pass": 3,
+        "warn": 1,
+        "fail": 2,
+        "worst": [
+            {"host": "web-01", "status": "fail", "message": "5% free"},
+            {"host": "db-02", "status": "fail", "message": "8% free"},
+        ],
+    }
+    assert rollup["checks"]["git_installed"]["fail"] == 1
+    assert rollup["checks"]["git_installed"]["worst"][0]["host"] == "edge.example.com"
+    assert rollup["python_versions"] == {"3.11.8": 4, "3.12.1": 2}
+    assert rollup["os_versions"] == {"Linux 6.1": 6}
+    percent_free = rollup["percent_free"]
+    assert percent_free["count"] == 6
+    assert percent_free["min"] == 0.05
+    assert percent_free["max"] == 0.95
+    assert percent_free["histogram"]["0.0-0.1"] == 2
+    assert percent_free["histogram"]["0.9-1.0"] == 1
+
+
+def test_rollup_tolerates_malformed_sections() -> None:
+    rollup = FleetRollup()
+    rollup.add_report("odd", {"collected": [], "checks": {"results": ["x", {"name": 1}]}})
+
+    assert rollup.to_dict()["reports"] == 1
+    assert rollup.to_dict()["checks"] == {}
+
+
+def test_host_name_strips_report_suffixes() -> None:
+    assert host_name(Path("web-01.example.com.json.gz")) == "web-01.example.com"
+
+
+def test_iter_report_paths_includes_compressed_reports(tmp_path: Path) -> None:
+    write_json_file(make_report(0.05), tmp_path / "web-01.json.gz")
+    write_json_file(make_report(0.5), tmp_path / "db-01.json")
+    (tmp_path / "notes.txt").write_text("not a report")
+    (tmp_path / ".db-02.json.abc123.tmp").write_text("{")
+
+    paths = sorted(iter_report_paths(tmp_path))
+    rollup = aggregate_reports(paths).to_dict()
+
+    assert [Path(path).name for path in paths] == ["db-01.json", "web-01.json.gz"]
+    assert rollup["reports"] == 2
+    assert rollup["errors"]["count"] == 0
+    assert sorted(iter_report_paths(tmp_path, "*.json")) == [str(tmp_path / "db-01.json")]
+
+
+def test_aggregate_command_writes_rollup(fleet: Path, tmp_path: Path) -> None:
+    out_path = tmp_path / "out" / "rollup.json"
+
+    result = CliRunner().invoke(
+        app, ["aggregate", str(fleet), "--jobs", "1", "--output", str(out_path)]
+    )
+
+    assert result.exit_code == 0
+    assert json.loads(out_path.read_text())["reports"] == 6
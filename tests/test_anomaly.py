@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from sysforge.anomaly import (
+    AnomalyDetector,
+    Ewma,
+    FillRate,
+    P2Quantile,
+    format_eta,
+    iter_disk_usages,
+)
+
+
+def test_ewma_tracks_mean_and_flags_outliers() -> None:
+    ewma = Ewma(0.1)
+    rng = random.Random(1)
+    for _ in range(500):
+        ewma.update(100 + rng.gauss(0, 2))
+
+    assert ewma.mean == pytest.approx(100, abs=1.5)
+    assert ewma.stddev == pytest.approx(2, rel=0.5)
+    assert abs(ewma.zscore(101)) < 2
+    assert ewma.zscore(130) > 10
+
+
+def test_ewma_flat_series_uses_relative_spread() -> None:
+    ewma = Ewma(0.1)
+    for _ in range(10):
+        ewma.update(100.0)
+
+    assert ewma.zscore(100.5) == pytest.approx(0.5)
+
+
+@pytest.mark.parametrize("quantile", [0.5, 0.95, 0.99])
+def test_p2_quantile_approximates_exact_quantile(quantile: float) -> None:
+    rng = random.Random(7)
+    values = [rng.expovariate(1.0) for _ in range(20_000)]
+    sketch = P2Quantile(quantile)
+    for value in values:
+        sketch.update(value)
+
+    exact = sorted(values)[int(quantile * len(values))]
+    assert sketch.value == pytest.approx(exact, rel=0.05)
+
+
+def test_p2_quantile_small_samples() -> None:
+    sketch = P2Quantile(0.5)
+    assert sketch.value is None
+    for value in (3.0, 1.0, 2.0):
+        sketch.update(value)
+    assert sketch.value == 2.0
+
+
+def test_fill_rate_follows_recent_slope() -> None:
+    fit = FillRate(window=120)
+    assert fit.slope() is None
+    for second in range(0, 3_600, 10):
+        # Flat for 50 minutes, then shrinking by 1000 bytes per second.
+        value = 1e9 if second < 3_000 else 1e9 - 1_000 * (second - 3_000)
+        fit.update(1_700_000_000 + second, value)
+
+    assert fit.slope() == pytest.approx(-1_000, rel=0.1)
+    assert fit.span == 3_590
+
+
+def test_fill_rate_stays_exact_over_long_runs() -> None:
+    fit = FillRate(window=3_600)
+    for minute in range(60 * 24 * 365):
+        fit.update(minute * 60.0, 5e11 - 2.0 * minute * 60)
+
+    assert fit.slope() == pytest.approx(-2.0, rel=1e-6)
+
+
+def test_iter_disk_usages_names_mounts() -> None:
+    data = {
+        "disk": {"path": "/", "free_bytes": 10, "total_bytes": 100},
+        "mounts": [
+            {"mount_point": "/var", "free_bytes": 1, "total_bytes": 2},
+            {"mount_point": "/broken", "error": "timeout"},
+        ],
+    }
+
+    assert list(iter_disk_usages(data, "system")) == [
+        ("system.disk", 10.0, 100.0),
+        ("system.mounts[/var]", 1.0, 2.0),
+    ]
+
+
+def test_format_eta() -> None:
+    assert [format_eta(s) for s in (30, 2_700, 6 * 3_600, 3 * 86_400)] == [
+        "30s",
+        "45m",
+        "6h",
+        "3d",
+    ]
+
+
+def test_detector_reports_status_changes_only() -> None:
+    detector = AnomalyDetector(warmup=10, zscore=4)
+    rng = random.Random(3)
+    changes = []
+    for second in range(60):
+        value = 500.0 if second == 40 else 50 + rng.gauss(0, 1)
+        changes.append(detector.update("cpu", {"load": value}, 1_700_000_000 + second))
+
+    flagged = [(second, r) for second, batch in enumerate(changes) for r in batch]
+    assert [(second, r.status) for second, r in flagged] == [(40, "warn"), (41, "pass")]
+    warning = flagged[0][1]
+    assert warning.name == "anomaly.cpu.load"
+    assert "above its average" in warning.message
+    assert set(warning.data) >= {"value", "ewma", "stddev", "zscore", "p50", "p95", "p99"}
+
+
+def test_detector_forecasts_disk_full() -> None:
+    detector = AnomalyDetector(fill_window=1_800, min_fill_span=300, fill_warn=86_400)
+    total = 100e9
+    results = []
+    for second in range(0, 3_600, 10):
+        # 20 GB free, shrinking by 1 MB/s: full in ~5.5h.
+        free = 20e9 - 1e6 * second
+        disk = {"disk": {"free_bytes": free, "total_bytes": total}}
+        results.extend(detector.update("system", disk, 1_700_000_000 + second))
+
+    fills = [r for r in results if r.name.startswith("disk_fill.")]
+    assert [r.status for r in fills] == ["fail"]
+    assert fills[0].name == "disk_fill.system.disk"
+    assert fills[0].message.startswith("system.disk will be full in ~")
+    assert fills[0].data["bytes_per_second"] == pytest.approx(-1e6, rel=1e-3)
+
+
+def test_detector_validates_settings() -> None:
+    with pytest.raises(ValueError):
+        AnomalyDetector(fill_fail=10, fill_warn=5)
+    with pytest.raises(ValueError):
+        AnomalyDetector(quantiles=(1.5,))
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from sysforge import bench
+from sysforge.bench import (
+    benchmark_cases,
+    compare_to_baseline,
+    measure,
+    percentile,
+    run_benchmarks,
+    summarize,
+    synthetic_report,
+)
+from sysforge.cli import app
+from sysforge.reporting import render_report_markdown
+
+runner = CliRunner()
+
+
+def test_percentile_interpolates() -> None:
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert percentile(values, 0.0) == 1.0
+    assert percentile(values, 0.5) == 3.0
+    assert percentile(values, 0.95) == pytest.approx(4.8)
+    assert percentile([7.0], 0.99) == 7.0
+    with pytest.raises(ValueError):
+        percentile([], 0.5)
+
+
+def test_summarize_reports_all_stats() -> None:
+    stats = summarize([3.0, 1.0, 2.0])
+    assert stats == {
+        "runs": 3,
+        "min_ms": 1.0,
+        "mean_ms": 2.0,
+        "p50_ms": 2.0,
+        "p95_ms": 2.9,
+        "p99_ms": 2.98,
+        "max_ms": 3.0,
+    }
+
+
+def test_measure_runs_warmup_untimed() -> None:
+    calls = []
+    stats = measure(lambda: calls.append(1), warmup=2, repeat=5)
+    assert len(calls) == 7
+    assert stats["runs"] == 5
+    with pytest.raises(ValueError):
+        measure(lambda: None, repeat=0)
+
+
+def test_synthetic_report_scales_and_renders() -> None:
+    report = synthetic_report(30)
+    assert len(report["checks"]["results"]) == 30
+    assert report["checks"]["summary"] == {"pass": 10, "warn": 10, "fail": 10}
+    assert len(report["collected"]["synthetic"]) == 30
+    markdown = render_report_markdown(report)
+    assert "check_29" in markdown
+    assert "\\|" in markdown
+
+
+def test_benchmark_cases_cover_registry() -> None:
+    cases = benchmark_cases(sizes=(5, 50), startup=False)
+    assert "startup.cli" not in cases
+    assert "collector.system" in cases
+    assert "check.disk_space" in cases
+    assert {"json_dump.5", "json_dump.50", "render_report_markdown.50"} <= set(cases)
+    assert "assemble_report" in cases
+    with pytest.raises(ValueError):
+        benchmark_cases(sizes=(0,), startup=False)
+
+
+def test_startup_runs_module_entry_point() -> None:
+    bench._startup()
+
+
+def test_run_benchmarks_filters_and_records_errors(monkeypatch) -> None:
+    def broken() -> None:
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(
+        bench, "benchmark_cases", lambda **_: {"json_dump.1": lambda: None, "broken": broken}
+    )
+    data = run_benchmarks(warmup=0, repeat=2, pattern="^json")
+    assert list(data["benchmarks"]) == ["json_dump.1"]
+    assert data["repeat"] == 2
+
+    data = run_benchmarks(warmup=0, repeat=1)
+    assert data["benchmarks"]["broken"] == {"error": "RuntimeError: boom"}
+
+
+def _result(**medians: float) -> dict:
+    return {"benchmarks": {name: {"p50_ms": value} for name, value in medians.items()}}
+
+
+def test_compare_to_baseline_flags_regressions() -> None:
+    baseline = _result(slow=10.0, same=10.0, tiny=0.01, gone=1.0)
+    current = _result(slow=12.0, same=10.5, tiny=0.03, new=1.0)
+    comparison = compare_to_baseline(current, baseline, max_regression=10.0)
+    assert [entry["name"] for entry in comparison["regressions"]] == ["slow"]
+    assert comparison["regressions"][0]["change_pct"] == 20.0
+    # "tiny" tripled, but by less than the noise floor.
+    assert {entry["name"] for entry in comparison["changes"]} == {"slow", "same", "tiny"}
+    assert comparison["not_compared"] == ["gone", "new"]
+
+    with pytest.raises(ValueError):
+        compare_to_baseline(current, baseline, metric="median")
+
+
+def _fake_run(**kwargs) -> dict:
+    return {"repeat": kwargs["repeat"], **_result(a=2.0)}
+
+
+def test_bench_cli_writes_output(monkeypatch, tmp_path: Path) -> None:
+    captured = {}
+
+    def fake_run(**kwargs):
+        captured.update(kwargs)
+        return _fake_run(**kwargs)
+
+    monkeypatch.setattr("sysforge.cli.run_benchmarks", fake_run)
+    out_path = tmp_path / "bench.json"
+    result = runner.invoke(
+        app, ["bench", "-r", "3", "--no-startup", "--size", "7", "-k", "json", "-o", str(out_path)]
+    )
+    assert result.exit_code == 0, result.output
+    assert json.loads(out_path.read_text())["benchmarks"] == {"a": {"p50_ms": 2.0}}
+    assert captured["sizes"] == [7]
+    assert captured["startup"] is False
+    assert captured["pattern"] == "json"
+
+
+def test_bench_cli_fails_on_regression(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr("sysforge.cli.run_benchmarks", _fake_run)
+    baseline = tmp_path / "baseline.json"
+
+    baseline.write_text(json.dumps(_result(a=1.9)))
+    result = runner.invoke(app, ["bench", "--baseline", str(baseline)])
+    assert result.exit_code == 0
+    assert json.loads(result.stdout)["comparison"]["regressions"] == []
+
+    baseline.write_text(json.dumps(_result(a=1.0)))
+    result = runner.invoke(app, ["bench", "--baseline", str(baseline), "--max-regression", "50"])
+    assert result.exit_code == 2
+    assert "Regression: a" in result.output
+
+
+def test_bench_cli_rejects_bad_input(tmp_path: Path) -> None:
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text("not json")
+    result = runner.invoke(app, ["bench", "--baseline", str(baseline)])
+    assert result.exit_code != 0
+    result = runner.invoke(app, ["bench", "--filter", "("])
+    assert result.exit_code != 0
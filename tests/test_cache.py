@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from sysforge import cache as cache_module
+from sysforge.cache import CollectorCache
+from sysforge.collectors.system import SystemCollector
+from sysforge.context import RunContext
+
+
+@pytest.fixture(autouse=True)
+def fixed_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache_module, "invalidation_key", lambda: {"boot_id": "boot-1"})
+
+
+def test_get_or_compute_serves_fresh_entries(tmp_path: Path) -> None:
+    calls: list[int] = []
+
+    def compute() -> dict[str, int]:
+        calls.append(1)
+        return {"value": len(calls)}
+
+    assert CollectorCache(tmp_path).get_or_compute("x", compute, ttl=60) == {"value": 1}
+    assert CollectorCache(tmp_path).get_or_compute("x", compute, ttl=60) == {"value": 1}
+    assert len(calls) == 1
+
+
+def test_entries_expire_after_ttl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    CollectorCache(tmp_path).store("x", 1)
+    monkeypatch.setattr(cache_module.time, "time", lambda: 1e12)
+
+    assert CollectorCache(tmp_path).load("x", ttl=60) is None
+
+
+def test_entries_invalidate_when_key_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    CollectorCache(tmp_path).store("x", 1, key={"mtime": 1})
+
+    assert CollectorCache(tmp_path).load("x", ttl=60, key={"mtime": 1}) == 1
+    assert CollectorCache(tmp_path).load("x", ttl=60, key={"mtime": 2}) is None
+
+    monkeypatch.setattr(cache_module, "invalidation_key", lambda: {"boot_id": "boot-2"})
+    assert CollectorCache(tmp_path).load("x", ttl=60, key={"mtime": 1}) is None
+
+
+def test_refresh_skips_reads_but_rewrites(tmp_path: Path) -> None:
+    CollectorCache(tmp_path).store("x", "old")
+
+    value = CollectorCache(tmp_path, refresh=True).get_or_compute("x", lambda: "new", ttl=60)
+
+    assert value == "new"
+    assert CollectorCache(tmp_path).load("x", ttl=60) == "new"
+
+
+def test_corrupt_entries_are_misses(tmp_path: Path) -> None:
+    (tmp_path / "x.json").write_text("{not json")
+
+    assert CollectorCache(tmp_path).load("x", ttl=60) is None
+
+
+def test_system_collector_caches_static_sections(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[int] = []
+
+    def fake_system() -> str:
+        calls.append(1)
+        return "TestOS"
+
+    monkeypatch.setattr("sysforge.collectors.system.platform.system", fake_system)
+    monkeypatch.setattr(
+        "sysforge.collectors.system.disk_usage_summary",
+        lambda path: {"path": str(path), "percent_free": 0.5},
+    )
+
+    first = SystemCollector().collect(RunContext(cache=CollectorCache(tmp_path)))
+    second = SystemCollector().collect(RunContext(cache=CollectorCache(tmp_path)))
+
+    assert len(calls) == 1
+    assert first["os"] == second["os"]
+    assert (tmp_path / "system.static.json").exists()
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sysforge.checks.cgroup import CgroupLimitsCheck
+from sysforge.collectors import cgroup, mounts
+from sysforge.collectors.cgroup import parse_pressure, parse_proc_cgroup, probe_cgroup
+from sysforge.collectors.system import effective_limits
+from sysforge.context import RunContext
+
+PSI = (
+    "some avg10=1.50 avg60=2.00 avg300=0.50 total=1234\n"
+    "full avg10=0.00 avg60=0.10 avg300=0.00 total=5\n"
+)
+
+
+@pytest.fixture
+def fake_proc(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(cgroup, "PROC_CGROUP", tmp_path / "cgroup")
+    monkeypatch.setattr(cgroup, "PRESSURE_DIR", tmp_path / "pressure")
+    monkeypatch.setattr(mounts, "MOUNTINFO_PATH", tmp_path / "mountinfo")
+    monkeypatch.setattr(cgroup.os, "sched_getaffinity", lambda _pid: set(range(8)), raising=False)
+    monkeypatch.setattr(cgroup.os, "cpu_count", lambda: 16)
+    return tmp_path
+
+
+def _write(directory: Path, files: dict[str, str]) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, content in files.items():
+        (directory / name).write_text(content)
+
+
+def test_parse_proc_cgroup_and_pressure() -> None:
+    paths = parse_proc_cgroup("4:memory:/docker/abc\n2:cpu,cpuacct:/docker/abc\n0::/user.slice\n")
+    assert paths == {
+        "memory": "/docker/abc",
+        "cpu": "/docker/abc",
+        "cpuacct": "/docker/abc",
+        "": "/user.slice",
+    }
+    assert parse_pressure(PSI)["some"] == {"avg10": 1.5, "avg60": 2.0, "avg300": 0.5, "total": 1234}
+
+
+def test_probe_cgroup_v2_uses_tightest_ancestor_limits(fake_proc: Path) -> None:
+    root = fake_proc / "sys" / "cgroup"
+    (fake_proc / "cgroup").write_text("0::/kubepods/pod1/ctr\n")
+    (fake_proc / "mountinfo").write_text(
+        f"30 1 0:26 / {root} rw,nosuid shared:4 - cgroup2 cgroup2 rw,nsdelegate\n"
+    )
+    _write(root / "kubepods", {"memory.max": "max", "cpu.max": "max 100000"})
+    _write(root / "kubepods" / "pod1", {"memory.max": "1000", "cpu.max": "150000 100000"})
+    _write(
+        root / "kubepods" / "pod1" / "ctr",
+        {
+            "memory.max": "max",
+            "memory.current": "900",
+            "memory.stat": "anon 500\ninactive_file 100\n",
+            "cpu.max": "400000 100000",
+            "cpu.stat": "usage_usec 10\nnr_periods 200\nnr_throttled 50\nthrottled_usec 2500000\n",
+            "memory.pressure": PSI,
+        },
+    )
+
+    result = probe_cgroup()
+
+    assert result["supported"] is True
+    assert result["version"] == 2
+    assert result["cpu"] == {
+        "quota_cores": 1.5,
+        "cpuset_cpus": 8,
+        "effective_cpus": 1.5,
+        "periods": 200,
+        "throttled_periods": 50,
+        "throttled_ratio": 0.25,
+        "throttled_seconds": 2.5,
+    }
+    assert result["memory"] == {
+        "limit_bytes": 1000,
+        "usage_bytes": 900,
+        "working_set_bytes": 800,
+        "percent_used": 0.8,
+    }
+    assert result["pressure"]["memory"]["full"]["avg60"] == 0.1
+    assert "cpu" not in result["pressure"]
+
+
+def test_probe_cgroup_v1_reads_controller_mounts(fake_proc: Path) -> None:
+    cpu_root = fake_proc / "cg" / "cpu"
+    memory_root = fake_proc / "cg" / "memory"
+    (fake_proc / "cgroup").write_text("4:memory:/docker/abc\n2:cpu,cpuacct:/docker/abc\n0::/\n")
+    (fake_proc / "mountinfo").write_text(
+        f"33 32 0:29 / {cpu_root} rw,relatime - cgroup cgroup rw,cpu,cpuacct\n"
+        f"36 32 0:32 / {memory_root} rw,relatime - cgroup cgroup rw,memory\n"
+    )
+    _write(memory_root, {"memory.limit_in_bytes": "9223372036854771712"})
+    _write(
+        memory_root / "docker" / "abc",
+        {
+            "memory.limit_in_bytes": "2048",
+            "memory.usage_in_bytes": "1024",
+            "memory.stat": "cache 10\ntotal_inactive_file 24\n",
+        },
+    )
+    _write(
+        cpu_root / "docker" / "abc",
+        {
+            "cpu.cfs_quota_us": "-1",
+            "cpu.cfs_period_us": "100000",
+            "cpu.stat": "nr_periods 0\nnr_throttled 0\nthrottled_time 0\n",
+        },
+    )
+    _write(fake_proc / "pressure", {"cpu": PSI})
+
+    result = probe_cgroup()
+
+    assert result["version"] == 1
+    assert result["cpu"]["quota_cores"] is None
+    assert result["cpu"]["effective_cpus"] == 8
+    assert result["memory"]["limit_bytes"] == 2048
+    assert result["memory"]["working_set_bytes"] == 1000
+    assert result["pressure"]["cpu"]["some"]["avg10"] == 1.5
+
+
+def test_probe_cgroup_unsupported_without_proc(fake_proc: Path) -> None:
+    assert probe_cgroup() == {"supported": False}
+
+
+def test_effective_limits_only_reports_constraints() -> None:
+    limited = {
+        "supported": True,
+        "cpu": {"effective_cpus": 2},
+        "memory": {"limit_bytes": 512},
+    }
+    assert effective_limits({"cpu_count": 8, "memory_bytes": 1024}, limited) == {
+        "effective_cpu_count": 2,
+        "effective_memory_bytes": 512,
+    }
+    assert effective_limits({"cpu_count": 2, "memory_bytes": 256}, limited) == {}
+    assert effective_limits({"cpu_count": 8}, {"supported": False}) == {}
+
+
+def _run(cgroup_payload: dict[str, Any]) -> Any:
+    context = RunContext()
+    context.fact("cgroup", lambda: cgroup_payload)
+    return CgroupLimitsCheck().run(context=context)
+
+
+def _payload(percent_used: float | None, throttled_ratio: float, periods: int = 1000) -> dict:
+    return {
+        "supported": True,
+        "version": 2,
+        "memory": {
+            "limit_bytes": None if percent_used is None else 1000,
+            "percent_used": percent_used,
+        },
+        "cpu": {"quota_cores": 2.0, "periods": periods, "throttled_ratio": throttled_ratio},
+    }
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        (_payload(0.5, 0.0), "pass"),
+        (_payload(0.85, 0.0), "warn"),
+        (_payload(0.97, 0.0), "fail"),
+        (_payload(None, 0.3), "warn"),
+        (_payload(None, 0.3, periods=10), "pass"),
+    ],
+)
+def test_cgroup_limits_check_levels(payload: dict[str, Any], expected: str) -> None:
+    assert _run(payload).status == expected
+
+
+def test_cgroup_limits_check_outside_cgroups() -> None:
+    result = _run({"supported": False})
+
+    assert result.status == "pass"
+    assert "Not running under cgroup" in result.message
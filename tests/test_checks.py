@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import threading
+import time
+from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
 
+from sysforge.checks import register_check, run_checks
+from sysforge.checks.base import BaseCheck, CheckResult
 from sysforge.checks.core import DiskSpaceCheck, GitInstalledCheck, PythonVersionCheck
+from sysforge.context import RunContext
 
 
 def test_python_version_check_pass(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -25,11 +31,17 @@ def test_python_version_check_fail(monkeypatch: pytest.MonkeyPatch) -> None:
     assert result.status == "fail"
 
 
-def test_git_installed_check(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr("sysforge.checks.core.shutil.which", lambda _: "/usr/bin/git")
+def test_git_installed_check(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    git = tmp_path / "git"
+    git.write_text("#!/bin/sh\n")
+    git.chmod(0o755)
+    monkeypatch.setenv("PATH", str(tmp_path))
     result = GitInstalledCheck().run(disk_threshold=0.1)
     assert result.status == "pass"
 
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+    assert GitInstalledCheck().run(disk_threshold=0.1).status == "fail"
+
 
 def test_disk_space_check_statuses(monkeypatch: pytest.MonkeyPatch) -> None:
     def fake_usage(percent_free: float) -> dict[str, float]:
@@ -70,3 +82,282 @@ def test_disk_space_check_statuses(monkeypatch: pytest.MonkeyPatch) -> None:
         lambda _: fake_usage(0.151),
     )
     assert DiskSpaceCheck().run(disk_threshold=0.1).status == "pass"
+
+
+class StaticCheck(BaseCheck):
+    def __init__(
+        self,
+        name: str,
+        status: str,
+        *,
+        depends_on: tuple[str, ...] = (),
+        barrier: threading.Barrier | None = None,
+    ) -> None:
+        self.name = name
+        self.status = status
+        self.depends_on = depends_on
+        self.barrier = barrier
+        self.calls = 0
+
+    def run(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> CheckResult:
+        self.calls += 1
+        if self.barrier is not None:
+            self.barrier.wait()
+        return CheckResult(name=self.name, status=self.status, message=self.status)
+
+
+def test_run_checks_skips_dependents_of_failed_checks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sysforge.checks._check_registry", [])
+    dependent = StaticCheck("uses_git", "pass", depends_on=("git",))
+    transitive = StaticCheck("uses_repo", "pass", depends_on=("uses_git",))
+    register_check(transitive)
+    register_check(dependent)
+    register_check(StaticCheck("git", "fail"))
+    register_check(StaticCheck("python", "pass"))
+
+    output = run_checks(disk_threshold=0.1)
+
+    assert [result["name"] for result in output["results"]] == [
+        "uses_repo",
+        "uses_git",
+        "git",
+        "python",
+    ]
+    assert dependent.calls == 0
+    assert transitive.calls == 0
+    assert output["results"][0]["skipped"] is True
+    assert "'git'" in output["results"][0]["message"]
+    assert output["summary"] == {"pass": 1, "warn": 2, "fail": 1}
+
+
+class HangingCheck(BaseCheck):
+    def __init__(self, name: str, release: threading.Event) -> None:
+        self.name = name
+        self.release = release
+
+    def run(
+        self, *, disk_threshold: float = 0.10, context: RunContext | None = None
+    ) -> CheckResult:
+        self.release.wait(5)
+        return CheckResult(name=self.name, status="pass", message="late")
+
+
+def test_run_checks_abandons_checks_that_overrun(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sysforge.checks._check_registry", [])
+    release = threading.Event()
+    register_check(HangingCheck("hangs", release))
+    dependent = StaticCheck("after", "pass", depends_on=("hangs",))
+    register_check(dependent)
+    register_check(StaticCheck("quick", "pass"))
+
+    start = time.monotonic()
+    output = run_checks(timeout=0.1, timeout_status="warn")
+    release.set()
+
+    assert time.monotonic() - start < 2
+    hung, after, quick = output["results"]
+    assert hung["status"] == "warn" and hung["timed_out"] is True
+    assert "Timed out" in hung["message"]
+    assert after["skipped"] is True and dependent.calls == 0
+    assert quick == {"name": "quick", "status": "pass", "message": "pass"}
+    assert output["summary"] == {"pass": 1, "warn": 2, "fail": 0}
+
+
+def test_run_checks_does_not_restart_a_check_that_is_still_stuck(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("sysforge.checks._check_registry", [])
+    release = threading.Event()
+    starts: list[float] = []
+
+    class Wedged(HangingCheck):
+        def run(self, **kwargs: object) -> CheckResult:  # type: ignore[override]
+            starts.append(time.monotonic())
+            return super().run()
+
+    register_check(Wedged("wedged", release))
+    abandoned: dict = {}
+
+    for _ in range(3):
+        output = run_checks(timeout=0.05, abandoned=abandoned)
+        assert output["results"][0]["timed_out"] is True
+    assert len(starts) == 1
+    assert "has not returned" in output["results"][0]["message"]
+
+    release.set()
+    scope = abandoned["wedged"]
+    waited = time.monotonic() + 5
+    while not scope.closed and time.monotonic() < waited:
+        time.sleep(0.01)
+    assert run_checks(timeout=0.05, abandoned=abandoned)["summary"]["pass"] == 1
+    assert len(starts) == 2 and abandoned == {}
+
+
+def test_run_checks_does_not_start_checks_after_the_deadline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("sysforge.checks._check_registry", [])
+    check = StaticCheck("never", "pass")
+    register_check(check)
+
+    output = run_checks(deadline=time.monotonic() - 1)
+
+    assert check.calls == 0
+    assert output["results"][0]["timed_out"] is True
+    assert output["summary"] == {"pass": 0, "warn": 0, "fail": 1}
+
+
+def test_run_checks_runs_independent_checks_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("sysforge.checks._check_registry", [])
+    barrier = threading.Barrier(3, timeout=5)
+    for name in ("a", "b", "c"):
+        register_check(StaticCheck(name, "pass", barrier=barrier))
+    register_check(StaticCheck("after", "warn", depends_on=("a", "b")))
+
+    output = run_checks(disk_threshold=0.1, jobs=3)
+
+    assert output["summary"] == {"pass": 3, "warn": 1, "fail": 0}
+    assert "skipped" not in output["results"][3]
+
+
+def test_run_checks_rejects_dependency_cycles(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sysforge.checks._check_registry", [])
+    register_check(StaticCheck("a", "pass", depends_on=("b",)))
+    register_check(StaticCheck("b", "pass", depends_on=("a",)))
+
+    with pytest.raises(ValueError, match="cycle"):
+        run_checks()
+
+
+def _mount_context(entries: list[dict[str, object]], **settings: object) -> RunContext:
+    context = RunContext(settings=settings)
+    context.fact("mounts", lambda: {"supported": True, "mounts": entries})
+    return context
+
+
+def test_disk_space_check_evaluates_every_mount() -> None:
+    context = _mount_context(
+        [
+            {"mount_point": "/", "percent_free": 0.5, "percent_inodes_free": 0.9},
+            {"mount_point": "/var", "percent_free": 0.02, "percent_inodes_free": 0.9},
+            {"mount_point": "/srv", "percent_free": 0.5, "percent_inodes_free": 0.12},
+            {"mount_point": "/mnt/nfs", "error": "timeout"},
+        ],
+        all_mounts=True,
+    )
+    result = DiskSpaceCheck().run(disk_threshold=0.1, context=context)
+
+    assert result.status == "fail"
+    assert "/var 2.00% free" in result.message
+    assert "could not stat /mnt/nfs (timeout)" in result.message
+    statuses = {entry["mount_point"]: entry["status"] for entry in result.data["mounts"]}
+    assert statuses == {"/": "pass", "/var": "fail", "/srv": "warn", "/mnt/nfs": "warn"}
+    assert result.data["percent_free"] == 0.02
+
+
+def test_disk_space_check_uses_per_mount_thresholds() -> None:
+    context = _mount_context(
+        [
+            {"mount_point": "/", "percent_free": 0.3, "percent_inodes_free": None},
+            {"mount_point": "/var", "percent_free": 0.3, "percent_inodes_free": None},
+        ],
+        mount_thresholds={"/var": 0.4, "/data": 0.1},
+    )
+    result = DiskSpaceCheck().run(disk_threshold=0.1, context=context)
+
+    assert result.status == "fail"
+    entries = {entry["mount_point"]: entry for entry in result.data["mounts"]}
+    assert set(entries) == {"/var", "/data"}
+    assert entries["/var"]["threshold"] == 0.4
+    assert entries["/data"]["error"] == "not mounted"
+
+
+def test_parse_mount_thresholds() -> None:
+    from sysforge.checks.core import parse_mount_thresholds
+
+    assert parse_mount_thresholds(["/var=0.2", "/mnt/a=b=0.5"]) == {"/var": 0.2, "/mnt/a=b": 0.5}
+    with pytest.raises(ValueError, match="MOUNT=FRACTION"):
+        parse_mount_thresholds(["/var"])
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        parse_mount_thresholds(["/var=2"])
+
+
+class FingerprintedCheck(StaticCheck):
+    def __init__(self, name: str, status: str) -> None:
+        super().__init__(name, status)
+        self.inputs: dict[str, object] | None = {"version": 1}
+
+    def fingerprint(self, *, disk_threshold: float = 0.10, context: RunContext | None = None):
+        return self.inputs
+
+
+def test_check_result_round_trips_through_dict() -> None:
+    result = CheckResult("x", "warn", "msg", data={"a": 1}, skipped=True, freshness="cached")
+    assert CheckResult.from_dict(result.to_dict()) == result
+    assert "freshness" not in CheckResult("x", "pass", "ok").to_dict()
+    with pytest.raises(ValueError):
+        CheckResult.from_dict({"name": "x", "status": "bad", "message": ""})
+
+
+def test_run_checks_reuses_results_while_fingerprint_matches(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    from sysforge.cache import CollectorCache
+
+    monkeypatch.setattr("sysforge.checks._check_registry", [])
+    stable = FingerprintedCheck("stable", "warn")
+    live = StaticCheck("live", "pass")
+    register_check(stable)
+    register_check(live)
+    cache = CollectorCache(tmp_path)
+
+    def freshness(**kwargs: object) -> dict[str, object]:
+        report = run_checks(result_cache=cache, **kwargs)
+        return {result["name"]: result["freshness"] for result in report["results"]}
+
+    assert freshness() == {"stable": "fresh", "live": "fresh"}
+    assert freshness() == {"stable": "cached", "live": "fresh"}
+    assert (stable.calls, live.calls) == (1, 2)
+
+    stable.inputs = {"version": 2}
+    assert freshness() == {"stable": "fresh", "live": "fresh"}
+    assert freshness(disk_threshold=0.2) == {"stable": "fresh", "live": "fresh"}
+    assert stable.calls == 3
+
+    # Without a result cache nothing is stored or marked.
+    report = run_checks()
+    assert all("freshness" not in result for result in report["results"])
+    assert stable.calls == 4
+
+
+def test_disk_space_fingerprint_buckets_free_space(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fingerprint(percent_free: float, **settings: object) -> object:
+        context = RunContext(settings=settings)
+        monkeypatch.setattr("sysforge.checks.core.Path.home", lambda: "/home/me")
+        context.fact("disk_usage:/home/me", lambda: {"percent_free": percent_free})
+        return DiskSpaceCheck().fingerprint(disk_threshold=0.10, context=context)
+
+    assert fingerprint(0.503) == fingerprint(0.507)
+    assert fingerprint(0.503) != fingerprint(0.513)
+    # A bucket never straddles a status boundary.
+    assert fingerprint(0.1000) != fingerprint(0.1004)
+
+    mounts = [{"mount_point": "/", "percent_free": 0.5, "percent_inodes_free": 0.9}]
+    context = _mount_context(mounts, all_mounts=True)
+    assert DiskSpaceCheck().fingerprint(disk_threshold=0.1, context=context) == {
+        "supported": True,
+        "thresholds": {},
+        "all_mounts": True,
+        "mounts": {"/": [["pass", 50], ["pass", 90]]},
+    }
+
+
+def test_git_and_python_fingerprints(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PATH", "/nonexistent")
+    assert GitInstalledCheck().fingerprint() == {"path": "/nonexistent", "git": None, "mtime": None}
+    monkeypatch.setattr("sysforge.checks.core.sys.version_info", (3, 12, 1, "final", 0))
+    assert PythonVersionCheck().fingerprint() == {"version_info": [3, 12, 1]}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import sqlite3
 from pathlib import Path
 
 from typer.testing import CliRunner
@@ -11,7 +12,7 @@ runner = CliRunner()
 
 
 def test_collect_writes_file(monkeypatch, tmp_path: Path) -> None:
-    monkeypatch.setattr("sysforge.cli.run_collectors", lambda: {"hello": "world"})
+    monkeypatch.setattr("sysforge.cli.run_collectors", lambda **_: {"hello": "world"})
     out_path = tmp_path / "collect.json"
 
     result = runner.invoke(app, ["collect", "--output", str(out_path)])
@@ -23,7 +24,7 @@ def test_collect_writes_file(monkeypatch, tmp_path: Path) -> None:
 def test_doctor_success_exit(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(
         "sysforge.cli.run_checks",
-        lambda disk_threshold: {"results": [], "summary": {"pass": 1, "warn": 0, "fail": 0}},
+        lambda **_: {"results": [], "summary": {"pass": 1, "warn": 0, "fail": 0}},
     )
     result = runner.invoke(app, ["doctor"])
     assert result.exit_code == 0
@@ -33,7 +34,7 @@ def test_doctor_success_exit(monkeypatch, tmp_path: Path) -> None:
 def test_doctor_failure_exit(monkeypatch) -> None:
     monkeypatch.setattr(
         "sysforge.cli.run_checks",
-        lambda disk_threshold: {"results": [], "summary": {"pass": 0, "warn": 0, "fail": 1}},
+        lambda **_: {"results": [], "summary": {"pass": 0, "warn": 0, "fail": 1}},
     )
     result = runner.invoke(app, ["doctor"])
     assert result.exit_code == 2
@@ -42,7 +43,7 @@ def test_doctor_failure_exit(monkeypatch) -> None:
 def test_doctor_warn_exit(monkeypatch) -> None:
     monkeypatch.setattr(
         "sysforge.cli.run_checks",
-        lambda disk_threshold: {"results": [], "summary": {"pass": 0, "warn": 1, "fail": 0}},
+        lambda **_: {"results": [], "summary": {"pass": 0, "warn": 1, "fail": 0}},
     )
     result = runner.invoke(app, ["doctor"])
     assert result.exit_code == 1
@@ -51,7 +52,7 @@ def test_doctor_warn_exit(monkeypatch) -> None:
 def test_doctor_malformed_summary_not_dict_exits_2(monkeypatch) -> None:
     monkeypatch.setattr(
         "sysforge.cli.run_checks",
-        lambda disk_threshold: {"results": [], "summary": None},
+        lambda **_: {"results": [], "summary": None},
     )
     result = runner.invoke(app, ["doctor"])
     assert result.exit_code == 2
@@ -60,7 +61,7 @@ def test_doctor_malformed_summary_not_dict_exits_2(monkeypatch) -> None:
 def test_doctor_malformed_summary_string_exits_2(monkeypatch) -> None:
     monkeypatch.setattr(
         "sysforge.cli.run_checks",
-        lambda disk_threshold: {"results": [], "summary": "bad"},
+        lambda **_: {"results": [], "summary": "bad"},
     )
     result = runner.invoke(app, ["doctor"])
     assert result.exit_code == 2
@@ -69,7 +70,7 @@ def test_doctor_malformed_summary_string_exits_2(monkeypatch) -> None:
 def test_doctor_malformed_summary_bool_values_exits_2(monkeypatch) -> None:
     monkeypatch.setattr(
         "sysforge.cli.run_checks",
-        lambda disk_threshold: {"results": [], "summary": {"pass": 0, "warn": True, "fail": False}},
+        lambda **_: {"results": [], "summary": {"pass": 0, "warn": True, "fail": False}},
     )
     result = runner.invoke(app, ["doctor"])
     assert result.exit_code == 2
@@ -78,7 +79,7 @@ def test_doctor_malformed_summary_bool_values_exits_2(monkeypatch) -> None:
 def test_doctor_malformed_summary_missing_keys_exits_2(monkeypatch) -> None:
     monkeypatch.setattr(
         "sysforge.cli.run_checks",
-        lambda disk_threshold: {"results": [], "summary": {}},
+        lambda **_: {"results": [], "summary": {}},
     )
     result = runner.invoke(app, ["doctor"])
     assert result.exit_code == 2
@@ -87,7 +88,7 @@ def test_doctor_malformed_summary_missing_keys_exits_2(monkeypatch) -> None:
 def test_doctor_malformed_summary_wrong_types_exits_2(monkeypatch) -> None:
     monkeypatch.setattr(
         "sysforge.cli.run_checks",
-        lambda disk_threshold: {"results": [], "summary": {"warn": "1", "fail": 0}},
+        lambda **_: {"results": [], "summary": {"warn": "1", "fail": 0}},
     )
     result = runner.invoke(app, ["doctor"])
     assert result.exit_code == 2
@@ -96,7 +97,7 @@ def test_doctor_malformed_summary_wrong_types_exits_2(monkeypatch) -> None:
 def test_doctor_malformed_summary_pass_wrong_type_exits_2(monkeypatch) -> None:
     monkeypatch.setattr(
         "sysforge.cli.run_checks",
-        lambda disk_threshold: {"results": [], "summary": {"pass": "1", "warn": 0, "fail": 0}},
+        lambda **_: {"results": [], "summary": {"pass": "1", "warn": 0, "fail": 0}},
     )
     result = runner.invoke(app, ["doctor"])
     assert result.exit_code == 2
@@ -105,7 +106,7 @@ def test_doctor_malformed_summary_pass_wrong_type_exits_2(monkeypatch) -> None:
 def test_doctor_respects_pretty_option(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(
         "sysforge.cli.run_checks",
-        lambda disk_threshold: {"results": [], "summary": {"pass": 1, "warn": 0, "fail": 0}},
+        lambda **_: {"results": [], "summary": {"pass": 1, "warn": 0, "fail": 0}},
     )
     out_path = tmp_path / "doctor.json"
 
@@ -119,7 +120,7 @@ def test_doctor_respects_pretty_option(monkeypatch, tmp_path: Path) -> None:
 def test_report_writes_combined(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(
         "sysforge.cli.assemble_report",
-        lambda disk_threshold: {
+        lambda **_: {
             "timestamp": "2025-01-01T00:00:00Z",
             "collected": {"ok": True},
             "checks": {"results": [], "summary": {"pass": 1, "warn": 0, "fail": 0}},
@@ -136,7 +137,7 @@ def test_report_writes_combined(monkeypatch, tmp_path: Path) -> None:
 def test_report_warn_exit(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(
         "sysforge.cli.assemble_report",
-        lambda disk_threshold: {
+        lambda **_: {
             "timestamp": "2025-01-01T00:00:00Z",
             "collected": {"ok": True},
             "checks": {"results": [], "summary": {"pass": 0, "warn": 1, "fail": 0}},
@@ -151,7 +152,7 @@ def test_report_warn_exit(monkeypatch, tmp_path: Path) -> None:
 def test_report_fail_exit(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(
         "sysforge.cli.assemble_report",
-        lambda disk_threshold: {
+        lambda **_: {
             "timestamp": "2025-01-01T00:00:00Z",
             "collected": {"ok": True},
             "checks": {"results": [], "summary": {"pass": 0, "warn": 0, "fail": 1}},
@@ -166,7 +167,7 @@ def test_report_fail_exit(monkeypatch, tmp_path: Path) -> None:
 def test_report_malformed_summary_exits_2_and_writes_file(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(
         "sysforge.cli.assemble_report",
-        lambda disk_threshold: {
+        lambda **_: {
             "timestamp": "2025-01-01T00:00:00Z",
             "collected": {"ok": True},
             "checks": {"results": [], "summary": {}},
@@ -182,7 +183,7 @@ def test_report_markdown_output(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr("sysforge.reporting.iso_timestamp", lambda: "2024-01-01T00:00:00Z")
     monkeypatch.setattr(
         "sysforge.reporting.run_collectors",
-        lambda: {
+        lambda **_: {
             "system": {
                 "os": {"name": "TestOS", "release": "1.0", "version": "build-1", "machine": "x86"},
                 "python": {
@@ -196,7 +197,7 @@ def test_report_markdown_output(monkeypatch, tmp_path: Path) -> None:
         },
     )
 
-    def fake_run_checks(*, disk_threshold: float) -> dict[str, object]:
+    def fake_run_checks(**_: object) -> dict[str, object]:
         return {
             "results": [
                 {"name": "disk", "status": "pass", "message": "ok"},
@@ -221,5 +222,306 @@ def test_report_markdown_output(monkeypatch, tmp_path: Path) -> None:
 def test_report_rejects_invalid_format() -> None:
     result = runner.invoke(app, ["report", "--format", "xml"])
     assert result.exit_code != 0
-    assert "format must be either" in result.stderr
-    assert "'json' or 'md'" in result.stderr
+    assert "format must be json, md or ndjson" in result.stderr
+
+
+def test_collect_passes_parallel_options(monkeypatch) -> None:
+    calls: dict[str, object] = {}
+
+    def fake_run_collectors(**kwargs: object) -> dict[str, object]:
+        calls.update(kwargs)
+        return {}
+
+    monkeypatch.setattr("sysforge.cli.run_collectors", fake_run_collectors)
+    result = runner.invoke(
+        app, ["collect", "--jobs", "4", "--collector-timeout", "2.5", "--executor", "process"]
+    )
+    assert result.exit_code == 0
+    assert calls["jobs"] == 4
+    assert calls["timeout"] == 2.5
+    assert calls["executor"] == "process"
+
+
+def test_collect_rejects_invalid_executor() -> None:
+    result = runner.invoke(app, ["collect", "--executor", "fiber"])
+    assert result.exit_code != 0
+    assert "executor must be either" in result.stderr
+
+
+def test_collect_cache_flags_configure_context(monkeypatch) -> None:
+    contexts: list[object] = []
+
+    def fake_run_collectors(**kwargs: object) -> dict[str, object]:
+        contexts.append(kwargs["context"])
+        return {}
+
+    monkeypatch.setattr("sysforge.cli.run_collectors", fake_run_collectors)
+
+    assert runner.invoke(app, ["collect"]).exit_code == 0
+    assert runner.invoke(app, ["collect", "--refresh"]).exit_code == 0
+    assert runner.invoke(app, ["collect", "--no-cache"]).exit_code == 0
+
+    default, refreshed, uncached = contexts
+    assert default.cache is not None and default.cache.refresh is False
+    assert refreshed.cache is not None and refreshed.cache.refresh is True
+    assert uncached.cache is None
+
+
+def test_collect_rejects_conflicting_cache_flags() -> None:
+    result = runner.invoke(app, ["collect", "--no-cache", "--refresh"])
+    assert result.exit_code != 0
+    assert "cannot be combined" in result.stderr
+
+
+def test_doctor_ndjson_streams_results_and_summary(monkeypatch) -> None:
+    from sysforge.checks.base import CheckResult
+
+    monkeypatch.setattr(
+        "sysforge.cli.iter_checks",
+        lambda **_: iter(
+            [
+                CheckResult(name="a", status="pass", message="ok"),
+                CheckResult(name="b", status="warn", message="meh"),
+            ]
+        ),
+    )
+    result = runner.invoke(app, ["doctor", "--format", "ndjson"])
+
+    assert result.exit_code == 1
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [r["type"] for r in records] == ["check", "check", "summary"]
+    assert records[-1]["summary"] == {"pass": 1, "warn": 1, "fail": 0}
+
+
+def test_collect_ndjson_appends_to_file(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(
+        "sysforge.cli.iter_collectors", lambda **_: iter([("a", {"x": 1}), ("b", {"y": 2})])
+    )
+    out_path = tmp_path / "collect.ndjson"
+
+    for _ in range(2):
+        result = runner.invoke(
+            app, ["collect", "--format", "ndjson", "--output", str(out_path), "--no-cache"]
+        )
+        assert result.exit_code == 0
+
+    records = [json.loads(line) for line in out_path.read_text().splitlines()]
+    assert [r["name"] for r in records] == ["a", "b", "a", "b"]
+    assert records[0] == {"type": "collector", "name": "a", "data": {"x": 1}}
+
+
+def test_report_ndjson_uses_streamed_summary(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(
+        "sysforge.cli.iter_report_records",
+        lambda **_: iter(
+            [
+                {"type": "report", "timestamp": "t"},
+                {"type": "summary", "summary": {"pass": 0, "warn": 0, "fail": 1}},
+            ]
+        ),
+    )
+    out_path = tmp_path / "report.ndjson"
+
+    result = runner.invoke(app, ["report", "--format", "ndjson", "--output", str(out_path)])
+
+    assert result.exit_code == 2
+    assert len(out_path.read_text().splitlines()) == 2
+    assert "1 fail" in result.stderr
+
+
+def test_doctor_passes_mount_settings_to_checks(monkeypatch) -> None:
+    seen: dict[str, object] = {}
+
+    def fake_run_checks(**kwargs: object) -> dict[str, object]:
+        seen.update(kwargs["context"].settings)  # type: ignore[attr-defined]
+        return {"results": [], "summary": {"pass": 1, "warn": 0, "fail": 0}}
+
+    monkeypatch.setattr("sysforge.cli.run_checks", fake_run_checks)
+    result = runner.invoke(app, ["doctor", "--all-mounts", "--mount-threshold", "/var=0.2"])
+
+    assert result.exit_code == 0
+    assert seen == {"mount_thresholds": {"/var": 0.2}, "all_mounts": True}
+
+
+def test_doctor_check_deadlines_are_opt_in(monkeypatch) -> None:
+    calls: list[tuple[object, object]] = []
+
+    def fake_run_checks(**kwargs: object) -> dict[str, object]:
+        calls.append((kwargs["timeout"], kwargs["deadline"]))
+        return {"results": [], "summary": {"pass": 1, "warn": 0, "fail": 0}}
+
+    monkeypatch.setattr("sysforge.cli.run_checks", fake_run_checks)
+
+    assert runner.invoke(app, ["doctor"]).exit_code == 0
+    assert runner.invoke(app, ["doctor", "--check-timeout", "5"]).exit_code == 0
+    assert calls == [(None, None), (5.0, None)]
+
+
+def test_doctor_rejects_invalid_mount_threshold() -> None:
+    result = runner.invoke(app, ["doctor", "--mount-threshold", "/var"])
+
+    assert result.exit_code != 0
+    assert "MOUNT=FRACTION" in result.output
+
+
+def test_report_profile_writes_pstats(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(
+        "sysforge.cli.assemble_report",
+        lambda **_: {
+            "timestamp": "2025-01-01T00:00:00Z",
+            "collected": {},
+            "checks": {"results": [], "summary": {"pass": 1, "warn": 0, "fail": 0}},
+        },
+    )
+    profile_path = tmp_path / "run.pstats"
+    result = runner.invoke(
+        app,
+        ["report", "--output", str(tmp_path / "r.json"), "--profile", str(profile_path)],
+    )
+    assert result.exit_code == 0
+    assert profile_path.stat().st_size > 0
+    assert f"Wrote profile to {profile_path}" in result.output
+
+
+def test_doctor_incremental_marks_cached_results(monkeypatch, tmp_path: Path) -> None:
+    from sysforge.checks import register_check
+    from sysforge.checks.core import PythonVersionCheck
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr("sysforge.checks._check_registry", [])
+    register_check(PythonVersionCheck())
+
+    def freshness() -> list[str]:
+        result = runner.invoke(app, ["doctor", "--incremental"])
+        assert result.exit_code == 0
+        return [entry["freshness"] for entry in json.loads(result.stdout)["results"]]
+
+    assert freshness() == ["fresh"]
+    assert freshness() == ["cached"]
+    assert list((tmp_path / "sysforge").glob("check.python_version.json"))
+
+
+def test_report_incremental_requires_cache(tmp_path: Path) -> None:
+    result = runner.invoke(
+        app, ["report", "--no-cache", "--incremental", "--output", str(tmp_path / "r.json")]
+    )
+    assert result.exit_code != 0
+    assert "--incremental" in result.output
+
+
+def test_report_history_records_run_and_history_queries(monkeypatch, tmp_path: Path) -> None:
+    reports = iter(
+        [
+            {
+                "timestamp": f"2025-01-0{day}T00:00:00+00:00",
+                "collected": {"system": {"disk": {"percent_free": free}}},
+                "checks": {
+                    "results": [{"name": "disk_space", "status": status, "message": "m"}],
+                    "summary": {"pass": 1, "warn": 0, "fail": 0},
+                },
+            }
+            for day, free, status in ((1, 0.5, "pass"), (2, 0.12, "warn"))
+        ]
+    )
+    monkeypatch.setattr("sysforge.cli.assemble_report", lambda **_: next(reports))
+    db = tmp_path / "history.sqlite3"
+
+    for _ in range(2):
+        result = runner.invoke(
+            app,
+            ["report", "--output", str(tmp_path / "r.json"), "--history", "--history-db", str(db)],
+        )
+        assert result.exit_code == 0
+        assert "Recorded run" in result.stdout
+
+    checks = runner.invoke(app, ["history", "check", "disk_space", "--db", str(db)])
+    buckets = runner.invoke(
+        app, ["history", "metric", "system.disk.percent_free", "-b", "1d", "--db", str(db)]
+    )
+    changed = runner.invoke(app, ["history", "changed", "disk_space", "--db", str(db)])
+
+    assert [r["status"] for r in json.loads(checks.stdout)["results"]] == ["pass", "warn"]
+    assert [b["max"] for b in json.loads(buckets.stdout)["buckets"]] == [0.5, 0.12]
+    assert json.loads(changed.stdout) == {
+        "check": "disk_space",
+        "current": {"status": "warn", "message": "m"},
+        "since": "2025-01-02T00:00:00+00:00",
+        "previous": {"status": "pass", "message": "m"},
+    }
+
+
+def test_history_import_and_prune(tmp_path: Path) -> None:
+    reports = tmp_path / "reports"
+    reports.mkdir()
+    for day in (1, 2):
+        report = {"timestamp": f"2025-01-0{day}T00:00:00+00:00", "collected": {"a": day}}
+        (reports / f"{day}.json").write_text(json.dumps(report))
+    (reports / "bad.json").write_text(json.dumps({"collected": {}}))
+    db = tmp_path / "history.sqlite3"
+
+    imported = runner.invoke(app, ["history", "import", str(reports), "--db", str(db)])
+    reimported = runner.invoke(app, ["history", "import", str(reports), "--db", str(db)])
+    pruned = runner.invoke(app, ["history", "prune", "--max-age", "1d", "--db", str(db)])
+    listed = runner.invoke(app, ["history", "list", "--db", str(db)])
+
+    assert imported.exit_code == 0
+    assert "Imported 2 report(s)" in imported.stdout
+    assert "Skipping" in imported.stderr
+    assert "Imported 0 report(s)" in reimported.stdout
+    assert "2 already recorded" in reimported.stdout
+    assert "Deleted 2 run(s)" in pruned.stdout
+    assert json.loads(listed.stdout) == {"checks": [], "metrics": ["a"]}
+
+
+def test_history_import_reports_database_errors(monkeypatch, tmp_path: Path) -> None:
+    from sysforge.history import HistoryStore
+
+    def locked(self, reports):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(HistoryStore, "record_many", locked)
+    (tmp_path / "1.json").write_text(json.dumps({"timestamp": "2025-01-01T00:00:00+00:00"}))
+
+    result = runner.invoke(
+        app, ["history", "import", str(tmp_path), "--db", str(tmp_path / "history.sqlite3")]
+    )
+
+    assert result.exit_code == 1
+    assert "Failed to record history: database is locked" in result.stderr
+
+
+def test_history_requires_existing_database(tmp_path: Path) -> None:
+    result = runner.invoke(
+        app, ["history", "check", "disk_space", "--db", str(tmp_path / "missing.sqlite3")]
+    )
+
+    assert result.exit_code == 1
+    assert "No history database" in result.stderr
+
+
+def test_doctor_reuses_cached_package_index(monkeypatch, tmp_path: Path) -> None:
+    from sysforge.checks import register_check
+    from sysforge.checks.packages import PackageRequirementsCheck
+    from sysforge.collectors import packages
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr("sysforge.checks._check_registry", [])
+    register_check(PackageRequirementsCheck())
+    builds: list[list[str]] = []
+    build_index = packages.build_index
+
+    def counting_build_index(paths: list[str]) -> dict[str, object]:
+        builds.append(paths)
+        return build_index(paths)
+
+    monkeypatch.setattr(packages, "build_index", counting_build_index)
+
+    def doctor(*args: str) -> str:
+        result = runner.invoke(app, ["doctor", *args])
+        return json.loads(result.stdout)["results"][0]["name"]
+
+    assert doctor() == "package_requirements"
+    assert doctor() == "package_requirements"
+    assert len(builds) == 1
+    doctor("--no-cache")
+    assert len(builds) == 2
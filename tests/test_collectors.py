@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
 
 import pytest
 
-from sysforge.collectors import get_collectors, register_collector
+from sysforge.collectors import get_collectors, register_collector, run_collectors
 from sysforge.collectors.base import BaseCollector
 from sysforge.collectors.system import SystemCollector
+from sysforge.context import RunContext
 
 
 def test_system_collector_collects_expected_payload(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -41,6 +43,7 @@ def test_system_collector_collects_expected_payload(monkeypatch: pytest.MonkeyPa
 
     monkeypatch.setattr("sysforge.collectors.system.disk_usage_summary", fake_disk_usage)
     monkeypatch.setattr("sysforge.collectors.system.safe_env_summary", fake_env_summary)
+    monkeypatch.setattr("sysforge.collectors.system.probe_cgroup", lambda: {"supported": False})
 
     payload = SystemCollector().collect()
 
@@ -88,6 +91,7 @@ def test_system_collector_omits_memory_when_unknown(monkeypatch: pytest.MonkeyPa
         "sysforge.collectors.system.safe_env_summary",
         lambda keys: {"allowed": {}, "total_count": len(keys)},
     )
+    monkeypatch.setattr("sysforge.collectors.system.probe_cgroup", lambda: {"supported": False})
 
     payload = SystemCollector().collect()
 
@@ -98,7 +102,7 @@ def test_system_collector_omits_memory_when_unknown(monkeypatch: pytest.MonkeyPa
 class DummyCollector(BaseCollector):
     name = "dummy"
 
-    def collect(self) -> dict[str, object]:
+    def collect(self, context: RunContext | None = None) -> dict[str, object]:
         return {"dummy": True}
 
 
@@ -111,3 +115,31 @@ def test_register_collector_warns_on_duplicate(monkeypatch: pytest.MonkeyPatch)
         register_collector(collector)
 
     assert get_collectors() == [collector]
+
+
+class SlowCollector(BaseCollector):
+    name = "slow"
+
+    def collect(self, context: RunContext | None = None) -> dict[str, object]:
+        time.sleep(1)
+        return {"slow": True}
+
+
+def test_run_collectors_reports_timeouts_in_registration_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("sysforge.collectors._collector_registry", [])
+    register_collector(SlowCollector())
+    register_collector(DummyCollector())
+
+    context = RunContext()
+    results = run_collectors(jobs=2, timeout=0.05, context=context)
+
+    assert list(results) == ["slow", "dummy"]
+    assert results["dummy"] == {"dummy": True}
+    assert results["slow"]["error"] == "timeout"
+    assert results["slow"]["elapsed_ms"] >= 50
+    timings = context.timings()["collectors"]
+    assert timings["slow"]["timed_out"] is True
+    assert timings["dummy"]["wall_ms"] >= 0
+    assert "cpu_ms" in timings["dummy"]
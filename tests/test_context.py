@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import threading
+
+from sysforge.context import RunContext
+
+
+def test_fact_is_computed_once_under_concurrency() -> None:
+    context = RunContext()
+    calls: list[int] = []
+    barrier = threading.Barrier(4, timeout=5)
+
+    def producer() -> int:
+        calls.append(1)
+        return 42
+
+    def reader(out: list[int]) -> None:
+        barrier.wait()
+        out.append(context.fact("answer", producer))
+
+    values: list[int] = []
+    threads = [threading.Thread(target=reader, args=(values,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert values == [42, 42, 42, 42]
+    assert len(calls) == 1
+
+
+def test_merge_facts_keeps_existing_values() -> None:
+    context = RunContext()
+    context.fact("a", lambda: 1)
+
+    context.merge_facts({"a": 2, "b": 3})
+
+    assert context.facts() == {"a": 1, "b": 3}
+
+
+def test_collected_payloads_are_readable() -> None:
+    context = RunContext()
+    context.record_collected("system", {"ok": True})
+
+    assert context.collected("system") == {"ok": True}
+    assert context.collected("missing") is None
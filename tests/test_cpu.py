@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sysforge.cache import CollectorCache
+from sysforge.checks.cpu import CpuSaturationCheck
+from sysforge.collectors import cpu
+from sysforge.collectors.cpu import CpuCollector, _ProcReader, parse_proc_stat, utilization
+from sysforge.context import RunContext
+
+
+def _stat(total: tuple[int, ...], *cores: tuple[int, ...]) -> str:
+    lines = ["cpu  " + " ".join(map(str, total))]
+    lines += [f"cpu{index} " + " ".join(map(str, core)) for index, core in enumerate(cores)]
+    lines += ["intr 1 2 3", "ctxt 100", "btime 1"]
+    return "\n".join(lines) + "\n"
+
+
+@pytest.fixture
+def proc_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> tuple[Path, Path]:
+    stat = tmp_path / "stat"
+    loadavg = tmp_path / "loadavg"
+    loadavg.write_text("1.50 0.75 0.25 3/412 12345\n")
+    monkeypatch.setattr(cpu, "STAT_PATH", stat)
+    monkeypatch.setattr(cpu, "LOADAVG_PATH", loadavg)
+    monkeypatch.setattr(cpu.time, "sleep", lambda _seconds: None)
+    return stat, loadavg
+
+
+def test_parse_proc_stat_reads_cpu_lines_only() -> None:
+    counters = parse_proc_stat(_stat((1, 2, 3, 4, 5, 6, 7, 8, 9, 10), (1, 1, 1, 1)).encode())
+
+    assert counters["cpu"] == (1, 2, 3, 4, 5, 6, 7, 8)
+    assert counters["cpu0"] == (1, 1, 1, 1, 0, 0, 0, 0)
+    assert set(counters) == {"cpu", "cpu0"}
+
+
+def test_utilization_shares_and_busy() -> None:
+    shares = utilization((0,) * 8, (50, 0, 10, 30, 10, 0, 0, 0))
+
+    assert shares["user"] == pytest.approx(0.5)
+    assert shares["iowait"] == pytest.approx(0.1)
+    assert shares["busy"] == pytest.approx(0.6)
+    assert utilization((5,) * 8, (5,) * 8)["busy"] == 0.0
+
+
+def test_collector_measures_deltas_between_calls(proc_files: tuple[Path, Path]) -> None:
+    stat, _ = proc_files
+    stat.write_text(_stat((0,) * 8, (0,) * 8, (0,) * 8))
+    collector = CpuCollector()
+    try:
+        first = collector.sample()
+        assert first["supported"] is True
+        assert first["cpu_count"] == 2
+        assert first["loadavg"] == {"1m": 1.5, "5m": 0.75, "15m": 0.25, "runnable": 3, "tasks": 412}
+        assert first["total"]["busy"] == 0.0
+
+        stat.write_text(
+            _stat(
+                (100, 0, 0, 60, 0, 0, 0, 40),
+                (100, 0, 0, 0, 0, 0, 0, 0),
+                (0, 0, 0, 60, 0, 0, 0, 40),
+            )
+        )
+        second = collector.sample()
+    finally:
+        collector.close()
+
+    assert second["total"]["steal"] == pytest.approx(0.2)
+    assert second["total"]["busy"] == pytest.approx(0.7)
+    assert [core["busy"] for core in second["cores"]] == pytest.approx([1.0, 0.4])
+
+
+def test_collector_reuses_a_baseline_saved_by_an_earlier_run(
+    proc_files: tuple[Path, Path], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    stat, _ = proc_files
+    sleeps: list[float] = []
+    monkeypatch.setattr(cpu.time, "sleep", sleeps.append)
+    cache = CollectorCache(tmp_path / "cache")
+    stat.write_text(_stat((0,) * 8, (0,) * 8))
+
+    CpuCollector().collect(RunContext(cache=cache))
+    assert len(sleeps) == 1
+
+    stat.write_text(_stat((50, 0, 0, 50, 0, 0, 0, 0), (50, 0, 0, 50, 0, 0, 0, 0)))
+    usage = CpuCollector().collect(RunContext(cache=cache))
+
+    # The second run measured against the first one's counters instead of sleeping.
+    assert len(sleeps) == 1
+    assert usage["total"]["busy"] == pytest.approx(0.5)
+    assert usage["interval_seconds"] > 0
+
+    CpuCollector().collect(RunContext(cache=CollectorCache(tmp_path / "cache", refresh=True)))
+    assert len(sleeps) == 2
+
+
+def test_proc_reader_reuses_handle_and_grows_buffer(tmp_path: Path) -> None:
+    path = tmp_path / "stat"
+    path.write_text(_stat((1,) * 8, *[(1,) * 8] * 40))
+    reader = _ProcReader(path, 64)
+    try:
+        first = bytes(reader.read(cpu._cpu_lines_complete))
+        handle = reader._handle
+        second = bytes(reader.read(cpu._cpu_lines_complete))
+    finally:
+        reader.close()
+
+    assert reader._handle is None
+    assert handle is not None
+    assert first == second
+    assert len(parse_proc_stat(first)) == 41
+
+
+def test_collector_unsupported_without_proc(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(cpu, "STAT_PATH", tmp_path / "missing")
+
+    assert CpuCollector().sample() == {"supported": False}
+
+
+def _cpu_context(load_5m: float, cores: int, steal: float) -> RunContext:
+    usage: dict[str, Any] = {
+        "supported": True,
+        "cpu_count": cores,
+        "loadavg": {"1m": load_5m, "5m": load_5m, "15m": load_5m},
+        "total": {"busy": 0.5, "iowait": 0.0, "steal": steal},
+    }
+    context = RunContext()
+    context.fact("cpu", lambda: usage)
+    return context
+
+
+@pytest.mark.parametrize(
+    ("load_5m", "cores", "steal", "expected"),
+    [
+        (1.0, 4, 0.0, "pass"),
+        (4.0, 4, 0.0, "warn"),
+        (8.0, 4, 0.0, "fail"),
+        (1.0, 4, 0.06, "warn"),
+        (1.0, 4, 0.25, "fail"),
+    ],
+)
+def test_cpu_saturation_check_levels(
+    load_5m: float, cores: int, steal: float, expected: str
+) -> None:
+    result = CpuSaturationCheck().run(context=_cpu_context(load_5m, cores, steal))
+
+    assert result.status == expected
+    assert result.data is not None
+    assert result.data["load_per_core"] == pytest.approx(load_5m / cores)
+
+
+def test_cpu_saturation_check_reuses_the_collected_payload(monkeypatch) -> None:
+    context = RunContext()
+    context.record_collected("cpu", _cpu_context(8.0, 4, 0.0).fact("cpu", dict))
+    monkeypatch.setattr(
+        "sysforge.checks.cpu._COLLECTOR.sample", lambda *_: pytest.fail("sampled again")
+    )
+
+    result = CpuSaturationCheck().run(context=context)
+
+    assert result.status == "fail"
+
+
+def test_cpu_saturation_check_falls_back_to_getloadavg(monkeypatch) -> None:
+    context = RunContext()
+    context.fact("cpu", lambda: {"supported": False})
+    monkeypatch.setattr("sysforge.checks.cpu.os.getloadavg", lambda: (0.1, 9.0, 0.1))
+    monkeypatch.setattr("sysforge.checks.cpu.os.cpu_count", lambda: 2)
+
+    result = CpuSaturationCheck().run(context=context)
+
+    assert result.status == "fail"
+    assert "4.50 per core" in result.message
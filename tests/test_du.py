@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from sysforge import du
+from sysforge.cli import app
+from sysforge.du import disk_usage_tree
+
+runner = CliRunner()
+
+
+def _tree(root: Path) -> Path:
+    (root / "a" / "deep" / "deeper").mkdir(parents=True)
+    (root / "b").mkdir()
+    (root / "a" / "deep" / "deeper" / "big.bin").write_bytes(b"x" * 5000)
+    (root / "a" / "small.txt").write_bytes(b"x" * 10)
+    (root / "b" / "medium.bin").write_bytes(b"x" * 2000)
+    os.link(root / "b" / "medium.bin", root / "a" / "medium-link.bin")
+    (root / "b" / "loop").symlink_to(root)
+    return root
+
+
+def _expected_apparent_total(root: Path) -> int:
+    total = os.lstat(root).st_size
+    seen: set[tuple[int, int]] = set()
+    for directory, dirnames, filenames in os.walk(root):
+        for name in dirnames + filenames:
+            info = os.lstat(os.path.join(directory, name))
+            if (info.st_dev, info.st_ino) in seen:
+                continue
+            seen.add((info.st_dev, info.st_ino))
+            total += info.st_size
+    return total
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_disk_usage_tree_totals_and_hotspots(tmp_path: Path, jobs: int) -> None:
+    root = _tree(tmp_path / "tree")
+
+    result = disk_usage_tree(root, jobs=jobs, top=2, apparent_size=True)
+
+    assert result["total_bytes"] == _expected_apparent_total(root)
+    assert result["files"] == 5
+    assert result["directories"] == 5
+    assert result["hardlinks_skipped"] == 1
+    assert result["errors"] == 0
+    assert [entry["path"] for entry in result["top_directories"]] == [
+        str(root / "a"),
+        str(root / "a" / "deep"),
+    ]
+    assert result["top_files"][0] == {
+        "path": str(root / "a" / "deep" / "deeper" / "big.bin"),
+        "bytes": 5000,
+    }
+    assert len(result["top_files"]) == 2
+
+
+def test_disk_usage_tree_max_depth_limits_ranking_only(tmp_path: Path) -> None:
+    root = _tree(tmp_path / "tree")
+
+    result = disk_usage_tree(root, jobs=1, top=10, max_depth=1, apparent_size=True)
+
+    assert {entry["path"] for entry in result["top_directories"]} == {
+        str(root / "a"),
+        str(root / "b"),
+    }
+    assert result["total_bytes"] == _expected_apparent_total(root)
+
+
+def test_disk_usage_tree_records_unreadable_directories(tmp_path: Path, monkeypatch) -> None:
+    root = _tree(tmp_path / "tree")
+    real_scandir = os.scandir
+
+    def flaky_scandir(path: str):
+        if path.endswith("deep"):
+            raise PermissionError(13, "Permission denied")
+        return real_scandir(path)
+
+    monkeypatch.setattr(du.os, "scandir", flaky_scandir)
+    result = disk_usage_tree(root, jobs=4, apparent_size=True)
+
+    assert result["errors"] == 1
+    assert result["error_samples"] == [f"{root / 'a' / 'deep'}: Permission denied"]
+    assert all("big.bin" not in entry["path"] for entry in result["top_files"])
+
+
+def test_disk_usage_tree_rejects_invalid_arguments(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="not a directory"):
+        disk_usage_tree(_tree(tmp_path / "tree") / "a" / "small.txt")
+    with pytest.raises(ValueError, match="jobs"):
+        disk_usage_tree(tmp_path, jobs=0)
+
+
+def test_du_command_writes_output(tmp_path: Path) -> None:
+    root = _tree(tmp_path / "tree")
+    output = tmp_path / "out" / "du.json"
+
+    result = runner.invoke(
+        app, ["du", str(root), "--top", "1", "--apparent-size", "--output", str(output)]
+    )
+
+    assert result.exit_code == 0
+    assert "Wrote disk usage" in result.stdout
+    data = json.loads(output.read_text())
+    assert data["path"] == str(root)
+    assert len(data["top_directories"]) == 1
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from typer.testing import CliRunner
+
+from sysforge.checks import register_check
+from sysforge.checks.base import BaseCheck, CheckResult
+from sysforge.cli import app
+from sysforge.collectors.base import BaseCollector
+from sysforge.context import RunContext
+from sysforge.exporter import (
+    Exporter,
+    MetricsServer,
+    collector_series,
+    metric_name,
+    render_exposition,
+)
+
+runner = CliRunner()
+
+
+class CountingCollector(BaseCollector):
+    name = "counting"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def collect(self, context: RunContext | None = None) -> dict[str, object]:
+        ctx = context or RunContext()
+        self.calls += 1
+        probe = ctx.fact("probe", lambda: {"value": 41 + self.calls})
+        return {"probe": probe, "rx.errors": 2, "label": "skipped", "up": True}
+
+
+class ProbeCheck(BaseCheck):
+    name = "probe_check"
+
+    def __init__(self) -> None:
+        self.probes = 0
+
+    def run(self, *, disk_threshold: float = 0.10, context: RunContext | None = None):
+        ctx = context or RunContext()
+
+        def probe() -> dict[str, int]:
+            self.probes += 1
+            return {"value": 0}
+
+        value = ctx.fact("probe", probe)["value"]
+        return CheckResult(self.name, "warn" if value > 40 else "pass", "probed")
+
+
+@pytest.fixture()
+def registry(monkeypatch: pytest.MonkeyPatch) -> ProbeCheck:
+    monkeypatch.setattr("sysforge.checks._check_registry", [])
+    check = ProbeCheck()
+    register_check(check)
+    return check
+
+
+def test_metric_name_sanitizes() -> None:
+    assert metric_name("network", "interfaces.eth0:1.rx-bytes") == (
+        "sysforge_network_interfaces_eth0_1_rx_bytes"
+    )
+
+
+def test_render_exposition_groups_families() -> None:
+    text = render_exposition(
+        {
+            "b_metric": ("B help.", "gauge", [({"name": 'a"b\\c\nd'}, 1.5)]),
+            "a_metric": ("A help.", "gauge", [({}, float("nan")), ({"x": "1"}, float("inf"))]),
+        }
+    )
+    assert text.splitlines() == [
+        "# HELP a_metric A help.",
+        "# TYPE a_metric gauge",
+        "a_metric NaN",
+        'a_metric{x="1"} +Inf',
+        "# HELP b_metric B help.",
+        "# TYPE b_metric gauge",
+        'b_metric{name="a\\"b\\\\c\\nd"} 1.5',
+    ]
+    assert render_exposition({}) == ""
+
+
+def test_collector_series_label_instances() -> None:
+    series = list(
+        collector_series(
+            "mounts",
+            {
+                "supported": True,
+                "mounts": [
+                    {"mount_point": "/", "fstype": "ext4", "free_bytes": 10},
+                    {"mount_point": "/var", "free_bytes": 20, "percent_free": 0.5},
+                ],
+            },
+        )
+    )
+    assert series == [
+        (("mounts", "free_bytes"), {"mount_point": "/"}, 10.0),
+        (("mounts", "free_bytes"), {"mount_point": "/var"}, 20.0),
+        (("mounts", "percent_free"), {"mount_point": "/var"}, 0.5),
+    ]
+    network = {"interfaces": {"eth0": {"rx_bytes": 5, "rates": None}}, "tcp": {"in_errs": 1}}
+    assert list(collector_series("network", network)) == [
+        (("interfaces", "rx_bytes"), {"interface": "eth0"}, 5.0),
+        (("tcp", "in_errs"), {}, 1.0),
+    ]
+
+
+def test_exporter_labels_mounts_and_never_repeats_a_series(registry: ProbeCheck) -> None:
+    class Mounts(BaseCollector):
+        name = "mounts"
+
+        def collect(self, context: RunContext | None = None) -> dict[str, object]:
+            return {
+                "mounts": [
+                    {"mount_point": "/", "free_bytes": 10},
+                    {"mount_point": "/data", "free_bytes": 20},
+                ],
+                # Both sanitize to sysforge_mounts_a_b.
+                "a.b": 1,
+                "a": {"b": 2},
+            }
+
+    exporter = Exporter([Mounts()], interval=60.0)
+    exporter.start()
+    try:
+        assert exporter.ready.wait(5)
+    finally:
+        exporter.stop(timeout=5)
+    text = exporter.metrics()
+
+    assert 'sysforge_mounts_mounts_free_bytes{mount_point="/"} 10.0' in text
+    assert 'sysforge_mounts_mounts_free_bytes{mount_point="/data"} 20.0' in text
+    assert "sysforge_mounts_a_b 1.0" in text
+    assert 'sysforge_collector_series_collisions{collector="mounts"} 1.0' in text
+    series = [line.rsplit(" ", 1)[0] for line in text.splitlines() if not line.startswith("#")]
+    assert len(series) == len(set(series))
+    families = [line.split()[2] for line in text.splitlines() if line.startswith("# TYPE")]
+    assert len(families) == len(set(families))
+
+
+def test_exporter_serves_cached_results(registry: ProbeCheck) -> None:
+    collector = CountingCollector()
+    exporter = Exporter([collector], interval=60.0)
+    assert "sysforge_exporter_ready 0.0" in exporter.metrics()
+
+    exporter.start()
+    try:
+        assert exporter.ready.wait(5)
+        text = exporter.metrics()
+    finally:
+        exporter.stop(timeout=5)
+
+    assert "sysforge_exporter_ready 1.0" in text
+    assert "sysforge_counting_probe_value 42.0" in text
+    assert "sysforge_counting_rx_errors 2.0" in text
+    assert "label" not in text
+    assert 'sysforge_collector_success{collector="counting"} 1.0' in text
+    assert 'sysforge_check_status{check="probe_check"} 1.0' in text
+    assert 'sysforge_check_duration_seconds{check="probe_check"}' in text
+    assert "sysforge_checks_success 1.0" in text
+    # The check reused the probe the collector resolved instead of running its own.
+    assert registry.probes == 0
+    assert collector.calls == 1
+
+
+def test_exporter_records_collector_errors(registry: ProbeCheck) -> None:
+    class Broken(BaseCollector):
+        name = "broken"
+
+        def collect(self, context: RunContext | None = None) -> dict[str, object]:
+            raise RuntimeError("boom")
+
+    exporter = Exporter([Broken()], interval=60.0)
+    exporter.start()
+    try:
+        assert exporter.ready.wait(5)
+    finally:
+        exporter.stop(timeout=5)
+    text = exporter.metrics()
+    assert 'sysforge_collector_success{collector="broken"} 0.0' in text
+    # Without the collector's probe, the check resolved it itself.
+    assert registry.probes == 1
+
+
+def test_exporter_stop_interrupts_sleep(registry: ProbeCheck) -> None:
+    exporter = Exporter([CountingCollector()], interval=3600.0)
+    exporter.start()
+    assert exporter.ready.wait(5)
+    exporter.stop(timeout=5)
+    assert exporter._thread is not None and not exporter._thread.is_alive()
+    with pytest.raises(RuntimeError):
+        exporter.start()
+
+
+def test_concurrent_scrapes_never_run_probes(registry: ProbeCheck) -> None:
+    collector = CountingCollector()
+    exporter = Exporter([collector], interval=3600.0)
+    exporter.start()
+    assert exporter.ready.wait(5)
+    server = MetricsServer(exporter, "127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+
+        def scrape(_: int) -> tuple[str, str]:
+            with urllib.request.urlopen(f"{base}/metrics", timeout=5) as response:
+                return response.headers["Content-Type"], response.read().decode()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            responses = list(pool.map(scrape, range(32)))
+
+        with pytest.raises(urllib.error.HTTPError) as info:
+            urllib.request.urlopen(f"{base}/nope", timeout=5)
+        assert info.value.code == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+        exporter.stop(timeout=5)
+
+    assert all(kind.startswith("text/plain; version=0.0.4") for kind, _ in responses)
+    assert all("sysforge_counting_probe_value 42.0" in body for _, body in responses)
+    assert collector.calls == 1
+    assert registry.probes == 0
+
+
+def test_serve_cli_starts_and_stops(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: list[str] = []
+
+    class FakeServer:
+        server_address = ("127.0.0.1", 9999)
+
+        def __init__(self, exporter: Exporter, host: str, port: int) -> None:
+            events.append(f"bind {host}:{port} every {exporter.check_interval}")
+
+        def serve_forever(self) -> None:
+            raise KeyboardInterrupt
+
+        def server_close(self) -> None:
+            events.append("close")
+
+    monkeypatch.setattr("sysforge.cli.MetricsServer", FakeServer)
+    monkeypatch.setattr(Exporter, "start", lambda self: events.append("start"))
+    monkeypatch.setattr(Exporter, "stop", lambda self, timeout=None: events.append("stop"))
+
+    result = runner.invoke(app, ["serve", "--port", "9999", "--check-interval", "1m"])
+
+    assert result.exit_code == 0, result.output
+    assert events == ["bind 127.0.0.1:9999 every 60.0", "start", "close", "stop"]
+    assert "http://127.0.0.1:9999/metrics" in result.stderr
+
+
+def test_serve_cli_rejects_bad_intervals() -> None:
+    result = runner.invoke(app, ["serve", "--interval", "soon"])
+    assert result.exit_code != 0
+    result = runner.invoke(app, ["serve", "--every", "nope=5s"])
+    assert result.exit_code != 0
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from sysforge.history import HistoryStore, report_from_records, report_timestamp
+
+T0 = 1_700_000_000.0
+
+
+def make_report(
+    offset: float, *, free: float = 0.5, status: str = "pass", python: str = "3.11.8"
+) -> dict:
+    return {
+        "timestamp": datetime.fromtimestamp(T0 + offset, UTC).isoformat(),
+        "collected": {"system": {"disk": {"percent_free": free, "path": "/"}}},
+        "checks": {
+            "results": [
+                {"name": "disk_space", "status": status, "message": f"{free:.0%} free"},
+                {"name": "python_version", "status": "pass", "message": f"Python {python}"},
+            ],
+            "summary": {},
+        },
+    }
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    with HistoryStore(tmp_path / "history.sqlite3") as history:
+        yield history
+
+
+def test_history_uses_wal_and_clustered_indexes(store: HistoryStore) -> None:
+    conn = sqlite3.connect(store.path)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        plan = " ".join(
+            str(row)
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM check_results "
+                "WHERE check_id = 1 AND timestamp >= 0 ORDER BY timestamp"
+            )
+        )
+    finally:
+        conn.close()
+    assert "PRIMARY KEY" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_record_and_query_check_results(store: HistoryStore) -> None:
+    store.record_many(
+        [make_report(0), make_report(60, free=0.12, status="warn"), make_report(120)]
+    )
+
+    results = store.check_results("disk_space", start=T0 + 30)
+    assert [entry["status"] for entry in results] == ["warn", "pass"]
+    assert results[0]["timestamp"] == T0 + 60
+    assert store.check_results("unknown") == []
+    assert store.names("check") == ["disk_space", "python_version"]
+    assert store.names("metric") == ["system.disk.percent_free"]
+
+
+def test_check_buckets_count_statuses(store: HistoryStore) -> None:
+    day = 86_400
+    base = day - T0 % day
+    store.record_many(
+        [
+            make_report(base),
+            make_report(base + 60, status="warn"),
+            make_report(base + day, status="fail"),
+        ]
+    )
+
+    buckets = store.check_buckets("disk_space", day)
+
+    assert [(b["pass"], b["warn"], b["fail"], b["worst"]) for b in buckets] == [
+        (1, 1, 0, "warn"),
+        (0, 0, 1, "fail"),
+    ]
+    assert buckets[0]["start"] == T0 + base
+
+
+def test_metric_samples_and_buckets(store: HistoryStore) -> None:
+    store.record_many([make_report(i * 60, free=0.5 - i / 100) for i in range(4)])
+
+    samples = store.metric_samples("system.disk.percent_free", end=T0 + 120)
+    buckets = store.metric_buckets("system.disk.percent_free", 3600)
+
+    assert samples == [(T0, 0.5), (T0 + 60, 0.49)]
+    assert len(buckets) in (1, 2)
+    assert sum(b["count"] for b in buckets) == 4
+    assert min(b["min"] for b in buckets) == pytest.approx(0.47)
+
+
+def test_last_change(store: HistoryStore) -> None:
+    store.record_many(
+        [
+            make_report(0),
+            make_report(60),
+            make_report(120, python="3.12.1"),
+            make_report(180, python="3.12.1"),
+        ]
+    )
+
+    change = store.last_change("check", "python_version", messages=True)
+    unchanged = store.last_change("metric", "system.disk.percent_free")
+
+    assert change == {
+        "name": "python_version",
+        "current": ["pass", "Python 3.12.1"],
+        "since": T0 + 120,
+        "previous": ["pass", "Python 3.11.8"],
+    }
+    assert unchanged is not None
+    assert unchanged["previous"] is None
+    assert unchanged["since"] == T0
+    assert store.last_change("check", "unknown") is None
+    # The status never changed, and only --messages counts the new version.
+    assert store.last_change("check", "python_version")["previous"] is None
+
+
+def test_last_change_ignores_drifting_messages(store: HistoryStore) -> None:
+    store.record_many(
+        [
+            make_report(0),
+            make_report(60, free=0.12, status="warn"),
+            make_report(120, free=0.11, status="warn"),
+            make_report(180, free=0.10, status="warn"),
+        ]
+    )
+
+    change = store.last_change("check", "disk_space")
+    strict = store.last_change("check", "disk_space", messages=True)
+
+    assert change == {
+        "name": "disk_space",
+        "current": ["warn", "10% free"],
+        "since": T0 + 60,
+        "previous": ["pass", "50% free"],
+    }
+    assert strict is not None
+    assert strict["since"] == T0 + 180
+    assert strict["previous"] == ["warn", "11% free"]
+
+
+def test_failed_batch_rolls_back(store: HistoryStore) -> None:
+    with pytest.raises(ValueError, match="timestamp"):
+        store.record_many([make_report(0), {"timestamp": "yesterday"}])
+
+    assert store.check_results("disk_space") == []
+    assert store.names("check") == []
+    store.record(make_report(0))
+    assert len(store.check_results("disk_space")) == 1
+
+
+def test_recording_a_run_twice_keeps_one_copy(store: HistoryStore) -> None:
+    assert store.record(make_report(0)) is not None
+    assert store.record(make_report(0)) is None
+    assert len(store.record_many([make_report(0), make_report(60), make_report(60)])) == 1
+    assert [entry["timestamp"] for entry in store.check_results("disk_space")] == [T0, T0 + 60]
+    # Same timestamp, different content: a distinct run.
+    assert store.record(make_report(0, status="warn")) is not None
+
+
+def test_upgrades_schema_1_database(tmp_path: Path) -> None:
+    path = tmp_path / "history.sqlite3"
+    with HistoryStore(path) as history:
+        history.record(make_report(0))
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("DROP INDEX runs_digest")
+        conn.execute("ALTER TABLE runs DROP COLUMN digest")
+        conn.execute("PRAGMA user_version = 1")
+    conn.close()
+
+    with HistoryStore(path) as history:
+        assert history.record(make_report(60)) is not None
+        assert history.record(make_report(60)) is None
+        assert len(history.check_results("disk_space")) == 2
+
+
+def test_prune_drops_and_compacts(store: HistoryStore) -> None:
+    hour = 3600
+    # Day-old runs every 10 minutes, plus one week-old run and one fresh run.
+    offsets = [-7 * 86_400] + [-86_400 + i * 600 for i in range(12)] + [0]
+    store.record_many([make_report(offset) for offset in offsets])
+
+    result = store.prune(max_age=3 * 86_400, compact_after=hour, resolution=hour, now=T0)
+
+    timestamps = [entry["timestamp"] for entry in store.check_results("disk_space")]
+    assert result["deleted_runs"] == 1
+    assert result["compacted_runs"] == 12 - len(timestamps) + 1
+    assert timestamps[-1] == T0
+    assert len({int(ts // hour) for ts in timestamps[:-1]}) == len(timestamps) - 1
+    assert len(store.metric_samples("system.disk.percent_free")) == len(timestamps)
+
+
+def test_rejects_non_database(tmp_path: Path) -> None:
+    path = tmp_path / "history.sqlite3"
+    path.write_text("not sqlite" * 100)
+
+    with pytest.raises(ValueError, match="not a sysforge history database"):
+        HistoryStore(path)
+
+
+def test_report_timestamp_and_records() -> None:
+    report = report_from_records(
+        [
+            {"type": "report", "timestamp": "2025-01-01T00:00:00+00:00"},
+            {"type": "collector", "name": "system", "data": {"cpu": 2}},
+            {"type": "check", "name": "disk_space", "status": "pass", "message": "ok"},
+            {"type": "summary", "summary": {"pass": 1, "warn": 0, "fail": 0}},
+        ]
+    )
+
+    assert report_timestamp(report) == datetime(2025, 1, 1, tzinfo=UTC).timestamp()
+    assert report["collected"] == {"system": {"cpu": 2}}
+    assert report["checks"]["results"] == [
+        {"name": "disk_space", "status": "pass", "message": "ok"}
+    ]
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sysforge.collectors import mounts
+from sysforge.collectors.mounts import MountsCollector, parse_mountinfo, probe_mounts
+from sysforge.context import RunContext
+
+MOUNTINFO = """\
+22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw
+23 22 0:21 / /proc rw,nosuid shared:2 - proc proc rw
+24 22 8:2 / /var rw,relatime shared:3 - xfs /dev/sda2 rw
+25 22 0:40 / /mnt/my\\040share rw,relatime shared:4 master:9 - nfs4 srv:/export rw
+26 22 0:41 / /var rw,relatime shared:5 - tmpfs tmpfs rw
+garbage line
+"""
+
+
+def _usage(percent_free: float, inodes_free: float | None = 0.9) -> dict[str, Any]:
+    return {
+        "total_bytes": 100,
+        "used_bytes": 100 - int(percent_free * 100),
+        "free_bytes": int(percent_free * 100),
+        "percent_free": percent_free,
+        "inodes_total": 10,
+        "inodes_free": 9,
+        "percent_inodes_free": inodes_free,
+    }
+
+
+@pytest.fixture
+def mountinfo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "mountinfo"
+    path.write_text(MOUNTINFO)
+    monkeypatch.setattr(mounts, "MOUNTINFO_PATH", path)
+    return path
+
+
+def test_parse_mountinfo_unescapes_and_keeps_topmost_mount() -> None:
+    parsed = parse_mountinfo(MOUNTINFO)
+
+    assert [entry["mount_point"] for entry in parsed] == ["/", "/proc", "/mnt/my share", "/var"]
+    assert parsed[2]["fstype"] == "nfs4"
+    assert parsed[2]["source"] == "srv:/export"
+    assert parsed[3]["fstype"] == "tmpfs"
+
+
+def test_probe_mounts_filters_fstypes(mountinfo: Path, monkeypatch) -> None:
+    monkeypatch.setattr(mounts, "statvfs_summary", lambda _point: _usage(0.5))
+
+    default = probe_mounts()
+    assert [entry["mount_point"] for entry in default["mounts"]] == [
+        "/",
+        "/mnt/my share",
+        "/var",
+    ]
+    assert default["mounts"][0]["percent_free"] == 0.5
+
+    included = probe_mounts(include_fstypes={"ext4", "nfs4"}, exclude_fstypes={"nfs4"})
+    assert [entry["mount_point"] for entry in included["mounts"]] == ["/"]
+
+
+def test_probe_mounts_times_out_hung_mount(mountinfo: Path, monkeypatch) -> None:
+    release = threading.Event()
+
+    def fake_statvfs(point: str) -> dict[str, Any]:
+        if point == "/mnt/my share":
+            release.wait(5)
+        return _usage(0.5)
+
+    monkeypatch.setattr(mounts, "statvfs_summary", fake_statvfs)
+    start = time.monotonic()
+    try:
+        result = probe_mounts(timeout=0.2)
+    finally:
+        release.set()
+
+    assert time.monotonic() - start < 2
+    by_point = {entry["mount_point"]: entry for entry in result["mounts"]}
+    assert by_point["/mnt/my share"]["error"] == "timeout"
+    assert by_point["/"]["percent_free"] == 0.5
+    assert by_point["/var"]["percent_free"] == 0.5
+
+
+def test_probe_mounts_reports_statvfs_errors(mountinfo: Path, monkeypatch) -> None:
+    def fake_statvfs(point: str) -> dict[str, Any]:
+        if point == "/var":
+            raise PermissionError("denied")
+        return _usage(0.5)
+
+    monkeypatch.setattr(mounts, "statvfs_summary", fake_statvfs)
+    by_point = {entry["mount_point"]: entry for entry in probe_mounts()["mounts"]}
+
+    assert by_point["/var"]["error"] == "PermissionError: denied"
+
+
+def test_probe_mounts_unsupported_without_mountinfo(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(mounts, "MOUNTINFO_PATH", tmp_path / "missing")
+
+    assert probe_mounts() == {"supported": False, "mounts": []}
+
+
+def test_mounts_collector_shares_probe_through_context(mountinfo: Path, monkeypatch) -> None:
+    calls: list[str] = []
+
+    def fake_statvfs(point: str) -> dict[str, Any]:
+        calls.append(point)
+        return _usage(0.5)
+
+    monkeypatch.setattr(mounts, "statvfs_summary", fake_statvfs)
+    context = RunContext()
+    first = MountsCollector().collect(context)
+    second = MountsCollector().collect(context)
+
+    assert first is second
+    assert len(calls) == 3
+
+
+def test_statvfs_summary_reads_real_filesystem(tmp_path: Path) -> None:
+    summary = mounts.statvfs_summary(str(tmp_path))
+
+    assert summary["total_bytes"] > 0
+    assert 0.0 <= summary["percent_free"] <= 1.0
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sysforge.checks.network import InterfaceErrorsCheck, SocketExhaustionCheck
+from sysforge.collectors import network
+from sysforge.collectors.network import (
+    NetworkCollector,
+    parse_net_dev,
+    parse_snmp,
+    scan_socket_table,
+)
+from sysforge.context import RunContext
+
+DEV_HEADER = (
+    "Inter-|   Receive                                                |  Transmit\n"
+    " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs "
+    "drop fifo colls carrier compressed\n"
+)
+TCP_HEADER = "  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid\n"
+V6_ZERO = "0" * 32
+
+
+def _dev(rx_bytes: int, tx_bytes: int, rx_errors: int = 0) -> str:
+    return DEV_HEADER + (
+        f"  eth0: {rx_bytes} 1000 {rx_errors} 0 0 0 0 0 {tx_bytes} 1000 0 0 0 0 0 0\n"
+        "    lo: 10 1 0 0 0 0 0 0 10 1 0 0 0 0 0 0\n"
+    )
+
+
+def _row(slot: int, state: str, queues: str = "00000000:00000000", v6: bool = False) -> str:
+    address = f"{V6_ZERO}:1F90" if v6 else "0100007F:1F90"
+    return f"{slot:4d}: {address} {address} {state} {queues} 00:00000000 00000000  1000 0 {slot}\n"
+
+
+def _snmp(active_opens: int, overflows: int) -> tuple[str, str]:
+    snmp = (
+        "Tcp: RtoAlgorithm ActiveOpens PassiveOpens CurrEstab RetransSegs\n"
+        f"Tcp: 1 {active_opens} 5 3 7\n"
+    )
+    netstat = f"TcpExt: SyncookiesSent ListenOverflows ListenDrops\nTcpExt: 0 {overflows} 2\n"
+    return snmp, netstat
+
+
+@pytest.fixture
+def proc_net(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(network, "PROC_NET", tmp_path)
+    port_range = tmp_path / "ip_local_port_range"
+    port_range.write_text("32768\t32777\n")
+    monkeypatch.setattr(network, "PORT_RANGE_PATH", port_range)
+    return tmp_path
+
+
+def _write(root: Path, *, dev: str, active_opens: int = 10, overflows: int = 0) -> None:
+    snmp, netstat = _snmp(active_opens, overflows)
+    (root / "dev").write_text(dev)
+    (root / "snmp").write_text(snmp)
+    (root / "netstat").write_text(netstat)
+    # As the kernel prints them: a listener's tx_queue is always 0 and rx_queue is the number
+    # of connections waiting in its accept queue.
+    (root / "tcp").write_text(
+        TCP_HEADER
+        + _row(0, "0A", "00000000:00000081")
+        + _row(1, "0A", "00000000:00000001")
+        + _row(2, "01")
+        + _row(3, "06")
+        + _row(4, "06")
+    )
+    (root / "tcp6").write_text(TCP_HEADER + _row(0, "08", v6=True) + _row(1, "01", v6=True))
+
+
+def test_parse_net_dev_and_snmp() -> None:
+    interfaces = parse_net_dev(_dev(100, 200, rx_errors=3))
+    assert interfaces["eth0"] == (100, 1000, 3, 0, 200, 1000, 0, 0)
+    assert set(interfaces) == {"eth0", "lo"}
+
+    counters = parse_snmp("Tcp: A B\nTcp: 1 2\nUdp: A\nUdp: 9\n")
+    assert counters == {("Tcp", "A"): 1, ("Tcp", "B"): 2, ("Udp", "A"): 9}
+
+
+def test_scan_socket_table_streams_across_chunks(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(network, "_CHUNK_BYTES", 64)
+    path = tmp_path / "tcp"
+    rows = [_row(index, "0A" if index < 3 else "01", "00000000:00000002") for index in range(50)]
+    path.write_text(TCP_HEADER + "".join(rows))
+
+    assert scan_socket_table(path) == {b"0A": 3, b"01": 47}
+
+
+def test_collector_reports_counters_then_rates(proc_net: Path, monkeypatch) -> None:
+    ticks = iter([100.0, 102.0])
+    monkeypatch.setattr(network.time, "monotonic", lambda: next(ticks))
+    collector = NetworkCollector()
+
+    _write(proc_net, dev=_dev(1000, 2000))
+    first = collector.sample()
+    assert first["supported"] is True
+    assert first["interval_seconds"] is None
+    assert first["interfaces"]["eth0"]["rates"] is None
+    assert first["tcp"]["active_opens"] == 10
+    assert first["tcp"]["listen_overflows"] == 0
+    assert first["sockets"] == {
+        "total": 7,
+        "states": {"ESTABLISHED": 2, "TIME_WAIT": 2, "CLOSE_WAIT": 1, "LISTEN": 2},
+        "listen": {"sockets": 2},
+        "ephemeral_ports": 10,
+    }
+
+    _write(proc_net, dev=_dev(5000, 2000), active_opens=30, overflows=8)
+    second = collector.sample()
+    assert second["interval_seconds"] == 2.0
+    assert second["interfaces"]["eth0"]["rates"]["rx_bytes_per_sec"] == 2000.0
+    assert second["tcp"]["rates"]["active_opens_per_sec"] == 10.0
+    assert second["tcp"]["rates"]["listen_overflows_per_sec"] == 4.0
+    assert second["sockets"]["listen"] == {"sockets": 2}
+    assert "curr_estab_per_sec" not in second["tcp"]["rates"]
+
+
+def test_collector_unsupported_without_proc(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(network, "PROC_NET", tmp_path / "missing")
+
+    assert NetworkCollector().sample() == {"supported": False}
+
+
+def _context(payload: dict[str, Any]) -> RunContext:
+    context = RunContext()
+    context.fact("network", lambda: payload)
+    return context
+
+
+def _interfaces(errors: int) -> dict[str, Any]:
+    counters = {
+        "rx_packets": 5000,
+        "tx_packets": 5000,
+        "rx_errors": errors,
+        "rx_dropped": 0,
+        "tx_errors": 0,
+        "tx_dropped": 0,
+    }
+    return {"supported": True, "interfaces": {"eth0": counters}}
+
+
+@pytest.mark.parametrize(
+    ("errors", "expected"), [(0, "pass"), (5, "pass"), (10, "warn"), (100, "fail")]
+)
+def test_interface_errors_check_levels(errors: int, expected: str) -> None:
+    result = InterfaceErrorsCheck().run(context=_context(_interfaces(errors)))
+
+    assert result.status == expected
+
+
+def _sockets(
+    *, time_wait: int = 0, close_wait: int = 0, overflow_rate: float = 0.0
+) -> dict[str, Any]:
+    return {
+        "supported": True,
+        "tcp": {"listen_overflows": 0, "rates": {"listen_overflows_per_sec": overflow_rate}},
+        "sockets": {
+            "total": time_wait + close_wait,
+            "states": {"TIME_WAIT": time_wait, "CLOSE_WAIT": close_wait},
+            "listen": {"sockets": 1},
+            "ephemeral_ports": 1000,
+        },
+    }
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected", "fragment"),
+    [
+        (_sockets(time_wait=100), "pass", "no exhaustion"),
+        (_sockets(time_wait=600), "warn", "60% of ephemeral ports"),
+        (_sockets(time_wait=900), "fail", "90% of ephemeral ports"),
+        (_sockets(close_wait=500), "warn", "500 CLOSE_WAIT"),
+        (_sockets(overflow_rate=3.0), "warn", "overflowing at 3.0/s"),
+    ],
+)
+def test_socket_exhaustion_check(payload: dict[str, Any], expected: str, fragment: str) -> None:
+    result = SocketExhaustionCheck().run(context=_context(payload))
+
+    assert result.status == expected
+    assert fragment in result.message
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from sysforge.cache import CollectorCache
+from sysforge.checks import packages as package_checks
+from sysforge.checks.packages import PackageRequirementsCheck
+from sysforge.collectors import packages
+from sysforge.collectors.packages import PackagesCollector, build_index, normalize_name
+from sysforge.context import RunContext
+
+
+def _install(site: Path, name: str, version: str, *requires: str) -> None:
+    dist_info = site / f"{name.replace('-', '_')}-{version}.dist-info"
+    dist_info.mkdir(parents=True)
+    lines = ["Metadata-Version: 2.1", f"Name: {name}", f"Version: {version}"]
+    lines += [f"Requires-Dist: {requirement}" for requirement in requires]
+    (dist_info / "METADATA").write_text("\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def site(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    site = tmp_path / "site-packages"
+    site.mkdir()
+    monkeypatch.setattr(packages, "search_paths", lambda: [str(site)])
+    return site
+
+
+def test_normalize_name() -> None:
+    assert normalize_name("Foo_Bar.baz") == "foo-bar-baz"
+
+
+def test_build_index_prefers_first_path_and_reports_duplicates(tmp_path: Path) -> None:
+    first, second = tmp_path / "first", tmp_path / "second"
+    _install(first, "alpha", "1.0", "beta>=2")
+    _install(second, "Alpha", "0.9")
+    _install(second, "beta", "2.1")
+
+    index = build_index([str(first), str(second)])
+
+    assert index["distributions"] == [
+        {"name": "alpha", "version": "1.0", "requires": ["beta>=2"]},
+        {"name": "beta", "version": "2.1", "requires": []},
+    ]
+    assert index["duplicates"] == ["alpha"]
+
+
+def test_collector_serves_unchanged_environment_from_cache(
+    site: Path, tmp_path: Path, monkeypatch
+) -> None:
+    _install(site, "alpha", "1.0")
+    calls: list[list[str]] = []
+    real_build = packages.build_index
+
+    def counting_build(paths: list[str]) -> dict:
+        calls.append(paths)
+        return real_build(paths)
+
+    monkeypatch.setattr(packages, "build_index", counting_build)
+    cache = CollectorCache(tmp_path / "cache")
+
+    first = PackagesCollector().collect(RunContext(cache=cache))
+    second = PackagesCollector().collect(RunContext(cache=cache))
+    assert first == second == {"count": 1, "packages": {"alpha": "1.0"}, "duplicates": []}
+    assert len(calls) == 1
+
+    _install(site, "beta", "2.0")
+    os.utime(site, ns=(0, os.stat(site).st_mtime_ns + 1_000_000_000))
+    third = PackagesCollector().collect(RunContext(cache=cache))
+    assert third["packages"] == {"alpha": "1.0", "beta": "2.0"}
+    assert len(calls) == 2
+
+
+def _check(site: Path) -> dict:
+    result = PackageRequirementsCheck().run(context=RunContext())
+    return {"status": result.status, "message": result.message, **(result.data or {})}
+
+
+def test_requirements_check_passes_when_satisfied(site: Path) -> None:
+    _install(
+        site,
+        "app",
+        "1.0",
+        "lib>=1,<2",
+        "extra-only; extra == 'fancy'",
+        "windows-only; sys_platform == 'win32'",
+    )
+    _install(site, "lib", "1.5")
+
+    result = _check(site)
+
+    assert result["status"] == "pass"
+    assert result["version_checks"] is True
+
+
+def test_requirements_check_flags_conflicts_and_missing(site: Path) -> None:
+    _install(site, "app", "1.0", "lib>=2")
+    _install(site, "lib", "1.5")
+    result = _check(site)
+    assert result["status"] == "warn"
+    assert result["conflicts"] == ["app 1.0 requires lib>=2 (installed 1.5)"]
+
+    _install(site, "tool", "3.0", "absent-dep")
+    result = _check(site)
+    assert result["status"] == "fail"
+    assert result["missing"] == ["tool 3.0 requires absent-dep"]
+
+
+def test_requirements_check_without_packaging_checks_names_only(site: Path, monkeypatch) -> None:
+    monkeypatch.setattr(package_checks, "Requirement", None)
+    _install(site, "app", "1.0", "lib>=2", "absent-dep", "extra-only; extra == 'fancy'")
+    _install(site, "lib", "1.5")
+
+    result = _check(site)
+
+    assert result["status"] == "fail"
+    assert result["missing"] == ["app 1.0 requires absent-dep"]
+    assert result["conflicts"] == []
+    assert result["version_checks"] is False
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from sysforge.parallel import run_command, run_tasks
+
+posix_only = pytest.mark.skipif(not hasattr(os, "killpg"), reason="needs process groups")
+
+
+def _alive(pid: int) -> bool:
+    stat = Path(f"/proc/{pid}/stat")
+    if stat.parent.parent.is_dir():
+        # Orphans may linger as zombies where nothing reaps them; those are dead too.
+        return stat.exists() and stat.read_text().rsplit(")", 1)[1].split()[0] != "Z"
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+def _wait_dead(pid: int) -> bool:
+    for _ in range(100):
+        if not _alive(pid):
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def _spawn_grandchild(pidfile: Path) -> list[str]:
+    # The backgrounded sleep inherits the pipes, so waiting on the shell alone never ends.
+    return ["sh", "-c", f"sleep 30 & echo $! > {pidfile}; wait"]
+
+
+def test_run_tasks_inline_reports_values_and_errors() -> None:
+    def boom() -> None:
+        raise ValueError("nope")
+
+    outcomes = {o.name: o for o in run_tasks({"ok": lambda: 1, "bad": boom})}
+
+    assert outcomes["ok"].status == "ok"
+    assert outcomes["ok"].value == 1
+    assert outcomes["bad"].status == "error"
+    assert isinstance(outcomes["bad"].error, ValueError)
+
+
+def test_run_tasks_threads_run_concurrently() -> None:
+    barrier = threading.Barrier(3, timeout=5)
+
+    def task() -> str:
+        barrier.wait()
+        return "done"
+
+    tasks = {f"t{i}": task for i in range(3)}
+    outcomes = list(run_tasks(tasks, jobs=3))
+
+    assert sorted(o.name for o in outcomes) == ["t0", "t1", "t2"]
+    assert all(o.value == "done" for o in outcomes)
+
+
+def test_run_tasks_thread_timeout_returns_partial_results() -> None:
+    release = threading.Event()
+
+    def hang() -> None:
+        release.wait(5)
+
+    start = time.monotonic()
+    outcomes = {o.name: o for o in run_tasks({"slow": hang, "fast": lambda: 2}, timeout=0.05)}
+    release.set()
+
+    assert time.monotonic() - start < 2
+    assert outcomes["fast"].value == 2
+    assert outcomes["slow"].status == "timeout"
+    assert outcomes["slow"].elapsed_ms >= 50
+
+
+def test_abandoned_workers_exit_once_their_task_returns() -> None:
+    def task_threads() -> list[threading.Thread]:
+        return [t for t in threading.enumerate() if t.name == "sysforge-task"]
+
+    release = threading.Event()
+    for _ in range(5):
+        tasks = {"slow": lambda: release.wait(5), "fast": lambda: 1}
+        outcomes = {o.name: o.status for o in run_tasks(tasks, jobs=2, timeout=0.05)}
+        assert outcomes == {"slow": "timeout", "fast": "ok"}
+    release.set()
+
+    for thread in task_threads():
+        thread.join(5)
+    assert task_threads() == []
+
+
+def test_run_tasks_process_mode_kills_overrunning_task() -> None:
+    outcomes = {
+        o.name: o
+        for o in run_tasks(
+            {"slow": lambda: time.sleep(5), "fast": lambda: {"value": 3}},
+            jobs=2,
+            timeout=0.2,
+            mode="process",
+        )
+    }
+
+    assert outcomes["fast"].value == {"value": 3}
+    assert outcomes["slow"].status == "timeout"
+
+
+def test_run_tasks_rejects_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="jobs"):
+        list(run_tasks({}, jobs=0))
+    with pytest.raises(ValueError, match="mode"):
+        list(run_tasks({}, mode="fiber"))
+
+
+@posix_only
+def test_run_command_kills_the_whole_process_group_on_timeout(tmp_path: Path) -> None:
+    pidfile = tmp_path / "pid"
+    start = time.monotonic()
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        run_command(_spawn_grandchild(pidfile), stdout=subprocess.PIPE, timeout=0.3)
+
+    assert time.monotonic() - start < 5
+    assert _wait_dead(int(pidfile.read_text()))
+
+
+@posix_only
+def test_run_tasks_timeout_kills_processes_the_task_started(tmp_path: Path) -> None:
+    pidfile = tmp_path / "pid"
+
+    def task() -> object:
+        return run_command(_spawn_grandchild(pidfile), stdout=subprocess.PIPE)
+
+    [outcome] = run_tasks({"slow": task}, timeout=0.3)
+
+    assert outcome.status == "timeout"
+    assert _wait_dead(int(pidfile.read_text()))
+
+
+def test_run_tasks_deadline_reports_unstarted_tasks_as_timeouts() -> None:
+    calls: list[str] = []
+    tasks = {"slow": lambda: time.sleep(0.5), "late": lambda: calls.append("late")}
+
+    outcomes = {
+        o.name: o for o in run_tasks(tasks, jobs=1, deadline=time.monotonic() + 0.1)
+    }
+
+    assert outcomes["slow"].status == "timeout"
+    assert outcomes["late"].status == "timeout"
+    assert outcomes["late"].elapsed_ms == 0
+    time.sleep(0.5)
+    assert calls == []
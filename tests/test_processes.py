@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sysforge.checks.processes import ProcessesCheck
+from sysforge.collectors import processes
+from sysforge.collectors.processes import ProcessesCollector, parse_pid_stat, scan_processes
+from sysforge.context import RunContext
+
+
+def _stat_line(
+    pid: int,
+    name: str,
+    *,
+    state: str = "S",
+    ppid: int = 1,
+    utime: int = 0,
+    stime: int = 0,
+    start: int = 0,
+    rss: int = 0,
+) -> str:
+    fields = [state, ppid, pid, pid, 0, -1, 0, 0, 0, 0, 0, utime, stime, 0, 0, 20, 0, 1, 0]
+    fields += [start, 1000, rss] + [0] * 20
+    return f"{pid} ({name}) " + " ".join(map(str, fields)) + "\n"
+
+
+@pytest.fixture
+def proc_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(processes, "PROC_ROOT", tmp_path)
+    (tmp_path / "uptime").write_text("1000.00 500.00\n")
+    return tmp_path
+
+
+def _add(root: Path, pid: int, name: str, **fields: Any) -> None:
+    directory = root / str(pid)
+    directory.mkdir()
+    (directory / "stat").write_text(_stat_line(pid, name, **fields))
+    (directory / "cmdline").write_bytes(f"/usr/bin/{name}\0--flag\0".encode())
+
+
+def test_parse_pid_stat_handles_parentheses_in_name() -> None:
+    stat = parse_pid_stat(_stat_line(42, "weird) (name", utime=3, stime=4, rss=9).encode())
+
+    assert stat[0] == "weird) (name"
+    assert stat[1] == "S"
+    assert stat[3] == 7
+    assert stat[6] == 9
+
+
+def test_scan_keeps_top_n_and_counts_states(proc_root: Path, monkeypatch) -> None:
+    monkeypatch.setattr(processes.os, "sysconf", lambda name: 100 if "TCK" in name else 4096)
+    _add(proc_root, 1, "init", ppid=0, rss=10)
+    for pid in range(2, 12):
+        _add(proc_root, pid, f"worker{pid}", rss=pid * 100, utime=pid)
+    _add(proc_root, 20, "defunct", state="Z", ppid=5)
+    _add(proc_root, 21, "defunct", state="Z", ppid=5)
+    _add(proc_root, 30, "burner", utime=90000, start=0)
+    # A process that exited between listing and reading its stat file.
+    (proc_root / "99").mkdir()
+    (proc_root / "self").mkdir()
+
+    table = scan_processes(top=3)
+
+    assert table["supported"] is True
+    assert table["count"] == 14
+    assert table["states"] == {"S": 12, "Z": 2}
+    assert table["zombies"]["count"] == 2
+    assert table["zombies"]["parents"] == [{"pid": 5, "name": "worker5", "zombies": 2}]
+    assert [entry["pid"] for entry in table["top_rss"]] == [11, 10, 9]
+    assert table["top_rss"][0]["rss_bytes"] == 1100 * 4096
+    assert table["top_rss"][0]["cmdline"] == "/usr/bin/worker11 --flag"
+    burner = table["top_cpu"][0]
+    assert burner["pid"] == 30
+    assert burner["cpu_seconds"] == 900.0
+    assert burner["elapsed_seconds"] == 1000.0
+    assert burner["cpu_percent"] == 90.0
+
+
+def test_scan_unsupported_without_proc(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(processes, "PROC_ROOT", tmp_path / "missing")
+
+    assert scan_processes() == {"supported": False}
+    assert ProcessesCollector().collect() == {"supported": False}
+
+
+def _table(**overrides: Any) -> dict[str, Any]:
+    table: dict[str, Any] = {
+        "supported": True,
+        "count": 100,
+        "zombies": {"count": 0, "parents": []},
+        "top_rss": [],
+        "top_cpu": [],
+    }
+    table.update(overrides)
+    return table
+
+
+def _process(pid: int, **fields: Any) -> dict[str, Any]:
+    process = {
+        "pid": pid,
+        "name": f"p{pid}",
+        "rss_bytes": 0,
+        "cpu_percent": 1.0,
+        "elapsed_seconds": 10_000.0,
+    }
+    process.update(fields)
+    return process
+
+
+def _run(table: dict[str, Any], memory: int | None = 1000) -> Any:
+    context = RunContext()
+    context.fact("processes", lambda: table)
+    context.fact("memory_bytes", lambda: memory)
+    return ProcessesCheck().run(context=context)
+
+
+def test_processes_check_passes_on_quiet_table() -> None:
+    result = _run(_table(top_rss=[_process(1, rss_bytes=100)], top_cpu=[_process(1)]))
+
+    assert result.status == "pass"
+    assert result.data["runaways"] == []
+
+
+@pytest.mark.parametrize(("zombies", "expected"), [(19, "pass"), (20, "warn"), (200, "fail")])
+def test_processes_check_zombie_levels(zombies: int, expected: str) -> None:
+    parents = [{"pid": 7, "name": "reaper", "zombies": zombies}]
+    result = _run(_table(zombies={"count": zombies, "parents": parents}))
+
+    assert result.status == expected
+    if expected != "pass":
+        assert "reaper (pid 7)" in result.message
+
+
+def test_processes_check_flags_runaways() -> None:
+    table = _table(
+        top_cpu=[
+            _process(3, cpu_percent=99.0, rss_bytes=900),
+            _process(4, cpu_percent=99.0, elapsed_seconds=60.0),
+        ],
+        top_rss=[_process(3, cpu_percent=99.0, rss_bytes=900), _process(5, rss_bytes=400)],
+    )
+    result = _run(table)
+
+    assert result.status == "fail"
+    assert "p3 (pid 3) averaging 99% CPU" in result.message
+    assert "p3 (pid 3) using 90% of memory" in result.message
+    assert [entry["pid"] for entry in result.data["runaways"]] == [3]
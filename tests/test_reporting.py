@@ -4,28 +4,59 @@ from pathlib import Path
 
 import pytest
 
+from sysforge.context import RunContext
 from sysforge.reporting import assemble_report, render_report_markdown, write_report_markdown
 
 
 def test_assemble_report_calls_collectors_and_checks(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("sysforge.reporting.iso_timestamp", lambda: "2024-01-01T00:00:00Z")
-    monkeypatch.setattr("sysforge.reporting.run_collectors", lambda: {"collected": True})
-
-    calls: dict[str, float] = {}
-
-    def fake_run_checks(*, disk_threshold: float) -> dict[str, object]:
+    collector_calls: dict[str, object] = {}
+
+    def fake_run_collectors(**kwargs: object) -> dict[str, object]:
+        collector_calls.update(kwargs)
+        return {"collected": True}
+
+    monkeypatch.setattr("sysforge.reporting.run_collectors", fake_run_collectors)
+
+    calls: dict[str, object] = {}
+
+    def fake_run_checks(
+        *,
+        disk_threshold: float,
+        jobs: int,
+        context: RunContext,
+        result_cache: object,
+        **limits: object,
+    ) -> dict[str, object]:
+        calls.update(limits)
+        calls["result_cache"] = result_cache
         calls["disk_threshold"] = disk_threshold
+        calls["jobs"] = jobs
+        calls["context"] = context
         return {"checks": True}
 
     monkeypatch.setattr("sysforge.reporting.run_checks", fake_run_checks)
 
-    report = assemble_report(disk_threshold=0.2)
+    report = assemble_report(
+        disk_threshold=0.2, jobs=4, collector_timeout=1.5, check_timeout=9.0, deadline=100.0
+    )
 
-    assert set(report.keys()) == {"timestamp", "collected", "checks"}
+    assert set(report.keys()) == {"timestamp", "collected", "checks", "_meta"}
     assert report["timestamp"] == "2024-01-01T00:00:00Z"
     assert report["collected"] == {"collected": True}
     assert report["checks"] == {"checks": True}
     assert calls["disk_threshold"] == 0.2
+    assert calls["jobs"] == 4
+    assert calls["result_cache"] is None
+    assert collector_calls["jobs"] == 4
+    assert collector_calls["timeout"] == 1.5
+    assert collector_calls["executor"] == "thread"
+    assert collector_calls["context"] is calls["context"]
+    assert collector_calls["deadline"] == calls["deadline"] == 100.0
+    assert (calls["timeout"], calls["timeout_status"]) == (9.0, "fail")
+    timings = report["_meta"]["timings"]
+    assert timings["collectors"] == {} and timings["checks"] == {}
+    assert timings["total_wall_ms"] >= 0
 
 
 def test_write_report_file_delegates(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
@@ -83,6 +114,34 @@ def test_render_report_markdown_includes_sections() -> None:
     assert "disk | pass | ok" in rendered
     assert "## Summary" in rendered
     assert "- Warn: 1" in rendered
+    assert "## Timings" not in rendered
+
+
+def test_render_report_markdown_lists_timings_slowest_first() -> None:
+    io = {"rchar": 2048, "syscr": 3, "syscw": 1}
+    report = {
+        "_meta": {
+            "timings": {
+                "collectors": {
+                    "fast": {"wall_ms": 1.0, "cpu_ms": 0.5, "max_rss_delta_bytes": 0, "io": io},
+                    "hung": {"wall_ms": 5000.0, "timed_out": True},
+                },
+                "checks": {"slow": {"wall_ms": 20.0, "cpu_ms": 19.5, "io": None}},
+                "total_wall_ms": 5021.0,
+            }
+        }
+    }
+
+    rendered = render_report_markdown(report)
+
+    assert "## Timings" in rendered
+    assert "Total: 5,021.0 ms" in rendered
+    rows = rendered.split("--- | --- | --- | --- | --- | --- | ---\n")[1].splitlines()
+    assert rows == [
+        "hung | collector | 5,000.0 (timeout) | unknown | unknown | unknown | unknown",
+        "slow | check | 20.0 | 19.5 | unknown | unknown | unknown",
+        "fast | collector | 1.0 | 0.5 | 0 bytes | 2,048 bytes | 4",
+    ]
 
 
 def test_write_report_markdown_delegates_to_text_writer(
@@ -108,3 +167,47 @@ def test_write_report_markdown_delegates_to_text_writer(
     assert called["report"] == sample
     assert called["text"] == "content"
     assert called["path"] == target
+
+
+def test_assemble_report_probes_home_disk_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[Path] = []
+
+    def fake_disk_usage(path: Path) -> dict[str, object]:
+        calls.append(path)
+        return {"path": str(path), "free_bytes": 10, "percent_free": 0.5}
+
+    monkeypatch.setattr("sysforge.collectors.system.disk_usage_summary", fake_disk_usage)
+    monkeypatch.setattr("sysforge.checks.core.disk_usage_summary", fake_disk_usage)
+
+    report = assemble_report(disk_threshold=0.1)
+    timings = report["_meta"]["timings"]
+    assert set(timings["collectors"]) == set(report["collected"])
+    assert {result["name"] for result in report["checks"]["results"]} == set(timings["checks"])
+
+    assert len(calls) == 1
+    disk_result = next(r for r in report["checks"]["results"] if r["name"] == "disk_space")
+    assert disk_result["data"] == report["collected"]["system"]["disk"]
+
+
+def test_iter_report_records_streams_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    from sysforge.checks.base import CheckResult
+
+    monkeypatch.setattr("sysforge.reporting.iso_timestamp", lambda: "ts")
+    monkeypatch.setattr(
+        "sysforge.reporting.iter_collectors", lambda **_: iter([("system", {"ok": True})])
+    )
+    monkeypatch.setattr(
+        "sysforge.reporting.iter_checks",
+        lambda **_: iter([CheckResult(name="disk_space", status="fail", message="low")]),
+    )
+
+    from sysforge.reporting import iter_report_records
+
+    records = list(iter_report_records())
+
+    assert records == [
+        {"type": "report", "timestamp": "ts"},
+        {"type": "collector", "name": "system", "data": {"ok": True}},
+        {"type": "check", "name": "disk_space", "status": "fail", "message": "low"},
+        {"type": "summary", "summary": {"pass": 0, "warn": 0, "fail": 1}},
+    ]
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from sysforge.checks import run_checks
+from sysforge.checks.rules import RuleCheck
+from sysforge.cli import app
+from sysforge.context import RunContext
+from sysforge.rules import (
+    Rule,
+    RuleRollup,
+    evaluate_columns,
+    evaluate_reports,
+    get_field,
+    load_rules,
+    parse_rules,
+)
+
+COLLECTED = {
+    "system": {"os": {"name": "Linux"}, "disk": {"percent_free": 0.12}},
+    "cpu": {"cpu_count": 4, "loadavg": {"5m": 9.0}},
+    "mounts": {"mounts": [{"mount_point": "/", "percent_free": 0.5}, {"mount_point": "/var"}]},
+}
+
+
+def test_get_field_follows_mappings_indexes_and_mount_points() -> None:
+    assert get_field(COLLECTED, ("system", "disk", "percent_free")) == 0.12
+    assert get_field(COLLECTED, ("mounts", "mounts", "/", "percent_free")) == 0.5
+    assert get_field(COLLECTED, ("mounts", "mounts", 0, "mount_point")) == "/"
+    assert get_field(COLLECTED, ("mounts", "mounts", "/var", "percent_free")) is None
+    assert get_field(COLLECTED, ("system", "disk", "percent_free", "deeper")) is None
+
+
+@pytest.mark.parametrize(
+    ("when", "expected"),
+    [
+        ("system.disk.percent_free < 0.15", True),
+        ("system.disk.percent_free < 0.1", False),
+        ("cpu.loadavg['5m'] / cpu.cpu_count > 2", True),
+        ("0.1 < system.disk.percent_free < 0.2", True),
+        ("system.os.name in ('Linux', 'Darwin') and not cpu.cpu_count == 1", True),
+        ("mounts.mounts['/'].percent_free >= 0.5", True),
+        ("-cpu.cpu_count < -3", True),
+        # Missing data is unknown rather than false, unless the other side decides it.
+        ("mounts.mounts['/var'].percent_free < 0.1", None),
+        ("missing.value > 1 or system.disk.percent_free < 0.15", True),
+        ("missing.value > 1 and system.disk.percent_free > 0.15", False),
+        ("not missing.value", None),
+        ("system.os.name > 3", None),
+        ("cpu.cpu_count / 0 > 1", None),
+    ],
+)
+def test_rule_matches_rows_and_columns_alike(when: str, expected: bool | None) -> None:
+    rule = Rule("r", when, "warn")
+
+    assert rule.matches(COLLECTED) is expected
+    assert evaluate_columns([rule], [COLLECTED, {}]) == {
+        "r": [{True: "warn", False: "pass", None: "unknown"}[expected], "unknown"]
+    }
+
+
+@pytest.mark.parametrize(
+    "when",
+    ["__import__('os').system('id')", "system.disk.free_bytes ** 2 > 1", "x.y if a else b", "a <"],
+)
+def test_rule_rejects_anything_outside_the_grammar(when: str) -> None:
+    with pytest.raises(ValueError, match="rule 'bad'"):
+        Rule("bad", when, "warn")
+
+
+def test_parse_rules_accepts_shorthand_and_tables() -> None:
+    rules = parse_rules(
+        {
+            "rules": {
+                "low_disk": "system.disk.percent_free < 0.15 -> warn",
+                "full_disk": {
+                    "when": "system.disk.percent_free < 0.05",
+                    "status": "fail",
+                    "message": "Disk nearly full",
+                },
+                "busy": {"when": "cpu.loadavg['5m'] > 8"},
+            }
+        }
+    )
+
+    assert rules == [
+        {
+            "name": "low_disk",
+            "when": "system.disk.percent_free < 0.15",
+            "status": "warn",
+            "message": None,
+        },
+        {
+            "name": "full_disk",
+            "when": "system.disk.percent_free < 0.05",
+            "status": "fail",
+            "message": "Disk nearly full",
+        },
+        {"name": "busy", "when": "cpu.loadavg['5m'] > 8", "status": "warn", "message": None},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        ({}, "non-empty `rules` table"),
+        ({"rules": {"a": "x > 1"}}, "EXPRESSION -> warn"),
+        ({"rules": {"a": "x > 1 -> error"}}, "status must be"),
+        ({"rules": {"a": {"when": "x > 1", "level": "warn"}}}, "unknown key"),
+        ({"rules": {"a": {"status": "warn"}}}, "needs a `when`"),
+    ],
+)
+def test_parse_rules_rejects_invalid_definitions(data: dict, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        parse_rules(data)
+
+
+def test_load_rules_reads_toml_and_json(tmp_path: Path) -> None:
+    toml_file = tmp_path / "rules.toml"
+    toml_file.write_text('[rules]\nlow = "system.disk.percent_free < 0.15 -> warn"\n')
+    json_file = tmp_path / "rules.json"
+    json_file.write_text(json.dumps({"rules": {"low": "system.disk.percent_free < 0.15 -> warn"}}))
+
+    assert load_rules(toml_file) == load_rules(json_file)
+
+
+def test_rule_check_reads_recorded_payloads() -> None:
+    context = RunContext()
+    for name, payload in COLLECTED.items():
+        context.record_collected(name, payload)
+    rule = Rule("low_disk", "system.disk.percent_free < 0.15", "fail", "Disk low")
+    missing = Rule("var", "mounts.mounts['/var'].percent_free < 0.1", "warn")
+
+    result = RuleCheck(rule).run(context=context)
+    skipped = RuleCheck(missing).run(context=context)
+
+    assert (result.name, result.status, result.message) == ("rule.low_disk", "fail", "Disk low")
+    assert result.data == {
+        "when": "system.disk.percent_free < 0.15",
+        "values": {"system.disk.percent_free": 0.12},
+    }
+    assert skipped.status == "pass" and skipped.skipped
+
+
+def test_run_checks_appends_rules_from_settings() -> None:
+    rules = parse_rules({"rules": {"no_python": "system.python.version == 'none' -> warn"}})
+
+    checks = run_checks(context=RunContext(settings={"rules": rules}))
+
+    result = checks["results"][-1]
+    assert result["name"] == "rule.no_python"
+    assert result["status"] == "pass"
+    assert "skipped" not in result
+
+
+def write_fleet(directory: Path) -> None:
+    for host, percent_free in {"a": 0.02, "b": 0.12, "c": 0.5}.items():
+        report = {"collected": {"system": {"disk": {"percent_free": percent_free}}}}
+        (directory / f"{host}.json").write_text(json.dumps(report))
+    (directory / "d.json").write_text(json.dumps({"collected": {}}))
+    (directory / "broken.json").write_text("{not json")
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_evaluate_reports_counts_outcomes_per_rule(tmp_path: Path, jobs: int) -> None:
+    write_fleet(tmp_path)
+    rules = parse_rules(
+        {
+            "rules": {
+                "low": "system.disk.percent_free < 0.15 -> warn",
+                "full": "system.disk.percent_free < 0.05 -> fail",
+            }
+        }
+    )
+    paths = sorted(str(path) for path in tmp_path.glob("*.json"))
+
+    rollup = evaluate_reports(paths, rules, jobs=jobs, batch_size=2).to_dict()
+
+    assert rollup["reports"] == 4
+    assert rollup["errors"]["count"] == 1
+    assert rollup["rules"]["low"] == {
+        "pass": 1,
+        "warn": 2,
+        "fail": 0,
+        "unknown": 1,
+        "hosts": ["a", "b"],
+    }
+    assert rollup["rules"]["full"]["fail"] == 1
+    assert rollup["rules"]["full"]["hosts"] == ["a"]
+
+
+def test_rule_rollup_keeps_the_worst_hosts_whatever_the_merge_order() -> None:
+    first = RuleRollup(top=2)
+    first.add_outcomes(["d", "c"], {"disk": ["warn", "warn"]})
+    second = RuleRollup(top=2)
+    second.add_outcomes(["b", "a", "e"], {"disk": ["pass", "warn", "fail"]})
+
+    merged = [RuleRollup(top=2), RuleRollup(top=2)]
+    merged[0].merge(first)
+    merged[0].merge(second)
+    merged[1].merge(second)
+    merged[1].merge(first)
+
+    for rollup in merged:
+        assert rollup.to_dict()["rules"]["disk"]["hosts"] == ["e", "a"]
+
+
+def test_cli_evaluate_and_doctor_rules(tmp_path: Path) -> None:
+    fleet = tmp_path / "fleet"
+    fleet.mkdir()
+    write_fleet(fleet)
+    rules_file = tmp_path / "rules.toml"
+    rules_file.write_text('[rules]\nlow = "system.disk.percent_free < 0.15 -> warn"\n')
+    runner = CliRunner()
+
+    result = runner.invoke(app, ["evaluate", str(fleet), "--rules", str(rules_file), "-j", "1"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["rules"]["low"]["warn"] == 2
+
+    rules_file.write_text('[rules]\nlow = "open(\'x\') -> warn"\n')
+    result = runner.invoke(app, ["doctor", "--rules", str(rules_file)])
+    assert result.exit_code != 0
+    assert "--rules" in result.output
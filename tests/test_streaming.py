@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+
+from sysforge.checks.base import CheckResult
+from sysforge.streaming import NdjsonWriter, RotatingNdjsonFile, check_record
+
+
+def test_ndjson_writer_emits_one_compact_line_per_record() -> None:
+    stream = io.StringIO()
+    writer = NdjsonWriter(stream)
+
+    writer.write({"a": 1})
+    writer.write({"b": [1, 2]})
+
+    assert stream.getvalue() == '{"a": 1}\n{"b": [1, 2]}\n'
+
+
+def test_rotating_file_appends_across_instances(tmp_path: Path) -> None:
+    target = tmp_path / "out" / "log.ndjson"
+    with RotatingNdjsonFile(target) as writer:
+        writer.write({"n": 1})
+    with RotatingNdjsonFile(target) as writer:
+        writer.write({"n": 2})
+
+    assert [json.loads(line)["n"] for line in target.read_text().splitlines()] == [1, 2]
+
+
+def test_rotating_file_rotates_and_keeps_backups(tmp_path: Path) -> None:
+    target = tmp_path / "log.ndjson"
+    line_size = len('{"n": 0}\n')
+    with RotatingNdjsonFile(target, max_bytes=line_size * 2, backups=2) as writer:
+        for n in range(7):
+            writer.write({"n": n})
+
+    def numbers(path: Path) -> list[int]:
+        return [json.loads(line)["n"] for line in path.read_text().splitlines()]
+
+    assert numbers(target) == [6]
+    assert numbers(tmp_path / "log.ndjson.1") == [4, 5]
+    assert numbers(tmp_path / "log.ndjson.2") == [2, 3]
+    assert not (tmp_path / "log.ndjson.3").exists()
+
+
+def test_check_record_flattens_result() -> None:
+    record = check_record(CheckResult(name="x", status="warn", message="m"))
+
+    assert record == {"type": "check", "name": "x", "status": "warn", "message": "m"}
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pstats
+from pathlib import Path
+
+import pytest
+
+from sysforge import timing
+from sysforge.timing import profiled, read_io_counters, timed
+
+
+def test_read_io_counters_parses_known_fields(tmp_path: Path) -> None:
+    path = tmp_path / "io"
+    path.write_text(
+        "rchar: 100\nwchar: 20\nsyscr: 3\nsyscw: 1\nread_bytes: 4096\nwrite_bytes: 0\n"
+        "cancelled_write_bytes: 0\n"
+    )
+    assert read_io_counters(path) == {
+        "rchar": 100,
+        "wchar": 20,
+        "syscr": 3,
+        "syscw": 1,
+        "read_bytes": 4096,
+        "write_bytes": 0,
+    }
+    assert read_io_counters(tmp_path / "missing") is None
+
+
+def test_timed_reports_cost_and_returns_value() -> None:
+    def burn(n: int, *, scale: int) -> int:
+        return sum(i * scale for i in range(n))
+
+    value, sample = timed(burn, 200_000, scale=2)
+
+    assert value == sum(i * 2 for i in range(200_000))
+    assert sample["wall_ms"] > 0
+    assert 0 < sample["cpu_ms"] <= sample["wall_ms"] * 1.5
+    assert set(sample) == {"wall_ms", "cpu_ms", "max_rss_delta_bytes", "io"}
+
+
+def test_timed_counts_only_the_calls_io(tmp_path: Path) -> None:
+    if read_io_counters() is None:
+        pytest.skip("per-thread I/O accounting is unavailable")
+    target = tmp_path / "data"
+    target.write_bytes(b"x" * 10_000)
+
+    _, idle = timed(lambda: None)
+    _, busy = timed(target.read_bytes)
+
+    # The counters file grows by a byte now and then as its numbers gain digits.
+    assert idle["io"]["rchar"] < 16
+    assert busy["io"]["rchar"] >= 10_000
+    assert busy["io"]["syscr"] >= 1
+
+
+def test_timed_without_platform_support(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(timing, "resource", None)
+    monkeypatch.setattr(timing, "THREAD_IO_PATH", Path("/nonexistent/io"))
+
+    _, sample = timed(lambda: None)
+
+    assert sample["max_rss_delta_bytes"] is None
+    assert sample["io"] is None
+
+
+def test_profiled_writes_pstats(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "run.pstats"
+    with profiled(path):
+        sorted(range(1000), reverse=True)
+    stats = pstats.Stats(str(path))
+    assert stats.total_calls > 0
+
+    with profiled(None):
+        pass
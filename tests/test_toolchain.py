@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from sysforge.cache import CollectorCache
+from sysforge.checks.toolchain import (
+    ToolchainCheck,
+    load_toolchain,
+    parse_toolchain,
+    version_tuple,
+)
+from sysforge.cli import app
+from sysforge.collectors.toolchain import (
+    ToolchainCollector,
+    build_path_index,
+    path_directories,
+    resolve,
+)
+from sysforge.context import RunContext
+
+
+def make_tool(directory: Path, name: str, body: str = "", *, executable: bool = True) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    tool = directory / name
+    tool.write_text(f"#!/bin/sh\n{body}\n")
+    tool.chmod(0o755 if executable else 0o644)
+    return tool
+
+
+def test_path_directories_skips_missing_duplicates_and_empty(tmp_path: Path) -> None:
+    (tmp_path / "a").mkdir()
+    entries = [str(tmp_path / "a"), "", str(tmp_path / "missing"), str(tmp_path / "a")]
+    value = os.pathsep.join(entries)
+
+    assert path_directories(value) == [str(tmp_path / "a")]
+
+
+def test_resolve_matches_which_order_and_skips_non_executables(tmp_path: Path) -> None:
+    first, second = tmp_path / "first", tmp_path / "second"
+    make_tool(first, "cc", executable=False)
+    make_tool(second, "cc")
+    make_tool(second, "make")
+    (first / "subdir").mkdir()
+    index = build_path_index([str(first), str(second)])
+
+    assert resolve(index, "cc") == str(second / "cc")
+    assert resolve(index, "make") == str(second / "make")
+    assert resolve(index, "subdir") is None
+    assert resolve(index, "nope") is None
+
+
+def test_collector_caches_index_until_path_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    bin_dir = tmp_path / "bin"
+    make_tool(bin_dir, "git")
+    monkeypatch.setenv("PATH", str(bin_dir))
+    cache = CollectorCache(tmp_path / "cache")
+    scans: list[list[str]] = []
+    real_build = build_path_index
+
+    def counting_build(directories: list[str]) -> dict:
+        scans.append(directories)
+        return real_build(directories)
+
+    monkeypatch.setattr("sysforge.collectors.toolchain.build_path_index", counting_build)
+    settings = {"toolchain": {"tools": [{"name": "git"}, {"name": "cmake"}]}}
+
+    first = ToolchainCollector().collect(RunContext(cache=cache, settings=settings))
+    second = ToolchainCollector().collect(RunContext(cache=cache, settings=settings))
+    make_tool(bin_dir, "cmake")
+    os.utime(bin_dir, ns=(0, os.stat(bin_dir).st_mtime_ns + 1_000_000_000))
+    third = ToolchainCollector().collect(RunContext(cache=cache, settings=settings))
+
+    assert len(scans) == 2
+    assert first == second
+    assert first["tools"] == {"git": str(bin_dir / "git"), "cmake": None}
+    assert third["tools"]["cmake"] == str(bin_dir / "cmake")
+
+
+def test_parse_toolchain_shorthands_and_errors() -> None:
+    parsed = parse_toolchain({"tools": {"git": "2.30", "make": {}}, "probe_jobs": 2})
+
+    assert parsed["tools"][0] == {
+        "name": "git",
+        "min_version": "2.30",
+        "version_args": ["--version"],
+        "version_pattern": r"(\d+(?:\.\d+)+)",
+    }
+    assert parsed["tools"][1]["min_version"] is None
+    assert parse_toolchain({"tools": ["git"]})["tools"][0]["name"] == "git"
+    for bad in (
+        {},
+        {"tools": {"git": {"min": "1"}}},
+        {"tools": {"git": "latest"}},
+        {"tools": ["git"], "probe_timeout": 0},
+    ):
+        with pytest.raises(ValueError):
+            parse_toolchain(bad)
+
+
+def test_load_toolchain_toml(tmp_path: Path) -> None:
+    path = tmp_path / "toolchain.toml"
+    path.write_text(
+        'probe_timeout = 2\n[tools]\ngit = "2.30"\n'
+        'kubectl = { min_version = "1.28", version_args = ["version", "--client"] }\n'
+    )
+
+    toolchain = load_toolchain(path)
+
+    assert [tool["name"] for tool in toolchain["tools"]] == ["git", "kubectl"]
+    assert toolchain["tools"][1]["version_args"] == ["version", "--client"]
+    assert toolchain["probe_timeout"] == 2.0
+
+
+def test_version_tuple() -> None:
+    assert version_tuple("git version 2.43.0.windows.1") == (2, 43, 0)
+    assert version_tuple("11") == (11,)
+    assert version_tuple("1.9") < version_tuple("1.10")
+
+
+def _check(tmp_path: Path, tools: dict, **extra: object):
+    settings = {"toolchain": parse_toolchain({"tools": tools, **extra})}
+    return ToolchainCheck().run(context=RunContext(settings=settings))
+
+
+def test_toolchain_check_statuses(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    bin_dir = tmp_path / "bin"
+    make_tool(bin_dir, "gcc", "echo 'gcc (GCC) 12.2.0'")
+    make_tool(bin_dir, "make", "echo 'GNU Make 4.3'")
+    make_tool(bin_dir, "mystery", "echo 'no digits here'")
+    monkeypatch.setenv("PATH", str(bin_dir))
+
+    passing = _check(tmp_path, {"gcc": "11", "make": {}})
+    failing = _check(tmp_path, {"gcc": "13.1", "make": "4", "cmake": {}})
+    unknown = _check(tmp_path, {"mystery": "1"})
+
+    assert passing.status == "pass"
+    assert passing.data["tools"]["gcc"] == {"path": str(bin_dir / "gcc"), "version": "12.2.0"}
+    assert passing.data["tools"]["make"]["version"] is None
+    assert failing.status == "fail"
+    assert failing.data["missing"] == ["cmake"]
+    assert failing.data["outdated"] == ["gcc 12.2.0 < 13.1"]
+    assert unknown.status == "warn"
+    assert unknown.data["unprobed"] == ["mystery (no version in output)"]
+
+
+def test_toolchain_check_probe_timeout(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    bin_dir = tmp_path / "bin"
+    make_tool(bin_dir, "slow", "sleep 5; echo 1.0")
+    # The script itself needs `sleep` from the real PATH.
+    monkeypatch.setenv("PATH", os.pathsep.join([str(bin_dir), os.environ.get("PATH", "")]))
+
+    result = _check(tmp_path, {"slow": "1"}, probe_timeout=0.2)
+
+    assert result.status == "warn"
+    assert result.data["unprobed"][0].startswith("slow (TimeoutExpired")
+
+
+def test_toolchain_check_without_configuration() -> None:
+    result = ToolchainCheck().run(context=RunContext())
+
+    assert result.status == "pass"
+    assert ToolchainCheck().fingerprint(context=RunContext()) == {"toolchain": None}
+
+
+def test_doctor_toolchain_option(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    seen: dict[str, object] = {}
+
+    def fake_run_checks(**kwargs: object) -> dict[str, object]:
+        seen.update(kwargs["context"].settings)  # type: ignore[attr-defined]
+        return {"results": [], "summary": {"pass": 1, "warn": 0, "fail": 0}}
+
+    monkeypatch.setattr("sysforge.cli.run_checks", fake_run_checks)
+    path = tmp_path / "toolchain.json"
+    path.write_text(json.dumps({"tools": {"git": "2"}}))
+
+    result = CliRunner().invoke(app, ["doctor", "--toolchain", str(path)])
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps({"tools": []}))
+    rejected = CliRunner().invoke(app, ["doctor", "--toolchain", str(bad)])
+
+    assert result.exit_code == 0
+    assert seen["toolchain"]["tools"][0]["name"] == "git"  # type: ignore[index]
+    assert rejected.exit_code != 0
+    assert "tools" in rejected.stderr
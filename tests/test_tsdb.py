@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from sysforge.cli import app
+from sysforge.collectors.base import BaseCollector
+from sysforge.context import RunContext
+from sysforge.tsdb import MetricStore, open_or_create
+
+
+def test_store_round_trips_rows_and_missing_values(tmp_path: Path) -> None:
+    path = tmp_path / "m.sfts"
+    with MetricStore.create(path, ["a", "b"], capacity=10) as store:
+        store.append(1.0, {"a": 1.5})
+        store.append(2.0, {"a": 2.5, "b": 7})
+
+    with MetricStore(path) as store:
+        assert store.columns == ("a", "b")
+        assert len(store) == 2
+        assert list(store.rows("a")) == [(1.0, 1.5), (2.0, 2.5)]
+        assert list(store.rows("b")) == [(2.0, 7.0)]
+
+
+def test_store_ring_buffer_keeps_latest_rows(tmp_path: Path) -> None:
+    with MetricStore.create(tmp_path / "m.sfts", ["a"], capacity=4) as store:
+        for n in range(10):
+            store.append(float(n), {"a": n})
+
+        assert len(store) == 4
+        assert [value for _, value in store.rows("a")] == [6, 7, 8, 9]
+        assert [ts for ts, _ in store.rows("a", start=7, end=9)] == [7, 8]
+
+
+def test_store_downsamples_into_aligned_buckets(tmp_path: Path) -> None:
+    with MetricStore.create(tmp_path / "m.sfts", ["a"], capacity=100, typecode="f") as store:
+        for n in range(6):
+            store.append(60.0 + n * 20, {"a": n})
+
+        buckets = store.downsample("a", 60)
+
+    assert [b["start"] for b in buckets] == [60, 120]
+    assert buckets[0] == {"start": 60, "min": 0.0, "max": 2.0, "avg": 1.0, "count": 3}
+    assert buckets[1]["max"] == 5.0
+
+
+def test_store_rejects_out_of_order_and_bad_files(tmp_path: Path) -> None:
+    with MetricStore.create(tmp_path / "m.sfts", ["a"], capacity=4) as store:
+        store.append(5.0, {"a": 1})
+        with pytest.raises(ValueError, match="non-decreasing"):
+            store.append(4.0, {"a": 1})
+
+    bogus = tmp_path / "bogus"
+    bogus.write_bytes(b"not a store at all, definitely not" * 4)
+    with pytest.raises(ValueError, match="not a sysforge metric store"):
+        MetricStore(bogus)
+
+
+def test_open_or_create_reuses_existing_store(tmp_path: Path) -> None:
+    path = tmp_path / "m.sfts"
+    with open_or_create(path, ["a"], capacity=3) as store:
+        store.append(1.0, {"a": 1})
+    with open_or_create(path, ["a"], capacity=3) as store:
+        assert store.columns == ("a",)
+        assert store.capacity == 3
+        assert len(store) == 1
+
+
+@pytest.mark.parametrize(
+    ("columns", "capacity", "typecode", "problem"),
+    [
+        (["b"], 3, "d", "has columns a, not b"),
+        (["a"], 99, "d", "holds 3 rows, not 99"),
+        (["a"], 3, "f", "stores typecode 'd' values, not 'f'"),
+    ],
+)
+def test_open_or_create_rejects_a_different_layout(
+    tmp_path: Path, columns: list[str], capacity: int, typecode: str, problem: str
+) -> None:
+    path = tmp_path / "m.sfts"
+    open_or_create(path, ["a"], capacity=3).close()
+
+    with pytest.raises(ValueError, match=problem):
+        open_or_create(path, columns, capacity=capacity, typecode=typecode)
+
+
+def test_watch_store_and_query_commands(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    class Disk(BaseCollector):
+        name = "system"
+
+        def collect(self, context: RunContext | None = None) -> dict[str, object]:
+            return {"disk": {"free_bytes": 100, "percent_free": 0.5}}
+
+    monkeypatch.setattr("sysforge.cli.get_collectors", lambda: [Disk()])
+    store_path = tmp_path / "metrics.sfts"
+    runner = CliRunner()
+
+    watched = runner.invoke(
+        app,
+        ["watch", "-i", "1ms", "-n", "3", "--no-cache", "--store", str(store_path)],
+    )
+    assert watched.exit_code == 0
+    reopened = runner.invoke(
+        app,
+        ["watch", "-i", "1ms", "-n", "1", "--no-cache", "--store", str(store_path), "-m", "a"],
+    )
+    assert reopened.exit_code == 2
+    assert "not a" in reopened.output
+
+    queried = runner.invoke(
+        app, ["query", "--store", str(store_path), "-m", "system.disk.free_bytes"]
+    )
+    assert queried.exit_code == 0
+    points = json.loads(queried.stdout)["metrics"]["system.disk.free_bytes"]
+    assert [point["value"] for point in points] == [100, 100, 100]
+
+    bucketed = runner.invoke(app, ["query", "--store", str(store_path), "--bucket", "1h"])
+    metrics = json.loads(bucketed.stdout)["metrics"]
+    assert metrics["system.disk.percent_free"][0]["avg"] == pytest.approx(0.5)
+    assert metrics["system.hardware.memory_bytes"] == []
+
+    unknown = runner.invoke(app, ["query", "--store", str(store_path), "-m", "nope"])
+    assert unknown.exit_code != 0
+
+
+def test_watch_store_rows_come_from_feeding_collectors_and_never_go_backwards(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    class Disk(BaseCollector):
+        name = "system"
+
+        def collect(self, context: RunContext | None = None) -> dict[str, object]:
+            return {"disk": {"free_bytes": 100}}
+
+    class Other(BaseCollector):
+        name = "other"
+
+        def collect(self, context: RunContext | None = None) -> dict[str, object]:
+            return {"value": 1}
+
+    clock = iter([1000.0, 1001.0, 500.0, 1002.0, 1003.0, 1004.0])
+    monkeypatch.setattr("sysforge.cli.get_collectors", lambda: [Disk(), Other()])
+    monkeypatch.setattr("sysforge.cli.time.time", lambda: next(clock, 2000.0))
+    store_path = tmp_path / "metrics.sfts"
+
+    watched = CliRunner().invoke(
+        app,
+        [
+            "watch", "-i", "1ms", "-n", "6", "--no-cache", "--every", "other=2ms",
+            "--store", str(store_path), "-m", "system.disk.free_bytes", "--retention", "1s",
+        ],
+    )
+
+    assert watched.exit_code == 0, watched.output
+    samples = [json.loads(line)["collector"] for line in watched.stdout.splitlines()]
+    with MetricStore(store_path) as store:
+        # Only `system` feeds a column, so retention is sized by its interval alone.
+        assert store.capacity == 1000
+        assert len(store) == samples.count("system")
+        timestamps = [timestamp for timestamp, _ in store.rows("system.disk.free_bytes")]
+    assert len(timestamps) == samples.count("system")
+    assert timestamps == sorted(timestamps)
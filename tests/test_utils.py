@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import gzip
+import json
 import os
 import sys
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
@@ -69,6 +72,147 @@ def test_write_json_file_creates_parents(tmp_path: Path) -> None:
     assert target.read_text() == '{\n  "hello": "world"\n}'
 
 
+def _stdlib_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(utils, "orjson", None)
+    monkeypatch.setattr(utils, "msgspec", None)
+
+
+NESTED = {
+    "a": {"b": {"c": {"d": [1, 2.5, None, "x\ny"]}, "e": []}, "f": {}},
+    "g": [{"h": True}, (3, 4)],
+    "i": {1: "int key"},
+    "j": "\u00e9",
+}
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_write_json_file_stdlib_streams_same_text_as_json_dump(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, pretty: bool
+) -> None:
+    _stdlib_only(monkeypatch)
+    target = tmp_path / "report.json"
+
+    utils.write_json_file(NESTED, target, pretty=pretty)
+
+    assert target.read_text() == utils.json_dump(NESTED, pretty=pretty)
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_write_json_file_native_backend_round_trips(tmp_path: Path, pretty: bool) -> None:
+    pytest.importorskip("orjson")
+    target = tmp_path / "report.json"
+    data = {"when": datetime(2024, 1, 1, tzinfo=UTC), "big": 2**70, "n": {1: [1.5]}}
+
+    utils.write_json_file(data, target, pretty=pretty)
+
+    assert utils.read_json_file(target) == json.loads(utils.json_dump(data))
+
+
+def test_write_json_file_gzip_by_extension(tmp_path: Path) -> None:
+    target = tmp_path / "report.json.gz"
+
+    utils.write_json_file(NESTED, target)
+
+    assert target.read_bytes().startswith(utils.GZIP_MAGIC)
+    assert json.loads(gzip.decompress(target.read_bytes())) == utils.read_json_file(target)
+    assert utils.read_json_file(target)["g"] == [{"h": True}, [3, 4]]
+
+
+def test_write_json_file_zstd_needs_optional_package(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(utils, "zstandard", None)
+
+    with pytest.raises(ValueError, match="zstandard"):
+        utils.write_json_file({"a": 1}, tmp_path / "report.json.zst")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_write_json_file_failure_keeps_previous_file(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    _stdlib_only(monkeypatch)
+    target = tmp_path / "report.json"
+    target.write_text('{"old": true}')
+
+    class Unprintable:
+        def __str__(self) -> str:
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        utils.write_json_file({"a": list(range(10)), "b": Unprintable()}, target)
+
+    assert target.read_text() == '{"old": true}'
+    assert list(tmp_path.iterdir()) == [target]
+
+
+def test_write_text_file_keeps_existing_mode(tmp_path: Path) -> None:
+    target = tmp_path / "report.md"
+    target.write_text("old")
+    target.chmod(0o640)
+
+    utils.write_text_file("new", target)
+
+    assert target.read_text() == "new"
+    assert target.stat().st_mode & 0o777 == 0o640
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="needs /proc")
+def test_write_text_file_gives_new_files_the_umask_mode(monkeypatch, tmp_path: Path) -> None:
+    target = tmp_path / "report.md"
+    previous = os.umask(0o027)
+    try:
+        monkeypatch.setattr(os, "umask", lambda mask: pytest.fail("umask changed"))
+        utils.write_text_file("new", target)
+    finally:
+        monkeypatch.undo()
+        os.umask(previous)
+
+    assert target.stat().st_mode & 0o777 == 0o640
+
+
+def test_read_json_file_rejects_truncated_gzip(tmp_path: Path) -> None:
+    target = tmp_path / "report.json.gz"
+    utils.write_json_file({"a": "b" * 100}, target)
+    target.write_bytes(target.read_bytes()[:-8])
+
+    with pytest.raises(ValueError):
+        utils.read_json_file(target)
+
+
+def test_read_json_file_rejects_corrupt_zstd(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    class ZstdError(Exception):
+        pass
+
+    class Decompressor:
+        def stream_reader(self, source: object) -> object:
+            raise ZstdError("invalid frame header")
+
+    fake = type(sys)("zstandard")
+    fake.ZstdError = ZstdError  # type: ignore[attr-defined]
+    fake.ZstdDecompressor = Decompressor  # type: ignore[attr-defined]
+    monkeypatch.setattr(utils, "zstandard", fake)
+    target = tmp_path / "report.json.zst"
+    target.write_bytes(utils.ZSTD_MAGIC + b"\xff" * 16)
+
+    with pytest.raises(ValueError, match="corrupt compressed data"):
+        utils.read_json_file(target)
+
+
+def test_read_json_file_rejects_corrupt_zstd_frame(tmp_path: Path) -> None:
+    pytest.importorskip("zstandard")
+    target = tmp_path / "report.json.zst"
+    utils.write_json_file({"a": "b" * 100}, target)
+    raw = target.read_bytes()
+    target.write_bytes(raw[:4] + bytes(byte ^ 0xFF for byte in raw[4:]))
+
+    with pytest.raises(ValueError):
+        utils.read_json_file(target)
+
+
 def test_memory_bytes_windows_path(monkeypatch: pytest.MonkeyPatch) -> None:
     import types
 
@@ -105,3 +249,12 @@ def test_memory_bytes_windows_path(monkeypatch: pytest.MonkeyPatch) -> None:
 
     result = utils.memory_bytes()
     assert result == 1234
+
+
+def test_flatten_metrics_keeps_numeric_leaves() -> None:
+    data = {"disk": {"free_bytes": 10, "path": "/"}, "ok": True, "load": [1, 2], "cpu": 1.5}
+
+    assert utils.flatten_metrics(data, "system") == {
+        "system.disk.free_bytes": 10.0,
+        "system.cpu": 1.5,
+    }
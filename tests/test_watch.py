@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+from itertools import islice
+
+import pytest
+from typer.testing import CliRunner
+
+from sysforge.cli import app
+from sysforge.collectors import get_collectors
+from sysforge.collectors.base import BaseCollector
+from sysforge.context import RunContext
+from sysforge.watch import Sampler, parse_duration, parse_interval_overrides, parse_time
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TimedCollector(BaseCollector):
+    def __init__(self, name: str, clock: FakeClock, cost: float, interval: float | None = None):
+        self.name = name
+        self.clock = clock
+        self.cost = cost
+        self.sample_interval = interval
+        self.calls = 0
+
+    def collect(self, context: RunContext | None = None) -> dict[str, object]:
+        self.calls += 1
+        self.clock.now += self.cost
+        return {"call": self.calls}
+
+
+def test_parse_duration_units() -> None:
+    assert parse_duration("500ms") == pytest.approx(0.5)
+    assert parse_duration("5s") == 5
+    assert parse_duration("2") == 2
+    assert parse_duration("1m") == 60
+    assert parse_duration("1.5h") == 5400
+    with pytest.raises(ValueError):
+        parse_duration("soon")
+    with pytest.raises(ValueError):
+        parse_duration("0s")
+
+
+def test_parse_time_formats() -> None:
+    assert parse_time("1700000000") == 1_700_000_000
+    assert parse_time("2024-01-01T00:00:00+00:00") == 1_704_067_200
+    assert parse_time("6h", now=100_000) == 100_000 - 6 * 3600
+    with pytest.raises(ValueError, match="invalid time"):
+        parse_time("yesterday-ish")
+
+
+def test_parse_interval_overrides() -> None:
+    assert parse_interval_overrides(["disk=1m", "cpu = 1s"]) == {"disk": 60, "cpu": 1}
+    with pytest.raises(ValueError):
+        parse_interval_overrides(["disk"])
+
+
+def test_sampler_is_fixed_rate_without_drift() -> None:
+    clock = FakeClock()
+    collector = TimedCollector("slowish", clock, cost=0.3)
+    sampler = Sampler([collector], interval=1.0, clock=clock, sleep=clock.sleep)
+
+    records = list(islice(sampler.samples(), 4))
+
+    assert [r["data"]["call"] for r in records] == [1, 2, 3, 4]
+    # Each sleep makes up exactly for the collector's own latency.
+    assert clock.sleeps == pytest.approx([0.7, 0.7, 0.7])
+    assert clock.now == pytest.approx(103.3)
+
+
+def test_sampler_skips_missed_ticks_when_overrunning() -> None:
+    clock = FakeClock()
+    collector = TimedCollector("stuck", clock, cost=2.5)
+    sampler = Sampler([collector], interval=1.0, clock=clock, sleep=clock.sleep)
+
+    list(islice(sampler.samples(), 2))
+
+    assert clock.sleeps == pytest.approx([0.5])
+
+
+def test_sampler_honours_per_collector_intervals() -> None:
+    clock = FakeClock()
+    fast = TimedCollector("load", clock, cost=0.0, interval=1.0)
+    slow = TimedCollector("disk", clock, cost=0.0)
+    sampler = Sampler(
+        [fast, slow], interval=5.0, overrides={"disk": 3.0}, clock=clock, sleep=clock.sleep
+    )
+
+    # Seconds 0 through 6: "load" every second, "disk" at 0, 3 and 6.
+    list(islice(sampler.samples(), 10))
+
+    assert fast.calls == 7
+    assert slow.calls == 3
+
+
+def test_slow_builtin_collectors_sample_less_often() -> None:
+    sampler = Sampler(get_collectors(), interval=5.0, overrides={"mounts": 10.0})
+    intervals = dict(zip((c.name for c in sampler.collectors), sampler.intervals, strict=True))
+
+    assert intervals["packages"] == 3600.0
+    assert intervals["toolchain"] == 900.0
+    assert intervals["mounts"] == 10.0
+    assert intervals["cpu"] == 5.0
+
+
+def test_sampler_reports_collector_errors() -> None:
+    class Broken(BaseCollector):
+        name = "broken"
+
+        def collect(self, context: RunContext | None = None) -> dict[str, object]:
+            raise RuntimeError("probe failed")
+
+    record = next(Sampler([Broken()], interval=1.0).samples())
+
+    assert record["error"] == "RuntimeError: probe failed"
+    assert "data" not in record
+
+
+def test_sampler_rejects_unknown_overrides() -> None:
+    with pytest.raises(ValueError, match="unknown collector"):
+        Sampler([], interval=1.0, overrides={"nope": 1.0})
+
+
+def test_watch_command_emits_json_lines(monkeypatch: pytest.MonkeyPatch) -> None:
+    class Quick(BaseCollector):
+        name = "quick"
+
+        def collect(self, context: RunContext | None = None) -> dict[str, object]:
+            return {"ok": True}
+
+    monkeypatch.setattr("sysforge.cli.get_collectors", lambda: [Quick()])
+
+    result = CliRunner().invoke(app, ["watch", "--interval", "1ms", "--count", "3", "--no-cache"])
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert len(lines) == 3
+    assert all(line["collector"] == "quick" and line["data"] == {"ok": True} for line in lines)
+
+
+def test_watch_command_rejects_bad_interval() -> None:
+    result = CliRunner().invoke(app, ["watch", "--interval", "often"])
+    assert result.exit_code != 0
+    assert "invalid duration" in result.stderr
+
+
+def test_watch_command_detect_emits_anomaly_checks(monkeypatch: pytest.MonkeyPatch) -> None:
+    values = iter([10.0] * 40 + [1000.0, 10.0])
+
+    class Spiky(BaseCollector):
+        name = "spiky"
+
+        def collect(self, context: RunContext | None = None) -> dict[str, object]:
+            return {"value": next(values)}
+
+    monkeypatch.setattr("sysforge.cli.get_collectors", lambda: [Spiky()])
+
+    result = CliRunner().invoke(
+        app, ["watch", "--interval", "1ms", "--count", "42", "--no-cache", "--detect"]
+    )
+
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    checks = [line for line in lines if line["type"] == "check"]
+    assert [(c["name"], c["status"]) for c in checks] == [
+        ("anomaly.spiky.value", "warn"),
+        ("anomaly.spiky.value", "pass"),
+    ]
+    assert sum(line["type"] == "sample" for line in lines) == 42
+
+
+def test_watch_command_rejects_bad_fill_horizons() -> None:
+    result = CliRunner().invoke(
+        app, ["watch", "--detect", "--fill-warn", "1h", "--fill-fail", "2h"]
+    )
+    assert result.exit_code != 0
+    assert "fill_fail" in result.stderr